@@ -275,6 +275,12 @@ def main():
         parser.add_argument('--db_port',
                             default='3306',
                             help='Database port number (not used for sqlite)')
+        parser.add_argument('--db_replica_host',
+                            default=None,
+                            help='Database replica hostname for read-only sessions, defaults to db_host (not used for sqlite)')
+        parser.add_argument('--db_replica_port',
+                            default=None,
+                            help='Database replica port number for read-only sessions, defaults to db_port (not used for sqlite)')
         parser.add_argument('--db_username',
                             default='sickrage',
                             help='Database username (not used for sqlite)')
@@ -294,6 +300,8 @@ def main():
         app.db_prefix = args.db_prefix
         app.db_host = args.db_host
         app.db_port = args.db_port
+        app.db_replica_host = args.db_replica_host
+        app.db_replica_port = args.db_replica_port
         app.db_username = args.db_username
         app.db_password = args.db_password
         app.debug = args.debug
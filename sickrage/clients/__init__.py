@@ -19,9 +19,12 @@
 
 
 import re
+import threading
 import time
 from base64 import b16encode, b32decode
+from collections import defaultdict
 from hashlib import sha1
+from urllib.parse import urlparse
 
 from bencode3 import bdecode, bencode, BencodeError
 
@@ -154,6 +157,40 @@ def get_client_instance(name):
     return getattr(module, className)
 
 
+clients = {}
+clients_lock = threading.Lock()
+
+
+def get_client(name):
+    """
+    Returns the long-lived client of a torrent backend, the client keeps its session and authentication
+    between torrents and is only created again when the backend settings change.
+
+    :param name: torrent method
+    :return: client instance
+    """
+    settings = (sickrage.app.config.torrent_host, sickrage.app.config.torrent_username,
+                sickrage.app.config.torrent_password, sickrage.app.config.torrent_rpcurl,
+                sickrage.app.config.torrent_verify_cert, sickrage.app.config.torrent_auth_type)
+
+    with clients_lock:
+        if name not in clients or clients[name][0] != settings:
+            clients[name] = (settings, get_client_instance(name)())
+        return clients[name][1]
+
+
+class ClientCallStats(object):
+    def __init__(self):
+        self.calls = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def avg_time(self):
+        return (self.total_time / self.calls) if self.calls else 0.0
+
+
 class GenericClient(object):
     def __init__(self, name, host=None, username=None, password=None):
         self.name = name
@@ -167,6 +204,8 @@ class GenericClient(object):
         self.last_time = time.time()
 
         self.session = WebSession(cache=False)
+        self.lock = threading.RLock()
+        self.stats = defaultdict(ClientCallStats)
 
         self._response = None
 
@@ -179,9 +218,7 @@ class GenericClient(object):
         self._response = value
 
     def _request(self, method='get', params=None, data=None, *args, **kwargs):
-        if time.time() > self.last_time + 1800 or not self.auth:
-            self.last_time = time.time()
-            self._get_auth()
+        self._ensure_auth()
 
         sickrage.app.log.debug(
             '{name}: Requested a {method} connection to {url} with'
@@ -198,6 +235,9 @@ class GenericClient(object):
             sickrage.app.log.warning(self.name + ': Authentication Failed')
             return False
 
+        call = self._call_name(method, params, kwargs.get('json'))
+        start = time.time()
+
         try:
             self.response = self.session.request(method.upper(),
                                                  self.url,
@@ -208,8 +248,11 @@ class GenericClient(object):
                                                  verify=False,
                                                  *args, **kwargs)
         except Exception:
+            self._record_call(call, start, False)
             return False
 
+        self._record_call(call, start, self.response.ok)
+
         sickrage.app.log.debug('{name}: Response to {method} request is {response}'.format(
             name=self.name,
             method=method.upper(),
@@ -218,6 +261,68 @@ class GenericClient(object):
 
         return True
 
+    def _call_name(self, method, params, json):
+        for arguments in (json, params):
+            try:
+                arguments = dict(arguments or {})
+            except (TypeError, ValueError):
+                continue
+
+            for key in ('method', 'action'):
+                if key in arguments:
+                    return str(arguments[key])
+
+        return '{} {}'.format(method.upper(), urlparse(self.url or '').path)
+
+    def _record_call(self, call, start, success):
+        elapsed = time.time() - start
+
+        with self.lock:
+            stats = self.stats[call]
+            stats.calls += 1
+            stats.failed += 0 if success else 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+
+    def _authenticate(self):
+        self.last_time = time.time()
+
+        start = time.time()
+        auth = self._get_auth()
+        self._record_call('auth', start, bool(auth))
+
+        return auth
+
+    def _ensure_auth(self):
+        """
+        Authenticates when the client has no session yet or the session is older than 30 minutes
+        """
+        if self.auth and time.time() < self.last_time + 1800:
+            return self.auth
+        return self._authenticate()
+
+    def _auth_expired(self):
+        return getattr(self.response, 'status_code', None) in (401, 409)
+
+    def _call_with_reauth(self, func, result):
+        """
+        Calls a client method and calls it again with a new session when the client rejected the current one
+        """
+        try:
+            success = func(result)
+        except Exception:
+            if not self._auth_expired():
+                raise
+            success = False
+
+        if not success and self._auth_expired():
+            sickrage.app.log.debug(self.name + ': Session expired, authenticating again')
+            self.auth = None
+            if self._authenticate():
+                success = func(result)
+
+        return success
+
     def _get_auth(self):
         """
         This should be overridden and should return the auth_id needed for the client
@@ -280,6 +385,28 @@ class GenericClient(object):
         """
         return True
 
+    def _set_torrent_properties(self, result):
+        """
+        Sets pause, label, ratio, seed time, path and priority of an added torrent with one call each,
+        clients that can set several properties with one call should override this
+        """
+        success = True
+
+        for name, setter in (('pause', self._set_torrent_pause),
+                             ('label', self._set_torrent_label),
+                             ('ratio', self._set_torrent_ratio),
+                             ('seed time', self._set_torrent_seed_time),
+                             ('path', self._set_torrent_path),
+                             ('priority', self._set_torrent_priority)):
+            if name == 'priority' and result.priority == 0:
+                continue
+
+            if not setter(result):
+                sickrage.app.log.warning('{}: Unable to set the {} for Torrent'.format(self.name, name))
+                success = False
+
+        return success
+
     @staticmethod
     def _get_torrent_hash(result):
         if result.url.startswith('magnet'):
@@ -308,59 +435,49 @@ class GenericClient(object):
 
         return result
 
+    def _add_torrent(self, result):
+        if result.url.startswith('magnet'):
+            return self._add_torrent_uri(result)
+        return self._add_torrent_file(result)
+
     def send_torrent(self, result):
 
         r_code = False
 
         sickrage.app.log.debug('Calling ' + self.name + ' Client')
 
-        try:
-            if not self._get_auth():
-                sickrage.app.log.warning(self.name + ': Authentication Failed')
+        with self.lock:
+            try:
+                if not self._ensure_auth():
+                    sickrage.app.log.warning(self.name + ': Authentication Failed')
+                    return r_code
+
+                # Sets per provider seed ratio
+                result.ratio = result.provider.seed_ratio
+
+                # reuse the content cached when the result was verified
+                if not result.content and not result.url.startswith('magnet'):
+                    result.content = result.provider.get_content(result.url)
+
+                # lazy fix for now, I'm sure we already do this somewhere else too
+                result = self._get_torrent_hash(result)
+
+                # convert to magnetic url if result has info hash and is not a private provider
+                if sickrage.app.config.torrent_file_to_magnet:
+                    if result.hash and not result.provider.private and not result.url.startswith('magnet'):
+                        result.url = "magnet:?xt=urn:btih:{}".format(result.hash)
+
+                r_code = self._call_with_reauth(self._add_torrent, result)
+                if not r_code:
+                    sickrage.app.log.warning(self.name + ': Unable to send Torrent')
+                    return False
+
+                self._call_with_reauth(self._set_torrent_properties, result)
+            except Exception as e:
+                sickrage.app.log.warning(self.name + ': Failed Sending Torrent')
+                sickrage.app.log.debug(self.name + ': Exception raised when sending torrent: {}. Error: {}'.format(result, e))
                 return r_code
 
-            # Sets per provider seed ratio
-            result.ratio = result.provider.seed_ratio
-
-            # lazy fix for now, I'm sure we already do this somewhere else too
-            result = self._get_torrent_hash(result)
-
-            # convert to magnetic url if result has info hash and is not a private provider
-            if sickrage.app.config.torrent_file_to_magnet:
-                if result.hash and not result.provider.private and not result.url.startswith('magnet'):
-                    result.url = "magnet:?xt=urn:btih:{}".format(result.hash)
-
-            if result.url.startswith('magnet'):
-                r_code = self._add_torrent_uri(result)
-            else:
-                r_code = self._add_torrent_file(result)
-
-            if not r_code:
-                sickrage.app.log.warning(self.name + ': Unable to send Torrent')
-                return False
-
-            if not self._set_torrent_pause(result):
-                sickrage.app.log.warning(self.name + ': Unable to set the pause for Torrent')
-
-            if not self._set_torrent_label(result):
-                sickrage.app.log.warning(self.name + ': Unable to set the label for Torrent')
-
-            if not self._set_torrent_ratio(result):
-                sickrage.app.log.warning(self.name + ': Unable to set the ratio for Torrent')
-
-            if not self._set_torrent_seed_time(result):
-                sickrage.app.log.warning(self.name + ': Unable to set the seed time for Torrent')
-
-            if not self._set_torrent_path(result):
-                sickrage.app.log.warning(self.name + ': Unable to set the path for Torrent')
-
-            if result.priority != 0 and not self._set_torrent_priority(result):
-                sickrage.app.log.warning(self.name + ': Unable to set priority for Torrent')
-        except Exception as e:
-            sickrage.app.log.warning(self.name + ': Failed Sending Torrent')
-            sickrage.app.log.debug(self.name + ': Exception raised when sending torrent: {}. Error: {}'.format(result, e))
-            return r_code
-
         return r_code
 
     def test_authentication(self):
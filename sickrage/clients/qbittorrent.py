@@ -25,17 +25,19 @@ class qbittorrentAPI(GenericClient):
     def __init__(self, host=None, username=None, password=None):
         super(qbittorrentAPI, self).__init__('qbittorrent', host, username, password)
         self.url = self.host
+        self.api_version = None
 
     @property
     def api(self):
-        """Get API version."""
-        try:
-            self.url = '{}version/api'.format(self.host)
-            version = int(self.session.get(self.url, verify=sickrage.app.config.torrent_verify_cert).content)
-        except Exception:
-            version = 1
-
-        return version
+        """Get API version, asked once per client."""
+        if self.api_version is None:
+            try:
+                self.url = '{}version/api'.format(self.host)
+                self.api_version = int(self.session.get(self.url, verify=sickrage.app.config.torrent_verify_cert).content)
+            except Exception:
+                return 1
+
+        return self.api_version
 
     def _get_auth(self):
         if self.api > 1:
@@ -99,7 +99,17 @@ class TransmissionAPI(GenericClient):
         if self._request(method='post', json=post_data):
             return self.response.json()['result'] == "success"
 
-    def _set_torrent_ratio(self, result):
+    def _torrent_set(self, result, arguments):
+        post_data = {
+            'arguments': dict(arguments, ids=[result.hash]),
+            'method': 'torrent-set'
+        }
+
+        if self._request(method='post', json=post_data):
+            return self.response.json()['result'] == "success"
+
+    @staticmethod
+    def _ratio_arguments(result):
         ratio = None
         if isinstance(result.ratio, int):
             ratio = result.ratio
@@ -113,41 +123,23 @@ class TransmissionAPI(GenericClient):
                 ratio = float(ratio)
                 mode = 1  # Stop seeding at seedRatioLimit
 
-        arguments = {
-            'ids': [result.hash],
+        return {
             'seedRatioLimit': ratio,
             'seedRatioMode': mode
         }
 
-        post_data = {
-            'arguments': arguments,
-            'method': 'torrent-set'
-        }
-
-        if self._request(method='post', json=post_data):
-            return self.response.json()['result'] == "success"
-
-    def _set_torrent_seed_time(self, result):
+    @staticmethod
+    def _seed_time_arguments():
         if sickrage.app.config.torrent_seed_time and sickrage.app.config.torrent_seed_time != -1:
-            time = int(60 * float(sickrage.app.config.torrent_seed_time))
-            arguments = {
-                'ids': [result.hash],
-                'seedIdleLimit': time,
+            return {
+                'seedIdleLimit': int(60 * float(sickrage.app.config.torrent_seed_time)),
                 'seedIdleMode': 1
             }
+        return {}
 
-            post_data = {
-                'arguments': arguments,
-                'method': 'torrent-set'
-            }
-
-            if self._request(method='post', json=post_data):
-                return self.response.json()['result'] == "success"
-        else:
-            return True
-
-    def _set_torrent_priority(self, result):
-        arguments = {'ids': [result.hash]}
+    @staticmethod
+    def _priority_arguments(result):
+        arguments = {}
 
         if result.priority == -1:
             arguments['priority-low'] = []
@@ -161,13 +153,32 @@ class TransmissionAPI(GenericClient):
         else:
             arguments['priority-normal'] = []
 
-        post_data = {
-            'arguments': arguments,
-            'method': 'torrent-set'
-        }
+        return arguments
 
-        if self._request(method='post', json=post_data):
-            return self.response.json()['result'] == "success"
+    def _set_torrent_ratio(self, result):
+        return self._torrent_set(result, self._ratio_arguments(result))
+
+    def _set_torrent_seed_time(self, result):
+        arguments = self._seed_time_arguments()
+        if not arguments:
+            return True
+        return self._torrent_set(result, arguments)
+
+    def _set_torrent_priority(self, result):
+        return self._torrent_set(result, self._priority_arguments(result))
+
+    def _set_torrent_properties(self, result):
+        # pause state and download dir are sent with torrent-add, the rest is set with one torrent-set call
+        arguments = self._ratio_arguments(result)
+        arguments.update(self._seed_time_arguments())
+        if result.priority != 0:
+            arguments.update(self._priority_arguments(result))
+
+        if not self._torrent_set(result, arguments):
+            sickrage.app.log.warning(self.name + ': Unable to set the properties for Torrent')
+            return False
+
+        return True
 
     def remove_torrent(self, info_hash):
         arguments = {
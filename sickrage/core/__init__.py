@@ -44,6 +44,7 @@ from tornado.ioloop import IOLoop
 import sickrage
 from sickrage.core.api import API
 from sickrage.core.api.account import AccountAPI
+from sickrage.core.caches.content_cache import ContentCache
 from sickrage.core.caches.name_cache import NameCache
 from sickrage.core.caches.quicksearch_cache import QuicksearchCache
 from sickrage.core.common import SD, SKIPPED, WANTED
@@ -74,6 +75,7 @@ from sickrage.core.version_updater import VersionUpdater
 from sickrage.core.webserver import WebServer
 from sickrage.metadata import MetadataProviders
 from sickrage.notifiers import NotifierProviders
+from sickrage.notifiers.dispatcher import NotificationDispatcher
 from sickrage.providers import SearchProviders
 
 
@@ -107,6 +109,8 @@ class Core(object):
         self.db_prefix = None
         self.db_host = None
         self.db_port = None
+        self.db_replica_host = None
+        self.db_replica_port = None
         self.db_username = None
         self.db_password = None
         self.debug = None
@@ -165,6 +169,8 @@ class Core(object):
         self.upnp_client = None
         self.oidc_client = None
         self.quicksearch_cache = None
+        self.content_cache = None
+        self.notification_dispatcher = None
 
     def start(self):
         self.started = True
@@ -174,8 +180,10 @@ class Core(object):
         threading.currentThread().setName('CORE')
 
         # init core classes
-        self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
-        self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password)
+        self.main_db = MainDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password,
+                              self.db_replica_host, self.db_replica_port)
+        self.cache_db = CacheDB(self.db_type, self.db_prefix, self.db_host, self.db_port, self.db_username, self.db_password,
+                                self.db_replica_host, self.db_replica_port)
         self.notifier_providers = NotifierProviders()
         self.metadata_providers = MetadataProviders()
         self.search_providers = SearchProviders()
@@ -201,6 +209,8 @@ class Core(object):
         self.auto_postprocessor = AutoPostProcessor()
         self.upnp_client = UPNPClient()
         self.quicksearch_cache = QuicksearchCache()
+        self.content_cache = ContentCache()
+        self.notification_dispatcher = NotificationDispatcher()
 
         # setup oidc client
         realm = KeycloakRealm(server_url='https://auth.sickrage.ca', realm_name='sickrage')
@@ -530,6 +540,10 @@ class Core(object):
                 self.log.debug("Shutting down ANIDB connection")
                 self.adba_connection.stop()
 
+            # stop sending notifications
+            if self.notification_dispatcher:
+                self.notification_dispatcher.shutdown()
+
             # save settings
             self.config.save()
 
@@ -0,0 +1,109 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import re
+import threading
+import time
+from base64 import b16encode, b32decode
+from collections import OrderedDict
+from hashlib import sha1
+
+from bencode3 import bdecode, bencode
+
+
+def info_hash_from_url(url):
+    """
+    :param url: magnet url
+    :return: lowercase hex info hash of a magnet url or None
+    """
+    info_hash = re.findall(r'urn:btih:([\w]{32,40})', url or '')
+    if not info_hash:
+        return None
+
+    info_hash = info_hash[0]
+    if len(info_hash) == 32:
+        info_hash = b16encode(b32decode(info_hash.upper())).decode()
+    return info_hash.lower()
+
+
+def info_hash_from_content(content):
+    """
+    :param content: .torrent file content
+    :return: lowercase hex info hash of a .torrent file or None
+    """
+    try:
+        return sha1(bencode(bdecode(content)['info'])).hexdigest()
+    except Exception:
+        return None
+
+
+class ContentCache(object):
+    """
+    Keeps verified .torrent/.nzb payloads for a while so results verified during a search
+    aren't downloaded again when snatched. Payloads are keyed by URL and, for torrents, by
+    info hash so a magnet and a .torrent URL of the same release share one entry.
+    """
+
+    def __init__(self, ttl=3600, max_entries=100):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, url):
+        if url.startswith('magnet'):
+            return info_hash_from_url(url) or url
+        return url
+
+    def get(self, url):
+        if not url:
+            return None
+
+        with self.lock:
+            entry = self.entries.get(self._key(url))
+            if entry and entry[0] > time.time():
+                self.entries.move_to_end(self._key(url))
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+    def add(self, url, content):
+        if not url or not content:
+            return
+
+        keys = {self._key(url)}
+        if isinstance(content, bytes):
+            keys.add(info_hash_from_content(content))
+        keys.discard(None)
+
+        with self.lock:
+            for key in keys:
+                self.entries[key] = (time.time() + self.ttl, content)
+                self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
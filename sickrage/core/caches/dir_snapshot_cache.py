@@ -0,0 +1,136 @@
+# Author: echel0n <echel0n@sickrage.ca>
+# URL: https://sickrage.ca
+#
+# This file is part of SiCKRAGE.
+#
+# SiCKRAGE is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# SiCKRAGE is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+import os
+
+from sickrage.core import metrics
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.helpers import is_media_file
+from sickrage.subtitles import Subtitles
+
+SNAPSHOT_MEDIA_FILES = metrics.counter('sickrage_dir_snapshot_media_files', 'Media files of show directory refreshes by result', ['result'])
+
+
+class DirSnapshot(object):
+    """
+    Snapshot of the media and subtitle files in a show directory, stored as
+    (path, size, mtime, inode) in the cache database so that a refresh only has
+    to re-parse files that were added or changed since the previous refresh.
+    """
+
+    def __init__(self, show_id, location):
+        self.show_id = show_id
+        self.location = location
+        self.subtitle_extensions = tuple('.' + x for x in Subtitles().subtitle_extensions)
+        self.files = self.scan(location)
+        self.previous = self.load()
+
+    def scan(self, path):
+        """
+        Walk the show directory once with os.scandir, same rules as list_media_files.
+
+        :return: dict of path -> (size, mtime, inode)
+        """
+        files = {}
+
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return files
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not entry.name.startswith('.') and not entry.name == 'Extras':
+                        files.update(self.scan(entry.path))
+                elif is_media_file(entry.name) or entry.name.lower().endswith(self.subtitle_extensions):
+                    st = entry.stat()
+                    files[os.path.normpath(entry.path)] = (st.st_size, st.st_mtime_ns, st.st_ino)
+            except OSError:
+                continue
+
+        return files
+
+    @CacheDB.with_session
+    def load(self, session=None):
+        return {x.path: (x.size, x.mtime, x.inode) for x in session.query(CacheDB.DirSnapshot).filter_by(showid=self.show_id)}
+
+    @CacheDB.with_session
+    def save(self, session=None):
+        removed = list(set(self.previous) - set(self.files))
+        changed = [x for x in self.files if self.files[x] != self.previous.get(x)]
+
+        # delete in chunks to stay below the sqlite bound parameter limit
+        stale = removed + [x for x in changed if x in self.previous]
+        for i in range(0, len(stale), 500):
+            session.query(CacheDB.DirSnapshot).filter(CacheDB.DirSnapshot.showid == self.show_id,
+                                                      CacheDB.DirSnapshot.path.in_(stale[i:i + 500])).delete(synchronize_session=False)
+
+        if changed:
+            session.bulk_insert_mappings(CacheDB.DirSnapshot, [{'showid': self.show_id,
+                                                                'path': x,
+                                                                'size': self.files[x][0],
+                                                                'mtime': self.files[x][1],
+                                                                'inode': self.files[x][2]} for x in changed])
+
+        self.previous = dict(self.files)
+
+    @property
+    def media_files(self):
+        return [x for x in self.files if not x.lower().endswith(self.subtitle_extensions)]
+
+    @property
+    def changed_subtitles(self):
+        return [x for x in set(self.files) | set(self.previous) if x.lower().endswith(self.subtitle_extensions) and
+                self.files.get(x) != self.previous.get(x)]
+
+    def changed_media_files(self, known_locations):
+        """
+        Media files that need to be parsed again, files are unchanged when their
+        size, mtime and inode match the snapshot, an episode already points at
+        them and none of their subtitle files changed.
+
+        :param known_locations: normalized locations of the show's episodes
+        :return: list of media file paths
+        """
+        changed_subtitles = self.changed_subtitles
+
+        changed = []
+        for path in self.media_files:
+            if self.files[path] == self.previous.get(path) and path in known_locations:
+                stem = os.path.splitext(path)[0] + '.'
+                if not any(x.startswith(stem) for x in changed_subtitles):
+                    continue
+            changed.append(path)
+
+        SNAPSHOT_MEDIA_FILES.labels('unchanged').inc(len(self.media_files) - len(changed))
+        SNAPSHOT_MEDIA_FILES.labels('changed').inc(len(changed))
+
+        return changed
+
+    def exists(self, path):
+        return os.path.normpath(path) in self.files
+
+    @staticmethod
+    def stats():
+        """
+        :return: media files found unchanged and changed by refreshes since startup and the rate of unchanged files
+        """
+        unchanged, changed = SNAPSHOT_MEDIA_FILES.labels('unchanged').value, SNAPSHOT_MEDIA_FILES.labels('changed').value
+        return {'unchanged': unchanged,
+                'changed': changed,
+                'hit_rate': (unchanged / (unchanged + changed)) if unchanged + changed else 0.0}
@@ -18,24 +18,131 @@
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import hashlib
 import os
-
-from hachoir.core import config as hachoir_config
-from hachoir.metadata import extractMetadata
-from hachoir.parser import guessParser
-from hachoir.stream import StringInputStream
+import shutil
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import sickrage
-from sickrage.core.helpers import copy_file
+from sickrage.core import metrics
+from sickrage.core.databases import UnitOfWork
+from sickrage.core.databases.main import MainDB
+from sickrage.core.helpers import chmod_as_parent
+from sickrage.indexers import IndexerApi
+from sickrage.indexers.exceptions import indexer_error
 from sickrage.metadata import GenericMetadata
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_DOWNLOADS = metrics.counter('sickrage_image_cache_downloads', 'Images downloaded into the image cache')
+IMAGE_DEDUPLICATED = metrics.counter('sickrage_image_cache_deduplicated', 'Cached images whose content was already stored')
+IMAGE_RESIZED = metrics.counter('sickrage_image_cache_resized', 'Resized variants generated from cached images', ['width'])
+
+# number of shows whose images are looked up and number of images downloaded at the same time
+FILL_WORKERS = 2
+DOWNLOAD_WORKERS = 4
+
+# widths of the resized variants of cached images, requested widths are rounded up to one of them
+RESIZE_WIDTHS = (100, 200, 400, 600, 800)
+
+
+def image_dimensions(path):
+    """
+    Reads the width and height of a JPEG, PNG or GIF image from its header, JPEG segments before the frame
+    header are skipped without reading them
+
+    :param path: full path to the image
+    :return: (width, height) or None if the image couldn't be read
+    """
+    try:
+        with open(path, 'rb') as fh:
+            head = fh.read(26)
+
+            if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+                return struct.unpack('>II', head[16:24])
+
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                return struct.unpack('<HH', head[6:10])
+
+            if head[:2] != b'\xff\xd8':
+                return None
+
+            fh.seek(2)
+            while True:
+                marker = fh.read(2)
+                if len(marker) != 2 or marker[0] != 0xFF:
+                    return None
+
+                # markers may be padded with fill bytes
+                while marker[1] == 0xFF:
+                    marker = marker[1:] + fh.read(1)
+                    if len(marker) != 2:
+                        return None
+
+                # markers without a segment
+                if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD8:
+                    continue
+
+                length = fh.read(2)
+                if len(length) != 2:
+                    return None
+
+                # start of frame, except for DHT, JPG and DAC markers
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    frame = fh.read(5)
+                    if len(frame) != 5:
+                        return None
+                    height, width = struct.unpack('>HH', frame[1:])
+                    return width, height
+
+                fh.seek(struct.unpack('>H', length)[0] - 2, os.SEEK_CUR)
+    except (IOError, OSError, struct.error):
+        return None
+
+
+def image_version(path):
+    """
+    :param path: full path to the image
+    :return: version of the image that changes whenever the image is replaced
+    """
+    stat = os.stat(path)
+    return '{:x}{:x}'.format(stat.st_mtime_ns, stat.st_size)
+
 
 class ImageCache(object):
-    def __init__(self):
-        hachoir_config.quiet = True
+    """
+    Images are stored once per content under the content dir, named by their SHA1 hash. The poster, banner and
+    fanart paths of a show are hard links to the stored content, so shows with the same artwork share one copy.
+
+    Filling the cache runs in the background, a show's images are looked up with one indexer client and one
+    images request per image kind, the images are downloaded by a bounded pool shared by all shows.
+    """
+
+    lock = threading.Lock()
+    filling = set()
+    fill_executor = None
+    download_executor = None
+
+    BANNER = 1
+    POSTER = 2
+    BANNER_THUMB = 3
+    POSTER_THUMB = 4
+    FANART = 5
+    FANART_THUMB = 6
 
-    def __del__(self):
-        pass
+    # image type -> indexer images key type, fanart.tv image type and thumbnail or not
+    INDEXER_TYPES = {
+        POSTER: ('poster', 'poster', False),
+        BANNER: ('series', 'series', False),
+        FANART: ('fanart', 'fanart', False),
+        POSTER_THUMB: ('poster', 'poster_thumb', True),
+        BANNER_THUMB: ('series', 'series_thumb', True),
+    }
 
     def _cache_dir(self):
         """
@@ -49,6 +156,25 @@ class ImageCache(object):
         """
         return os.path.abspath(os.path.join(self._cache_dir(), 'thumbnails'))
 
+    def _content_dir(self):
+        """
+        Builds up the full path to the directory of the content addressed images
+        """
+        return os.path.abspath(os.path.join(self._cache_dir(), 'content'))
+
+    def _resized_dir(self):
+        """
+        Builds up the full path to the directory of the resized variants of cached images
+        """
+        return os.path.abspath(os.path.join(self._cache_dir(), 'resized'))
+
+    def content_path(self, digest):
+        """
+        :param digest: SHA1 hex digest of the image data
+        :return: full path to the stored image with the digest
+        """
+        return os.path.join(self._content_dir(), digest[:2], digest)
+
     def poster_path(self, indexer_id):
         """
         Builds up the path to a poster cache for a given Indexer ID
@@ -149,12 +275,18 @@ class ImageCache(object):
         sickrage.app.log.debug("Checking if file " + str(banner_thumb_path) + " exists")
         return os.path.isfile(banner_thumb_path)
 
-    BANNER = 1
-    POSTER = 2
-    BANNER_THUMB = 3
-    POSTER_THUMB = 4
-    FANART = 5
-    FANART_THUMB = 6
+    def image_path(self, img_type, indexer_id):
+        """
+        :return: full path to the cached image of a type for the given Indexer ID, or None for an invalid type
+        """
+        return {
+            self.POSTER: self.poster_path,
+            self.BANNER: self.banner_path,
+            self.FANART: self.fanart_path,
+            self.POSTER_THUMB: self.poster_thumb_path,
+            self.BANNER_THUMB: self.banner_thumb_path,
+            self.FANART_THUMB: self.fanart_thumb_path,
+        }.get(img_type, lambda x: None)(indexer_id)
 
     def which_type(self, path):
         """
@@ -168,32 +300,143 @@ class ImageCache(object):
             sickrage.app.log.warning("Couldn't check the type of " + str(path) + " cause it doesn't exist")
             return None
 
-        with open(path, 'rb') as fh:
-            img_metadata = extractMetadata(guessParser(StringInputStream(fh.read())))
-            if not img_metadata:
-                sickrage.app.log.debug(
-                    "Unable to get metadata from " + str(path) + ", not using your existing image")
-                return None
+        dimensions = image_dimensions(path)
+        if not dimensions or not all(dimensions):
+            sickrage.app.log.debug("Unable to get the dimensions of " + str(path) + ", not using your existing image")
+            return None
+
+        img_ratio = float(dimensions[0]) / float(dimensions[1])
 
-            img_ratio = float(img_metadata.get('width', 0)) / float(img_metadata.get('height', 0))
+        # most posters are around 0.68 width/height ratio (eg. 680/1000)
+        if 0.55 < img_ratio < 0.8:
+            return self.POSTER
 
-            # most posters are around 0.68 width/height ratio (eg. 680/1000)
-            if 0.55 < img_ratio < 0.8:
-                return self.POSTER
+        # most banners are around 5.4 width/height ratio (eg. 758/140)
+        elif 5 < img_ratio < 6:
+            return self.BANNER
+
+        # most fanart are around 1.77777 width/height ratio (eg. 1280/720 and 1920/1080)
+        elif 1.7 < img_ratio < 1.8:
+            return self.FANART
+        else:
+            sickrage.app.log.warning("Image has size ratio of " + str(img_ratio) + ", unknown type")
 
-            # most banners are around 5.4 width/height ratio (eg. 758/140)
-            elif 5 < img_ratio < 6:
-                return self.BANNER
+    def store(self, data, dest_path):
+        """
+        Stores image data by its content and links the destination path to it
+
+        :param data: image data
+        :param dest_path: path the image should be available at
+        :return: SHA1 hex digest of the image data
+        """
+        digest = hashlib.sha1(data).hexdigest()
+        content_path = self.content_path(digest)
 
-            # most fanart are around 1.77777 width/height ratio (eg. 1280/720 and 1920/1080)
-            elif 1.7 < img_ratio < 1.8:
-                return self.FANART
+        with self.lock:
+            if os.path.isfile(content_path):
+                IMAGE_DEDUPLICATED.inc()
             else:
-                sickrage.app.log.warning("Image has size ratio of " + str(img_ratio) + ", unknown type")
+                os.makedirs(os.path.dirname(content_path), exist_ok=True)
+                with open(content_path + '.tmp', 'wb') as fh:
+                    fh.write(data)
+                os.replace(content_path + '.tmp', content_path)
+
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+
+            replaced = None
+            if os.path.isfile(dest_path):
+                with open(dest_path, 'rb') as fh:
+                    replaced = hashlib.sha1(fh.read()).hexdigest()
+                if replaced == digest and os.path.samefile(dest_path, content_path):
+                    return digest
+                os.remove(dest_path)
+
+            try:
+                os.link(content_path, dest_path)
+            except (OSError, AttributeError):
+                # file systems without hard links get a copy
+                shutil.copyfile(content_path, dest_path)
+
+            # drop content no image links to anymore
+            if replaced and replaced != digest and os.path.isfile(self.content_path(replaced)):
+                if os.stat(self.content_path(replaced)).st_nlink == 1:
+                    os.remove(self.content_path(replaced))
+
+        chmod_as_parent(dest_path)
+
+        return digest
+
+    def resized_path(self, path, width):
+        """
+        :param path: full path to a cached image
+        :param width: width of the variant
+        :return: full path to the resized variant of the image
+        """
+        return os.path.join(self._resized_dir(), str(width), os.path.relpath(path, self._cache_dir()))
+
+    def resize(self, path, width):
+        """
+        Returns a variant of a cached image no wider than the requested width rounded up to one of the
+        ``RESIZE_WIDTHS``, the variant is generated on first access and whenever the image was replaced since.
+
+        :param path: full path to a cached image
+        :param width: requested width
+        :return: full path to the variant, or to the image itself if it is small enough or can't be resized
+        """
+        width = next((x for x in RESIZE_WIDTHS if x >= width), RESIZE_WIDTHS[-1])
+
+        if Image is None or not path.startswith(self._cache_dir() + os.sep):
+            return path
+
+        dimensions = image_dimensions(path)
+        if not dimensions or dimensions[0] <= width:
+            return path
+
+        # variants carry the modification time of their image
+        stat = os.stat(path)
+        resized_path = self.resized_path(path, width)
+        if os.path.isfile(resized_path) and os.stat(resized_path).st_mtime_ns == stat.st_mtime_ns:
+            return resized_path
+
+        tmp_path = '{}.{}.tmp'.format(resized_path, threading.get_ident())
+
+        try:
+            os.makedirs(os.path.dirname(resized_path), exist_ok=True)
+
+            with Image.open(path) as img:
+                img_format = img.format
+                img.thumbnail((width, dimensions[1]), Image.LANCZOS)
+                if img_format == 'JPEG' and img.mode not in ('RGB', 'L'):
+                    img = img.convert('RGB')
+                img.save(tmp_path, img_format)
+
+            os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(tmp_path, resized_path)
+        except (IOError, OSError, ValueError) as e:
+            sickrage.app.log.debug("Unable to resize " + str(path) + ": {}".format(e))
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            return path
+
+        IMAGE_RESIZED.labels(width).inc()
+        return resized_path
+
+    def prune(self):
+        """
+        Removes stored images no cached image links to anymore
+        """
+        with self.lock:
+            for root, __, files in os.walk(self._content_dir()):
+                for name in files:
+                    try:
+                        if os.stat(os.path.join(root, name)).st_nlink == 1:
+                            os.remove(os.path.join(root, name))
+                    except OSError:
+                        continue
 
     def _cache_image_from_file(self, image_path, img_type, indexer_id):
         """
-        Takes the image provided and copies it to the cache folder
+        Takes the image provided and stores it in the cache folder
 
         :param image_path: path to the image we're caching
         :param img_type: BANNER or POSTER or FANART
@@ -201,70 +444,84 @@ class ImageCache(object):
         :return: bool representing success
         """
 
-        # generate the path based on the type & indexer_id
-        if img_type == self.POSTER:
-            dest_path = self.poster_path(indexer_id)
-        elif img_type == self.BANNER:
-            dest_path = self.banner_path(indexer_id)
-        elif img_type == self.FANART:
-            dest_path = self.fanart_path(indexer_id)
-        else:
+        if img_type not in (self.POSTER, self.BANNER, self.FANART):
             sickrage.app.log.error("Invalid cache image type: " + str(img_type))
             return False
 
-        # make sure the cache folder exists before we try copying to it
-        if not os.path.isdir(self._cache_dir()):
-            sickrage.app.log.info("Image cache dir didn't exist, creating it at " + str(self._cache_dir()))
-            os.makedirs(self._cache_dir())
-
-        if not os.path.isdir(self._thumbnails_dir()):
-            sickrage.app.log.info(
-                "Thumbnails cache dir didn't exist, creating it at " + str(self._thumbnails_dir()))
-            os.makedirs(self._thumbnails_dir())
+        dest_path = self.image_path(img_type, indexer_id)
 
         sickrage.app.log.info("Copying from " + image_path + " to " + dest_path)
-        copy_file(image_path, dest_path)
+
+        try:
+            with open(image_path, 'rb') as fh:
+                self.store(fh.read(), dest_path)
+        except (IOError, OSError) as e:
+            sickrage.app.log.warning("Unable to cache image {}: {}".format(image_path, e))
+            return False
 
         return True
 
-    def _cache_image_from_indexer(self, show_obj, img_type, force=False):
+    def image_urls(self, show_obj, img_types):
         """
-        Retrieves an image of the type specified from indexer and saves it to the cache folder
+        Looks up the image URLs of a show with one indexer client, one images request per indexer image kind
 
-        :param show_obj: TVShow object that we want to cache an image for
-        :param img_type: BANNER or POSTER or FANART
-        :return: bool representing success
+        :param show_obj: TVShow object to look up images for
+        :param img_types: image types to look up
+        :return: dict of image type -> URL of the images that were found
         """
+        indexer_api_params = IndexerApi(show_obj.indexer).api_params.copy()
+        indexer_api_params['language'] = show_obj.lang or sickrage.app.config.indexer_default_language
+        if show_obj.dvdorder != 0:
+            indexer_api_params['dvdorder'] = True
 
-        # generate the path based on the type & indexer_id
-        if img_type == self.POSTER:
-            img_type_name = 'poster'
-            dest_path = self.poster_path(show_obj.indexer_id)
-        elif img_type == self.BANNER:
-            img_type_name = 'series'
-            dest_path = self.banner_path(show_obj.indexer_id)
-        elif img_type == self.FANART:
-            img_type_name = 'fanart'
-            dest_path = self.fanart_path(show_obj.indexer_id)
-        elif img_type == self.POSTER_THUMB:
-            img_type_name = 'poster_thumb'
-            dest_path = self.poster_thumb_path(show_obj.indexer_id)
-        elif img_type == self.BANNER_THUMB:
-            img_type_name = 'series_thumb'
-            dest_path = self.banner_thumb_path(show_obj.indexer_id)
-        elif img_type == self.FANART_THUMB:
-            img_type_name = 'fanart_thumb'
-            dest_path = self.fanart_thumb_path(show_obj.indexer_id)
-        else:
-            sickrage.app.log.error("Invalid cache image type: " + str(img_type))
+        try:
+            t = IndexerApi(show_obj.indexer).indexer(**indexer_api_params)
+        except (indexer_error, IOError) as e:
+            sickrage.app.log.warning("{}: Unable to look up show on {}, not downloading images: {}".format(
+                show_obj.indexer_id, IndexerApi(show_obj.indexer).name, e))
+            return {}
+
+        images = {}
+        urls = {}
+
+        for img_type in img_types:
+            key_type, fanart_type, thumb = self.INDEXER_TYPES[img_type]
+
+            if key_type not in images:
+                try:
+                    images[key_type] = t.images(show_obj.indexer_id, key_type=key_type)
+                except (indexer_error, IOError) as e:
+                    sickrage.app.log.debug("{}: Unable to get {} images: {}".format(show_obj.indexer_id, key_type, e))
+                    images[key_type] = []
+
+            try:
+                urls[img_type] = images[key_type][0]['thumbnail' if thumb else 'filename']
+            except (KeyError, IndexError, TypeError):
+                url = GenericMetadata._retrieve_show_images_from_fanart(show_obj, fanart_type, thumb)
+                if url:
+                    urls[img_type] = url
+
+        return urls
+
+    def _download(self, url, dest_path):
+        # downloads still queued when shutting down are dropped
+        if not sickrage.app.started:
             return False
 
-        # retrieve the image from indexer using the generic metadata class
-        metadata_generator = GenericMetadata()
-        img_data = metadata_generator._retrieve_show_image(img_type_name, show_obj)
-        result = metadata_generator._write_image(img_data, dest_path, force)
+        image_data = GenericMetadata.get_show_image(url)
+        if not image_data:
+            sickrage.app.log.debug("Unable to retrieve image to save in %s, skipping" % dest_path)
+            return False
 
-        return result
+        IMAGE_DOWNLOADS.inc()
+
+        try:
+            self.store(image_data, dest_path)
+        except (IOError, OSError) as e:
+            sickrage.app.log.warning("Unable to cache image {}: {}".format(dest_path, e))
+            return False
+
+        return True
 
     def fill_cache(self, show_obj, force=False):
         """
@@ -277,17 +534,9 @@ class ImageCache(object):
         sickrage.app.log.debug("Checking if we need any cache images for show " + str(show_obj.indexer_id))
 
         # check if the images are already cached or not
-        need_images = {self.POSTER: force or not self.has_poster(show_obj.indexer_id),
-                       self.BANNER: force or not self.has_banner(show_obj.indexer_id),
-                       self.POSTER_THUMB: force or not self.has_poster_thumbnail(show_obj.indexer_id),
-                       self.BANNER_THUMB: force or not self.has_banner_thumbnail(show_obj.indexer_id),
-                       self.FANART: force or not self.has_fanart(show_obj.indexer_id)}
-
-        if all([not need_images[self.POSTER],
-                not need_images[self.BANNER],
-                not need_images[self.POSTER_THUMB],
-                not need_images[self.BANNER_THUMB],
-                not need_images[self.FANART]]):
+        need_images = {x: force or not os.path.isfile(self.image_path(x, show_obj.indexer_id)) for x in self.INDEXER_TYPES}
+
+        if not any(need_images.values()):
             sickrage.app.log.debug("No new cache images needed, not retrieving new ones")
             return
 
@@ -314,15 +563,55 @@ class ImageCache(object):
                             sickrage.app.log.debug(
                                 "Found an image in the show dir that doesn't exist in the cache, caching it: " + cur_file_name + ", type " + str(
                                     cur_file_type))
-                            self._cache_image_from_file(cur_file_name, cur_file_type, show_obj.indexer_id)
-                            need_images[cur_file_type] = False
+                            if self._cache_image_from_file(cur_file_name, cur_file_type, show_obj.indexer_id):
+                                need_images[cur_file_type] = False
 
         # download from indexer for missing ones
-        for cur_image_type in [self.POSTER, self.BANNER, self.POSTER_THUMB, self.BANNER_THUMB, self.FANART]:
-            sickrage.app.log.debug(
-                "Seeing if we still need an image of type " + str(cur_image_type) + ": " + str(
-                    need_images[cur_image_type]))
-            if cur_image_type in need_images and need_images[cur_image_type]:
-                self._cache_image_from_indexer(show_obj, cur_image_type, force)
+        urls = self.image_urls(show_obj, [x for x in need_images if need_images[x]])
+        if urls:
+            with self.lock:
+                if not self.download_executor:
+                    ImageCache.download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix='IMAGECACHE')
+
+            wait([self.download_executor.submit(self._download, url, self.image_path(img_type, show_obj.indexer_id))
+                  for img_type, url in urls.items()])
 
         sickrage.app.log.info("Done cache check")
+
+    def queue_fill_cache(self, show_id, force=False):
+        """
+        Fills the cache of a show in the background, a show is only queued once at a time
+
+        :param show_id: ID of the show to cache images for, the show is loaded in the background
+        """
+        with self.lock:
+            if show_id in self.filling:
+                return
+
+            self.filling.add(show_id)
+
+            if not self.fill_executor:
+                ImageCache.fill_executor = ThreadPoolExecutor(max_workers=FILL_WORKERS, thread_name_prefix='IMAGECACHE')
+
+        # the show is loaded in another thread, what the caller's unit of work committed has to be written first
+        if UnitOfWork.current():
+            UnitOfWork.current().write()
+
+        @MainDB.with_session
+        def task(session=None):
+            from sickrage.core.tv.show.helpers import find_show
+
+            try:
+                if sickrage.app.started:
+                    show_obj = find_show(show_id, session=session)
+                    if not show_obj:
+                        sickrage.app.log.warning("Unable to fill the image cache of show {}: show not found".format(show_id))
+                        return
+                    self.fill_cache(show_obj, force)
+            except Exception as e:
+                sickrage.app.log.warning("Unable to fill the image cache of show {}: {!r}".format(show_id, e))
+            finally:
+                with self.lock:
+                    self.filling.discard(show_id)
+
+        return self.fill_executor.submit(task)
@@ -29,6 +29,7 @@ from sqlalchemy import orm
 from sqlalchemy.exc import IntegrityError
 
 import sickrage
+from sickrage.core import metrics
 from sickrage.core.api.cache import ProviderCacheAPI
 from sickrage.core.common import Quality
 from sickrage.core.databases.cache import CacheDB
@@ -38,6 +39,10 @@ from sickrage.core.nameparser import InvalidNameException, NameParser, InvalidSh
 from sickrage.core.tv.show.helpers import find_show
 from sickrage.core.websession import WebSession
 
+CACHE_UPDATE_SECONDS = metrics.histogram('sickrage_cache_update_seconds', 'Time spent updating a provider cache', ['provider'])
+CACHE_UPDATE_ITEMS = metrics.counter('sickrage_cache_update_items', 'RSS items parsed by provider cache updates', ['provider'])
+CACHE_UPDATE_ERRORS = metrics.counter('sickrage_cache_update_errors', 'Provider cache updates that failed', ['provider'])
+
 
 class TVCache(object):
     def __init__(self, provider, **kwargs):
@@ -74,21 +79,26 @@ class TVCache(object):
         # check if we should update
         if self.should_update() or force:
             try:
-                data = self._get_rss_data()
-                if not self._check_auth(data):
-                    return False
+                with CACHE_UPDATE_SECONDS.labels(self.providerID).time():
+                    data = self._get_rss_data()
+                    if not self._check_auth(data):
+                        return False
+
+                    # clear cache
+                    self.clear()
 
-                # clear cache
-                self.clear()
+                    # set updated
+                    self.last_update = datetime.datetime.today()
 
-                # set updated
-                self.last_update = datetime.datetime.today()
+                    [self._parseItem(item) for item in data['entries']]
 
-                [self._parseItem(item) for item in data['entries']]
+                CACHE_UPDATE_ITEMS.labels(self.providerID).inc(len(data['entries']))
             except AuthException as e:
+                CACHE_UPDATE_ERRORS.labels(self.providerID).inc()
                 sickrage.app.log.warning("Authentication error: {}".format(e))
                 return False
             except Exception as e:
+                CACHE_UPDATE_ERRORS.labels(self.providerID).inc()
                 sickrage.app.log.debug(
                     "Error while searching {}, skipping: {}".format(self.provider.name, repr(e)))
                 return False
@@ -239,7 +249,7 @@ class TVCache(object):
                     try:
                         session.add(CacheDB.Provider(**dbData))
                         session.commit()
-                        sickrage.app.log.debug("SEARCH RESULT:[{}] ADDED TO CACHE!".format(name))
+                        sickrage.app.log.debug("SEARCH RESULT:[%s] ADDED TO CACHE!", name)
                     except IntegrityError:
                         session.rollback()
                         pass
@@ -296,7 +306,7 @@ class TVCache(object):
 
                 # skip if provider is anime only and show is not anime
                 if self.provider.anime_only and not show_object.is_anime:
-                    sickrage.app.log.debug("" + str(show_object.name) + " is not an anime, skiping")
+                    sickrage.app.log.debug("%s is not an anime, skiping", show_object.name)
                     continue
 
                 # get season and ep data (ignoring multi-eps for now)
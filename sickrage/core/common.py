@@ -21,7 +21,7 @@
 import operator
 import re
 from collections import UserDict
-from functools import reduce
+from functools import reduce, lru_cache
 
 import pathlib
 
@@ -76,6 +76,42 @@ multiEpStrings = {NAMING_REPEAT: _("Repeat"),
                   NAMING_LIMITED_EXTEND_E_PREFIXED: _("Extend (Limited, E-prefixed)")}
 
 
+# features of scene release names, each pattern is compiled once and searched once per name
+SCENE_FEATURES = tuple((x, re.compile(y, re.I)) for x, y in (
+    ('sd_source', r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip"),
+    ('sd_codec', r"xvid|divx|[xh].?26[45]"),
+    ('hd_scan', r"(720|1080)[pi]"),
+    ('1080_scan', r"1080[pi]"),
+    ('hrws', r"hr.ws.pdtv.[xh].?26[45]"),
+    ('dvd', r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray"),
+    ('720p', r"720p"),
+    ('1080p', r"1080p"),
+    ('2160p', r"2160p"),
+    ('4320p', r"4320p"),
+    ('720p_1080i', r"720p|1080i"),
+    ('1080_hdtv', r"1080[pi].hdtv"),
+    ('hdtv', r"hd.?tv"),
+    ('web', r"\bweb\b|web.?dl|web(rip|mux|hd)"),
+    ('itunes', r"itunes"),
+    ('bluray', r"blue?-?ray|hddvd|b[rd](rip|mux)"),
+    ('x26x', r"[xh].?26[45]"),
+    ('h26x', r"h.?26[45]"),
+    ('hevc', r"hevc"),
+    ('mpeg2', r"mpeg-?2"),
+))
+
+SCENE_ANIME_FEATURES = tuple((x, re.compile(y, re.I)) for x, y in (
+    ('dvd', r"dvd"),
+    ('bluray', r"BD|blue?-?ray"),
+    ('sd', r"360p|480p|848x480|XviD"),
+    ('720p', r"720p|1280x720|960x720"),
+    ('1080p', r"1080p|1920x1080"),
+))
+
+# (anime, features) -> quality
+SCENE_QUALITY_TABLE = {}
+
+
 # pylint: disable=W0232
 class Quality(object):
     NONE = 0  # 0
@@ -255,84 +291,82 @@ class Quality(object):
         :return: Quality prefix
         """
 
-        # pylint: disable=R0912
-
-        ret = Quality.UNKNOWN
         if not name:
-            return ret
+            return Quality.UNKNOWN
 
-        name = pathlib.Path(name).name
+        return Quality._scene_quality(pathlib.Path(name).name.lower(), bool(anime))
 
-        check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+    @staticmethod
+    @lru_cache(maxsize=10000)
+    def _scene_quality(name, anime):
+        features = frozenset(x for x, regex in (SCENE_ANIME_FEATURES if anime else SCENE_FEATURES) if regex.search(name))
+
+        key = (anime, features)
+        if key not in SCENE_QUALITY_TABLE:
+            SCENE_QUALITY_TABLE[key] = Quality.scene_quality_from_features(features, anime)
+        return SCENE_QUALITY_TABLE[key]
+
+    @staticmethod
+    def scene_quality_from_features(f, anime=False):
+        """
+        Map the features found in a scene name by SCENE_FEATURES/SCENE_ANIME_FEATURES to a quality
+
+        :param f: set of feature names
+        :param anime: Boolean to indicate if the features are from SCENE_ANIME_FEATURES
+        :return: Quality prefix
+        """
+
+        # pylint: disable=R0912
 
         if anime:
-            dvdOptions = check_name([r"dvd", r"dvdrip"], any)
-            blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
-            sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
-            hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
-            fullHD = check_name([r"1080p", r"1920x1080"], any)
-
-            if sdOptions and not blueRayOptions and not dvdOptions:
-                ret = Quality.SDTV
-            elif dvdOptions:
-                ret = Quality.SDDVD
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDTV
-            elif fullHD and not blueRayOptions and not hdOptions:
-                ret = Quality.FULLHDTV
-            elif hdOptions and not blueRayOptions and not fullHD:
-                ret = Quality.HDWEBDL
-            elif blueRayOptions and hdOptions and not fullHD:
-                ret = Quality.HDBLURAY
-            elif blueRayOptions and fullHD and not hdOptions:
-                ret = Quality.FULLHDBLURAY
-
-            return ret
-
-        if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"], all)
-                and not check_name([r"(720|1080)[pi]"], all)
-                and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDTV
-        elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
-              and not check_name([r"(720|1080)[pi]"], all)
-              and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
-            ret = Quality.SDDVD
-        elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
-              or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
-            ret = Quality.HDTV
-        elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
-              or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
-            ret = Quality.RAWHDTV
-        elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
-              or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDTV
-        elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.HDWEBDL
-        elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.FULLHDWEBDL
-        elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.HDBLURAY
-        elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.FULLHDBLURAY
-        elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_TV
-        elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_TV
-        elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_4K_WEBDL
-        elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
-              or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
-            ret = Quality.UHD_8K_WEBDL
-        elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_4K_BLURAY
-        elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
-            ret = Quality.UHD_8K_BLURAY
-
-        return ret
+            if 'sd' in f and 'bluray' not in f and 'dvd' not in f:
+                return Quality.SDTV
+            elif 'dvd' in f:
+                return Quality.SDDVD
+            elif '720p' in f and 'bluray' not in f and '1080p' not in f:
+                return Quality.HDTV
+            elif '1080p' in f and 'bluray' not in f and '720p' not in f:
+                return Quality.FULLHDTV
+            elif 'bluray' in f and '720p' in f and '1080p' not in f:
+                return Quality.HDBLURAY
+            elif 'bluray' in f and '1080p' in f and '720p' not in f:
+                return Quality.FULLHDBLURAY
+            return Quality.UNKNOWN
+
+        if {'sd_source', 'sd_codec'} <= f and 'hd_scan' not in f and 'hrws' not in f:
+            return Quality.SDTV
+        elif {'dvd', 'sd_codec'} <= f and 'hd_scan' not in f and 'hrws' not in f:
+            return Quality.SDDVD
+        elif ({'720p', 'hdtv', 'x26x'} <= f
+              or {'720p', 'hevc', 'x26x'} <= f
+              or 'hrws' in f and '1080_scan' not in f):
+            return Quality.HDTV
+        elif {'720p_1080i', 'hdtv', 'mpeg2'} <= f or {'1080_hdtv', 'h26x'} <= f:
+            return Quality.RAWHDTV
+        elif {'1080p', 'hdtv', 'x26x'} <= f or {'1080p', 'hevc', 'x26x'} <= f:
+            return Quality.FULLHDTV
+        elif {'720p', 'web'} <= f or {'720p', 'itunes', 'x26x'} <= f:
+            return Quality.HDWEBDL
+        elif {'1080p', 'web'} <= f or {'1080p', 'itunes', 'x26x'} <= f:
+            return Quality.FULLHDWEBDL
+        elif {'720p', 'bluray', 'x26x'} <= f:
+            return Quality.HDBLURAY
+        elif {'1080p', 'bluray', 'x26x'} <= f:
+            return Quality.FULLHDBLURAY
+        elif {'2160p', 'hdtv', 'x26x'} <= f:
+            return Quality.UHD_4K_TV
+        elif {'4320p', 'hdtv', 'x26x'} <= f:
+            return Quality.UHD_8K_TV
+        elif {'2160p', 'web'} <= f or {'2160p', 'itunes', 'x26x'} <= f:
+            return Quality.UHD_4K_WEBDL
+        elif {'4320p', 'web'} <= f or {'4320p', 'itunes', 'x26x'} <= f:
+            return Quality.UHD_8K_WEBDL
+        elif {'2160p', 'bluray', 'x26x'} <= f:
+            return Quality.UHD_4K_BLURAY
+        elif {'4320p', 'bluray', 'x26x'} <= f:
+            return Quality.UHD_8K_BLURAY
+
+        return Quality.UNKNOWN
 
     @staticmethod
     def composite_status(status, quality):
@@ -66,6 +66,7 @@ class Config(object):
         self.version_notify = True
         self.auto_update = True
         self.notify_on_update = True
+        self.library_update_window = 60
         self.notify_on_login = False
         self.pip3_path = ""
         self.git_reset = True
@@ -745,6 +746,7 @@ class Config(object):
                 'trash_rotate_logs': False,
                 'airdate_episodes': False,
                 'notify_on_update': True,
+                'library_update_window': 60,
                 'git_autoissues': False,
                 'backlog_days': 7,
                 'root_dirs': '',
@@ -1444,6 +1446,7 @@ class Config(object):
         self.version_notify = self.check_setting_bool('General', 'version_notify')
         self.auto_update = self.check_setting_bool('General', 'auto_update')
         self.notify_on_update = self.check_setting_bool('General', 'notify_on_update')
+        self.library_update_window = self.check_setting_int('General', 'library_update_window')
         self.notify_on_login = self.check_setting_bool('General', 'notify_on_login')
         self.flatten_folders_default = self.check_setting_bool('General', 'flatten_folders_default')
         self.indexer_default = self.check_setting_int('General', 'indexer_default')
@@ -1958,6 +1961,7 @@ class Config(object):
                 'version_notify': int(self.version_notify),
                 'auto_update': int(self.auto_update),
                 'notify_on_update': int(self.notify_on_update),
+                'library_update_window': int(self.library_update_window),
                 'notify_on_login': int(self.notify_on_login),
                 'naming_strip_year': int(self.naming_strip_year),
                 'naming_pattern': self.naming_pattern,
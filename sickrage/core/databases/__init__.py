@@ -19,23 +19,32 @@ import datetime
 import errno
 import os
 import pickle
+import random
 import shutil
 import sqlite3
+import threading
+import time
+import weakref
 from collections import OrderedDict
 from sqlite3 import OperationalError
-from time import sleep
 
 import sqlalchemy
 from migrate import DatabaseAlreadyControlledError, DatabaseNotControlledError
 from migrate.versioning import api
-from sqlalchemy import create_engine, event, inspect
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, mapper
 from sqlalchemy.pool import QueuePool
 
 import sickrage
+from sickrage.core import metrics
+from sickrage.core.common import Quality
 from sickrage.core.helpers import backup_versioned_file
 
+COMMIT_SECONDS = metrics.histogram('sickrage_db_commit_seconds', 'Time spent committing database sessions', ['database'])
+COMMIT_RETRIES = metrics.counter('sickrage_db_commit_retries', 'Database commits retried because the database was locked', ['database'])
+LOCK_WAIT_SECONDS = metrics.histogram('sickrage_db_lock_wait_seconds', 'Time spent waiting for the database write lock', ['database'])
+
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
@@ -56,6 +65,12 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.close()
 
 
+def set_sqlite_query_only(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA query_only=ON;')
+    cursor.close()
+
+
 @event.listens_for(mapper, "init")
 def instant_defaults_listener(target, args, kwargs):
     for key, column in inspect(target.__class__).columns.items():
@@ -66,18 +81,244 @@ def instant_defaults_listener(target, args, kwargs):
                 setattr(target, key, column.default.arg)
 
 
+class BatchCursor(sqlite3.Cursor):
+    """Cursor of a :class:`BatchConnection`, a deferred commit isn't written while a cursor may still fetch rows"""
+
+    def execute(self, *args):
+        return self._track(super(BatchCursor, self).execute, *args)
+
+    def executemany(self, *args):
+        return self._track(super(BatchCursor, self).executemany, *args)
+
+    def _track(self, method, *args):
+        connection = self.connection
+        with connection.lock:
+            began = not connection.in_transaction
+            try:
+                return method(*args)
+            finally:
+                connection.cursors.add(self)
+                if began and connection.in_transaction:
+                    connection.started = time.monotonic()
+
+    def close(self):
+        self.connection.cursors.discard(self)
+        super(BatchCursor, self).close()
+
+
+class BatchConnection(sqlite3.Connection):
+    """
+    :class:`sqlite3.Connection` of the main and cache databases. While a unit of work uses the connection, commits
+    of a write transaction younger than ``max_age`` seconds are deferred, a savepoint marks them so a rollback only
+    undoes what was written since. The transaction holds the database write lock, a timer writes it once it is
+    ``max_age`` old and the unit's thread isn't in the middle of using the connection, otherwise the next commit does.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(BatchConnection, self).__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        self.cursors = weakref.WeakSet()
+        self.unit = None
+        self.started = None
+        self.deferred = False
+        self.changes = 0
+        self.timer = None
+
+    def cursor(self, factory=BatchCursor):
+        return super(BatchConnection, self).cursor(factory)
+
+    def _execute(self, sql):
+        cursor = sqlite3.Cursor(self)
+        try:
+            cursor.execute(sql)
+        finally:
+            cursor.close()
+
+    def commit(self):
+        with self.lock:
+            unit = self.unit
+            if unit is None or not unit.active or not self.in_transaction or self.started is None \
+                    or time.monotonic() - self.started >= unit.max_age:
+                return self.write()
+
+            if self.deferred:
+                self._execute('RELEASE SAVEPOINT sr_commit')
+            self._execute('SAVEPOINT sr_commit')
+
+            self.deferred = True
+            self.changes = self.total_changes
+            if self.timer is None:
+                self._schedule(self.started + unit.max_age - time.monotonic())
+
+    def rollback(self):
+        with self.lock:
+            if self.deferred:
+                # only what was written since the last commit
+                return self._execute('ROLLBACK TO SAVEPOINT sr_commit')
+
+            super(BatchConnection, self).rollback()
+            self.started = None
+
+    def write(self):
+        """
+        Commits the write transaction and the commits deferred in it
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            if self.in_transaction and self.unit is not None:
+                self.unit.commits += 1
+
+            super(BatchConnection, self).commit()
+            self.started = None
+            self.deferred = False
+
+    def _schedule(self, delay):
+        self.timer = threading.Timer(max(delay, 0), self._expire)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def write_deferred(self):
+        """
+        Commits the deferred commits unless the unit's thread is reading or has written since the last commit
+
+        :return: True if no deferred commits are left
+        """
+        with self.lock:
+            if not self.deferred:
+                return True
+
+            if self.cursors or self.total_changes != self.changes:
+                return False
+
+            self.write()
+            return True
+
+    def _expire(self):
+        with self.lock:
+            self.timer = None
+            if not self.write_deferred():
+                # check again shortly
+                self._schedule(0.1)
+
+
+class UnitOfWork(object):
+    """
+    Batches the database writes of a queue item. While a unit is active, the sessions a database's session factory
+    hands out in the unit's thread are one session, on SQLite bound to a :class:`BatchConnection` whose commits of a
+    young write transaction are deferred. The write transaction is written once it is ``max_age`` seconds old, idle or
+    not, and when the unit ends, even if the item failed, what wasn't committed is rolled back like a session closed
+    without a commit would be.
+
+    Counts the commits and the seconds spent waiting for the database write lock in the unit's thread.
+    """
+
+    local = threading.local()
+
+    def __init__(self, max_age=1.0):
+        self.max_age = max_age
+        self.sessions = {}
+        self.connections = []
+        self.commits = 0
+        self.lock_wait = 0.0
+        self.active = False
+
+    @classmethod
+    def current(cls):
+        """
+        :return: unit of work of the current thread or None
+        """
+        return getattr(cls.local, 'unit', None)
+
+    def session(self, factory, **kwargs):
+        """
+        :param factory: session factory
+        :return: session of the unit for the session factory
+        """
+        if factory not in self.sessions:
+            # objects stay loaded across the commits of the unit like they do in its one session
+            kwargs['expire_on_commit'] = False
+
+            bind = kwargs.get('bind', factory.kw.get('bind'))
+            if isinstance(bind, Engine) and bind.dialect.name == 'sqlite':
+                connection = bind.connect()
+                if isinstance(connection.connection.connection, BatchConnection):
+                    connection.connection.connection.unit = self
+                    kwargs['bind'] = connection
+                    self.connections.append(connection)
+                else:
+                    connection.close()
+
+            self.sessions[factory] = sessionmaker.__call__(factory, **kwargs)
+            self.sessions[factory].unit = self
+        return self.sessions[factory]
+
+    def write(self):
+        """
+        Commits the deferred commits of the unit, for work handed to other threads that reads what the unit committed
+        """
+        for connection in self.connections:
+            connection.connection.connection.write_deferred()
+
+    def __enter__(self):
+        self.active = True
+        UnitOfWork.local.unit = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.active = False
+
+        try:
+            for session in self.sessions.values():
+                try:
+                    # changes after the last commit of the unit
+                    session.rollback()
+                finally:
+                    session.close()
+
+            for connection in self.connections:
+                try:
+                    connection.connection.connection.write()
+                finally:
+                    connection.connection.connection.unit = None
+                    connection.close()
+        finally:
+            UnitOfWork.local.unit = None
+
+
+class SessionMaker(sessionmaker):
+    """:class:`sqlalchemy.orm.sessionmaker` handing out the session of the current thread's unit of work"""
+
+    def __call__(self, **local_kw):
+        unit = UnitOfWork.current()
+        if unit is None or not unit.active:
+            return super(SessionMaker, self).__call__(**local_kw)
+        return unit.session(self, **local_kw)
+
+
 class ContextSession(sqlalchemy.orm.Session):
     """:class:`sqlalchemy.orm.Session` which can be used as context manager"""
 
     def __init__(self, *args, **kwargs):
         super(ContextSession, self).__init__(*args, **kwargs)
-        self.lockfile = self.bind.url.database + '-lock'
+        engine = getattr(self.bind, 'engine', self.bind)
+        self.lockfile = engine.url.database + '-lock'
+        self.database = os.path.basename(engine.url.database or '')
         self.max_attempts = 5
+        self.retry_delay = 0.1
+        self.unit = None
+        self.write_started = None
 
     @property
     def has_lock(self):
         return os.path.exists(self.lockfile)
 
+    @property
+    def batching(self):
+        return self.unit is not None and self.unit.active
+
     def write_lock(self):
         if self.has_lock:
             return
@@ -95,34 +336,93 @@ class ContextSession(sqlalchemy.orm.Session):
             if e.errno != errno.ENOENT:
                 raise
 
+    def begin_write(self):
+        """
+        Starts a write transaction before the first write, on SQLite by taking the write lock. A locked database is
+        retried a bounded number of times with a growing, jittered delay, unlike a failed flush this keeps the pending
+        changes.
+        """
+        if self.write_started is not None:
+            return
+
+        connection = self.connection()
+        if self.bind.dialect.name != 'sqlite' or connection.connection.in_transaction:
+            self.write_started = time.monotonic()
+            return
+
+        start = time.perf_counter()
+
+        try:
+            for attempt in range(self.max_attempts + 1):
+                try:
+                    connection.execute(text('BEGIN IMMEDIATE'))
+                    break
+                except sqlalchemy.exc.OperationalError as e:
+                    if attempt == self.max_attempts or 'locked' not in str(e.orig):
+                        raise
+
+                delay = self.retry_delay * 2 ** attempt * random.uniform(0.5, 1.5)
+                COMMIT_RETRIES.labels(self.database).inc()
+                sickrage.app.log.debug('Database is locked, retrying in {:.2f}s, attempt {}'.format(delay, attempt + 1))
+                time.sleep(delay)
+        finally:
+            lock_wait = time.perf_counter() - start
+            LOCK_WAIT_SECONDS.labels(self.database).observe(lock_wait)
+            if UnitOfWork.current():
+                UnitOfWork.current().lock_wait += lock_wait
+
+        self.write_started = time.monotonic()
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            self.begin_write()
+        super(ContextSession, self).flush(objects)
+
+    def commit(self):
+        with COMMIT_SECONDS.labels(self.database).time():
+            super(ContextSession, self).commit()
+
+        # commits of SQLite are counted by the connection of the unit, see BatchConnection
+        if self.write_started is not None and self.bind.dialect.name != 'sqlite' and UnitOfWork.current():
+            UnitOfWork.current().commits += 1
+        self.write_started = None
+
+    def rollback(self):
+        super(ContextSession, self).rollback()
+        self.write_started = None
+
+    def close(self):
+        # the session of a unit of work is closed when the unit ends
+        if self.batching:
+            return
+        super(ContextSession, self).close()
+        self.write_started = None
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        attempt = 0
-
-        while attempt <= self.max_attempts:
-            try:
-                self.commit()
-                break
-            except OperationalError as e:
-                self.rollback()
-                if not attempt < self.max_attempts:
-                    raise
-                sleep(1)
-            except Exception as e:
-                self.rollback()
-                raise
+        try:
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            self.close()
 
-            attempt += 1
 
-            sickrage.app.log.debug('Retrying database commit, attempt {}'.format(attempt))
+class ReadSession(ContextSession):
+    """:class:`ContextSession` of a read-only session factory, refuses to write changes so none end up on a replica"""
 
-        self.close()
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise sqlalchemy.exc.InvalidRequestError('Read-only {} database session can not write changes'.format(self.database))
+        super(ReadSession, self).flush(objects)
 
 
 class SRDatabase(object):
-    def __init__(self, name, db_type='sqlite', db_prefix='sickrage', db_host='localhost', db_port='3306', db_username='sickrage', db_password='sickrage'):
+    def __init__(self, name, db_type='sqlite', db_prefix='sickrage', db_host='localhost', db_port='3306', db_username='sickrage', db_password='sickrage',
+                 db_replica_host=None, db_replica_port=None):
         self.name = name
         self.db_type = db_type
         self.db_prefix = db_prefix
@@ -130,6 +430,8 @@ class SRDatabase(object):
         self.db_port = db_port
         self.db_username = db_username
         self.db_password = db_password
+        self.db_replica_host = db_replica_host or db_host
+        self.db_replica_port = db_replica_port or db_port
 
         self.tables = {}
 
@@ -148,7 +450,7 @@ class SRDatabase(object):
     def engine(self):
         if self.db_type == 'sqlite':
             return create_engine('sqlite:///{}'.format(self.db_path), echo=False, pool_size=200, poolclass=QueuePool,
-                                 connect_args={'check_same_thread': False, 'timeout': 10})
+                                 connect_args={'check_same_thread': False, 'timeout': 10, 'factory': BatchConnection})
         elif self.db_type == 'mysql':
             mysql_engine = create_engine('mysql+pymysql://{}:{}@{}:{}/'.format(self.db_username, self.db_password, self.db_host, self.db_port), echo=False)
             mysql_engine.execute("CREATE DATABASE IF NOT EXISTS {}_{}".format(self.db_prefix, self.name))
@@ -156,10 +458,29 @@ class SRDatabase(object):
                 'mysql+pymysql://{}:{}@{}:{}/{}_{}'.format(self.db_username, self.db_password, self.db_host, self.db_port, self.db_prefix, self.name),
                 echo=False)
 
+    @property
+    def read_engine(self):
+        """
+        Engine of the read-only sessions, on SQLite connections to the database file that can't write, on MySQL
+        connections to the replica
+        """
+        if self.db_type == 'sqlite':
+            engine = create_engine('sqlite:///{}'.format(self.db_path), echo=False, pool_size=200, poolclass=QueuePool,
+                                   connect_args={'check_same_thread': False, 'timeout': 10})
+            event.listen(engine, 'connect', set_sqlite_query_only)
+            return engine
+        elif self.db_type == 'mysql':
+            return create_engine('mysql+pymysql://{}:{}@{}:{}/{}_{}'.format(self.db_username, self.db_password, self.db_replica_host, self.db_replica_port,
+                                                                            self.db_prefix, self.name), echo=False)
+
     @property
     def session(self):
         return self.session
 
+    @property
+    def read_session(self):
+        return self.read_session
+
     @property
     def version(self):
         try:
@@ -167,6 +488,26 @@ class SRDatabase(object):
         except DatabaseNotControlledError:
             return 0
 
+    def wal_status(self):
+        """
+        Passive checkpoint of the write-ahead log, checkpoints can't write back frames that readers still need
+
+        :return: size of the write-ahead log in bytes and the number of its frames not written back to the database,
+                 None for databases that aren't SQLite
+        """
+        if self.db_type != 'sqlite':
+            return None
+
+        try:
+            wal_size = os.path.getsize(self.db_path + '-wal')
+        except OSError:
+            wal_size = 0
+
+        with self.session() as session:
+            __, log_frames, checkpointed_frames = session.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+
+        return wal_size, max(log_frames - checkpointed_frames, 0)
+
     def integrity_check(self):
         if self.db_type == 'sqlite':
             if self.session().scalar("PRAGMA integrity_check") != "ok":
@@ -252,6 +593,9 @@ class SRDatabase(object):
                         elif column == 'subtitles_lastsearch':
                             row[column] = 0
 
+                if table == 'tv_episodes' and row.get('status') is not None:
+                    row['ep_status'], row['ep_quality'] = Quality.split_composite_status(int(row['status']))
+
                 migrate_tables[table] += [row]
 
             for table, rows in migrate_tables.items():
@@ -17,11 +17,10 @@
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 import functools
 
-from sqlalchemy import Column, Integer, Text, String
+from sqlalchemy import Column, Integer, Text, String, BigInteger
 from sqlalchemy.ext.declarative import as_declarative
-from sqlalchemy.orm import sessionmaker
 
-from sickrage.core.databases import SRDatabase, ContextSession
+from sickrage.core.databases import SRDatabase, ContextSession, SessionMaker, ReadSession
 
 
 @as_declarative()
@@ -37,11 +36,13 @@ class CacheDBBase(object):
 class CacheDB(SRDatabase):
     db_version = 3
 
-    session = sessionmaker(class_=ContextSession)
+    session = SessionMaker(class_=ContextSession)
+    read_session = SessionMaker(class_=ReadSession)
 
-    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password):
-        super(CacheDB, self).__init__('cache', db_type, db_prefix, db_host, db_port, db_username, db_password)
+    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password, db_replica_host=None, db_replica_port=None):
+        super(CacheDB, self).__init__('cache', db_type, db_prefix, db_host, db_port, db_username, db_password, db_replica_host, db_replica_port)
         CacheDB.session.configure(bind=self.engine)
+        CacheDB.read_session.configure(bind=self.read_engine)
         CacheDBBase.metadata.create_all(self.engine)
         for model in CacheDBBase._decl_class_registry.values():
             if hasattr(model, '__tablename__'):
@@ -66,7 +67,11 @@ class CacheDB(SRDatabase):
             return decorator(args[0])
         else:
             # Arguments were specified, turn them into arguments for Session creation e.g. @with_session(autocommit=True)
-            _Session = functools.partial(CacheDB.session, *args, **kwargs)
+            # except read_only, @with_session(read_only=True) creates sessions of the read-only session factory
+            if kwargs.pop('read_only', False):
+                _Session = functools.partial(CacheDB.read_session, *args, **dict({'expire_on_commit': False}, **kwargs))
+            else:
+                _Session = functools.partial(CacheDB.session, *args, **kwargs)
             return decorator
 
     def cleanup(self):
@@ -159,3 +164,32 @@ class CacheDB(SRDatabase):
         name = Column(Text)
         showname = Column(Text)
         img = Column(Text)
+
+    class DirSnapshot(CacheDBBase):
+        __tablename__ = 'dir_snapshots'
+
+        id = Column(Integer, primary_key=True)
+        showid = Column(Integer, index=True)
+        path = Column(Text)
+        size = Column(BigInteger)
+        mtime = Column(BigInteger)
+        inode = Column(BigInteger)
+
+    class SubtitleInventory(CacheDBBase):
+        __tablename__ = 'subtitle_inventory'
+
+        id = Column(Integer, primary_key=True)
+        showid = Column(Integer, index=True)
+        path = Column(Text)
+        signature = Column(Text)
+        languages = Column(Text)
+
+    class SubtitleMiss(CacheDBBase):
+        __tablename__ = 'subtitle_misses'
+
+        showid = Column(Integer, index=True, primary_key=True)
+        season = Column(Integer, primary_key=True)
+        episode = Column(Integer, primary_key=True)
+        languages = Column(Text)
+        misses = Column(Integer, default=0)
+        next_search = Column(Integer)
@@ -19,9 +19,8 @@ import functools
 
 from sqlalchemy import Column, Integer, Text, ForeignKeyConstraint, String, DateTime
 from sqlalchemy.ext.declarative import as_declarative
-from sqlalchemy.orm import sessionmaker, scoped_session
 
-from sickrage.core.databases import SRDatabase, ContextSession
+from sickrage.core.databases import SRDatabase, ContextSession, SessionMaker, ReadSession
 
 
 @as_declarative()
@@ -37,13 +36,15 @@ class MainDBBase(object):
 
 
 class MainDB(SRDatabase):
-    db_version = 10
+    db_version = 11
 
-    session = sessionmaker(class_=ContextSession)
+    session = SessionMaker(class_=ContextSession)
+    read_session = SessionMaker(class_=ReadSession)
 
-    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password):
-        super(MainDB, self).__init__('main', db_type, db_prefix, db_host, db_port, db_username, db_password)
+    def __init__(self, db_type, db_prefix, db_host, db_port, db_username, db_password, db_replica_host=None, db_replica_port=None):
+        super(MainDB, self).__init__('main', db_type, db_prefix, db_host, db_port, db_username, db_password, db_replica_host, db_replica_port)
         MainDB.session.configure(bind=self.engine)
+        MainDB.read_session.configure(bind=self.read_engine)
         MainDBBase.metadata.create_all(self.engine)
         for model in MainDBBase._decl_class_registry.values():
             if hasattr(model, '__tablename__'):
@@ -68,7 +69,11 @@ class MainDB(SRDatabase):
             return decorator(args[0])
         else:
             # Arguments were specified, turn them into arguments for Session creation e.g. @with_session(autocommit=True)
-            _Session = functools.partial(MainDB.session, *args, **kwargs)
+            # except read_only, @with_session(read_only=True) creates sessions of the read-only session factory
+            if kwargs.pop('read_only', False):
+                _Session = functools.partial(MainDB.read_session, *args, **dict({'expire_on_commit': False}, **kwargs))
+            else:
+                _Session = functools.partial(MainDB.session, *args, **kwargs)
             return decorator
 
     class IMDbInfo(MainDBBase):
@@ -0,0 +1,79 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+from sqlalchemy import *
+
+UNKNOWN = -1
+UNKNOWN_QUALITY = 1 << 15
+QUALITIES = [0] + [1 << x for x in range(16)]
+INDEXES = ['ix_tv_episodes_ep_status', 'ix_tv_episodes_ep_quality', 'idx_showid_ep_status_ep_quality', 'idx_ep_status_airdate']
+
+
+def split_composite_status(status):
+    if status is None or status == UNKNOWN:
+        return UNKNOWN, UNKNOWN_QUALITY
+
+    for q in sorted(QUALITIES, reverse=True):
+        if status > q * 100:
+            return status - q * 100, q
+
+    return status, 0
+
+
+def upgrade(migrate_engine):
+    meta = MetaData(bind=migrate_engine)
+    tv_episodes = Table('tv_episodes', meta, autoload=True)
+
+    if not hasattr(tv_episodes.c, 'ep_status'):
+        ep_status = Column('ep_status', Integer, default=UNKNOWN)
+        ep_status.create(tv_episodes)
+
+    if not hasattr(tv_episodes.c, 'ep_quality'):
+        ep_quality = Column('ep_quality', Integer, default=UNKNOWN_QUALITY)
+        ep_quality.create(tv_episodes)
+
+    # one update per distinct composite status instead of one per episode
+    with migrate_engine.begin() as conn:
+        for row in conn.execute(select([tv_episodes.c.status]).distinct()).fetchall():
+            ep_status, ep_quality = split_composite_status(row.status)
+            where = tv_episodes.c.status.is_(None) if row.status is None else tv_episodes.c.status == row.status
+            conn.execute(tv_episodes.update().where(where).values(ep_status=ep_status, ep_quality=ep_quality))
+
+    Index('ix_tv_episodes_ep_status', tv_episodes.c.ep_status).create(migrate_engine)
+    Index('ix_tv_episodes_ep_quality', tv_episodes.c.ep_quality).create(migrate_engine)
+    Index('idx_showid_ep_status_ep_quality', tv_episodes.c.showid, tv_episodes.c.ep_status, tv_episodes.c.ep_quality).create(migrate_engine)
+    Index('idx_ep_status_airdate', tv_episodes.c.ep_status, tv_episodes.c.airdate).create(migrate_engine)
+
+
+def downgrade(migrate_engine):
+    meta = MetaData(bind=migrate_engine)
+    tv_episodes = Table('tv_episodes', meta, autoload=True)
+
+    for index in list(tv_episodes.indexes):
+        if index.name in INDEXES:
+            index.drop()
+            tv_episodes.indexes.discard(index)
+
+    if hasattr(tv_episodes.c, 'ep_status'):
+        tv_episodes.c.ep_status.drop()
+
+    if hasattr(tv_episodes.c, 'ep_quality'):
+        tv_episodes.c.ep_quality.drop()
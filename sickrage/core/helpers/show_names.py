@@ -24,7 +24,7 @@ import datetime
 import fnmatch
 import os
 import re
-from functools import partial
+from functools import partial, lru_cache
 
 import sickrage
 from sickrage.core import common
@@ -44,6 +44,24 @@ if hasattr('General', 'ignored_subs_list') and sickrage.app.config.ignored_subs_
     resultFilters.append("(" + sickrage.app.config.ignored_subs_list.replace(",", "|") + ")sub(bed|ed|s)?")
 
 
+@lru_cache(maxsize=1000)
+def compile_words(words):
+    """
+    Compile a list of words into one case-insensitive alternation, matchers are cached per list of
+    words so they are only rebuilt when a show's or the global word lists change.
+
+    words: tuple of words
+
+    Returns: tuple of compiled regex or None for an empty list, and dict of lowercase word -> word
+    """
+    words = [x.strip() for x in words if x.strip()]
+    if not words:
+        return None, {}
+
+    regex = re.compile(r'(?:^|[\W_])(%s)(?:$|[\W_])' % '|'.join(map(re.escape, words)), re.I)
+    return regex, dict((x.lower(), x) for x in reversed(words))
+
+
 def contains_at_least_one_word(name, words):
     """
     Filters out results based on filter_words
@@ -60,10 +78,11 @@ def contains_at_least_one_word(name, words):
     """
     if isinstance(words, str):
         words = words.split(',')
-    items = [(re.compile('(^|[\W_])%s($|[\W_])' % re.escape(word.strip()), re.I), word.strip()) for word in words]
-    for regexp, word in items:
-        if regexp.search(name):
-            return word
+
+    regex, words = compile_words(tuple(words))
+    match = regex.search(name) if regex else None
+    if match:
+        return words.get(match.group(1).lower(), match.group(1))
     return False
 
 
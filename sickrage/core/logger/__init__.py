@@ -23,18 +23,19 @@ import logging
 import os
 import pkgutil
 import platform
-import re
+import queue
 import sys
 from logging import FileHandler, CRITICAL, DEBUG, ERROR, INFO, WARNING
 from logging.handlers import RotatingFileHandler
 
 import raven
 from raven.handlers.logging import SentryHandler
-from unidecode import unidecode
 
 import sickrage
 from sickrage.core import make_dir
 from sickrage.core.classes import ErrorViewer, WarningViewer
+from sickrage.core.logger.handlers import LogQueueHandler, LogQueueListener, min_handler_level
+from sickrage.core.logger.index import LogIndex
 
 
 class Logger(logging.getLoggerClass()):
@@ -52,6 +53,7 @@ class Logger(logging.getLoggerClass()):
         self.logFile = logFile
         self.logSize = logSize
         self.logNr = logNr
+        self.logQueueSize = 10000
 
         self.CRITICAL = CRITICAL
         self.DEBUG = DEBUG
@@ -86,13 +88,23 @@ class Logger(logging.getLoggerClass()):
         self.warning_viewer = WarningViewer()
         self.error_viewer = ErrorViewer()
 
+        # log file index
+        self.log_index = LogIndex(self.logLevels)
+
+        # background logging pipeline
+        self.queue_handler = None
+        self.queue_listener = None
+
         # start logger
         self.start()
 
     def start(self):
-        # remove all handlers
+        # stop previous logging pipeline and remove all handlers
+        self.stop_queue()
         self.handlers.clear()
 
+        handlers = []
+
         sentry_ignore_exceptions = [
             'KeyboardInterrupt',
             'PermissionError',
@@ -123,7 +135,7 @@ class Logger(logging.getLoggerClass()):
 
         sentry_handler.setLevel(self.logLevels['ERROR'])
         sentry_handler.set_name('sentry')
-        self.addHandler(sentry_handler)
+        handlers.append(sentry_handler)
 
         # console log handler
         if self.consoleLogging:
@@ -132,15 +144,10 @@ class Logger(logging.getLoggerClass()):
 
             console_handler.setFormatter(formatter)
             console_handler.setLevel(self.logLevels['INFO'] if not self.debugLogging else self.logLevels['DEBUG'])
-            self.addHandler(console_handler)
-
-        # file log handlers
-        if self.logFile:
-            # make logs folder if it doesn't exist
-            if not os.path.exists(os.path.dirname(self.logFile)):
-                if not make_dir(os.path.dirname(self.logFile)):
-                    return
+            handlers.append(console_handler)
 
+        # file log handlers, make logs folder if it doesn't exist
+        if self.logFile and (os.path.exists(os.path.dirname(self.logFile)) or make_dir(os.path.dirname(self.logFile))):
             if sickrage.app.developer:
                 rfh = FileHandler(
                     filename=self.logFile,
@@ -162,44 +169,73 @@ class Logger(logging.getLoggerClass()):
 
             rfh.setFormatter(formatter)
             rfh.setLevel(self.logLevels['INFO'] if not self.debugLogging else self.logLevels['DEBUG'])
-            self.addHandler(rfh)
+            handlers.append(rfh)
 
             rfh_errors.setFormatter(formatter)
             rfh_errors.setLevel(self.logLevels['ERROR'])
-            self.addHandler(rfh_errors)
+            handlers.append(rfh_errors)
 
-    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None, sinfo=None):
-        if (False, True)[name in self.loggers]:
-            record = super(Logger, self).makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra, sinfo)
+        # formatting, censoring and I/O happen in the listener thread
+        log_queue = queue.Queue(self.logQueueSize)
+        self.queue_handler = LogQueueHandler(log_queue)
+        self.queue_listener = LogQueueListener(log_queue, self.queue_handler, self, *handlers)
+        self.addHandler(self.queue_handler)
+        self.queue_listener.start()
 
-            try:
-                record.msg = re.sub(
-                    r"(.*)\b({})\b(.*)".format(
-                        '|'.join([x for x in self.CENSORED_ITEMS.values() if len(x)])), r"\1\3",
-                    record.msg)
+        # records below the lowest handler level are discarded before they are formatted
+        self.setLevel(min_handler_level(handlers))
 
-                # needed because Newznab apikey isn't stored as key=value in a section.
-                record.msg = re.sub(r"([&?]r|[&?]apikey|[&?]api_key)=[^&]*([&\w]?)", r"\1=**********\2", record.msg)
-                record.msg = unidecode(record.msg)
-            except:
-                pass
+    def stop_queue(self):
+        if self.queue_listener and self.queue_listener._thread:
+            self.queue_listener.stop()
 
-            # sending record to UI
-            if record.levelno in [WARNING, ERROR]:
-                (self.warning_viewer, self.error_viewer)[record.levelno == ERROR].add(
-                    "{}::{}".format(record.threadName, record.msg), True)
+    @property
+    def queue_stats(self):
+        """Return queued, enqueued, processed and dropped record counts of the logging pipeline.
 
-            return record
+        :return:
+        :rtype: dict
+        """
+        if not self.queue_listener:
+            return {}
+
+        return self.queue_listener.stats
+
+    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None, sinfo=None):
+        if (False, True)[name in self.loggers]:
+            return super(Logger, self).makeRecord(name, level, fn, lno, msg, args, exc_info, func, extra, sinfo)
 
     def set_level(self):
         self.debugLogging = sickrage.app.config.debug
         level = DEBUG if self.debugLogging else INFO
         for __, logger in self.loggers.items():
             logger.setLevel(level)
-            for handler in logger.handlers:
+            handlers = self.queue_listener.handlers if logger is self and self.queue_listener else logger.handlers
+            for handler in handlers:
                 if not handler.name == 'sentry':
                     handler.setLevel(level)
 
+    @property
+    def log_files(self):
+        """Return current and rotated log files, newest first.
+
+        :return:
+        :rtype: list of str
+        """
+        if not self.logFile:
+            return []
+
+        return [self.logFile] + ["{}.{}".format(self.logFile, x) for x in range(1, int(self.logNr) + 1)]
+
+    def read_logs(self, min_level=INFO, thread_filter='', search='', page=0, max_lines=500, since=None, until=None):
+        """Return a page of log entries, newest first, using the log index.
+
+        :return:
+        :rtype: list of str
+        """
+        return list(self.log_index.read(self.log_files, min_level=min_level, thread_filter=thread_filter, search=search,
+                                        since=since, until=until, offset=int(page) * int(max_lines), limit=int(max_lines)))
+
     def list_modules(self, package):
         """Return all sub-modules for the specified package.
 
@@ -246,7 +282,9 @@ class Logger(logging.getLoggerClass()):
 
     def fatal(self, msg, *args, **kwargs):
         super(Logger, self).fatal(msg, *args, **kwargs)
+        self.stop_queue()
         sys.exit(1)
 
     def close(self, *args, **kwargs):
+        self.stop_queue()
         logging.shutdown()
@@ -0,0 +1,128 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import logging
+import queue
+import re
+import threading
+from logging import ERROR, WARNING
+from logging.handlers import QueueHandler, QueueListener
+
+from unidecode import unidecode
+
+# needed because Newznab apikey isn't stored as key=value in a section.
+API_KEY_REGEX = re.compile(r"([&?]r|[&?]apikey|[&?]api_key)=[^&]*([&\w]?)")
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Puts records on a bounded queue for the listener thread. Records below
+    ERROR are dropped when the queue is full, errors wait briefly for room.
+    """
+
+    def __init__(self, log_queue):
+        super(LogQueueHandler, self).__init__(log_queue)
+        self.lock_counters = threading.Lock()
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record):
+        # only merge args here, censoring and formatting happen in the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if record.levelno >= ERROR:
+                self.queue.put(record, timeout=1)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock_counters:
+                self.dropped += 1
+        else:
+            with self.lock_counters:
+                self.enqueued += 1
+
+
+class LogQueueListener(QueueListener):
+    """
+    Censors records, feeds the warning/error viewers and dispatches records to
+    the file, console and sentry handlers from a background thread.
+    """
+
+    def __init__(self, log_queue, queue_handler, logger, *handlers):
+        super(LogQueueListener, self).__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.logger = logger
+        self.processed = 0
+        self.reported_dropped = 0
+        self.censor_items = None
+        self.censor_regex = None
+
+    def censor(self, msg):
+        items = tuple(x for x in self.logger.CENSORED_ITEMS.values() if x)
+        if items != self.censor_items:
+            self.censor_items = items
+            self.censor_regex = re.compile(r"\b(?:{})\b".format('|'.join(map(re.escape, items)))) if items else None
+
+        if self.censor_regex:
+            msg = self.censor_regex.sub('', msg)
+
+        return unidecode(API_KEY_REGEX.sub(r"\1=**********\2", msg))
+
+    def prepare(self, record):
+        try:
+            record.msg = self.censor(str(record.msg))
+        except Exception:
+            pass
+
+        # sending record to UI
+        if record.levelno in [WARNING, ERROR]:
+            (self.logger.warning_viewer, self.logger.error_viewer)[record.levelno == ERROR].add(
+                "{}::{}".format(record.threadName, record.msg), True)
+
+        return record
+
+    def handle(self, record):
+        super(LogQueueListener, self).handle(record)
+        self.processed += 1
+
+        dropped = self.queue_handler.dropped
+        if dropped > self.reported_dropped:
+            self.reported_dropped = dropped
+            super(LogQueueListener, self).handle(self.logger.makeRecord(
+                self.logger.name, WARNING, __file__, 0,
+                "Logging queue full, {} log records dropped so far".format(dropped), None, None
+            ))
+
+    @property
+    def stats(self):
+        return {
+            'queued': self.queue.qsize(),
+            'enqueued': self.queue_handler.enqueued,
+            'processed': self.processed,
+            'dropped': self.queue_handler.dropped,
+        }
+
+
+def min_handler_level(handlers):
+    return min([x.level for x in handlers if x.level > logging.NOTSET] or [logging.NOTSET])
@@ -0,0 +1,186 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import bisect
+import os
+import re
+import threading
+
+ENTRY_REGEX = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) ([A-Z]+)::(.*?)::')
+
+
+class LogFileIndex(object):
+    """
+    Byte offsets of every log entry in a single log file, together with the
+    entry timestamp, level name and thread name.
+
+    Log files are only ever appended to until they are rotated, so the index
+    is extended incrementally from the last indexed offset instead of being
+    rebuilt on every read.
+    """
+
+    def __init__(self, path, inode):
+        self.path = path
+        self.inode = inode
+        self.indexed_to = 0
+        self.offsets = []
+        self.timestamps = []
+        self.levels = []
+        self.threads = []
+
+    def update(self, size):
+        if size < self.indexed_to:
+            self.__init__(self.path, self.inode)
+
+        if size == self.indexed_to:
+            return
+
+        with open(self.path, 'rb') as fh:
+            fh.seek(self.indexed_to)
+            offset = self.indexed_to
+            for line in fh:
+                # only index complete lines, partial writes are picked up next time
+                if not line.endswith(b'\n'):
+                    break
+
+                match = ENTRY_REGEX.match(line)
+                if match:
+                    self.offsets.append(offset)
+                    self.timestamps.append(match.group(1).decode())
+                    self.levels.append(match.group(2).decode())
+                    self.threads.append(match.group(3).decode('utf-8', 'replace'))
+
+                offset += len(line)
+
+        self.indexed_to = offset
+
+    def end_of(self, i):
+        return self.offsets[i + 1] if i + 1 < len(self.offsets) else self.indexed_to
+
+    def range(self, since=None, until=None):
+        start = bisect.bisect_left(self.timestamps, since) if since else 0
+        end = bisect.bisect_right(self.timestamps, until) if until else len(self.timestamps)
+        return start, end
+
+
+class LogIndex(object):
+    """
+    Index of all current and rotated log files, keyed by inode so that an
+    index survives the rename performed by the rotating file handler.
+    """
+
+    def __init__(self, log_levels):
+        self.log_levels = log_levels
+        self.lock = threading.Lock()
+        self.files = {}
+
+    def get(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = (st.st_dev, st.st_ino)
+
+        with self.lock:
+            index = self.files.get(key)
+            if not index:
+                index = self.files[key] = LogFileIndex(path, key)
+            index.path = path
+            index.update(st.st_size)
+
+        return index
+
+    def prune(self, paths):
+        keys = set()
+        for path in paths:
+            try:
+                st = os.stat(path)
+                keys.add((st.st_dev, st.st_ino))
+            except OSError:
+                continue
+
+        with self.lock:
+            for key in set(self.files.keys()) - keys:
+                del self.files[key]
+
+    def read(self, paths, min_level=0, thread_filter='', search='', since=None, until=None, offset=0, limit=None):
+        """
+        Yields matching log entries, newest first.
+
+        Level, thread and timestamp filtering is done from the index alone, only
+        entries that pass those filters are read from disk.
+
+        :param paths: log files ordered newest to oldest
+        :param min_level: minimum numeric log level
+        :param thread_filter: entries whose thread name or level contains this string
+        :param search: case-insensitive substring the entry must contain
+        :param since: earliest timestamp to include, formatted as %Y-%m-%d %H:%M:%S
+        :param until: latest timestamp to include, formatted as %Y-%m-%d %H:%M:%S
+        :param offset: number of matching entries to skip
+        :param limit: maximum number of entries to yield
+        """
+
+        search = search.lower()
+        allowed_levels = set(x for x, y in self.log_levels.items() if y >= int(min_level))
+
+        self.prune(paths)
+
+        skipped = 0
+        yielded = 0
+        for path in paths:
+            index = self.get(path)
+            if not index:
+                continue
+
+            start, end = index.range(since, until)
+
+            try:
+                fh = open(index.path, 'rb')
+            except OSError:
+                continue
+
+            with fh:
+                for i in range(end - 1, start - 1, -1):
+                    if index.levels[i] not in allowed_levels:
+                        continue
+
+                    if thread_filter and thread_filter not in index.threads[i] and thread_filter != index.levels[i]:
+                        continue
+
+                    if not search and skipped < offset:
+                        skipped += 1
+                        continue
+
+                    fh.seek(index.offsets[i])
+                    entry = fh.read(index.end_of(i) - index.offsets[i]).decode('utf-8', 'replace').rstrip('\n')
+
+                    if search and search not in entry.lower():
+                        continue
+
+                    if skipped < offset:
+                        skipped += 1
+                        continue
+
+                    yield entry
+
+                    yielded += 1
+                    if limit and yielded >= limit:
+                        return
@@ -1,12 +1,18 @@
 import os
 from mimetypes import guess_type
 
+from urllib.parse import urlencode
+
 from tornado.escape import url_escape
 
 import sickrage
+from sickrage.core.caches.image_cache import ImageCache, image_version
 from sickrage.core.exceptions import MultipleShowObjectsException
 from sickrage.core.tv.show.helpers import find_show
 
+# width of thumbnails resized from full size images
+THUMBNAIL_WIDTH = 400
+
 
 class Media(object):
     def __init__(self, indexer_id, media_format=None):
@@ -34,21 +40,30 @@ class Media(object):
     @property
     def url(self):
         """
-        :return: The url to the desired media file
+        :return: The url to the desired media file, thumbnails missing from the image cache are resized from
+                 the full size image
         """
 
-        path = self.get_static_media_path().replace(sickrage.app.cache_dir, "")
-        path = path.replace(sickrage.app.config.gui_static_dir, "")
-        return url_escape(path.replace('\\', '/'), False)
+        return self.sized_url(THUMBNAIL_WIDTH if self.media_format == 'thumb' else None)
 
-    @property
-    def content(self):
+    def sized_url(self, width=None):
         """
-        :return: The content of the desired media file
+        :param width: width of a resized variant of a cached image, the image as is if None
+        :return: The url to the desired media file, urls of cached images include their version
         """
 
-        with open(os.path.abspath(self.get_static_media_path()).replace('\\', '/'), 'rb') as media:
-            return media.read()
+        path = self.get_static_media_path()
+
+        image_cache_dir = ImageCache()._cache_dir()
+        if not path.startswith(image_cache_dir + os.sep):
+            path = path.replace(sickrage.app.config.gui_static_dir, "")
+            return url_escape(path.replace('\\', '/'), False)
+
+        args = [('v', image_version(path))]
+        if width:
+            args.append(('width', width))
+
+        return '/cache/images/{}?{}'.format(url_escape(os.path.relpath(path, image_cache_dir).replace('\\', '/'), False), urlencode(args))
 
     @property
     def type(self):
@@ -44,6 +44,10 @@ class FanArt(Media):
         if self.media_format == 'thumb':
             media_file = ImageCache().fanart_thumb_path(self.indexer_id)
 
+            # resized from the full size image when the indexer has no thumbnail
+            if not os.path.exists(media_file):
+                media_file = ImageCache().fanart_path(self.indexer_id)
+
         if not all([media_file, os.path.exists(media_file)]):
             media_file = os.path.join(self.get_media_root(), 'images', self.get_default_media_name())
 
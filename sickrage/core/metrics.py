@@ -0,0 +1,273 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+
+DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, 300)
+
+
+class Metric(object):
+    """
+    Base of counters, gauges and histograms. Samples are recorded without locking into cells that only the
+    recording thread writes to, the cells of all threads are added up when the metric is collected.
+    Labelled metrics keep one child metric per label values.
+    """
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=(), **kwargs):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.kwargs = kwargs
+        self.lock = threading.Lock()
+        self.children = {}
+        self.local = threading.local()
+        self.shards = []
+        self.base = self._new_cells()
+
+    def _new_cells(self):
+        return [0]
+
+    def _cells(self):
+        cells = self.local.cells = self._new_cells()
+        with self.lock:
+            self.shards.append((threading.current_thread(), cells))
+        return cells
+
+    def _merged(self):
+        """
+        :return: cells of all threads added up, cells of finished threads are folded into the base cells
+        """
+        with self.lock:
+            for thread, cells in [x for x in self.shards if not x[0].is_alive()]:
+                self.base = [x + y for x, y in zip(self.base, cells)]
+                self.shards.remove((thread, cells))
+
+            merged = list(self.base)
+            for __, cells in self.shards:
+                merged = [x + y for x, y in zip(merged, cells)]
+
+        return merged
+
+    def labels(self, *values):
+        """
+        :param values: label values in the order of the label names
+        :return: child metric for the label values
+        """
+        try:
+            return self.children[values]
+        except KeyError:
+            with self.lock:
+                if values not in self.children:
+                    self.children[values] = self.__class__(self.name, self.documentation, **self.kwargs)
+                return self.children[values]
+
+    def samples(self):
+        """
+        :return: list of (name suffix, labels, value) of this metric without its children
+        """
+        return []
+
+    def collect(self):
+        """
+        :return: list of (name suffix, labels, value) of this metric and its children
+        """
+        if not self.labelnames:
+            return self.samples()
+
+        samples = []
+        for values, child in sorted(list(self.children.items())):
+            labels = tuple(zip(self.labelnames, values))
+            samples += [(suffix, labels + extra, value) for suffix, extra, value in child.samples()]
+        return samples
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1):
+        try:
+            self.local.cells[0] += amount
+        except AttributeError:
+            self._cells()[0] += amount
+
+    @property
+    def value(self):
+        return self._merged()[0]
+
+    def samples(self):
+        return [('_total', (), self.value)]
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def inc(self, amount=1):
+        try:
+            self.local.cells[0] += amount
+        except AttributeError:
+            self._cells()[0] += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set(self, value):
+        with self.lock:
+            self.base = [value]
+            for __, cells in self.shards:
+                cells[0] = 0
+
+    @property
+    def value(self):
+        return self._merged()[0]
+
+    def samples(self):
+        return [('', (), self.value)]
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super(Histogram, self).__init__(name, documentation, labelnames, buckets=buckets)
+
+    def _new_cells(self):
+        # one count per bucket, one for +Inf and the sum of all observed values
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value):
+        try:
+            cells = self.local.cells
+        except AttributeError:
+            cells = self._cells()
+
+        cells[bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def time(self):
+        """
+        :return: context manager observing the seconds spent in its block
+        """
+        return Timer(self)
+
+    def timed(self, func):
+        """
+        Decorator observing the seconds spent in a function
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Timer(self):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def samples(self):
+        cells = self._merged()
+
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), cells[:-1]):
+            cumulative += count
+            samples.append(('_bucket', (('le', format_value(bound)),), cumulative))
+
+        return samples + [('_sum', (), cells[-1]), ('_count', (), cumulative)]
+
+
+class Timer(object):
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class MetricsRegistry(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = OrderedDict()
+
+    def register(self, cls, name, documentation, labelnames=(), **kwargs):
+        """
+        Returns the metric registered under a name, registers a new one if there is none yet
+        """
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return self.metrics[name]
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def exposition(self):
+        """
+        :return: all metrics in the Prometheus text exposition format
+        """
+        lines = []
+
+        for metric in list(self.metrics.values()):
+            lines.append('# HELP {} {}'.format(metric.name, metric.documentation.replace('\\', r'\\').replace('\n', r'\n')))
+            lines.append('# TYPE {} {}'.format(metric.name, metric.type))
+
+            for suffix, labels, value in metric.collect():
+                if labels:
+                    lines.append('{}{}{{{}}} {}'.format(metric.name, suffix, ','.join(
+                        '{}="{}"'.format(k, escape_label(v)) for k, v in labels), format_value(value)))
+                else:
+                    lines.append('{}{} {}'.format(metric.name, suffix, format_value(value)))
+
+        return '\n'.join(lines) + '\n'
+
+
+def escape_label(value):
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return repr(value)
+    return str(value)
+
+
+registry = MetricsRegistry()
+
+counter = registry.counter
+gauge = registry.gauge
+histogram = registry.histogram
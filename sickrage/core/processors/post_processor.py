@@ -30,6 +30,7 @@ import subprocess
 from sqlalchemy import orm
 
 import sickrage
+from sickrage.core import metrics
 from sickrage.core.common import Quality, ARCHIVED, DOWNLOADED
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import EpisodePostProcessingFailedException, NoFreeSpaceException
@@ -44,6 +45,8 @@ from sickrage.core.tv.show.history import FailedHistory, History
 from sickrage.notifiers import Notifiers
 from sickrage.subtitles import Subtitles
 
+POST_PROCESS_SECONDS = metrics.histogram('sickrage_post_process_seconds', 'Time spent post-processing a file')
+
 
 class PostProcessor(object):
     """
@@ -893,6 +896,7 @@ class PostProcessor(object):
     def _add_processed_marker_file(self, file_path):
         touch_file(file_path + '.sr_processed')
 
+    @POST_PROCESS_SECONDS.timed
     @MainDB.with_session
     def process(self, session=None):
         """
@@ -1157,26 +1161,29 @@ class PostProcessor(object):
             # send notifications
             Notifiers.mass_notify_download(ep_obj._format_pattern('%SN - %Sx%0E - %EN - %QN'))
 
-            # do the library update for KODI
-            sickrage.app.notifier_providers['kodi'].update_library(show_object.name)
+            # do the library update for KODI, updates of the same show within the update window are sent once
+            sickrage.app.notifier_providers['kodi'].schedule_library_update('update_library_or_raise', show_object.name,
+                                                                            key=show_object.location)
 
             # do the library update for Plex
-            sickrage.app.notifier_providers['plex'].update_library(ep_obj)
+            sickrage.app.notifier_providers['plex'].schedule_library_update('update_library_or_raise', ep_obj,
+                                                                            key=show_object.location)
 
             # do the library update for EMBY
-            sickrage.app.notifier_providers['emby'].update_library(show_object)
+            sickrage.app.notifier_providers['emby'].schedule_library_update('update_library_or_raise', show_object,
+                                                                            key=show_object.location)
 
             # do the library update for NMJ
             # nmj_notifier kicks off its library update when the notify_download is issued (inside notifiers)
 
-            # do the library update for Synology Indexer
-            sickrage.app.notifier_providers['synoindex'].addFile(ep_obj.location)
-
-            # do the library update for pyTivo
-            sickrage.app.notifier_providers['pytivo'].update_library(ep_obj)
+            # do the library update for Synology Indexer, one folder scan per episode directory
+            sickrage.app.notifier_providers['synoindex'].schedule_library_update('addFolder',
+                                                                                 os.path.dirname(ep_obj.location))
 
-            # do the library update for Trakt
-            sickrage.app.notifier_providers['trakt'].update_library(ep_obj)
+            # do the library update for pyTivo and Trakt
+            for notifier_id in ('pytivo', 'trakt'):
+                if sickrage.app.notifier_providers[notifier_id].enabled:
+                    sickrage.app.notification_dispatcher.dispatch(sickrage.app.notifier_providers[notifier_id], 'update_library', ep_obj)
         except Exception:
             sickrage.app.log.info("Some notifications could not be sent. Continuing with post-processing...")
 
@@ -25,6 +25,16 @@ from tornado import gen
 from tornado.queues import Queue, PriorityQueue
 
 import sickrage
+from sickrage.core import metrics
+from sickrage.core.databases import UnitOfWork
+
+QUEUE_ITEM_SECONDS = metrics.histogram('sickrage_queue_item_seconds', 'Time spent running queue items', ['queue'])
+QUEUE_ITEM_WAIT_SECONDS = metrics.histogram('sickrage_queue_item_wait_seconds', 'Time queue items waited before running', ['queue'])
+QUEUE_ITEM_ERRORS = metrics.counter('sickrage_queue_item_errors', 'Queue items that raised an error', ['queue'])
+QUEUE_PROCESSING = metrics.gauge('sickrage_queue_processing', 'Queue items running', ['queue'])
+QUEUE_ITEM_COMMITS = metrics.histogram('sickrage_queue_item_commits', 'Database commits per queue item', ['queue'])
+QUEUE_ITEM_LOCK_WAIT_SECONDS = metrics.histogram('sickrage_queue_item_lock_wait_seconds', 'Time queue items waited for the database write lock',
+                                                 ['queue'])
 
 
 class QueueItemStopException(Exception):
@@ -69,15 +79,29 @@ class SRQueue(object):
         threading.currentThread().setName(item.name)
         item.thread_id = threading.currentThread().ident
 
+        if item.added:
+            QUEUE_ITEM_WAIT_SECONDS.labels(self.name).observe((datetime.datetime.now() - item.added).total_seconds())
+
+        unit = UnitOfWork()
+
         try:
             item.is_alive = True
             self.processing.append(item)
-            item.run()
+            QUEUE_PROCESSING.labels(self.name).inc()
+            with QUEUE_ITEM_SECONDS.labels(self.name).time(), unit:
+                item.run()
         except QueueItemStopException:
             pass
         except Exception:
+            QUEUE_ITEM_ERRORS.labels(self.name).inc()
             sickrage.app.log.debug(traceback.format_exc())
         finally:
+            item.commits, item.lock_wait = unit.commits, unit.lock_wait
+            QUEUE_ITEM_COMMITS.labels(self.name).observe(unit.commits)
+            QUEUE_ITEM_LOCK_WAIT_SECONDS.labels(self.name).observe(unit.lock_wait)
+            sickrage.app.log.debug("{} made {} database commits, waited {:.2f}s for the database".format(item.name, unit.commits, unit.lock_wait))
+
+            QUEUE_PROCESSING.labels(self.name).dec()
             self.processing.remove(item)
             self.queue.task_done()
 
@@ -148,6 +172,8 @@ class SRQueueItem(object):
         self.priority = SRQueuePriorities.NORMAL
         self.is_alive = False
         self.thread_id = None
+        self.commits = 0
+        self.lock_wait = 0.0
 
     def __eq__(self, other):
         return self.priority == other.priority
@@ -20,6 +20,7 @@
 # ##############################################################################
 
 
+import threading
 import traceback
 
 import sickrage
@@ -50,10 +51,15 @@ class SearchQueue(SRQueue):
 
     def is_in_queue(self, show_id, season, episode):
         for cur_item in self.queue_items:
-            if isinstance(cur_item, BacklogQueueItem) and all([cur_item.show_id == show_id, cur_item.season == season, cur_item.episode == episode]):
+            if isinstance(cur_item, BacklogQueueItem) and cur_item.show_id == show_id and (season, episode) in cur_item.episodes:
                 return True
         return False
 
+    def get_waiting_backlog_item(self, show_id):
+        for cur_item in self.queue._queue:
+            if isinstance(cur_item, BacklogQueueItem) and cur_item.show_id == show_id and not cur_item.started:
+                return cur_item
+
     def is_ep_in_queue(self, season, episode):
         for cur_item in self.queue_items:
             if isinstance(cur_item, (ManualSearchQueueItem, FailedQueueItem)) and all([cur_item.season == season, cur_item.episode == episode]):
@@ -75,7 +81,10 @@ class SearchQueue(SRQueue):
 
     def remove_from_queue(self, show_id, season, episode):
         for cur_item in self.queue_items:
-            if all([cur_item.show_id == show_id, cur_item.season == season, cur_item.episode == episode]):
+            if isinstance(cur_item, BacklogQueueItem):
+                if cur_item.show_id == show_id and (season, episode) in cur_item.episodes:
+                    self.stop_item(cur_item)
+            elif all([cur_item.show_id == show_id, cur_item.season == season, cur_item.episode == episode]):
                 self.stop_item(cur_item)
 
     def pause_daily_searcher(self):
@@ -140,9 +149,16 @@ class SearchQueue(SRQueue):
         if isinstance(item, DailySearchQueueItem):
             # daily searches
             sickrage.app.io_loop.add_callback(super(SearchQueue, self).put, item)
-        elif isinstance(item, BacklogQueueItem) and not self.is_in_queue(item.show_id, item.season, item.episode):
-            # backlog searches
-            sickrage.app.io_loop.add_callback(super(SearchQueue, self).put, item)
+        elif isinstance(item, BacklogQueueItem) and [x for x in item.episodes if not self.is_in_queue(item.show_id, *x)]:
+            # backlog searches, episodes of a show are added to its waiting backlog search if there is one
+            episodes = [x for x in item.episodes if not self.is_in_queue(item.show_id, *x)]
+
+            waiting_item = self.get_waiting_backlog_item(item.show_id)
+            if waiting_item and waiting_item.add_episodes(episodes):
+                sickrage.app.log.debug("Added {} episode(s) to the queued backlog search of show {}".format(len(episodes), item.show_id))
+            else:
+                item.episodes = episodes
+                sickrage.app.io_loop.add_callback(super(SearchQueue, self).put, item)
         elif isinstance(item, (ManualSearchQueueItem, FailedQueueItem)) and not self.is_ep_in_queue(item.season, item.episode):
             # manual and failed searches
             sickrage.app.io_loop.add_callback(super(SearchQueue, self).put, item)
@@ -235,44 +251,64 @@ class ManualSearchQueueItem(SRQueueItem):
 
 
 class BacklogQueueItem(SRQueueItem):
-    def __init__(self, show_id, season, episode):
+    def __init__(self, show_id, episodes):
+        """
+        :param show_id: show id
+        :param episodes: list of (season, episode) to search for, more can be added until the search is started
+        """
         super(BacklogQueueItem, self).__init__('Backlog Search', BACKLOG_SEARCH)
         self.name = 'BACKLOG-{}'.format(show_id)
         self.show_id = show_id
-        self.season = season
-        self.episode = episode
+        self.episodes = list(episodes)
+        self.lock = threading.Lock()
         self.priority = SRQueuePriorities.LOW
         self.success = False
         self.started = False
 
+    def add_episodes(self, episodes):
+        """
+        :param episodes: list of (season, episode)
+        :return: True if the episodes were added, False if the search already started
+        """
+        with self.lock:
+            if self.started:
+                return False
+
+            self.episodes += [x for x in episodes if x not in self.episodes]
+            return True
+
     @MainDB.with_session
     def run(self, session=None):
-        self.started = True
+        with self.lock:
+            self.started = True
+            episodes = list(self.episodes)
 
         show_object = find_show(self.show_id, session=session)
 
-        try:
-            sickrage.app.log.info("Starting backlog search for: [" + show_object.name + "]")
-
-            search_result = search_providers(self.show_id, self.season, self.episode, manualSearch=False)
-            if search_result:
-                for episode in search_result.episodes:
-                    if (search_result.show_id, search_result.season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
-                        raise StopIteration
-
-                    sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY, (search_result.show_id, search_result.season, episode),
-                                                   sickrage.app.search_queue.SNATCH_HISTORY_SIZE)
-
-                sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
-                snatch_episode(search_result)
-            else:
-                sickrage.app.log.info("Unable to find search results for: [" + show_object.name + "]")
-        except StopIteration:
-            pass
-        except Exception:
-            sickrage.app.log.debug(traceback.format_exc())
-        finally:
-            sickrage.app.log.info("Finished backlog search for: [" + show_object.name + "]")
+        sickrage.app.log.info("Starting backlog search for: [" + show_object.name + "]")
+
+        for season, episode in episodes:
+            try:
+                search_result = search_providers(self.show_id, season, episode, manualSearch=False)
+                if search_result:
+                    for episode_number in search_result.episodes:
+                        if (search_result.show_id, search_result.season, episode_number) in sickrage.app.search_queue.SNATCH_HISTORY:
+                            raise StopIteration
+
+                        sickrage.app.search_queue.fifo(sickrage.app.search_queue.SNATCH_HISTORY,
+                                                       (search_result.show_id, search_result.season, episode_number),
+                                                       sickrage.app.search_queue.SNATCH_HISTORY_SIZE)
+
+                    sickrage.app.log.info("Downloading " + search_result.name + " from " + search_result.provider.name)
+                    snatch_episode(search_result)
+                else:
+                    sickrage.app.log.info("Unable to find search results for: [{}] S{:02d}E{:02d}".format(show_object.name, season, episode))
+            except StopIteration:
+                continue
+            except Exception:
+                sickrage.app.log.debug(traceback.format_exc())
+
+        sickrage.app.log.info("Finished backlog search for: [" + show_object.name + "]")
 
 
 class FailedQueueItem(SRQueueItem):
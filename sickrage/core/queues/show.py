@@ -390,7 +390,7 @@ class QueueItemAdd(ShowQueueItem):
         session.commit()
 
         sickrage.app.io_loop.add_callback(show_obj.write_metadata, force=True)
-        sickrage.app.io_loop.add_callback(show_obj.populate_cache)
+        show_obj.populate_cache()
 
         if sickrage.app.config.use_trakt:
             # if there are specific episodes that need to be added by trakt
@@ -19,12 +19,14 @@
 import itertools
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 
 import sickrage
-from sickrage.clients import get_client_instance
+from sickrage.clients import get_client
 from sickrage.clients.nzbget import NZBGet
 from sickrage.clients.sabnzbd import SabNZBd
+from sickrage.core import metrics
 from sickrage.core.common import Quality, SEASON_RESULT, SNATCHED_BEST, SNATCHED_PROPER, SNATCHED, MULTI_EP_RESULT
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import AuthException
@@ -36,6 +38,13 @@ from sickrage.core.tv.show.history import FailedHistory, History
 from sickrage.notifiers import Notifiers
 from sickrage.providers import NZBProvider, NewznabProvider, TorrentProvider, TorrentRssProvider
 
+# results verified at the same time by pick_best_result
+VERIFY_WORKERS = 4
+
+PROVIDER_SEARCH_SECONDS = metrics.histogram('sickrage_provider_search_seconds', 'Time spent searching a provider', ['provider'])
+PROVIDER_SEARCH_RESULTS = metrics.counter('sickrage_provider_search_results', 'Results found by provider searches', ['provider'])
+PROVIDER_SEARCH_ERRORS = metrics.counter('sickrage_provider_search_errors', 'Provider searches that failed', ['provider'])
+
 
 @MainDB.with_session
 def snatch_episode(result, end_status=SNATCHED, session=None):
@@ -87,7 +96,7 @@ def snatch_episode(result, end_status=SNATCHED, session=None):
             dlResult = result.provider.download_result(result)
         else:
             if any([result.content, result.url.startswith('magnet:')]):
-                client = get_client_instance(sickrage.app.config.torrent_method)()
+                client = get_client(sickrage.app.config.torrent_method)
                 dlResult = client.send_torrent(result)
             else:
                 sickrage.app.log.warning("Torrent file content is empty")
@@ -132,6 +141,58 @@ def snatch_episode(result, end_status=SNATCHED, session=None):
     return True
 
 
+def _is_better_result(cur_result, best_result, any_qualities, best_qualities):
+    if cur_result.quality in best_qualities and (best_result.quality < cur_result.quality or best_result.quality not in best_qualities):
+        return True
+    elif cur_result.quality in any_qualities and best_result.quality not in best_qualities and best_result.quality < cur_result.quality:
+        return True
+    elif best_result.quality == cur_result.quality:
+        if "proper" in cur_result.name.lower() or "repack" in cur_result.name.lower():
+            return True
+        elif "internal" in best_result.name.lower() and "internal" not in cur_result.name.lower():
+            return True
+        elif "xvid" in best_result.name.lower() and "x264" in cur_result.name.lower():
+            sickrage.app.log.info("Preferring " + cur_result.name + " (x264 over xvid)")
+            return True
+
+    return False
+
+
+def _pick_best_candidate(candidates):
+    """
+    :param candidates: list of (result, any qualities, best qualities) tuples that passed the result filters
+    :return: best result object
+    """
+    best_result = None
+
+    for cur_result, any_qualities, best_qualities in candidates:
+        if not best_result or _is_better_result(cur_result, best_result, any_qualities, best_qualities):
+            best_result = cur_result
+
+    return best_result
+
+
+def _verify_result(result):
+    """
+    Downloads the content of a result, the content is cached for when the result gets snatched
+
+    :param result: result object
+    :return: True if the result can be snatched
+    """
+    if result.provider.private or result.type not in ["nzb", "torrent"]:
+        return True
+
+    if result.provider.get_content(result.url):
+        return True
+
+    if sickrage.app.config.download_unverified_magnet_link and result.url.startswith('magnet'):
+        # Attempt downloading unverified torrent magnet link
+        return True
+
+    sickrage.app.log.info("Ignoring {} because we are unable to verify the download url".format(result.name))
+    return False
+
+
 @MainDB.with_session
 def pick_best_result(results, season_pack=False, session=None):
     """
@@ -146,6 +207,7 @@ def pick_best_result(results, season_pack=False, session=None):
     sickrage.app.log.debug("Picking the best result out of " + str([x.name for x in results]))
 
     best_result = None
+    candidates = []
 
     # find the best result for the current episode
     for cur_result in results:
@@ -218,32 +280,32 @@ def pick_best_result(results, season_pack=False, session=None):
                 sickrage.app.log.info(e)
                 continue
 
-        # verify result content
-        if not cur_result.provider.private:
-            if cur_result.type in ["nzb", "torrent"] and not cur_result.provider.get_content(cur_result.url):
-                if sickrage.app.config.download_unverified_magnet_link and cur_result.url.startswith('magnet'):
-                    # Attempt downloading unverified torrent magnet link
-                    pass
-                else:
-                    sickrage.app.log.info(
-                        "Ignoring {} because we are unable to verify the download url".format(cur_result.name))
-                    continue
+        candidates.append((cur_result, any_qualities, best_qualities))
 
-        if not best_result:
-            best_result = cur_result
-        elif cur_result.quality in best_qualities and (
-                best_result.quality < cur_result.quality or best_result.quality not in best_qualities):
-            best_result = cur_result
-        elif cur_result.quality in any_qualities and best_result.quality not in best_qualities and best_result.quality < cur_result.quality:
-            best_result = cur_result
-        elif best_result.quality == cur_result.quality:
-            if "proper" in cur_result.name.lower() or "repack" in cur_result.name.lower():
-                best_result = cur_result
-            elif "internal" in best_result.name.lower() and "internal" not in cur_result.name.lower():
-                best_result = cur_result
-            elif "xvid" in best_result.name.lower() and "x264" in cur_result.name.lower():
-                sickrage.app.log.info("Preferring " + cur_result.name + " (x264 over xvid)")
-                best_result = cur_result
+    # verify result content, concurrently and only for as many results as needed to find the best one
+    verified = {}
+    executor = ThreadPoolExecutor(max_workers=VERIFY_WORKERS)
+
+    try:
+        while candidates:
+            # verify the next results in the order they would be picked
+            remaining, order = list(candidates), []
+            while remaining and len([x for x in order if id(x) not in verified]) < VERIFY_WORKERS:
+                order.append(_pick_best_candidate(remaining))
+                remaining = [x for x in remaining if x[0] is not order[-1]]
+
+            for result in order:
+                if id(result) not in verified:
+                    verified[id(result)] = executor.submit(_verify_result, result)
+
+            best_result = order[0]
+            if verified[id(best_result)].result():
+                break
+
+            candidates = [x for x in candidates if x[0] is not best_result]
+            best_result = None
+    finally:
+        executor.shutdown(wait=False)
 
     if best_result:
         sickrage.app.log.debug("Picked " + best_result.name + " as the best")
@@ -307,6 +369,75 @@ def is_first_best_match(result):
     return False
 
 
+class ResultRanker(object):
+    """
+    Scores each search result once and orders results best first.
+
+    Scores compare the quality class against the show's best/any quality lists, then the
+    same proper/repack, internal and x264 over xvid preferences as pick_best_result,
+    then size fit against the quality size definitions, seeders and provider priority.
+    Complete ties keep the first result, or the last one for propers, like pick_best_result.
+    """
+
+    def __init__(self, provider_priority=None):
+        """
+        :param provider_priority: dict of provider ID -> position in the provider order
+        """
+        self.provider_priority = provider_priority or {}
+        self.show_qualities = {}
+        self.scores = {}
+
+    def qualities(self, show_id):
+        if show_id not in self.show_qualities:
+            self.show_qualities[show_id] = Quality.split_quality(find_show(show_id).quality)
+        return self.show_qualities[show_id]
+
+    def size_fit(self, result):
+        """1 if the per episode size is within the quality size definition, -1 if it's above it, 0 if unknown"""
+        quality_size = sickrage.app.config.quality_sizes.get(result.quality)
+        if not quality_size or not result.size or result.size < 0 or not len(result.episodes):
+            return 0
+        return (-1, 1)[float(result.size / len(result.episodes) / 1000000) <= quality_size]
+
+    def score(self, result):
+        if id(result) in self.scores:
+            return self.scores[id(result)][1]
+
+        any_qualities, best_qualities = self.qualities(result.show_id)
+        name = result.name.lower()
+        proper = "proper" in name or "repack" in name
+        position = len(self.scores)
+
+        score = (
+            2 if result.quality in best_qualities else 1 if result.quality in any_qualities else 0,
+            result.quality,
+            proper,
+            "internal" not in name,
+            ("x264" in name) - ("xvid" in name),
+            self.size_fit(result),
+            int(result.seeders) if result.seeders not in (-1, None) else -1,
+            -self.provider_priority.get(getattr(result.provider, 'id', None), len(self.provider_priority)),
+            position if proper else -position
+        )
+
+        self.scores[id(result)] = (result, score)
+        return score
+
+    def rank(self, results):
+        """
+        :param results: list of result objects
+        :return: results sorted best first
+        """
+        return sorted(results, key=self.score, reverse=True)
+
+    def best(self, results):
+        """
+        :param results: list of result objects
+        :return: best result object or None
+        """
+        return max(results, key=self.score, default=None)
+
+
 @MainDB.with_session
 def search_providers(show_id, season, episode, manualSearch=False, downCurQuality=False, cacheOnly=False, session=None):
     """
@@ -328,7 +459,10 @@ def search_providers(show_id, season, episode, manualSearch=False, downCurQualit
 
     final_results = []
 
-    for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.randomize_providers).items():
+    providers = sickrage.app.search_providers.sort(randomize=sickrage.app.config.randomize_providers)
+    ranker = ResultRanker(dict((x, i) for i, x in enumerate(providers)))
+
+    for providerID, providerObj in providers.items():
         # check if provider is enabled
         if not providerObj.isEnabled:
             continue
@@ -364,17 +498,21 @@ def search_providers(show_id, season, episode, manualSearch=False, downCurQualit
                     sickrage.app.log.info("Performing season pack search for " + show_object.name)
 
                 # search provider for episodes
-                found_results = providerObj.find_search_results(show_id,
-                                                                season,
-                                                                episode,
-                                                                search_mode,
-                                                                manualSearch,
-                                                                downCurQuality,
-                                                                cacheOnly)
+                with PROVIDER_SEARCH_SECONDS.labels(providerObj.id).time():
+                    found_results = providerObj.find_search_results(show_id,
+                                                                    season,
+                                                                    episode,
+                                                                    search_mode,
+                                                                    manualSearch,
+                                                                    downCurQuality,
+                                                                    cacheOnly)
+                PROVIDER_SEARCH_RESULTS.labels(providerObj.id).inc(sum(len(x) for x in found_results.values()))
             except AuthException as e:
+                PROVIDER_SEARCH_ERRORS.labels(providerObj.id).inc()
                 sickrage.app.log.warning("Authentication error: {}".format(e))
                 break
             except Exception as e:
+                PROVIDER_SEARCH_ERRORS.labels(providerObj.id).inc()
                 sickrage.app.log.error("Error while searching " + providerObj.name + ", skipping: {}".format(e))
                 break
             finally:
@@ -553,19 +691,15 @@ def search_providers(show_id, season, episode, manualSearch=False, downCurQualit
             # add result
             final_results.append(best_result)
 
-        # narrow results by comparing quality
-        if len(final_results) > 1:
-            final_results = list(set([a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.quality >= b.quality]))
-
-        # narrow results by comparing seeders for torrent results
-        if len(final_results) > 1:
-            final_results = list(set(
-                [a for a, b in itertools.product(final_results, repeat=len(final_results)) if a.provider.type == NZBProvider.type or a.seeders > b.seeders]))
+        # rank results by quality, proper/repack, size, seeders and provider priority
+        ranked_results = ranker.rank(final_results)
 
         # check that we got all the episodes we wanted first before doing a match and snatch
-        for result in final_results.copy():
-            if all([episode in result.episodes and is_final_result(result)]):
+        for result in ranked_results:
+            if episode in result.episodes and is_final_result(result):
                 return result
 
-    if len(final_results) == 1:
-        return next(iter(final_results))
+    if final_results:
+        best_result = ranker.best(final_results)
+        sickrage.app.log.debug("Picked " + best_result.name + " as the best of all providers")
+        return best_result
@@ -20,19 +20,38 @@
 
 import datetime
 
+from sqlalchemy import and_, or_
+
 import sickrage
-from sickrage.core.common import UNAIRED, SKIPPED, statusStrings
+from sickrage.core.common import UNAIRED, SKIPPED, statusStrings, Quality, WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.databases.main import MainDB
 
 
+def wanted_episodes_criterion(show):
+    """
+    :param show: show object
+    :return: SQL criterion of the episodes of a show that are wanted or can be upgraded to one of its qualities
+    """
+    any_qualities, best_qualities = Quality.split_quality(show.quality)
+    qualities = best_qualities or any_qualities
+    if not qualities:
+        return TVEpisode.ep_status == WANTED
+
+    statuses = [SNATCHED, SNATCHED_PROPER] + ([DOWNLOADED] if not show.skip_downloaded else [])
+
+    return or_(TVEpisode.ep_status == WANTED, and_(TVEpisode.ep_status.in_(statuses),
+                                                  TVEpisode.ep_quality.notin_(qualities),
+                                                  or_(TVEpisode.ep_quality == Quality.UNKNOWN, TVEpisode.ep_quality < max(qualities))))
+
+
 @MainDB.with_session
 def new_episode_finder(session=None):
     cur_date = datetime.date.today()
     cur_date += datetime.timedelta(days=1)
     cur_time = datetime.datetime.now(sickrage.app.tz)
 
-    for episode_object in session.query(TVEpisode).filter_by(status=UNAIRED).filter(TVEpisode.season > 0, TVEpisode.airdate > datetime.date.min):
+    for episode_object in session.query(TVEpisode).filter_by(ep_status=UNAIRED).filter(TVEpisode.season > 0, TVEpisode.airdate > datetime.date.min):
         if episode_object.show.paused:
             continue
 
@@ -26,10 +26,10 @@ import threading
 from sqlalchemy import orm
 
 import sickrage
-from sickrage.core.common import Quality, DOWNLOADED, SNATCHED, SNATCHED_PROPER, WANTED
 from sickrage.core.databases.main import MainDB
 from sickrage.core.queues.search import BacklogQueueItem
-from sickrage.core.searchers import new_episode_finder
+from sickrage.core.searchers import new_episode_finder, wanted_episodes_criterion
+from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 
 
@@ -98,7 +98,7 @@ class BacklogSearcher(object):
                 if (curShow.indexer_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
                     sickrage.app.search_queue.SNATCH_HISTORY.remove((curShow.indexer_id, season, episode))
 
-                sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(curShow.indexer_id, season, episode))
+            sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(curShow.indexer_id, wanted))
 
             if from_date == datetime.date.min and not show_id:
                 self._set_last_backlog_search(curShow, cur_date)
@@ -106,42 +106,13 @@ class BacklogSearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_wanted(show, from_date):
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-
+    @MainDB.with_session
+    def _get_wanted(show, from_date, session=None):
         sickrage.app.log.debug("Seeing if we need anything that's older then today for {}".format(show.name))
 
         # check through the list of statuses to see if we want any
-        wanted = []
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not datetime.date.today() > episode_object.airdate > from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(int(episode_object.status or -1))
-
-            # if we need a better one then say yes
-            if cur_status not in {WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER}:
-                continue
-
-            if cur_status != WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
+        return [(x.season, x.episode) for x in session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show.indexer_id).filter(
+            TVEpisode.season > 0, TVEpisode.airdate > from_date, TVEpisode.airdate < datetime.date.today(), wanted_episodes_criterion(show))]
 
     @staticmethod
     def _get_last_backlog_search(show):
@@ -22,9 +22,9 @@ import datetime
 import threading
 
 import sickrage
-from sickrage.core.common import Quality, WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER
 from sickrage.core.queues.search import DailySearchQueueItem
-from sickrage.core.searchers import new_episode_finder
+from sickrage.core.searchers import new_episode_finder, wanted_episodes_criterion
+from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show.helpers import get_show_list
 from sickrage.core.databases.main import MainDB
 
@@ -71,7 +71,8 @@ class DailySearcher(object):
         self.amActive = False
 
     @staticmethod
-    def _get_wanted(show, from_date):
+    @MainDB.with_session
+    def _get_wanted(show, from_date, session=None):
         """
         Get a list of episodes that we want to download
         :param show: Show these episodes are from
@@ -79,40 +80,8 @@ class DailySearcher(object):
         :return: list of wanted episodes
         """
 
-        wanted = []
-
-        any_qualities, best_qualities = Quality.split_quality(show.quality)
-        all_qualities = list(set(any_qualities + best_qualities))
-
         sickrage.app.log.debug("Seeing if we need anything for today from {}".format(show.name))
 
         # check through the list of statuses to see if we want any
-        for episode_object in show.episodes:
-            if not episode_object.season > 0 or not episode_object.airdate >= from_date:
-                continue
-
-            cur_status, cur_quality = Quality.split_composite_status(int(episode_object.status or -1))
-
-            # if we need a better one then say yes
-            if cur_status not in (WANTED, DOWNLOADED, SNATCHED, SNATCHED_PROPER):
-                continue
-
-            if cur_status != WANTED:
-                if best_qualities:
-                    if cur_quality in best_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(best_qualities):
-                        continue
-                else:
-                    if cur_quality in any_qualities:
-                        continue
-                    elif cur_quality != Quality.UNKNOWN and cur_quality > max(any_qualities):
-                        continue
-
-            # skip upgrading quality of downloaded episodes if enabled
-            if cur_status == DOWNLOADED and show.skip_downloaded:
-                continue
-
-            wanted += [(episode_object.season, episode_object.episode)]
-
-        return wanted
+        return [(x.season, x.episode) for x in session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show.indexer_id).filter(
+            TVEpisode.season > 0, TVEpisode.airdate >= from_date, wanted_episodes_criterion(show))]
@@ -28,7 +28,7 @@ import traceback
 from sqlalchemy import orm
 
 import sickrage
-from sickrage.core.common import DOWNLOADED, Quality, SNATCHED, SNATCHED_PROPER, cpu_presets
+from sickrage.core.common import DOWNLOADED, Quality, SNATCHED, SNATCHED_BEST, SNATCHED_PROPER, cpu_presets
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import AuthException
 from sickrage.core.helpers import remove_non_release_groups
@@ -82,51 +82,70 @@ class ProperSearcher(object):
 
         orig_thread_name = threading.currentThread().getName()
 
+        wanted = {}
         for show in get_show_list(session=session):
-            wanted = self._get_wanted(show, search_date)
-            if not wanted:
+            show_wanted = self._get_wanted(show, search_date)
+            if not show_wanted:
                 sickrage.app.log.debug("Nothing needs to be downloaded for {}, skipping".format(show.name))
                 continue
 
-            self._lastProperSearch = self._get_last_proper_search(show.indexer_id)
+            wanted[show.indexer_id] = set(show_wanted)
 
-            # for each provider get a list of the
-            for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.randomize_providers).items():
-                # check provider type and provider is enabled
-                if not sickrage.app.config.use_nzbs and providerObj.type in [NZBProvider.type, NewznabProvider.type]:
-                    continue
-                elif not sickrage.app.config.use_torrents and providerObj.type in [TorrentProvider.type, TorrentRssProvider.type]:
-                    continue
-                elif not providerObj.isEnabled:
-                    continue
+        if not wanted:
+            return final_propers
 
-                threading.currentThread().setName(orig_thread_name + " :: [" + providerObj.name + "]")
-
-                sickrage.app.log.info("Searching for any new PROPER releases from " + providerObj.name)
+        # for each provider get a list of the
+        for providerID, providerObj in sickrage.app.search_providers.sort(randomize=sickrage.app.config.randomize_providers).items():
+            # check provider type and provider is enabled
+            if not sickrage.app.config.use_nzbs and providerObj.type in [NZBProvider.type, NewznabProvider.type]:
+                continue
+            elif not sickrage.app.config.use_torrents and providerObj.type in [TorrentProvider.type, TorrentRssProvider.type]:
+                continue
+            elif not providerObj.isEnabled:
+                continue
 
-                try:
-                    for season, episode in wanted:
-                        for x in providerObj.find_propers(show.indexer_id, season, episode):
-                            if not re.search(r'(^|[. _-])(proper|repack)([. _-]|$)', x.name, re.I):
-                                sickrage.app.log.debug('Found a non-proper, we have caught and skipped it.')
-                                continue
+            threading.currentThread().setName(orig_thread_name + " :: [" + providerObj.name + "]")
 
-                            name = self._generic_name(x.name)
-                            if name not in propers:
-                                sickrage.app.log.debug("Found new proper: " + x.name)
-                                x.provider = providerObj
-                                propers[name] = x
-                except AuthException as e:
-                    sickrage.app.log.warning("Authentication error: {}".format(e))
-                    continue
-                except Exception as e:
-                    sickrage.app.log.debug("Error while searching " + providerObj.name + ", skipping: {}".format(e))
-                    sickrage.app.log.debug(traceback.format_exc())
-                    continue
+            sickrage.app.log.info("Searching for any new PROPER releases from " + providerObj.name)
 
+            try:
+                found_propers = None
+
+                if providerObj.supports_generic_search:
+                    try:
+                        found_propers = self._match_wanted(providerObj.find_generic_propers(), wanted)
+                    except AuthException:
+                        raise
+                    except Exception as e:
+                        sickrage.app.log.debug("Generic PROPER search of {} failed, searching each wanted episode instead: {}".format(providerObj.name, e))
+
+                if found_propers is None:
+                    # fallback to searching each wanted episode
+                    found_propers = [x for show_id in wanted for season, episode in sorted(wanted[show_id])
+                                     for x in providerObj.find_propers(show_id, season, episode)]
+
+                for x in found_propers:
+                    if not re.search(r'(^|[. _-])(proper|repack)([. _-]|$)', x.name, re.I):
+                        sickrage.app.log.debug('Found a non-proper, we have caught and skipped it.')
+                        continue
+
+                    name = self._generic_name(x.name)
+                    if name not in propers:
+                        sickrage.app.log.debug("Found new proper: " + x.name)
+                        x.provider = providerObj
+                        propers[name] = x
+            except AuthException as e:
+                sickrage.app.log.warning("Authentication error: {}".format(e))
+                continue
+            except Exception as e:
+                sickrage.app.log.debug("Error while searching " + providerObj.name + ", skipping: {}".format(e))
+                sickrage.app.log.debug(traceback.format_exc())
+                continue
+            finally:
                 threading.currentThread().setName(orig_thread_name)
 
-            self._set_last_proper_search(show.indexer_id, datetime.datetime.today().toordinal(), session=session)
+        for show_id in wanted:
+            self._set_last_proper_search(show_id, datetime.datetime.today().toordinal(), session=session)
 
         # take the list of unique propers and get it sorted by
         sorted_propers = sorted(propers.values(), key=operator.attrgetter('date'), reverse=True)
@@ -216,11 +235,33 @@ class ProperSearcher(object):
         wanted = []
 
         for episode_object in session.query(TVEpisode).filter_by(showid=show.indexer_id).filter(
-                TVEpisode.airdate >= search_date, TVEpisode.status.in_(Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST)):
+                TVEpisode.airdate >= search_date, TVEpisode.ep_status.in_([DOWNLOADED, SNATCHED, SNATCHED_BEST])):
             wanted += [(episode_object.season, episode_object.episode)]
 
         return wanted
 
+    def _match_wanted(self, results, wanted):
+        """
+        Keep the results that are for one of the wanted episodes
+
+        :param results: list of result objects
+        :param wanted: dict of show id -> set of wanted (season, episode)
+        :return: list of result objects
+        """
+        matched = []
+
+        for result in results:
+            try:
+                parse_result = NameParser(False).parse(result.name)
+            except (InvalidNameException, InvalidShowException):
+                continue
+
+            season = parse_result.season_number if parse_result.season_number is not None else 1
+            if any((season, x) in wanted.get(parse_result.indexer_id, ()) for x in parse_result.episode_numbers):
+                matched.append(result)
+
+        return matched
+
     @MainDB.with_session
     def _download_propers(self, proper_list, session=None):
         """
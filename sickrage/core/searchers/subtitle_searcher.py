@@ -20,14 +20,24 @@
 import datetime
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from sqlalchemy import or_, and_
 
 import sickrage
-from sickrage.subtitles import Subtitles
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.tv.episode import TVEpisode
-from sickrage.core.tv.show.helpers import get_show_list, find_show
+from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.helpers import find_show
+from sickrage.subtitles import Subtitles, SubtitleProviderPools
+
+SUBTITLE_WORKERS = 4
+
+# hours to wait before searching again for an episode that had no subtitles, doubled with every miss
+MISS_BACKOFF = 6
+MISS_BACKOFF_MAX = 7 * 24
 
 
 class SubtitleSearcher(object):
@@ -40,8 +50,7 @@ class SubtitleSearcher(object):
         self.name = "SUBTITLESEARCHER"
         self.amActive = False
 
-    @MainDB.with_session
-    def run(self, force=False, session=None):
+    def run(self, force=False):
         if self.amActive or not sickrage.app.config.use_subtitles and not force:
             return
 
@@ -50,82 +59,132 @@ class SubtitleSearcher(object):
         # set thread name
         threading.currentThread().setName(self.name)
 
+        try:
+            self._run()
+        finally:
+            self.amActive = False
+
+    def _run(self):
         if len(Subtitles().getEnabledServiceList()) < 1:
             sickrage.app.log.warning('Not enough services selected. At least 1 service is required to search subtitles in the background')
             return
 
         sickrage.app.log.info('Checking for subtitles')
 
-        # get episodes on which we want subtitles
-        # criteria is:
-        #  - show subtitles = 1
-        #  - episode subtitles != config wanted languages or 'und' (depends on config multi)
-        #  - search count < 2 and diff(airdate, now) > 1 week : now -> 1d
-        #  - search count < 7 and diff(airdate, now) <= 1 week : now -> 4h -> 8h -> 16h -> 1d -> 1d -> 1d
+        results = self._get_wanted_episodes()
+        if len(results) == 0:
+            sickrage.app.log.info('No subtitles to download')
+            return
+
+        pools = SubtitleProviderPools()
+
+        try:
+            with ThreadPoolExecutor(max_workers=SUBTITLE_WORKERS, thread_name_prefix=self.name) as executor:
+                for epToSub in results:
+                    executor.submit(self._download_subtitles, epToSub, pools)
+        finally:
+            pools.terminate()
 
+    @MainDB.with_session
+    def _get_wanted_episodes(self, session=None):
+        """
+        Get episodes on which we want subtitles, criteria is:
+         - show subtitles = 1
+         - episode subtitles != config wanted languages or 'und' (depends on config multi)
+         - search count < 2 and diff(airdate, now) > 1 week : now -> 1d
+         - search count < 7 and diff(airdate, now) <= 1 week : now -> 4h -> 8h -> 16h -> 1d -> 1d -> 1d
+         - no earlier search without results is still backing off
+        """
         rules = self._get_rules()
         now = datetime.datetime.now()
+        week_ago = datetime.date.today() - datetime.timedelta(days=7)
+
+        misses = self._get_misses()
 
         results = []
-        for s in get_show_list():
-            if s.subtitles != 1:
+        for e in session.query(TVEpisode.showid, TVShow.name, TVEpisode.season, TVEpisode.episode, TVEpisode.location,
+                               TVEpisode.airdate, TVEpisode.subtitles_searchcount, TVEpisode.subtitles_lastsearch).join(
+                TVShow, TVShow.indexer_id == TVEpisode.showid).filter(
+                TVShow.subtitles == 1, TVEpisode.location != '', ~TVEpisode.subtitles.in_(Subtitles().wanted_languages()),
+                or_(and_(TVEpisode.airdate < week_ago, TVEpisode.subtitles_searchcount < 2),
+                    and_(TVEpisode.airdate >= week_ago, TVEpisode.subtitles_searchcount < 7))):
+            searchcount = e.subtitles_searchcount or 0
+            wait = rules['old' if e.airdate < week_ago else 'new'][searchcount]
+            if now - datetime.datetime.fromordinal(e.subtitles_lastsearch or 1) <= datetime.timedelta(hours=wait):
                 continue
 
-            for e in session.query(TVEpisode).filter_by(showid=s.indexer_id).filter(
-                    TVEpisode.location != '', ~TVEpisode.subtitles.in_(
-                        Subtitles().wanted_languages()
-                    ), or_(TVEpisode.subtitles_searchcount <= 2,
-                           and_(TVEpisode.subtitles_searchcount <= 7,
-                                datetime.date.today() - TVEpisode.airdate))):
-                results += [{
-                    'show_name': s.name,
-                    'show_id': s.indexer_id,
-                    'season': e.season,
-                    'episode': e.episode,
-                    'status': e.status,
-                    'subtitles': e.subtitles,
-                    'searchcount': e.subtitles_searchcount,
-                    'lastsearch': e.subtitles_lastsearch,
-                    'location': e.location,
-                    'airdate_daydiff': (datetime.date.today() - e.airdate)
-                }]
+            if misses.get((e.showid, e.season, e.episode), 0) > time.time():
+                continue
 
-        if len(results) == 0:
-            sickrage.app.log.info('No subtitles to download')
-            return
+            if not os.path.isfile(e.location):
+                sickrage.app.log.debug('Episode file does not exist, cannot download '
+                                       'subtitles for episode %dx%d of show %s' % (e.season, e.episode, e.name))
+                continue
+
+            results += [{
+                'show_name': e.name,
+                'show_id': e.showid,
+                'season': e.season,
+                'episode': e.episode,
+            }]
+
+        return results
 
-        for epToSub in results:
+    @MainDB.with_session
+    def _download_subtitles(self, epToSub, pools, session=None):
+        try:
             show_object = find_show(epToSub['show_id'], session=session)
             episode_object = show_object.get_episode(epToSub['season'], epToSub['episode'])
 
-            if not os.path.isfile(epToSub['location']):
-                sickrage.app.log.debug('Episode file does not exist, cannot download '
-                                       'subtitles for episode %dx%d of show %s' % (episode_object.season, episode_object.episode, epToSub['show_name']))
-                continue
+            sickrage.app.log.debug('Downloading subtitles for '
+                                   'episode %dx%d of show %s' % (episode_object.season, episode_object.episode, epToSub['show_name']))
+
+            existing_subtitles = episode_object.subtitles
+            episode_object.download_subtitles(pools=pools)
+        except Exception as e:
+            sickrage.app.log.debug('Unable to find subtitles')
+            sickrage.app.log.debug(str(e))
+            return
+
+        new_subtitles = frozenset(episode_object.subtitles.split(',')).difference(existing_subtitles.split(','))
+        if new_subtitles:
+            sickrage.app.log.info('Downloaded subtitles '
+                                  'for S%02dE%02d in %s' % (episode_object.season, episode_object.episode, ', '.join(new_subtitles)))
 
-            if ((epToSub['airdate_daydiff'] > 7 and epToSub['searchcount'] < 2 and now - datetime.datetime.fromordinal(
-                    epToSub['lastsearch']) > datetime.timedelta(hours=rules['old'][epToSub['searchcount']])) or
-                    (epToSub['airdate_daydiff'] <= 7 and epToSub['searchcount'] < 7 and
-                     now - datetime.datetime.fromordinal(epToSub['lastsearch']) > datetime.timedelta(hours=rules['new'][epToSub['searchcount']]))):
+        self._update_miss(epToSub['show_id'], epToSub['season'], epToSub['episode'], not new_subtitles)
+
+    @staticmethod
+    def _languages_key():
+        return '{}:{}'.format(int(sickrage.app.config.subtitles_multi), ','.join(sorted(Subtitles().wanted_languages())))
 
-                sickrage.app.log.debug('Downloading subtitles for '
-                                       'episode %dx%d of show %s' % (episode_object.season, episode_object.episode, epToSub['show_name']))
+    @CacheDB.with_session
+    def _get_misses(self, session=None):
+        """
+        :return: dict of (show id, season, episode) -> time the episode can be searched again, searches
+                 for other languages than the ones wanted now don't count
+        """
+        languages = self._languages_key()
+        return {(x.showid, x.season, x.episode): x.next_search for x in session.query(CacheDB.SubtitleMiss) if x.languages == languages}
 
-                existing_subtitles = episode_object.subtitles
+    @CacheDB.with_session
+    def _update_miss(self, show_id, season, episode, missed, session=None):
+        languages = self._languages_key()
 
-                try:
-                    episode_object.download_subtitles()
-                except Exception as e:
-                    sickrage.app.log.debug('Unable to find subtitles')
-                    sickrage.app.log.debug(str(e))
-                    return
+        miss = session.query(CacheDB.SubtitleMiss).filter_by(showid=show_id, season=season, episode=episode).one_or_none()
+        if not missed:
+            if miss:
+                session.delete(miss)
+            return
 
-                new_subtitles = frozenset(episode_object.subtitles).difference(existing_subtitles)
-                if new_subtitles:
-                    sickrage.app.log.info('Downloaded subtitles '
-                                          'for S%02dE%02d in %s' % (episode_object.season, episode_object.episode, ', '.join(new_subtitles)))
+        if not miss:
+            miss = CacheDB.SubtitleMiss(showid=show_id, season=season, episode=episode, misses=0)
+            session.add(miss)
+        elif miss.languages != languages:
+            miss.misses = 0
 
-        self.amActive = False
+        miss.languages = languages
+        miss.misses += 1
+        miss.next_search = int(time.time() + min(MISS_BACKOFF * 2 ** (miss.misses - 1), MISS_BACKOFF_MAX) * 3600)
 
     @staticmethod
     def _get_rules():
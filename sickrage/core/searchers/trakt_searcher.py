@@ -20,20 +20,30 @@
 import datetime
 import os
 import threading
+import time
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 
 import sickrage
-from sickrage.core.common import Quality
-from sickrage.core.common import SKIPPED, WANTED, UNKNOWN
+from sickrage.core import metrics
+from sickrage.core.common import SKIPPED, WANTED, SNATCHED, SNATCHED_PROPER, SNATCHED_BEST, DOWNLOADED, ARCHIVED
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import EpisodeNotFoundException
 from sickrage.core.helpers import sanitize_file_name, make_dir, chmod_as_parent
 from sickrage.core.queues.search import BacklogQueueItem
 from sickrage.core.traktapi import TraktAPI
 from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show import TVShow
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 from sickrage.indexers import IndexerApi
 
+TRAKT_SYNC_SECONDS = metrics.histogram('sickrage_trakt_sync_seconds', 'Time spent in the phases of Trakt syncs', ['phase'])
+TRAKT_SYNC_EPISODES = metrics.counter('sickrage_trakt_sync_episodes', 'Episodes added to or removed from Trakt lists', ['phase'])
+
+# maximum number of episodes per bulk request
+BULK_SIZE = 500
+
 
 def set_episode_to_wanted(show, s, e):
     """
@@ -48,7 +58,7 @@ def set_episode_to_wanted(show, s, e):
 
         epObj.status = WANTED
 
-        sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(show.indexer_id, epObj.season, epObj.episode))
+        sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(show.indexer_id, [(epObj.season, epObj.episode)]))
 
         sickrage.app.log.info("Starting backlog search for %s S%02dE%02d because some episodes were set to wanted" % (show.name, s, e))
     except EpisodeNotFoundException as e:
@@ -64,6 +74,10 @@ class TraktSearcher(object):
         self.ShowWatchlist = {}
         self.EpisodeWatchlist = {}
         self.Collectionlist = {}
+        self.show_watchlist_index = set()
+        self.episode_watchlist_index = set()
+        self.collection_index = set()
+        self.durations = OrderedDict()
         self.amActive = False
 
     def run(self, force=False):
@@ -101,11 +115,17 @@ class TraktSearcher(object):
 
         self.remove_show_from_sick_rage()
 
-        if self._get_show_watchlist():
+        with self.sync_phase('show_watchlist_fetch'):
+            fetched = self._get_show_watchlist()
+
+        if fetched:
             self.add_show_to_trakt_watch_list()
             self.update_shows()
 
-        if self._get_episode_watchlist():
+        with self.sync_phase('episode_watchlist_fetch'):
+            fetched = self._get_episode_watchlist()
+
+        if fetched:
             self.add_episodes_to_trakt_watch_list()
             if sickrage.app.config.trakt_remove_show_from_sickrage:
                 self.remove_episodes_from_trakt_watch_list()
@@ -113,25 +133,25 @@ class TraktSearcher(object):
 
     def sync_collection(self):
         sickrage.app.log.debug("Syncing SiCKRAGE with Trakt Collection")
-        if self._get_show_collection():
+
+        with self.sync_phase('collection_fetch'):
+            fetched = self._get_show_collection()
+
+        if fetched:
             self.add_episodes_to_trakt_collection()
             if sickrage.app.config.trakt_sync_remove:
                 self.remove_episodes_from_trakt_collection()
 
     def find_show_match(self, indexer, indexer_id):
-        traktShow = None
-
-        try:
-            library = TraktAPI()["sync/collection"].shows() or {}
-            if not library:
-                sickrage.app.log.debug("No shows found in your library, aborting library update")
-                return
+        if not self._get_show_collection():
+            sickrage.app.log.warning("Could not connect to Trakt service. Aborting library check.")
+            return False
 
-            traktShow = [x for __, x in library.items() if int(indexer_id) == int(x.ids[IndexerApi(indexer).trakt_id])]
-        except Exception as e:
-            sickrage.app.log.warning("Could not connect to Trakt service. Aborting library check. Error: %s" % repr(e))
+        if not self.Collectionlist:
+            sickrage.app.log.debug("No shows found in your library, aborting library update")
+            return False
 
-        return traktShow
+        return (IndexerApi(indexer).trakt_id, int(indexer_id)) in self.show_index(self.Collectionlist)
 
     def remove_show_from_trakt_library(self, show_obj):
         if self.find_show_match(show_obj.indexer, show_obj.indexer_id):
@@ -186,104 +206,106 @@ class TraktSearcher(object):
 
     @MainDB.with_session
     def add_episodes_to_trakt_collection(self, session=None):
-        trakt_data = []
-
-        sickrage.app.log.debug("COLLECTION::SYNC::START - Look for Episodes to Add to Trakt Collection")
-
-        for s in get_show_list(session=session):
-            for e in s.episodes:
-                trakt_id = IndexerApi(s.indexer).trakt_id
-                if not self._check_in_list(trakt_id, str(e.showid), e.season, e.episode, 'Collection'):
-                    sickrage.app.log.debug(
-                        "Adding Episode %s S%02dE%02d to collection" % (s.name, e.season, e.episode))
-                    trakt_data.append((e.showid, s.indexer, s.name, s.startyear, e.season, e.episode))
-
-        if len(trakt_data):
-            try:
-                TraktAPI()["sync/collection"].add(self.trakt_bulk_data_generate(trakt_data))
-                self._get_show_collection()
-            except Exception as e:
-                sickrage.app.log.warning("Could not connect to Trakt service. Error: %s" % e)
-
-        sickrage.app.log.debug("COLLECTION::ADD::FINISH - Look for Episodes to Add to Trakt Collection")
+        """
+        Adds the episodes that have a file and aren't in the Trakt collection
+        """
+        with self.sync_phase('collection_add'):
+            episodes = self.local_episodes(TVEpisode.location != '', session=session)
+            self.collection_index |= self.push('collection_add', TraktAPI()["sync/collection"].add, episodes,
+                                               set(episodes).difference(self.collection_index))
 
     @MainDB.with_session
     def remove_episodes_from_trakt_collection(self, session=None):
-        trakt_data = []
+        """
+        Removes the episodes that have no file from the Trakt collection
+        """
+        with self.sync_phase('collection_remove'):
+            episodes = self.local_episodes(TVEpisode.location == '', session=session)
+            self.collection_index -= self.push('collection_remove', TraktAPI()["sync/collection"].remove, episodes,
+                                               set(episodes).intersection(self.collection_index))
 
-        sickrage.app.log.debug(
-            "COLLECTION::REMOVE::START - Look for Episodes to Remove From Trakt Collection")
+    @MainDB.with_session
+    def remove_episodes_from_trakt_watch_list(self, session=None):
+        """
+        Removes the downloaded episodes from the Trakt watchlist
+        """
+        with self.sync_phase('watchlist_remove'):
+            episodes = self.local_episodes(TVEpisode.ep_status.in_([DOWNLOADED, ARCHIVED]), session=session)
+            self.episode_watchlist_index -= self.push('watchlist_remove', TraktAPI()["sync/watchlist"].remove, episodes,
+                                                      set(episodes).intersection(self.episode_watchlist_index))
 
-        for s in get_show_list(session=session):
-            for e in s.episodes:
-                if e.location:
-                    continue
+    @MainDB.with_session
+    def add_episodes_to_trakt_watch_list(self, session=None):
+        """
+        Adds the wanted and snatched episodes that aren't in the Trakt watchlist
+        """
+        with self.sync_phase('watchlist_add'):
+            episodes = self.local_episodes(TVEpisode.ep_status.in_([WANTED, SNATCHED, SNATCHED_PROPER, SNATCHED_BEST]), session=session)
+            self.episode_watchlist_index |= self.push('watchlist_add', TraktAPI()["sync/watchlist"].add, episodes,
+                                                      set(episodes).difference(self.episode_watchlist_index))
 
-                trakt_id = IndexerApi(s.indexer).trakt_id
-                if self._check_in_list(trakt_id, str(e.showid), e.season, e.episode, 'Collection'):
-                    sickrage.app.log.debug(
-                        "Removing Episode %s S%02dE%02d from collection" % (s.name, e.season, e.episode))
-                    trakt_data.append((e.showid, s.indexer, s.name, s.startyear, e.season, e.episode))
+    @staticmethod
+    @MainDB.with_session
+    def local_episodes(*criterion, session=None):
+        """
+        :param criterion: SQL criterion of the episodes
+        :return: dict of (trakt id, indexer id, season, episode) -> (indexer id, indexer, show name, start year, season, episode)
+        """
+        trakt_ids = {}
 
-        if len(trakt_data):
-            try:
-                TraktAPI()["sync/collection"].remove(self.trakt_bulk_data_generate(trakt_data))
-                self._get_show_collection()
-            except Exception as e:
-                sickrage.app.log.warning("Could not connect to Trakt service. Error: %s" % e)
+        episodes = {}
+        for row in session.query(TVShow.indexer_id, TVShow.indexer, TVShow.name, TVShow.startyear, TVEpisode.season, TVEpisode.episode).join(
+                TVShow.episodes).filter(*criterion):
+            if row.indexer not in trakt_ids:
+                trakt_ids[row.indexer] = IndexerApi(row.indexer).trakt_id
+            episodes[(trakt_ids[row.indexer], row.indexer_id, row.season, row.episode)] = tuple(row)
 
-        sickrage.app.log.debug(
-            "COLLECTION::REMOVE::FINISH - Look for Episodes to Remove From Trakt Collection")
+        return episodes
 
-    @MainDB.with_session
-    def remove_episodes_from_trakt_watch_list(self, session=None):
-        trakt_data = []
+    def push(self, phase, request, episodes, keys):
+        """
+        Sends episodes to Trakt in bulk requests of at most ``BULK_SIZE`` episodes
 
-        sickrage.app.log.debug(
-            "WATCHLIST::REMOVE::START - Look for Episodes to Remove from Trakt Watchlist")
+        :param phase: name of the sync phase
+        :param request: Trakt API method sending the request
+        :param episodes: dict of local episodes returned by ``local_episodes``
+        :param keys: keys of the episodes to send
+        :return: keys of the episodes that were sent
+        """
+        keys = sorted(keys)
+        sent = set()
 
-        for s in get_show_list(session=session):
-            for e in s.episodes:
-                trakt_id = IndexerApi(s.indexer).trakt_id
-                if self._check_in_list(trakt_id, str(e.showid), e.season, e.episode):
-                    sickrage.app.log.debug(
-                        "Removing Episode %s S%02dE%02d from watchlist" % (s.name, e.season, e.episode))
-                    trakt_data.append((e.showid, s.indexer, s.name, s.startyear, e.season, e.episode))
+        for i in range(0, len(keys), BULK_SIZE):
+            chunk = keys[i:i + BULK_SIZE]
 
-        if len(trakt_data):
             try:
-                data = self.trakt_bulk_data_generate(trakt_data)
-                TraktAPI()["sync/watchlist"].remove(data)
-                self._get_episode_watchlist()
+                request(self.trakt_bulk_data_generate([episodes[x] for x in chunk]))
             except Exception as e:
                 sickrage.app.log.warning("Could not connect to Trakt service. Error: %s" % e)
+                break
 
-        sickrage.app.log.debug(
-            "WATCHLIST::REMOVE::FINISH - Look for Episodes to Remove from Trakt Watchlist")
+            sent.update(chunk)
 
-    @MainDB.with_session
-    def add_episodes_to_trakt_watch_list(self, session=None):
-        trakt_data = []
+        TRAKT_SYNC_EPISODES.labels(phase).inc(len(sent))
+        sickrage.app.log.debug("Trakt sync {}: sent {} of {} episodes".format(phase, len(sent), len(keys)))
 
-        sickrage.app.log.debug("WATCHLIST::ADD::START - Look for Episodes to Add to Trakt Watchlist")
+        return sent
 
-        for s in get_show_list(session=session):
-            for e in session.query(TVEpisode).filter_by(showid=s.indexer_id).filter(
-                    ~TVEpisode.episode.in_(Quality.SNATCHED + Quality.SNATCHED_PROPER + [UNKNOWN] + [WANTED])):
-                trakt_id = IndexerApi(s.indexer).trakt_id
-                if self._check_in_list(trakt_id, str(e.showid), e.season, e.episode):
-                    sickrage.app.log.debug("Adding Episode %s S%02dE%02d to watchlist" % (s.name, e.season, e.episode))
-                    trakt_data.append((e.showid, s.indexer, s.name, s.startyear, e.season, e.episode))
+    @contextmanager
+    def sync_phase(self, phase):
+        """
+        Logs and records how long a phase of the sync took
+        """
+        start = time.time()
 
-        if len(trakt_data):
-            try:
-                data = self.trakt_bulk_data_generate(trakt_data)
-                TraktAPI()["sync/watchlist"].add(data)
-                self._get_episode_watchlist()
-            except Exception as e:
-                sickrage.app.log.warning("Could not connect to Trakt service. Error %s" % e)
+        sickrage.app.log.debug("Trakt sync {}: start".format(phase))
 
-        sickrage.app.log.debug("WATCHLIST::ADD::FINISH - Look for Episodes to Add to Trakt Watchlist")
+        try:
+            yield
+        finally:
+            self.durations[phase] = time.time() - start
+            TRAKT_SYNC_SECONDS.labels(phase).observe(self.durations[phase])
+            sickrage.app.log.debug("Trakt sync {}: finished in {:.2f}s".format(phase, self.durations[phase]))
 
     def add_show_to_trakt_watch_list(self):
         trakt_data = []
@@ -291,7 +313,7 @@ class TraktSearcher(object):
         sickrage.app.log.debug("SHOW_WATCHLIST::ADD::START - Look for Shows to Add to Trakt Watchlist")
 
         for show in get_show_list():
-            if not self._check_in_list(IndexerApi(show.indexer).trakt_id, str(show.indexer_id), 0, 0, 'Show'):
+            if (IndexerApi(show.indexer).trakt_id, show.indexer_id) not in self.show_watchlist_index:
                 sickrage.app.log.debug(
                     "Adding Show: Indexer %s %s - %s to Watchlist" % (
                         IndexerApi(show.indexer).trakt_id, str(show.indexer_id), show.name))
@@ -451,26 +473,38 @@ class TraktSearcher(object):
             self.todoWanted.remove(episode)
             set_episode_to_wanted(show, episode[1], episode[2])
 
-    def _check_in_list(self, trakt_id, showid, season, episode, List=None):
+    @staticmethod
+    def show_index(trakt_list):
         """
-         Check in the Watchlist or CollectionList for Show
-         Is the Show, Season and Episode in the trakt_id list (tvdb / tvrage)
+        :param trakt_list: shows of a Trakt list keyed by (trakt id, indexer id)
+        :return: set of (trakt id, indexer id) of the shows in the list
         """
-        if "Collection" == List:
+        index = set()
+        for trakt_id, indexer_id in trakt_list.keys():
             try:
-                if self.Collectionlist[trakt_id, showid].seasons[int(season)].episodes[int(episode)]: return True
-            except Exception:
-                return False
-        elif "Show" == List:
-            try:
-                if self.ShowWatchlist[trakt_id, showid]: return True
-            except Exception:
-                return False
-        else:
+                index.add((trakt_id, int(indexer_id)))
+            except (TypeError, ValueError):
+                continue
+        return index
+
+    @staticmethod
+    def episode_index(trakt_list):
+        """
+        :param trakt_list: shows of a Trakt list keyed by (trakt id, indexer id)
+        :return: set of (trakt id, indexer id, season, episode) of the episodes in the list
+        """
+        index = set()
+        for (trakt_id, indexer_id), show in trakt_list.items():
             try:
-                if self.EpisodeWatchlist[trakt_id, showid].seasons[int(season)].episodes[int(episode)]: return True
-            except Exception:
-                return False
+                indexer_id = int(indexer_id)
+            except (TypeError, ValueError):
+                continue
+
+            for season_number, season in (getattr(show, 'seasons', None) or {}).items():
+                for episode_number in season.episodes.keys():
+                    index.add((trakt_id, indexer_id, int(season_number), int(episode_number)))
+
+        return index
 
     def _get_show_watchlist(self):
         """
@@ -479,6 +513,7 @@ class TraktSearcher(object):
         try:
             sickrage.app.log.debug("Getting Show Watchlist")
             self.ShowWatchlist = TraktAPI()["sync/watchlist"].shows() or {}
+            self.show_watchlist_index = self.show_index(self.ShowWatchlist)
         except Exception as e:
             sickrage.app.log.warning(
                 "Could not connect to trakt service, cannot download Show Watchlist: %s" % repr(e))
@@ -492,6 +527,7 @@ class TraktSearcher(object):
         try:
             sickrage.app.log.debug("Getting Episode Watchlist")
             self.EpisodeWatchlist = TraktAPI()["sync/watchlist"].episodes() or {}
+            self.episode_watchlist_index = self.episode_index(self.EpisodeWatchlist)
         except Exception as e:
             sickrage.app.log.warning(
                 "Could not connect to trakt service, cannot download Episode Watchlist: %s" % repr(e))
@@ -506,6 +542,7 @@ class TraktSearcher(object):
         try:
             sickrage.app.log.debug("Getting Show Collection")
             self.Collectionlist = TraktAPI()["sync/collection"].shows() or {}
+            self.collection_index = self.episode_index(self.Collectionlist)
         except Exception as e:
             sickrage.app.log.warning(
                 "Could not connect to trakt service, cannot download Show Collection: %s" % repr(e))
@@ -529,12 +566,7 @@ class TraktSearcher(object):
                                      'year': startyear,
                                      'ids': {IndexerApi(indexer).trakt_id: indexer_id}}
 
-            if indexer_id not in seasons:
-                seasons[indexer_id] = {}
-            if season not in seasons[indexer_id]:
-                seasons[indexer_id] = {season: []}
-            if episode not in seasons[indexer_id][season]:
-                seasons[indexer_id][season] += [{'number': episode}]
+            seasons.setdefault(indexer_id, OrderedDict()).setdefault(season, []).append({'number': episode})
 
         for indexer_id, seasonlist in seasons.items():
             if 'seasons' not in shows[indexer_id]: shows[indexer_id]['seasons'] = []
@@ -41,8 +41,10 @@ from sickrage.core.helpers import is_media_file, try_int, replace_extension, mod
     sanitize_file_name, safe_getattr, make_dirs, move_file, delete_empty_folders, file_size
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_seasonnotfound, indexer_error, indexer_episodenotfound
+from sickrage.metadata import metadata_file_cache, file_exists
 from sickrage.notifiers import Notifiers
 from sickrage.subtitles import Subtitles
+from sickrage.subtitles.inventory import SubtitleInventory
 
 
 class TVEpisode(MainDBBase):
@@ -54,6 +56,8 @@ class TVEpisode(MainDBBase):
         Index('idx_sta_epi_air', 'status', 'episode', 'airdate'),
         Index('idx_sea_epi_sta_air', 'season', 'episode', 'status', 'airdate'),
         Index('idx_indexer_id_airdate', 'indexer_id', 'airdate'),
+        Index('idx_showid_ep_status_ep_quality', 'showid', 'ep_status', 'ep_quality'),
+        Index('idx_ep_status_airdate', 'ep_status', 'airdate'),
     )
 
     showid = Column(Integer, index=True, primary_key=True)
@@ -72,6 +76,8 @@ class TVEpisode(MainDBBase):
     hasnfo = Column(Boolean, default=False)
     hastbn = Column(Boolean, default=False)
     status = Column(Integer, default=UNKNOWN)
+    ep_status = Column(Integer, index=True, default=UNKNOWN)
+    ep_quality = Column(Integer, index=True, default=Quality.UNKNOWN)
     location = Column(Text, default='')
     file_size = Column(BigInteger, default=0)
     release_name = Column(Text, default='')
@@ -81,12 +87,19 @@ class TVEpisode(MainDBBase):
     version = Column(Integer, default=-1)
     release_group = Column(Text, default='')
 
-    show = relationship('TVShow', uselist=False, backref='tv_episodes', lazy='joined')
+    show = relationship('TVShow', uselist=False, backref='tv_episodes', lazy='selectin')
 
     def __init__(self, **kwargs):
         super(TVEpisode, self).__init__(**kwargs)
         self.checkForMetaFiles()
 
+    @validates('status')
+    def validate_status(self, key, status):
+        # keep the split status and quality columns in sync with the composite status so they can be queried
+        if isinstance(status, int):
+            self.ep_status, self.ep_quality = Quality.split_composite_status(status)
+        return status
+
     @validates('location')
     def validate_location(self, key, location):
         if os.path.exists(location):
@@ -101,13 +114,28 @@ class TVEpisode(MainDBBase):
     def related_episodes(self, value):
         setattr(self, '_related_episodes', value)
 
-    def refresh_subtitles(self):
-        """Look for subtitles files and refresh the subtitles property"""
-        subtitles, save_subtitles = Subtitles().refresh_subtitles(self.showid, self.season, self.episode)
-        if save_subtitles:
+    def refresh_subtitles(self, inventory=None):
+        """
+        Look for subtitles files and refresh the subtitles property
+
+        :param inventory: subtitle inventory of the show shared by its episodes, a new one if None
+        """
+        shared_inventory = inventory is not None
+        if not shared_inventory:
+            inventory = SubtitleInventory(self.showid)
+
+        subtitles = inventory.refresh(self.location) if self.location else None
+        if subtitles is None:
+            sickrage.app.log.debug("Episode file of {} doesn't exist, subtitles couldn't be refreshed".format(self.pretty_name()))
+        elif self.subtitles != ','.join(subtitles):
             self.subtitles = ','.join(subtitles)
+        else:
+            sickrage.app.log.debug('No changed subtitles for {}'.format(self.pretty_name()))
+
+        if not shared_inventory:
+            inventory.save()
 
-    def download_subtitles(self):
+    def download_subtitles(self, pools=None, inventory=None):
         if self.location == '':
             return
 
@@ -118,7 +146,7 @@ class TVEpisode(MainDBBase):
 
         sickrage.app.log.debug("%s: Downloading subtitles for S%02dE%02d" % (self.show.indexer_id, self.season or 0, self.episode or 0))
 
-        subtitles, newSubtitles = Subtitles().download_subtitles(self.showid, self.season, self.episode)
+        subtitles, newSubtitles = Subtitles().download_subtitles(self.showid, self.season, self.episode, pools=pools, inventory=inventory)
 
         self.subtitles = ','.join(subtitles)
         self.subtitles_searchcount += 1 if self.subtitles_searchcount else 1
@@ -144,7 +172,7 @@ class TVEpisode(MainDBBase):
         cur_tbn = False
 
         # check for nfo and tbn
-        if os.path.isfile(self.location):
+        if file_exists(self.location):
             for cur_provider in sickrage.app.metadata_providers.values():
                 if cur_provider.episode_metadata:
                     new_result = cur_provider._has_episode_metadata(self)
@@ -431,10 +459,11 @@ class TVEpisode(MainDBBase):
             sickrage.app.log.info(str(self.show.indexer_id) + ": The show dir is missing, not bothering to try to create metadata")
             return
 
-        self.create_nfo(force)
-        self.create_thumbnail(force)
+        with metadata_file_cache():
+            self.create_nfo(force)
+            self.create_thumbnail(force)
 
-        self.checkForMetaFiles()
+            self.checkForMetaFiles()
 
     def create_nfo(self, force=False):
         result = False
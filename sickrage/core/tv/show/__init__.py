@@ -37,18 +37,22 @@ import sickrage
 from sickrage.core.api import ApiError
 from sickrage.core.api.imdb import IMDbAPI
 from sickrage.core.blackandwhitelist import BlackAndWhiteList
+from sickrage.core.caches.dir_snapshot_cache import DirSnapshot
 from sickrage.core.caches.image_cache import ImageCache
 from sickrage.core.common import Quality, SKIPPED, WANTED, UNKNOWN, DOWNLOADED, IGNORED, SNATCHED, SNATCHED_PROPER, \
     UNAIRED, ARCHIVED, statusStrings, Overview
+from sickrage.core.databases import UnitOfWork
 from sickrage.core.databases.main import MainDB, MainDBBase
 from sickrage.core.exceptions import ShowNotFoundException, \
     EpisodeNotFoundException, EpisodeDeletedException, MultipleEpisodesInDatabaseException
-from sickrage.core.helpers import list_media_files, is_media_file, try_int, safe_getattr
+from sickrage.core.helpers import is_media_file, try_int, safe_getattr
 from sickrage.core.nameparser import NameParser, InvalidNameException, InvalidShowException
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.config import INDEXER_TVRAGE
 from sickrage.indexers.exceptions import indexer_attributenotfound
+from sickrage.metadata import metadata_file_cache, create_episodes_meta_files
+from sickrage.subtitles.inventory import SubtitleInventory
 
 
 class TVShow(MainDBBase):
@@ -89,7 +93,9 @@ class TVShow(MainDBBase):
     last_backlog_search = Column(Integer, default=datetime.datetime.now().toordinal())
     last_proper_search = Column(Integer, default=datetime.datetime.now().toordinal())
 
-    episodes = relationship('TVEpisode', uselist=True, backref='tv_shows', lazy='joined')
+    # episodes are loaded with one more query per batch of shows instead of joined to them, listings of shows
+    # that don't need them lazy load them, see ``get_show_list``
+    episodes = relationship('TVEpisode', uselist=True, backref='tv_shows', lazy='selectin')
     imdb_info = relationship('IMDbInfo', uselist=False, backref='tv_shows', lazy='joined')
 
     @property
@@ -376,11 +382,14 @@ class TVShow(MainDBBase):
 
         self.get_images()
 
-        self.write_show_nfo(force)
+        with metadata_file_cache() as cache:
+            self.write_show_nfo(force)
 
-        if not show_only:
-            self.write_episode_nfos(force)
-            self.update_episode_video_metadata()
+            if not show_only:
+                self.write_episode_nfos(force)
+                self.update_episode_video_metadata()
+
+        sickrage.app.log.info("{}: Metadata files written: {}, unchanged: {}".format(self.indexer_id, cache.written, cache.skipped))
 
     def write_episode_nfos(self, force=False):
         if not os.path.isdir(self.location):
@@ -389,13 +398,17 @@ class TVShow(MainDBBase):
 
         sickrage.app.log.debug(str(self.indexer_id) + ": Writing NFOs for all episodes")
 
-        for episode_obj in self.episodes:
-            if episode_obj.location == '':
-                continue
+        episodes = [x for x in self.episodes if x.location != '']
 
-            sickrage.app.log.debug(str(self.indexer_id) + ": Retrieving/creating episode S%02dE%02d" % (episode_obj.season or 0, episode_obj.episode or 0))
+        # the metadata workers load the episodes in sessions of their own
+        object_session(self).commit()
+        if UnitOfWork.current():
+            UnitOfWork.current().write()
+
+        create_episodes_meta_files([(x.showid, x.indexer, x.season, x.episode) for x in episodes], force)
 
-            episode_obj.create_meta_files(force)
+        for episode_obj in episodes:
+            episode_obj.checkForMetaFiles()
 
     def update_episode_video_metadata(self):
         if not os.path.isdir(self.location):
@@ -421,8 +434,25 @@ class TVShow(MainDBBase):
 
         sickrage.app.log.debug(str(self.indexer_id) + ": Loading all episodes from the show directory " + self.location)
 
-        # get file list
-        media_files = list_media_files(self.location)
+        # get file list, only files that changed since the last refresh need to be parsed again
+        snapshot = DirSnapshot(self.indexer_id, self.location)
+        media_files = snapshot.changed_media_files(set(os.path.normpath(x.location) for x in self.episodes if x.location))
+
+        sickrage.app.log.debug("{}: Directory snapshot found {} of {} media files unchanged".format(
+            self.indexer_id, len(snapshot.media_files) - len(media_files), len(snapshot.media_files)))
+
+        # one subtitle inventory for all episodes lists every directory once and skips unchanged episodes
+        inventory = SubtitleInventory(self.indexer_id)
+
+        # subtitles stored outside the show dir are not part of the snapshot, refresh them for unchanged files as well
+        if self.subtitles and sickrage.app.config.use_subtitles and sickrage.app.config.subtitles_dir:
+            for episode_obj in self.episodes:
+                if episode_obj.location and snapshot.exists(episode_obj.location) and os.path.normpath(episode_obj.location) not in media_files:
+                    try:
+                        episode_obj.refresh_subtitles(inventory)
+                    except Exception:
+                        sickrage.app.log.error("%s: Could not refresh subtitles" % self.indexer_id)
+                        sickrage.app.log.debug(traceback.format_exc())
 
         # create TVEpisodes from each media file (if possible)
         for mediaFile in media_files:
@@ -457,11 +487,16 @@ class TVShow(MainDBBase):
             # store the reference in the show
             if self.subtitles and sickrage.app.config.use_subtitles:
                 try:
-                    curEpisode.refresh_subtitles()
+                    curEpisode.refresh_subtitles(inventory)
                 except Exception:
                     sickrage.app.log.error("%s: Could not refresh subtitles" % self.indexer_id)
                     sickrage.app.log.debug(traceback.format_exc())
 
+        snapshot.save()
+        inventory.save()
+
+        return snapshot
+
     def load_imdb_info(self):
         imdb_info_mapper = {
             'imdbvotes': 'votes',
@@ -681,7 +716,9 @@ class TVShow(MainDBBase):
 
         # clear the cache
         image_cache_dir = os.path.join(sickrage.app.cache_dir, 'images')
-        for cache_file in glob.glob(os.path.join(image_cache_dir, str(self.indexer_id) + '.*')):
+        for cache_file in glob.glob(os.path.join(image_cache_dir, str(self.indexer_id) + '.*')) + glob.glob(
+                os.path.join(image_cache_dir, 'resized', '*', str(self.indexer_id) + '.*')) + glob.glob(
+                os.path.join(image_cache_dir, 'resized', '*', 'thumbnails', str(self.indexer_id) + '.*')):
             sickrage.app.log.info('Attempt to %s cache file %s' % (action, cache_file))
             try:
                 if sickrage.app.config.trash_remove_show:
@@ -691,6 +728,8 @@ class TVShow(MainDBBase):
             except OSError as e:
                 sickrage.app.log.warning('Unable to %s %s: %s / %s' % (action, cache_file, repr(e), str(e)))
 
+        ImageCache().prune()
+
         # remove entire show folder
         if full:
             try:
@@ -725,7 +764,7 @@ class TVShow(MainDBBase):
 
     def populate_cache(self, force=False):
         sickrage.app.log.debug("Checking & filling cache for show " + self.name)
-        ImageCache().fill_cache(self, force)
+        ImageCache().queue_fill_cache(self.indexer_id, force)
 
     def refresh_dir(self):
         # make sure the show dir is where we think it is unless dirs are created on the fly
@@ -733,8 +772,9 @@ class TVShow(MainDBBase):
             return False
 
         # load from dir
+        snapshot = None
         try:
-            self.load_episodes_from_dir()
+            snapshot = self.load_episodes_from_dir()
         except Exception as e:
             sickrage.app.log.debug("Error searching dir for episodes: {}".format(e))
             sickrage.app.log.debug(traceback.format_exc())
@@ -751,7 +791,9 @@ class TVShow(MainDBBase):
             episode = int(curEp.episode)
 
             # if the path doesn't exist or if it's not in our show dir
-            if not os.path.isfile(curLoc) or not os.path.normpath(curLoc).startswith(os.path.normpath(self.location)):
+            # files found by the directory snapshot exist, anything else is checked on disk
+            file_exists = (snapshot and snapshot.exists(curLoc)) or os.path.isfile(curLoc)
+            if not file_exists or not curLoc.startswith(os.path.normpath(self.location)):
                 # check if downloaded files still exist, update our data if this has changed
                 if not sickrage.app.config.skip_removed_files:
                     # if it used to have a file associated with it and it doesn't anymore then set it to
@@ -794,11 +836,20 @@ class TVShow(MainDBBase):
 
         sickrage.app.log.debug("%s: Downloading subtitles" % self.indexer_id)
 
+        # subtitles already on disk are taken from the inventory, subliminal only runs for missing languages
+        inventory = SubtitleInventory(self.indexer_id)
+
         try:
             for episode in self.episodes:
-                episode.download_subtitles()
+                if not episode.location:
+                    continue
+
+                episode.refresh_subtitles(inventory)
+                episode.download_subtitles(inventory=inventory)
         except Exception:
             sickrage.app.log.error("%s: Error occurred when downloading subtitles for %s" % (self.indexer_id, self.name))
+        finally:
+            inventory.save()
 
     def qualitiesToString(self, qualities=None):
         if qualities is None:
@@ -825,16 +876,17 @@ class TVShow(MainDBBase):
             sickrage.app.log.debug("Unable to find a matching episode in database, ignoring found episode")
             return False
 
-        sickrage.app.log.debug("Checking if found episode %s S%02dE%02d is wanted at quality %s" % (
-            self.name, episode_object.season or 0, episode_object.episode or 0, Quality.qualityStrings[quality]))
+        sickrage.app.log.debug("Checking if found episode %s S%02dE%02d is wanted at quality %s",
+                               self.name, episode_object.season or 0, episode_object.episode or 0, Quality.qualityStrings[quality])
 
         # if the quality isn't one we want under any circumstances then just say no
         any_qualities, best_qualities = Quality.split_quality(self.quality)
-        sickrage.app.log.debug("Any, Best = [{}] [{}] Found = [{}]".format(
-            self.qualitiesToString(any_qualities),
-            self.qualitiesToString(best_qualities),
-            self.qualitiesToString([quality]))
-        )
+        if sickrage.app.log.isEnabledFor(sickrage.app.log.DEBUG):
+            sickrage.app.log.debug("Any, Best = [{}] [{}] Found = [{}]".format(
+                self.qualitiesToString(any_qualities),
+                self.qualitiesToString(best_qualities),
+                self.qualitiesToString([quality]))
+            )
 
         if quality not in any_qualities + best_qualities or quality is UNKNOWN:
             sickrage.app.log.debug("Don't want this quality, ignoring found episode")
@@ -843,7 +895,7 @@ class TVShow(MainDBBase):
         ep_status = int(episode_object.status)
         ep_status_text = statusStrings[ep_status]
 
-        sickrage.app.log.debug("Existing episode status: " + str(ep_status) + " (" + ep_status_text + ")")
+        sickrage.app.log.debug("Existing episode status: %s (%s)", ep_status, ep_status_text)
 
         # if we know we don't want it then just say no
         if ep_status in Quality.ARCHIVED + [UNAIRED, SKIPPED, IGNORED] and not manualSearch:
@@ -20,11 +20,14 @@
 import datetime
 from functools import cmp_to_key
 
+from sqlalchemy.orm import selectinload
+
 import sickrage
 from sickrage.core.common import Quality, get_quality_string, WANTED, UNAIRED, timeFormat, dateFormat
 from sickrage.core.helpers.srdatetime import SRDateTime
-from sickrage.core.tv.show.helpers import get_show_list
 from sickrage.core.databases.main import MainDB
+from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show import TVShow
 
 
 class ComingEpisodes:
@@ -95,22 +98,23 @@ class ComingEpisodes:
                          Quality.ARCHIVED + \
                          Quality.IGNORED
 
+        # only episodes that aired recently or air later are listed, their shows are loaded with one more query but not
+        # all the episodes of the shows
         results = []
-        for s in get_show_list(session=session):
-            for e in s.episodes:
-                if e.season == 0:
-                    continue
+        for e in session.query(TVEpisode).options(selectinload(TVEpisode.show).lazyload(TVShow.episodes)).filter(
+                TVEpisode.season != 0, TVEpisode.airdate >= recently).order_by(TVEpisode.showid, TVEpisode.airdate):
+            s = e.show
 
-                if today <= e.airdate < next_week and e.status not in qualities_list:
-                    results += result(s, e)
+            if today <= e.airdate < next_week and e.status not in qualities_list:
+                results += result(s, e)
 
-                if e.showid not in [int(r['showid']) for r in results] \
-                        and e.airdate >= next_week and e.status \
-                        not in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER:
-                    results += result(s, e)
+            if e.showid not in [int(r['showid']) for r in results] \
+                    and e.airdate >= next_week and e.status \
+                    not in Quality.DOWNLOADED + Quality.SNATCHED + Quality.SNATCHED_BEST + Quality.SNATCHED_PROPER:
+                results += result(s, e)
 
-                if today > e.airdate >= recently and e.status in [WANTED, UNAIRED] and e.status not in qualities_list:
-                    results += result(s, e)
+            if today > e.airdate >= recently and e.status in [WANTED, UNAIRED] and e.status not in qualities_list:
+                results += result(s, e)
 
         for index, item in enumerate(results):
             results[index]['localtime'] = SRDateTime(
@@ -0,0 +1,221 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import os
+from collections import OrderedDict
+
+from sqlalchemy import case
+
+import sickrage
+from sickrage.core.common import Quality, UNAIRED, WANTED, FAILED, DOWNLOADED, ARCHIVED, SNATCHED, SNATCHED_PROPER, SNATCHED_BEST, IGNORED, \
+    SKIPPED
+from sickrage.core.databases.main import MainDB
+from sickrage.core.queues.search import BacklogQueueItem, FailedQueueItem
+from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show.helpers import find_show
+
+# maximum number of episodes per update statement
+CHUNK_SIZE = 500
+
+
+class StatusChange(object):
+    """Outcome of a status change of the episodes of one show"""
+
+    def __init__(self, show_id, show_name, status):
+        self.show_id = show_id
+        self.show_name = show_name
+        self.status = status
+        self.changed = []
+        self.refused = []
+        self.searched = []
+
+    def refuse(self, season, episode, reason, status=None):
+        self.refused.append((season, episode, reason, status))
+        sickrage.app.log.warning("Refusing to change status of {} S{:02d}E{:02d}: {}".format(self.show_name, season, episode, reason))
+
+
+class EpisodeStatuses:
+    """
+    Changes the status of many episodes at once. The episodes of a show are changed with an update statement per
+    season, all shows in one transaction, afterwards every show gets one Trakt watchlist update and one backlog search.
+    """
+
+    @staticmethod
+    def refusal(status, episode_status, location, keep_downloaded=False):
+        """
+        :param status: new status without its quality
+        :param episode_status: current status of the episode without its quality
+        :param location: file location of the episode
+        :param keep_downloaded: refuse to change downloaded and archived episodes
+        :return: reason the status of the episode can't be changed or None
+        """
+        if episode_status == UNAIRED:
+            return "it is UNAIRED"
+
+        if keep_downloaded and episode_status in (DOWNLOADED, ARCHIVED):
+            return "it is already marked as DOWNLOADED"
+
+        if status == DOWNLOADED and episode_status not in (SNATCHED, SNATCHED_PROPER, SNATCHED_BEST, DOWNLOADED, IGNORED) and not os.path.isfile(location):
+            return "it's not SNATCHED/DOWNLOADED"
+
+        if status == FAILED and episode_status not in (SNATCHED, SNATCHED_PROPER, SNATCHED_BEST, DOWNLOADED, ARCHIVED):
+            return "it's not SNATCHED/DOWNLOADED"
+
+    @MainDB.with_session
+    def set_status(self, to_change, status, old_statuses=None, keep_downloaded=False, session=None):
+        """
+        Set the status of episodes of one or more shows
+
+        :param to_change: dict of show id -> list of (season, episode), None for all episodes of the show
+        :param status: new status
+        :param old_statuses: only change episodes that have one of these statuses, quality ignored
+        :param keep_downloaded: refuse to change downloaded and archived episodes
+        :return: list of StatusChange
+        """
+        status = int(status)
+        new_status, new_quality = Quality.split_composite_status(status)
+
+        values = {TVEpisode.status: status, TVEpisode.ep_status: new_status, TVEpisode.ep_quality: new_quality}
+        if new_status == WANTED:
+            # downloaded episodes set back to wanted obviously are to be replaced
+            values[TVEpisode.release_name] = case([(TVEpisode.ep_status.in_([DOWNLOADED, ARCHIVED]), '')], else_=TVEpisode.release_name)
+
+        changes = []
+
+        for show_id, episodes in to_change.items():
+            show_obj = find_show(int(show_id), session=session)
+            if not show_obj:
+                continue
+
+            change = StatusChange(show_obj.indexer_id, show_obj.name, status)
+
+            query = session.query(TVEpisode.season, TVEpisode.episode, TVEpisode.status, TVEpisode.ep_status, TVEpisode.location).filter_by(
+                showid=show_obj.indexer_id)
+            if old_statuses:
+                query = query.filter(TVEpisode.ep_status.in_(old_statuses))
+
+            requested = set(episodes) if episodes is not None else None
+
+            by_season = OrderedDict()
+            for season, episode, composite_status, episode_status, location in query.order_by(TVEpisode.season, TVEpisode.episode):
+                if requested is not None:
+                    if (season, episode) not in requested:
+                        continue
+                    requested.discard((season, episode))
+
+                reason = self.refusal(new_status, episode_status, location, keep_downloaded)
+                if reason:
+                    change.refuse(season, episode, reason, composite_status)
+                    continue
+
+                by_season.setdefault(season, []).append(episode)
+                change.changed.append((season, episode))
+
+            for season, episode in sorted(requested or []):
+                change.refuse(season, episode, "episode couldn't be retrieved")
+
+            for season, season_episodes in by_season.items():
+                for i in range(0, len(season_episodes), CHUNK_SIZE):
+                    session.query(TVEpisode).filter_by(showid=show_obj.indexer_id, season=season).filter(
+                        TVEpisode.episode.in_(season_episodes[i:i + CHUNK_SIZE])).update(values, synchronize_session=False)
+
+            changes.append(change)
+
+        session.commit()
+
+        # episode objects loaded before the update statements are stale
+        session.expire_all()
+
+        for change in changes:
+            self.sync_trakt(change, session=session)
+            self.start_searches(change, session=session)
+
+        return changes
+
+    @MainDB.with_session
+    def sync_trakt(self, change, session=None):
+        """
+        Update the Trakt watchlist with the changed episodes of a show in one request
+        """
+        if not change.changed or not (sickrage.app.config.use_trakt and sickrage.app.config.trakt_sync_watchlist):
+            return
+
+        if change.status in [WANTED, FAILED]:
+            update = "add"
+        elif change.status in [IGNORED, SKIPPED] + Quality.DOWNLOADED + Quality.ARCHIVED:
+            update = "remove"
+        else:
+            return
+
+        trakt = sickrage.app.notifier_providers['trakt']
+        data = trakt.trakt_episode_data_generate(change.changed)
+
+        sickrage.app.log.debug("Update watchlist of show {}, {} episodes: {}".format(change.show_name, len(change.changed), update))
+        sickrage.app.notification_dispatcher.dispatch(trakt, 'update_watchlist', find_show(change.show_id, session=session), None, None, None, data,
+                                                      update, key=(change.show_id, update, tuple(change.changed)))
+
+    @MainDB.with_session
+    def start_searches(self, change, session=None):
+        """
+        Queue one backlog search for the episodes of a show set to wanted, or retry searches for failed episodes
+        """
+        if not change.changed or change.status not in [WANTED, FAILED]:
+            return
+
+        show_obj = find_show(change.show_id, session=session)
+        if change.status == WANTED and show_obj.paused:
+            sickrage.app.log.info("Some episodes were set to wanted, but {} is paused. Not adding to Backlog until "
+                                  "show is unpaused".format(show_obj.name))
+            return
+
+        for season, episode in change.changed:
+            if (change.show_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
+                sickrage.app.search_queue.SNATCH_HISTORY.remove((change.show_id, season, episode))
+
+        if change.status == WANTED:
+            sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(change.show_id, change.changed))
+            sickrage.app.log.info("Sending backlog for {} because {} episodes were set to wanted".format(show_obj.name, len(change.changed)))
+        else:
+            for season, episode in change.changed:
+                sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, FailedQueueItem(change.show_id, season, episode))
+            sickrage.app.log.info("Retrying search for {} because {} episodes were set to failed".format(show_obj.name, len(change.changed)))
+
+        change.searched = list(change.changed)
+
+    @staticmethod
+    def alert(changes):
+        """
+        Let the user know which searches were started for the changed episodes
+        """
+        for change in changes:
+            if not change.searched:
+                continue
+
+            if change.status == WANTED:
+                title = _("Backlog started")
+                msg = _("Backlog was automatically started for the following seasons of ")
+            else:
+                title = _("Retry Search started")
+                msg = _("Retrying Search was automatically started for the following season of ")
+
+            msg += "<b>" + change.show_name + "</b>:<br>"
+            msg += "<ul>" + "".join("<li>" + _("Season ") + str(season) + "</li>" for season in sorted(set(x[0] for x in change.searched))) + "</ul>"
+
+            sickrage.app.alerts.message(title, msg)
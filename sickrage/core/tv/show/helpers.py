@@ -38,5 +38,9 @@ def find_show_by_name(term, session=None):
 
 @MainDB.with_session
 def get_show_list(session=None):
+    """
+    :return: query of all shows, their episodes are only loaded for the shows whose episodes are used, add
+             ``selectinload(TVShow.episodes)`` to load the episodes of all shows at once
+    """
     from sickrage.core.tv.show import TVShow
-    return session.query(TVShow)
+    return session.query(TVShow).options(orm.lazyload(TVShow.episodes))
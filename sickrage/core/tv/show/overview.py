@@ -0,0 +1,183 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import datetime
+from collections import OrderedDict, defaultdict
+
+from sqlalchemy import and_, or_, false, func, literal, case
+
+from sickrage.core.common import Quality, Overview, WANTED, FAILED, DOWNLOADED, UNAIRED, ARCHIVED, SNATCHED, SNATCHED_PROPER, SNATCHED_BEST
+from sickrage.core.databases.main import MainDB
+from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show import TVShow
+
+# default and maximum number of episodes per page of the manage overviews
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def paginate(query, offset=0, limit=PAGE_SIZE):
+    """
+    :param query: episode query
+    :param offset: number of rows to skip
+    :param limit: maximum number of rows
+    :return: total number of rows of the query and the rows of the page
+    """
+    return query.order_by(None).count(), query.offset(offset).limit(limit).all()
+
+
+def is_low_quality(show_quality, skip_downloaded, ep_quality):
+    """
+    Same as ``TVShow.get_overview`` returning ``Overview.QUAL`` for a downloaded episode
+
+    :param show_quality: composite quality of the show
+    :param skip_downloaded: show doesn't upgrade episodes that have one of its best qualities
+    :param ep_quality: quality of the downloaded episode
+    """
+    __, best_qualities = Quality.split_quality(show_quality)
+    if not best_qualities:
+        return False
+
+    if skip_downloaded and (ep_quality in best_qualities or ep_quality > min(best_qualities)):
+        return False
+
+    return ep_quality < max(best_qualities)
+
+
+def low_quality_criterion(show_quality, skip_downloaded):
+    """
+    :return: SQL criterion of the downloaded episodes of a show that ``is_low_quality``
+    """
+    __, best_qualities = Quality.split_quality(show_quality)
+    if not best_qualities:
+        return false()
+
+    criterion = [TVEpisode.ep_status == DOWNLOADED, TVEpisode.ep_quality < max(best_qualities)]
+    if skip_downloaded:
+        criterion += [TVEpisode.ep_quality.notin_(best_qualities), TVEpisode.ep_quality <= min(best_qualities)]
+
+    return and_(*criterion)
+
+
+def backlog_criterion(show_quality, skip_downloaded, overview=None):
+    """
+    :param overview: ``Overview.WANTED`` or ``Overview.QUAL`` for only those episodes, None for both
+    :return: SQL criterion of the episodes of a show that are wanted or of low quality
+    """
+    wanted = TVEpisode.ep_status.in_([WANTED, FAILED])
+    low_quality = low_quality_criterion(show_quality, skip_downloaded)
+
+    if overview == Overview.WANTED:
+        return wanted
+    if overview == Overview.QUAL:
+        return low_quality
+    return or_(wanted, low_quality)
+
+
+@MainDB.with_session
+def backlog_counts(session=None):
+    """
+    Counts the wanted and low quality episodes of all shows that aren't paused with one query grouped by show,
+    status and quality
+
+    :return: OrderedDict of show id -> {'name', Overview.WANTED, Overview.QUAL} of the shows with a backlog sorted by name
+    """
+    shows = {x.indexer_id: x for x in session.query(TVShow.indexer_id, TVShow.name, TVShow.quality, TVShow.skip_downloaded).filter_by(
+        paused=False)}
+
+    counts = {}
+    for showid, ep_status, ep_quality, count in session.query(TVEpisode.showid, TVEpisode.ep_status, TVEpisode.ep_quality, func.count()).filter(
+            TVEpisode.ep_status.in_([WANTED, FAILED, DOWNLOADED])).group_by(TVEpisode.showid, TVEpisode.ep_status, TVEpisode.ep_quality):
+        show = shows.get(showid)
+        if not show:
+            continue
+
+        if ep_status in (WANTED, FAILED):
+            overview = Overview.WANTED
+        elif is_low_quality(show.quality, show.skip_downloaded, ep_quality):
+            overview = Overview.QUAL
+        else:
+            continue
+
+        show_counts = counts.setdefault(showid, {'name': show.name, Overview.WANTED: 0, Overview.QUAL: 0})
+        show_counts[overview] += count
+
+    return OrderedDict(sorted(counts.items(), key=lambda x: x[1]['name'].lower()))
+
+
+def empty_episode_stats():
+    return {'airs_next': datetime.date.min, 'airs_prev': datetime.date.min, 'snatched': 0, 'downloaded': 0, 'unaired': 0, 'special': 0,
+            'total': 0, 'total_size': 0}
+
+
+@MainDB.with_session
+def episode_stats(session=None):
+    """
+    Same as the ``TVShow`` properties ``airs_next``, ``airs_prev``, ``episodes_snatched``, ``episodes_downloaded``,
+    ``episodes_unaired``, ``episodes_special`` and ``total_size`` of all shows with one query grouped by show, for
+    listings of shows that don't load their episodes
+
+    :return: defaultdict of show id -> {'airs_next', 'airs_prev', 'snatched', 'downloaded', 'unaired', 'special', 'total', 'total_size'}
+    """
+    today = datetime.date.today()
+    regular = TVEpisode.season != 0
+
+    def count(*criterion):
+        return func.sum(case([(and_(*criterion), 1)], else_=0))
+
+    stats = defaultdict(empty_episode_stats)
+    for row in session.query(TVEpisode.showid,
+                             func.min(case([(and_(regular, TVEpisode.ep_status.in_([UNAIRED, WANTED]), TVEpisode.airdate >= today), TVEpisode.airdate)])),
+                             func.max(case([(and_(regular, TVEpisode.ep_status != UNAIRED, TVEpisode.airdate < today), TVEpisode.airdate)])),
+                             count(regular, TVEpisode.ep_status.in_([SNATCHED, SNATCHED_PROPER, SNATCHED_BEST])),
+                             count(regular, TVEpisode.ep_status.in_([DOWNLOADED, ARCHIVED])),
+                             count(regular, TVEpisode.ep_status == UNAIRED),
+                             count(TVEpisode.season == 0),
+                             func.count(),
+                             func.sum(TVEpisode.file_size)).group_by(TVEpisode.showid):
+        showid, airs_next, airs_prev, snatched, downloaded, unaired, special, total, total_size = row
+        stats[showid] = {'airs_next': airs_next or datetime.date.min,
+                         'airs_prev': airs_prev or datetime.date.min,
+                         'snatched': snatched or 0,
+                         'downloaded': downloaded or 0,
+                         'unaired': unaired or 0,
+                         'special': special or 0,
+                         'total': total,
+                         'total_size': total_size or 0}
+
+    return stats
+
+
+def missed_subtitles_criterion(which_subs, wanted_languages):
+    """
+    :param which_subs: subtitle language code or 'all'
+    :param wanted_languages: wanted subtitle language codes
+    :return: SQL criterion of the episodes without subtitles of the language, or for 'all' any wanted language
+    """
+    subtitles = func.coalesce(TVEpisode.subtitles, '')
+    if which_subs != 'all':
+        return ~subtitles.contains(which_subs)
+
+    if not wanted_languages:
+        return false()
+
+    subtitles = literal(',') + subtitles + ','
+    return or_(*[~subtitles.contains(',{},'.format(language)) for language in sorted(wanted_languages)])
+
@@ -184,7 +184,7 @@ class VersionUpdater(object):
                 sickrage.app.config.view_changelog = True
 
                 if webui:
-                    WebSocketMessage('task', {'cmd': 'restart'}).push()
+                    WebSocketMessage('task', {'cmd': 'restart'}, key='restart').push()
 
                 return True
 
@@ -67,6 +67,7 @@ from sickrage.core.webserver.handlers.home.add_shows import HomeAddShowsHandler,
     MassAddTableHandler, NewShowHandler, TraktShowsHandler, PopularShowsHandler, AddShowToBlacklistHandler, \
     ExistingShowsHandler, AddShowByIDHandler, AddNewShowHandler, AddExistingShowsHandler
 from sickrage.core.webserver.handlers.home.postprocess import HomePostProcessHandler, HomeProcessEpisodeHandler
+from sickrage.core.webserver.handlers.images import ImageCacheHandler
 from sickrage.core.webserver.handlers.irc import IRCHandler
 from sickrage.core.webserver.handlers.login import LoginHandler
 from sickrage.core.webserver.handlers.logout import LogoutHandler
@@ -74,10 +75,12 @@ from sickrage.core.webserver.handlers.logs import LogsHandler, LogsClearAllHanld
     LogsClearErrorsHanlder, LogsClearWarningsHanlder
 from sickrage.core.webserver.handlers.manage import ManageHandler, ShowEpisodeStatusesHandler, EpisodeStatusesHandler, \
     ChangeEpisodeStatusesHandler, ShowSubtitleMissedHandler, SubtitleMissedHandler, DownloadSubtitleMissedHandler, \
-    BacklogShowHandler, BacklogOverviewHandler, MassEditHandler, MassUpdateHandler, FailedDownloadsHandler
+    BacklogShowHandler, BacklogOverviewHandler, BacklogOverviewEpisodesHandler, MassEditHandler, MassUpdateHandler, \
+    FailedDownloadsHandler
 from sickrage.core.webserver.handlers.manage.queues import ManageQueuesHandler, ForceBacklogSearchHandler, \
     ForceFindPropersHandler, PauseDailySearcherHandler, PauseBacklogSearcherHandler, PausePostProcessorHandler, \
     ForceDailySearchHandler
+from sickrage.core.webserver.handlers.metrics import MetricsHandler
 from sickrage.core.webserver.handlers.root import RobotsDotTxtHandler, MessagesDotPoHandler, \
     APIBulderHandler, SetHomeLayoutHandler, SetPosterSortByHandler, SetPosterSortDirHandler, \
     ToggleDisplayShowSpecialsHandler, SetScheduleLayoutHandler, ToggleScheduleDisplayPausedHandler, \
@@ -86,19 +89,6 @@ from sickrage.core.webserver.handlers.web_file_browser import WebFileBrowserHand
 from sickrage.core.websocket import WebSocketUIHandler
 
 
-class StaticImageHandler(StaticFileHandler):
-    def initialize(self, path, default_filename=None):
-        super(StaticImageHandler, self).initialize(path, default_filename)
-
-    def get(self, path, include_body=True):
-        # image cache check
-        self.root = (self.root, os.path.join(sickrage.app.cache_dir, 'images'))[
-            os.path.exists(os.path.normpath(os.path.join(sickrage.app.cache_dir, 'images', path)))
-        ]
-
-        return super(StaticImageHandler, self).get(path, include_body)
-
-
 class StaticNoCacheFileHandler(StaticFileHandler):
     def set_extra_headers(self, path):
         self.set_header('Cache-Control', 'max-age=0,no-cache,no-store')
@@ -167,6 +157,9 @@ class WebServer(object):
 
         # Static File Handlers
         self.app.add_handlers('.*$', [
+            # metrics
+            (r'%s/api/(\w{32})/metrics' % sickrage.app.config.web_root, MetricsHandler),
+
             # api
             (r'%s/api/(\w{32})(/?.*)' % sickrage.app.config.web_root, ApiHandler),
 
@@ -189,9 +182,12 @@ class WebServer(object):
              {"path": os.path.join(sickrage.app.config.gui_static_dir, 'images/favicon.ico')}),
 
             # images
-            (r'%s/images/(.*)' % sickrage.app.config.web_root, StaticImageHandler,
+            (r'%s/images/(.*)' % sickrage.app.config.web_root, StaticFileHandler,
              {"path": os.path.join(sickrage.app.config.gui_static_dir, 'images')}),
 
+            # image cache
+            (r'%s/cache/images/(.*)' % sickrage.app.config.web_root, ImageCacheHandler),
+
             # css
             (r'%s/css/(.*)' % sickrage.app.config.web_root, StaticNoCacheFileHandler,
              {"path": os.path.join(sickrage.app.config.gui_static_dir, 'css')}),
@@ -328,6 +324,7 @@ class WebServer(object):
             (r'%s/manage/downloadSubtitleMissed(/?)' % sickrage.app.config.web_root, DownloadSubtitleMissedHandler),
             (r'%s/manage/backlogShow(/?)' % sickrage.app.config.web_root, BacklogShowHandler),
             (r'%s/manage/backlogOverview(/?)' % sickrage.app.config.web_root, BacklogOverviewHandler),
+            (r'%s/manage/backlogOverview/episodes(/?)' % sickrage.app.config.web_root, BacklogOverviewEpisodesHandler),
             (r'%s/manage/massEdit(/?)' % sickrage.app.config.web_root, MassEditHandler),
             (r'%s/manage/massUpdate(/?)' % sickrage.app.config.web_root, MassUpdateHandler),
             (r'%s/manage/failedDownloads(/?)' % sickrage.app.config.web_root, FailedDownloadsHandler),
@@ -22,22 +22,22 @@
 
 import collections
 import datetime
+import functools
 import os
-import re
 import threading
 import time
 import traceback
 from urllib.parse import unquote_plus
 
-from sqlalchemy import orm
+from sqlalchemy import orm, func
 from tornado.escape import json_encode, recursive_unicode
 from tornado.web import RequestHandler
 
 import sickrage
 from sickrage.subtitles import Subtitles
 from sickrage.core.caches import image_cache
-from sickrage.core.common import ARCHIVED, DOWNLOADED, IGNORED, \
-    Overview, Quality, SKIPPED, SNATCHED, SNATCHED_PROPER, UNAIRED, UNKNOWN, \
+from sickrage.core.common import ARCHIVED, DOWNLOADED, FAILED, IGNORED, \
+    Overview, Quality, SKIPPED, SNATCHED, SNATCHED_BEST, SNATCHED_PROPER, UNAIRED, UNKNOWN, \
     WANTED, dateFormat, dateTimeFormat, get_quality_string, statusStrings, \
     timeFormat
 from sickrage.core.databases.cache import CacheDB
@@ -45,16 +45,19 @@ from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import CantUpdateShowException, CantRemoveShowException, CantRefreshShowException, \
     EpisodeNotFoundException
 from sickrage.core.helpers import chmod_as_parent, make_dir, \
-    pretty_file_size, sanitize_file_name, srdatetime, try_int, read_file_buffered, backup_app_data
+    pretty_file_size, sanitize_file_name, srdatetime, try_int, backup_app_data
 from sickrage.core.media.banner import Banner
 from sickrage.core.media.fanart import FanArt
 from sickrage.core.media.network import Network
 from sickrage.core.media.poster import Poster
-from sickrage.core.queues.search import BacklogQueueItem, ManualSearchQueueItem
+from sickrage.core.queues.search import ManualSearchQueueItem
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show.coming_episodes import ComingEpisodes
+from sickrage.core.tv.show.episode_statuses import EpisodeStatuses
 from sickrage.core.tv.show.helpers import find_show, get_show_list
 from sickrage.core.tv.show.history import History
+from sickrage.core.tv.show.overview import episode_stats
+from sickrage.core.webserver.handlers.images import write_image
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_error, \
     indexer_showincomplete, indexer_shownotfound
@@ -95,13 +98,6 @@ class ApiHandler(RequestHandler):
     async def prepare(self, *args, **kwargs):
         threading.currentThread().setName("API")
 
-        # set the output callback
-        # default json
-        output_callback_dict = {
-            'default': self._out_as_json,
-            'image': self._out_as_image,
-        }
-
         if sickrage.app.config.api_key == self.path_args[0]:
             access_msg = "IP:{} - ACCESS GRANTED".format(self.request.remote_ip)
             sickrage.app.log.debug(access_msg)
@@ -129,11 +125,10 @@ class ApiHandler(RequestHandler):
             error_data = {"error_msg": access_msg, "request arguments": self.request.arguments}
             out_dict = _responds(RESULT_DENIED, error_data, access_msg)
 
-        output_callback = output_callback_dict['default']
-        if 'outputType' in out_dict:
-            output_callback = output_callback_dict[out_dict['outputType']]
+        if out_dict.get('outputType') == 'image':
+            return await self._out_as_image(out_dict)
 
-        self.finish(output_callback(out_dict))
+        self.finish(self._out_as_json(out_dict))
 
     async def route(self, function, **kwargs):
         kwargs = recursive_unicode(kwargs)
@@ -143,9 +138,8 @@ class ApiHandler(RequestHandler):
 
         return await function(**kwargs)
 
-    def _out_as_image(self, _dict):
-        self.set_header('Content-Type', _dict['image'].type)
-        return _dict['image'].content
+    async def _out_as_image(self, _dict):
+        await write_image(self, _dict['image'].get_static_media_path(), _dict.get('width'))
 
     def _out_as_json(self, _dict):
         self.set_header("Content-Type", "application/json;charset=UTF-8")
@@ -865,60 +859,96 @@ class CMD_EpisodeSetStatus(ApiCall):
             raise ApiError("The status string could not be matched to a status. Report to Devs!")
 
         if self.e:
-            try:
-                ep_list = [show_obj.get_episode(self.s, self.e)]
-            except EpisodeNotFoundException as e:
-                return await _responds(RESULT_FAILURE, msg="Episode not found")
+            episodes = [(self.s, self.e)]
         else:
             # get all episode numbers frome self,season
-            ep_list = show_obj.get_all_episodes(season=self.s)
+            episodes = [(x.season, x.episode) for x in session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show_obj.indexer_id,
+                                                                                                                    season=self.s)]
 
-        def _epResult(result_code, ep, msg=""):
-            return {'season': ep.season, 'episode': ep.episode, 'status': _get_status_strings(ep.status),
-                    'result': result_type_map[result_code], 'message': msg}
+        change = EpisodeStatuses().set_status({show_obj.indexer_id: episodes}, self.status, keep_downloaded=not self.force, session=session)[0]
+
+        if self.e and change.refused and change.refused[0][3] is None:
+            return await _responds(RESULT_FAILURE, msg="Episode not found")
 
         ep_results = []
-        failure = False
-        start_backlog = False
-        wanted = []
-
-        for epObj in ep_list:
-            if self.status == WANTED:
-                # figure out what episodes are wanted so we can backlog them
-                wanted += [(epObj.season, epObj.episode)]
-
-            # don't let them mess up UNAIRED episodes
-            if epObj.status == UNAIRED:
-                if self.e is not None:
-                    ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is UNAIRED"))
-                    failure = True
+        for season, episode, reason, status in change.refused:
+            # unaired episodes of a season are skipped silently
+            if not self.e and Quality.split_composite_status(status)[0] == UNAIRED:
                 continue
 
-            # allow the user to force setting the status for an already downloaded episode
-            if epObj.status in Quality.DOWNLOADED + Quality.ARCHIVED and not self.force:
-                ep_results.append(_epResult(RESULT_FAILURE, epObj, "Refusing to change status because it is already marked as DOWNLOADED"))
-                failure = True
-                continue
+            ep_results.append({'season': season, 'episode': episode, 'status': _get_status_strings(status), 'result': result_type_map[RESULT_FAILURE],
+                               'message': "Refusing to change status because " + reason})
 
-            epObj.status = self.status
+        extra_msg = " Backlog started" if change.searched else ""
 
-            if self.status == WANTED:
-                start_backlog = True
+        if ep_results:
+            return await _responds(RESULT_FAILURE, ep_results, 'Failed to set all or some status. Check data.' + extra_msg)
+        else:
+            return await _responds(RESULT_SUCCESS, msg='All status set successfully.' + extra_msg)
 
-            ep_results.append(_epResult(RESULT_SUCCESS, epObj))
 
-        extra_msg = ""
-        if start_backlog:
-            for season, episode in wanted:
-                sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(show_obj, season, episode))
-                sickrage.app.log.info("Starting backlog for " + show_obj.name + " season " + str(season) + " because some episodes were set to WANTED")
+class CMD_EpisodesSetStatus(ApiCall):
+    _cmd = "episodes.setstatus"
+    _help = {
+        "desc": "Set the status of many episodes of one or more shows at once",
+        "requiredParameters": {
+            "episodes": {"desc": "Pipe separated list of episodes as indexerid-SEASONxEPISODE, or indexerid-all for all episodes of a show"},
+            "status": {"desc": "The status of the episodes"}
+        },
+        "optionalParameters": {
+            "oldstatus": {"desc": "Only change episodes that currently have this status"},
+            "force": {"desc": "True to replace existing downloaded episodes, False otherwise"},
+        }
+    }
 
-            extra_msg = " Backlog started"
+    def __init__(self, application, request, *args, **kwargs):
+        super(CMD_EpisodesSetStatus, self).__init__(application, request, *args, **kwargs)
+        self.episodes, args = self.check_params("episodes", None, True, "list", [], *args, **kwargs)
+        self.status, args = self.check_params("status", None, True, "string",
+                                              ["wanted", "skipped", "ignored", "failed"], *args, **kwargs)
+        self.old_status, args = self.check_params("oldstatus", None, False, "string",
+                                                  ["wanted", "skipped", "ignored", "failed", "snatched", "downloaded", "archived"], *args, **kwargs)
+        self.force, args = self.check_params("force", False, False, "bool", [], *args, **kwargs)
 
-        if failure:
-            return await _responds(RESULT_FAILURE, ep_results, 'Failed to set all or some status. Check data.' + extra_msg)
-        else:
-            return await _responds(RESULT_SUCCESS, msg='All status set successfully.' + extra_msg)
+    @staticmethod
+    def _status_from_string(value):
+        for status in statusStrings.status_strings:
+            if str(statusStrings[status]).lower() == str(value).lower():
+                return status
+
+        # the allowed values has at least one item that could not be matched against the internal status strings
+        raise ApiError("The status string could not be matched to a status. Report to Devs!")
+
+    async def run(self):
+        """ Set the status of many episodes of one or more shows at once """
+        to_change = {}
+
+        for item in self.episodes:
+            try:
+                indexer_id, what = item.split('-')
+                if what == 'all':
+                    to_change[int(indexer_id)] = None
+                elif to_change.get(int(indexer_id), []) is not None:
+                    to_change.setdefault(int(indexer_id), []).append(tuple(map(int, what.split('x'))))
+            except ValueError:
+                raise ApiError('Invalid episode "{}"'.format(item))
+
+        old_statuses = None
+        if self.old_status:
+            old_statuses = [self._status_from_string(self.old_status)]
+            if old_statuses[0] == SNATCHED:
+                old_statuses = [SNATCHED, SNATCHED_PROPER, SNATCHED_BEST]
+
+        changes = await sickrage.app.io_loop.run_in_executor(None, functools.partial(
+            EpisodeStatuses().set_status, to_change, self._status_from_string(self.status), old_statuses=old_statuses,
+            keep_downloaded=not self.force))
+
+        return await _responds(RESULT_SUCCESS, [{
+            'indexerid': change.show_id,
+            'changed': len(change.changed),
+            'refused': [{'season': season, 'episode': episode, 'message': reason} for season, episode, reason, __ in change.refused],
+            'searched': len(change.searched)
+        } for change in changes])
 
 
 class CMD_SubtitleSearch(ApiCall):
@@ -991,7 +1021,7 @@ class CMD_Exceptions(ApiCall):
         super(CMD_Exceptions, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, False, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the scene exceptions for all or a given show """
 
@@ -1100,7 +1130,7 @@ class CMD_Failed(ApiCall):
         super(CMD_Failed, self).__init__(application, request, *args, **kwargs)
         self.limit, args = self.check_params("limit", 100, False, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the failed downloads """
 
@@ -1120,7 +1150,7 @@ class CMD_Backlog(ApiCall):
     def __init__(self, application, request, *args, **kwargs):
         super(CMD_Backlog, self).__init__(application, request, *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the backlogged episodes """
 
@@ -1132,7 +1162,9 @@ class CMD_Backlog(ApiCall):
             if s.paused:
                 continue
 
-            for e in sorted(s.episodes, key=lambda x: (x.season, x.episode), reverse=True):
+            # only wanted, failed and downloaded episodes can be wanted or upgradable
+            for e in session.query(TVEpisode).filter_by(showid=s.indexer_id).filter(TVEpisode.ep_status.in_([WANTED, FAILED, DOWNLOADED])).order_by(
+                    TVEpisode.season.desc(), TVEpisode.episode.desc()):
                 curEpCat = s.get_overview(int(e.status or -1))
                 if curEpCat and curEpCat in (Overview.WANTED, Overview.QUAL):
                     showEps += [e]
@@ -1168,33 +1200,10 @@ class CMD_Logs(ApiCall):
 
     async def run(self):
         """ Get the logs """
-        maxLines = 50
-
-        levelsFiltered = '|'.join(
-            [x for x in sickrage.app.log.logLevels.keys() if
-             sickrage.app.log.logLevels[x] >= int(
-                 sickrage.app.log.logLevels[str(self.min_level).upper()])])
-
-        logRegex = re.compile(
-            r"(?P<entry>^\d+\-\d+\-\d+\s+\d+\:\d+\:\d+\s+(?:{})[\s\S]+?(?:{})[\s\S]+?$)".format(levelsFiltered, ""),
-            re.S + re.M)
-
-        data = []
-        try:
-            if os.path.isfile(sickrage.app.config.log_file):
-                data += list(reversed(re.findall("((?:^.+?{}.+?$))".format(""),
-                                                 "\n".join(next(read_file_buffered(sickrage.app.config.log_file,
-                                                                                   reverse=True)).splitlines()),
-                                                 re.S + re.M + re.I)))
-                maxLines -= len(data)
-                if len(data) == maxLines:
-                    raise StopIteration
-        except StopIteration:
-            pass
-        except Exception as e:
-            pass
+        log_lines = sickrage.app.log.read_logs(min_level=sickrage.app.log.logLevels[str(self.min_level).upper()],
+                                               max_lines=50)
 
-        return await _responds(RESULT_SUCCESS, "\n".join(logRegex.findall("\n".join(data))))
+        return await _responds(RESULT_SUCCESS, "\n".join(log_lines))
 
 
 class CMD_PostProcess(ApiCall):
@@ -1750,7 +1759,7 @@ class CMD_Show(ApiCall):
         super(CMD_Show, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get detailed information about a show """
         showObj = find_show(int(self.indexerid), session=session)
@@ -2085,7 +2094,7 @@ class CMD_ShowCache(ApiCall):
         super(CMD_ShowCache, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Check SiCKRAGE's cache to see if the images (poster, banner, fanart) for a show are valid """
         showObj = find_show(int(self.indexerid), session=session)
@@ -2159,7 +2168,7 @@ class CMD_ShowGetQuality(ApiCall):
         super(CMD_ShowGetQuality, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the quality setting of a show """
         showObj = find_show(int(self.indexerid), session=session)
@@ -2180,18 +2189,21 @@ class CMD_ShowGetPoster(ApiCall):
         },
         "optionalParameters": {
             "tvdbid": {"desc": "thetvdb.com unique ID of a show"},
+            "width": {"desc": "Width of a resized variant of the image"},
         }
     }
 
     def __init__(self, application, request, *args, **kwargs):
         super(CMD_ShowGetPoster, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
+        self.width, args = self.check_params("width", None, False, "int", [], *args, **kwargs)
 
     async def run(self):
         """ Get the poster a show """
         return {
             'outputType': 'image',
             'image': Poster(self.indexerid),
+            'width': self.width,
         }
 
 
@@ -2204,18 +2216,21 @@ class CMD_ShowGetBanner(ApiCall):
         },
         "optionalParameters": {
             "tvdbid": {"desc": "thetvdb.com unique ID of a show"},
+            "width": {"desc": "Width of a resized variant of the image"},
         }
     }
 
     def __init__(self, application, request, *args, **kwargs):
         super(CMD_ShowGetBanner, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
+        self.width, args = self.check_params("width", None, False, "int", [], *args, **kwargs)
 
     async def run(self):
         """ Get the banner of a show """
         return {
             'outputType': 'image',
             'image': Banner(self.indexerid),
+            'width': self.width,
         }
 
 
@@ -2254,18 +2269,21 @@ class CMD_ShowGetFanArt(ApiCall):
         },
         "optionalParameters": {
             "tvdbid": {"desc": "thetvdb.com unique ID of a show"},
+            "width": {"desc": "Width of a resized variant of the image"},
         }
     }
 
     def __init__(self, application, request, *args, **kwargs):
         super(CMD_ShowGetFanArt, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
+        self.width, args = self.check_params("width", None, False, "int", [], *args, **kwargs)
 
     async def run(self):
         """ Get the fan art of a show """
         return {
             'outputType': 'image',
             'image': FanArt(self.indexerid),
+            'width': self.width,
         }
 
 
@@ -2351,7 +2369,7 @@ class CMD_ShowSeasonList(ApiCall):
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
         self.sort, args = self.check_params("sort", "desc", False, "string", ["asc", "desc"], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the list of seasons of a show """
         show_obj = find_show(int(self.indexerid), session=session)
@@ -2382,7 +2400,7 @@ class CMD_ShowSeasons(ApiCall):
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
         self.season, args = self.check_params("season", None, False, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the list of episodes for one or all seasons of a show """
 
@@ -2487,7 +2505,7 @@ class CMD_ShowStats(ApiCall):
         super(CMD_ShowStats, self).__init__(application, request, *args, **kwargs)
         self.indexerid, args = self.check_params("indexerid", None, True, "int", [], *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get episode statistics for a given show """
         showObj = find_show(int(self.indexerid), session=session)
@@ -2518,22 +2536,23 @@ class CMD_ShowStats(ApiCall):
             episode_qualities_counts_snatch[statusCode] = 0
 
         # the main loop that goes through all episodes
-        for row in session.query(TVEpisode).filter_by(showid=self.indexerid).filter(TVEpisode.season != 0):
-            status, quality = Quality.split_composite_status(int(row.status))
+        for status_code, status, quality, count in session.query(TVEpisode.status, TVEpisode.ep_status, TVEpisode.ep_quality,
+                                                                 func.count(TVEpisode.status)).filter_by(showid=self.indexerid).filter(
+                TVEpisode.season != 0).group_by(TVEpisode.status, TVEpisode.ep_status, TVEpisode.ep_quality):
             if quality in [Quality.NONE]:
                 continue
-            episode_status_counts_total["total"] += 1
-
-            if status in Quality.DOWNLOADED + Quality.ARCHIVED:
-                episode_qualities_counts_download["total"] += 1
-                episode_qualities_counts_download[int(row.status)] += 1
-            elif status in Quality.SNATCHED + Quality.SNATCHED_PROPER:
-                episode_qualities_counts_snatch["total"] += 1
-                episode_qualities_counts_snatch[int(row.status)] += 1
+            episode_status_counts_total["total"] += count
+
+            if status in [DOWNLOADED, ARCHIVED]:
+                episode_qualities_counts_download["total"] += count
+                episode_qualities_counts_download[int(status_code)] += count
+            elif status in [SNATCHED, SNATCHED_PROPER]:
+                episode_qualities_counts_snatch["total"] += count
+                episode_qualities_counts_snatch[int(status_code)] += count
             elif status == 0:  # we dont count NONE = 0 = N/A
                 pass
             else:
-                episode_status_counts_total[status] += 1
+                episode_status_counts_total[status] += count
 
         # the outgoing container
         episodes_stats = {
@@ -2618,10 +2637,12 @@ class CMD_Shows(ApiCall):
         self.sort, args = self.check_params("sort", "id", False, "string", ["id", "name"], *args, **kwargs)
         self.paused, args = self.check_params("paused", None, False, "bool", [], *args, **kwargs)
 
-    async def run(self):
+    @MainDB.with_session(read_only=True)
+    async def run(self, session=None):
         """ Get all shows in SiCKRAGE """
         shows = {}
-        for curShow in get_show_list():
+        stats = episode_stats(session=session)
+        for curShow in get_show_list(session=session):
             if self.paused is not None and bool(self.paused) != bool(curShow.paused):
                 continue
 
@@ -2642,9 +2663,10 @@ class CMD_Shows(ApiCall):
                 "subtitles": (0, 1)[curShow.subtitles],
             }
 
-            if try_int(curShow.airs_next, 1) > 693595:  # 1900
+            airs_next = stats[curShow.indexer_id]['airs_next']
+            if try_int(airs_next, 1) > 693595:  # 1900
                 dtEpisodeAirs = srdatetime.SRDateTime(
-                    sickrage.app.tz_updater.parse_date_time(curShow.airs_next, curShow.airs, showDict['network']), convert=True).dt
+                    sickrage.app.tz_updater.parse_date_time(airs_next, curShow.airs, showDict['network']), convert=True).dt
                 showDict['next_ep_airdate'] = srdatetime.SRDateTime(dtEpisodeAirs).srfdate(d_preset=dateFormat)
             else:
                 showDict['next_ep_airdate'] = ''
@@ -2668,7 +2690,7 @@ class CMD_ShowsStats(ApiCall):
     def __init__(self, application, request, *args, **kwargs):
         super(CMD_ShowsStats, self).__init__(application, request, *args, **kwargs)
 
-    @MainDB.with_session
+    @MainDB.with_session(read_only=True)
     async def run(self, session=None):
         """ Get the global shows and episodes statistics """
         overall_stats = {
@@ -2678,20 +2700,22 @@ class CMD_ShowsStats(ApiCall):
                 'total': 0,
             },
             'shows': {
-                'active': len([show for show in get_show_list() if show.paused == 0 and show.status.lower() == 'continuing']),
-                'total': get_show_list().count(),
+                'active': len([show for show in get_show_list(session=session) if show.paused == 0 and show.status.lower() == 'continuing']),
+                'total': get_show_list(session=session).count(),
             },
             'total_size': 0
         }
 
+        stats = episode_stats(session=session)
+
         for show in get_show_list(session=session):
             if sickrage.app.show_queue.is_being_added(show.indexer_id) or sickrage.app.show_queue.is_being_removed(show.indexer_id):
                 continue
 
-            overall_stats['episodes']['snatched'] += show.episodes_snatched or 0
-            overall_stats['episodes']['downloaded'] += show.episodes_downloaded or 0
-            overall_stats['episodes']['total'] += len(show.episodes) or 0
-            overall_stats['total_size'] += show.total_size or 0
+            overall_stats['episodes']['snatched'] += stats[show.indexer_id]['snatched']
+            overall_stats['episodes']['downloaded'] += stats[show.indexer_id]['downloaded']
+            overall_stats['episodes']['total'] += stats[show.indexer_id]['total']
+            overall_stats['total_size'] += stats[show.indexer_id]['total_size']
 
         return await _responds(RESULT_SUCCESS, {
             'ep_downloaded': overall_stats['episodes']['downloaded'],
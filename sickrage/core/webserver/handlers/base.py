@@ -35,17 +35,25 @@ from tornado.httpclient import AsyncHTTPClient, HTTPRequest
 from tornado.web import RequestHandler
 
 import sickrage
-from sickrage.core import helpers
+from sickrage.core import helpers, metrics
 from sickrage.core.databases.main import MainDB
 
+RENDER_SECONDS = metrics.histogram('sickrage_template_render_seconds', 'Time spent rendering mako templates', ['template'])
+
 
 class BaseHandler(RequestHandler, ABC):
+    # GET and HEAD requests get a read-only database session, handlers that change the database on GET turn this off
+    read_only_get = True
+
     def __init__(self, application, request, **kwargs):
         super(BaseHandler, self).__init__(application, request, **kwargs)
         self.startTime = time.time()
 
         # main database session
-        self.db_session = sickrage.app.main_db.session()
+        if self.read_only_get and request.method in ('GET', 'HEAD'):
+            self.db_session = sickrage.app.main_db.read_session()
+        else:
+            self.db_session = sickrage.app.main_db.session()
 
         # template settings
         self.mako_lookup = TemplateLookup(
@@ -145,7 +153,8 @@ class BaseHandler(RequestHandler, ABC):
         template_kwargs.update(kwargs)
 
         try:
-            return self.mako_lookup.get_template(template_name).render_unicode(**template_kwargs)
+            with RENDER_SECONDS.labels(template_name).time():
+                return self.mako_lookup.get_template(template_name).render_unicode(**template_kwargs)
         except Exception:
             kwargs['title'] = _('HTTP Error 500')
             kwargs['header'] = _('HTTP Error 500')
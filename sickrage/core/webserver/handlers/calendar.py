@@ -23,13 +23,15 @@ import datetime
 from abc import ABC
 
 import dateutil
+from sqlalchemy import false
+from sqlalchemy.orm import contains_eager
 from tornado.web import authenticated
 
 import sickrage
 from sickrage.core.databases.main import MainDB
 from sickrage.core.helpers import try_int
 from sickrage.core.tv.episode import TVEpisode
-from sickrage.core.tv.show.helpers import get_show_list
+from sickrage.core.tv.show import TVShow
 from sickrage.core.webserver.handlers.base import BaseHandler
 
 
@@ -63,41 +65,39 @@ class CalendarHandler(BaseHandler, ABC):
         past_date = datetime.date.today() + datetime.timedelta(weeks=-52)
         future_date = datetime.date.today() + datetime.timedelta(weeks=52)
 
-        # Get all the shows that are not paused and are currently on air (from kjoconnor Fork)
-        for show in get_show_list(session=self.db_session):
-            if show.status.lower() not in ['continuing', 'returning series'] or show.paused:
+        # Get the episodes in range of all the shows that are not paused and are currently on air (from kjoconnor Fork)
+        for episode in self.db_session.query(TVEpisode).join(TVEpisode.show).options(contains_eager(TVEpisode.show).lazyload(TVShow.episodes)).filter(
+                TVShow.paused == false(), TVEpisode.airdate >= past_date, TVEpisode.airdate < future_date).order_by(TVEpisode.showid):
+            show = episode.show
+            if show.status.lower() not in ['continuing', 'returning series']:
                 continue
 
-            for episode in show.episodes:
-                if not past_date <= episode.airdate < future_date:
-                    continue
-
-                air_date_time = sickrage.app.tz_updater.parse_date_time(episode.airdate, show.airs,
-                                                                        show.network).astimezone(utc)
-                air_date_time_end = air_date_time + datetime.timedelta(minutes=try_int(show.runtime, 60))
-
-                # Create event for episode
-                ical += 'BEGIN:VEVENT\r\n'
-                ical += 'DTSTART:' + air_date_time.strftime("%Y%m%d") + 'T' + air_date_time.strftime("%H%M%S") + 'Z\r\n'
-                ical += 'DTEND:' + air_date_time_end.strftime("%Y%m%d") + 'T' + air_date_time_end.strftime(
-                    "%H%M%S") + 'Z\r\n'
-                if sickrage.app.config.calendar_icons:
-                    ical += 'X-GOOGLE-CALENDAR-CONTENT-ICON:https://www.sickrage.ca/favicon.ico\r\n'
-                    ical += 'X-GOOGLE-CALENDAR-CONTENT-DISPLAY:CHIP\r\n'
-                ical += 'SUMMARY: {0} - {1}x{2} - {3}\r\n'.format(show.name, episode.season, episode.episode, episode.name)
-                ical += 'UID:SiCKRAGE-' + str(datetime.date.today().isoformat()) + '-' + \
-                        show.name.replace(" ", "-") + '-E' + str(episode.episode) + \
-                        'S' + str(episode.season) + '\r\n'
-                if episode.description:
-                    ical += 'DESCRIPTION: {0} on {1} \\n\\n {2}\r\n'.format(
-                        (show.airs or '(Unknown airs)'),
-                        (show.network or 'Unknown network'),
-                        episode.description.splitlines()[0])
-                else:
-                    ical += 'DESCRIPTION:' + (show.airs or '(Unknown airs)') + ' on ' + (
-                            show.network or 'Unknown network') + '\r\n'
-
-                ical += 'END:VEVENT\r\n'
+            air_date_time = sickrage.app.tz_updater.parse_date_time(episode.airdate, show.airs,
+                                                                    show.network).astimezone(utc)
+            air_date_time_end = air_date_time + datetime.timedelta(minutes=try_int(show.runtime, 60))
+
+            # Create event for episode
+            ical += 'BEGIN:VEVENT\r\n'
+            ical += 'DTSTART:' + air_date_time.strftime("%Y%m%d") + 'T' + air_date_time.strftime("%H%M%S") + 'Z\r\n'
+            ical += 'DTEND:' + air_date_time_end.strftime("%Y%m%d") + 'T' + air_date_time_end.strftime(
+                "%H%M%S") + 'Z\r\n'
+            if sickrage.app.config.calendar_icons:
+                ical += 'X-GOOGLE-CALENDAR-CONTENT-ICON:https://www.sickrage.ca/favicon.ico\r\n'
+                ical += 'X-GOOGLE-CALENDAR-CONTENT-DISPLAY:CHIP\r\n'
+            ical += 'SUMMARY: {0} - {1}x{2} - {3}\r\n'.format(show.name, episode.season, episode.episode, episode.name)
+            ical += 'UID:SiCKRAGE-' + str(datetime.date.today().isoformat()) + '-' + \
+                    show.name.replace(" ", "-") + '-E' + str(episode.episode) + \
+                    'S' + str(episode.season) + '\r\n'
+            if episode.description:
+                ical += 'DESCRIPTION: {0} on {1} \\n\\n {2}\r\n'.format(
+                    (show.airs or '(Unknown airs)'),
+                    (show.network or 'Unknown network'),
+                    episode.description.splitlines()[0])
+            else:
+                ical += 'DESCRIPTION:' + (show.airs or '(Unknown airs)') + ' on ' + (
+                        show.network or 'Unknown network') + '\r\n'
+
+            ical += 'END:VEVENT\r\n'
 
         # Ending the iCal
         ical += 'END:VCALENDAR'
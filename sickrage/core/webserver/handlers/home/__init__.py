@@ -34,8 +34,7 @@ from tornado.web import authenticated
 import sickrage
 from sickrage.clients import get_client_instance
 from sickrage.clients.sabnzbd import SabNZBd
-from sickrage.core.common import Overview, Quality, cpu_presets, statusStrings, WANTED, FAILED, UNAIRED, IGNORED, \
-    SKIPPED
+from sickrage.core.common import Overview, Quality, cpu_presets, statusStrings
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import AnidbAdbaConnectionException, CantRefreshShowException, NoNFOException, \
     CantUpdateShowException, CantRemoveShowException, EpisodeDeletedException, EpisodeNotFoundException, \
@@ -44,14 +43,16 @@ from sickrage.core.helpers import clean_url, clean_host, clean_hosts, get_disk_s
 from sickrage.core.helpers.anidb import get_release_groups_for_anime, short_group_names
 from sickrage.core.helpers.srdatetime import SRDateTime
 from sickrage.core.helpers.tornado_http import TornadoHTTP
-from sickrage.core.queues.search import BacklogQueueItem, FailedQueueItem, ManualSearchQueueItem
+from sickrage.core.queues.search import FailedQueueItem, ManualSearchQueueItem
 from sickrage.core.scene_exceptions import get_scene_exceptions, update_scene_exceptions
 from sickrage.core.scene_numbering import get_scene_numbering_for_show, get_xem_numbering_for_show, \
     get_scene_absolute_numbering_for_show, get_xem_absolute_numbering_for_show, xem_refresh, set_scene_numbering, \
     get_scene_absolute_numbering, get_scene_numbering
 from sickrage.core.traktapi import TraktAPI
 from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show.episode_statuses import EpisodeStatuses
 from sickrage.core.tv.show.helpers import find_show, get_show_list
+from sickrage.core.tv.show.overview import episode_stats
 from sickrage.core.webserver.handlers.base import BaseHandler
 from sickrage.indexers import IndexerApi
 from sickrage.subtitles import Subtitles
@@ -83,12 +84,12 @@ def _get_episode(show, season=None, episode=None, absolute=None, session=None):
 class HomeHandler(BaseHandler, ABC):
     @authenticated
     async def get(self, *args, **kwargs):
-        if not get_show_list().count():
+        if not get_show_list(session=self.db_session).count():
             return self.redirect('/home/addShows/')
 
         showlists = OrderedDict({'Shows': []})
         if sickrage.app.config.anime_split_home:
-            for show in get_show_list():
+            for show in get_show_list(session=self.db_session):
                 if show.is_anime:
                     if 'Anime' not in list(showlists.keys()):
                         showlists['Anime'] = []
@@ -96,7 +97,7 @@ class HomeHandler(BaseHandler, ABC):
                 else:
                     showlists['Shows'] += [show]
         else:
-            showlists['Shows'] = get_show_list()
+            showlists['Shows'] = get_show_list(session=self.db_session)
 
         return self.render(
             "/home/index.mako",
@@ -104,6 +105,7 @@ class HomeHandler(BaseHandler, ABC):
             header="Show List",
             topmenu="home",
             showlists=showlists,
+            show_stats=episode_stats(session=self.db_session),
             controller='home',
             action='index'
         )
@@ -124,6 +126,8 @@ class HomeHandler(BaseHandler, ABC):
             'total_size': 0
         }
 
+        stats = episode_stats(session=self.db_session)
+
         for show in get_show_list(session=self.db_session):
             if sickrage.app.show_queue.is_being_added(show.indexer_id) or sickrage.app.show_queue.is_being_removed(show.indexer_id):
                 show_stat[show.indexer_id] = {
@@ -136,12 +140,12 @@ class HomeHandler(BaseHandler, ABC):
                 }
             else:
                 show_stat[show.indexer_id] = {
-                    'ep_airs_next': show.airs_next or datetime.date.min,
-                    'ep_airs_prev': show.airs_prev or datetime.date.min,
-                    'ep_snatched': show.episodes_snatched or 0,
-                    'ep_downloaded': show.episodes_downloaded or 0,
-                    'ep_total': len(show.episodes),
-                    'total_size': show.total_size or 0
+                    'ep_airs_next': stats[show.indexer_id]['airs_next'],
+                    'ep_airs_prev': stats[show.indexer_id]['airs_prev'],
+                    'ep_snatched': stats[show.indexer_id]['snatched'],
+                    'ep_downloaded': stats[show.indexer_id]['downloaded'],
+                    'ep_total': stats[show.indexer_id]['total'],
+                    'total_size': stats[show.indexer_id]['total_size']
                 }
 
             overall_stats['episodes']['snatched'] += show_stat[show.indexer_id]['ep_snatched']
@@ -543,6 +547,8 @@ class LoadShowNotifyListsHandler(BaseHandler, ABC):
 
 
 class SaveShowNotifyListHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -756,6 +762,9 @@ class BranchCheckoutHandler(BaseHandler, ABC):
 
 
 class DisplayShowHandler(BaseHandler, ABC):
+    # the XEM numbering of the show is refreshed when it is a day old
+    read_only_get = False
+
     @authenticated
     async def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1199,6 +1208,8 @@ class EditShowHandler(BaseHandler, ABC):
 
 
 class TogglePauseHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1380,6 +1391,8 @@ class SyncTraktHandler(BaseHandler, ABC):
 
 
 class DeleteEpisodeHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1428,6 +1441,8 @@ class DeleteEpisodeHandler(BaseHandler, ABC):
 
 
 class SetStatusHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1453,8 +1468,7 @@ class SetStatusHandler(BaseHandler, ABC):
             else:
                 return self._genericMessage(_("Error"), err_msg)
 
-        wanted = []
-        trakt_data = []
+        to_change = []
 
         if eps:
             for curEp in eps.split('|'):
@@ -1469,88 +1483,10 @@ class SetStatusHandler(BaseHandler, ABC):
                     sickrage.app.log.debug("Something went wrong when trying to setStatus, epInfo[0]: %s, epInfo[1]: %s" % (ep_info[0], ep_info[1]))
                     continue
 
-                try:
-                    episode_object = show_obj.get_episode(int(ep_info[0]), int(ep_info[1]))
-                except EpisodeNotFoundException as e:
-                    return self._genericMessage(_("Error"), _("Episode couldn't be retrieved"))
-
-                if int(status) in [WANTED, FAILED]:
-                    # figure out what episodes are wanted so we can backlog them
-                    wanted += [(episode_object.season, episode_object.episode)]
-
-                # don't let them mess up UNAIRED episodes
-                if episode_object.status == UNAIRED:
-                    sickrage.app.log.warning("Refusing to change status of " + curEp + " because it is UNAIRED")
-                    continue
-
-                if int(status) in Quality.DOWNLOADED and episode_object.status not in Quality.SNATCHED + \
-                        Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST + Quality.DOWNLOADED + [IGNORED] and not os.path.isfile(episode_object.location):
-                    sickrage.app.log.warning("Refusing to change status of " + curEp + " to DOWNLOADED because it's not SNATCHED/DOWNLOADED")
-                    continue
-
-                if int(status) == FAILED and episode_object.status not in Quality.SNATCHED + Quality.SNATCHED_PROPER + \
-                        Quality.SNATCHED_BEST + Quality.DOWNLOADED + Quality.ARCHIVED:
-                    sickrage.app.log.warning("Refusing to change status of " + curEp + " to FAILED because it's not SNATCHED/DOWNLOADED")
-                    continue
-
-                if episode_object.status in Quality.DOWNLOADED + Quality.ARCHIVED and int(status) == WANTED:
-                    sickrage.app.log.info("Removing release_name for episode as you want to set a downloaded "
-                                          "episode back to wanted, so obviously you want it replaced")
-                    episode_object.release_name = ""
+                to_change += [(int(ep_info[0]), int(ep_info[1]))]
 
-                episode_object.status = int(status)
-
-                trakt_data += [(episode_object.season, episode_object.episode)]
-
-            data = sickrage.app.notifier_providers['trakt'].trakt_episode_data_generate(trakt_data)
-            if data and sickrage.app.config.use_trakt and sickrage.app.config.trakt_sync_watchlist:
-                if int(status) in [WANTED, FAILED]:
-                    sickrage.app.log.debug(
-                        "Add episodes, showid: indexer_id " + str(show_obj.indexer_id) + ", Title " + str(show_obj.name) + " to Watchlist")
-                    sickrage.app.notifier_providers['trakt'].update_watchlist(show_obj, data_episode=data, update="add")
-                elif int(status) in [IGNORED, SKIPPED] + Quality.DOWNLOADED + Quality.ARCHIVED:
-                    sickrage.app.log.debug(
-                        "Remove episodes, showid: indexer_id " + str(show_obj.indexer_id) + ", Title " + str(show_obj.name) + " from Watchlist")
-                    sickrage.app.notifier_providers['trakt'].update_watchlist(show_obj, data_episode=data, update="remove")
-
-        if int(status) == WANTED and not show_obj.paused:
-            msg = _("Backlog was automatically started for the following seasons of ") + "<b>" + show_obj.name + "</b>:<br>"
-            msg += '<ul>'
-
-            for season, episode in wanted:
-                if (show_obj.indexer_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
-                    sickrage.app.search_queue.SNATCH_HISTORY.remove((show_obj.indexer_id, season, episode))
-
-                sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, BacklogQueueItem(show_obj.indexer_id, season, episode))
-                msg += "<li>" + _("Season ") + str(season) + "</li>"
-                sickrage.app.log.info("Sending backlog for " + show_obj.name + " season " + str(season) + " because some eps were set to wanted")
-
-            msg += "</ul>"
-
-            if wanted:
-                sickrage.app.alerts.message(_("Backlog started"), msg)
-        elif int(status) == WANTED and show_obj.paused:
-            sickrage.app.log.info("Some episodes were set to wanted, but {} is paused. Not adding to Backlog until "
-                                  "show is unpaused".format(show_obj.name))
-
-        if int(status) == FAILED:
-            msg = _(
-                "Retrying Search was automatically started for the following season of ") + "<b>" + show_obj.name + "</b>:<br>"
-            msg += '<ul>'
-
-            for season, episode in wanted:
-                if (show_obj.indexer_id, season, episode) in sickrage.app.search_queue.SNATCH_HISTORY:
-                    sickrage.app.search_queue.SNATCH_HISTORY.remove((show_obj.indexer_id, season, episode))
-
-                sickrage.app.io_loop.add_callback(sickrage.app.search_queue.put, FailedQueueItem(show_obj.indexer_id, season, episode))
-
-                msg += "<li>" + _("Season ") + str(season) + "</li>"
-                sickrage.app.log.info("Retrying Search for {} season {} because some eps were set to failed".format(show_obj.name, season))
-
-            msg += "</ul>"
-
-            if wanted:
-                sickrage.app.alerts.message(_("Retry Search started"), msg)
+        changes = EpisodeStatuses().set_status({show_obj.indexer_id: to_change}, int(status), session=self.db_session)
+        EpisodeStatuses.alert(changes)
 
         if direct:
             return self.write(json_encode({'result': 'success'}))
@@ -1603,6 +1539,8 @@ class TestRenameHandler(BaseHandler, ABC):
 
 
 class DoRenameHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1731,6 +1669,8 @@ class GetManualSearchStatusHandler(BaseHandler, ABC):
 
 
 class SearchEpisodeSubtitlesHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
@@ -1757,6 +1697,8 @@ class SearchEpisodeSubtitlesHandler(BaseHandler, ABC):
 
 
 class SetSceneNumberingHandler(BaseHandler, ABC):
+    read_only_get = False
+
     @authenticated
     def get(self, *args, **kwargs):
         show = self.get_argument('show')
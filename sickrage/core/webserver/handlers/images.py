@@ -0,0 +1,131 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import datetime
+import hashlib
+import os
+from abc import ABC
+from mimetypes import guess_type
+
+from tornado.web import RequestHandler, HTTPError
+
+import sickrage
+from sickrage.core import metrics
+from sickrage.core.caches.image_cache import ImageCache, image_version
+
+IMAGE_RESPONSES = metrics.counter('sickrage_image_responses', 'Image responses by status', ['status'])
+
+# size of the chunks images are written in
+CHUNK_SIZE = 64 * 1024
+
+# image path -> ((inode, modification time, size), etag) of images written before
+etags = {}
+
+
+def image_file(path, width=None):
+    """
+    :param path: full path to the image
+    :param width: width of a resized variant of a cached image
+    :return: full path to the image or its variant and its strong etag, the content hash of the file
+    """
+    if width:
+        path = ImageCache().resize(path, width)
+
+    stat = os.stat(path)
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    cached = etags.get(path)
+    if cached and cached[0] == key:
+        return path, cached[1]
+
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b''):
+            sha1.update(chunk)
+
+    etag = '"{}"'.format(sha1.hexdigest())
+    etags[path] = (key, etag)
+
+    return path, etag
+
+
+async def write_image(handler, path, width=None, version=None, include_body=True):
+    """
+    Writes an image in chunks with a strong etag, requests with a matching If-None-Match get a 304 Not Modified.
+    Images requested with their current version never change and may be cached forever, others are revalidated.
+
+    :param handler: request handler
+    :param path: full path to the image
+    :param width: width of a resized variant of a cached image to write instead
+    :param version: version of the image the request asked for
+    :param include_body: False for HEAD requests
+    """
+    try:
+        image_path, etag = await sickrage.app.io_loop.run_in_executor(None, image_file, path, width)
+        fh = open(image_path, 'rb')
+    except (IOError, OSError):
+        raise HTTPError(404)
+
+    with fh:
+        stat = os.fstat(fh.fileno())
+
+        handler.set_header('Etag', etag)
+        handler.set_header('Last-Modified', datetime.datetime.utcfromtimestamp(stat.st_mtime))
+        handler.set_header('Content-Type', guess_type(image_path)[0] or 'application/octet-stream')
+
+        if version and version == image_version(path):
+            handler.set_header('Cache-Control', 'public, max-age=31536000, immutable')
+        else:
+            handler.set_header('Cache-Control', 'no-cache')
+
+        if handler.check_etag_header():
+            IMAGE_RESPONSES.labels(304).inc()
+            handler.set_status(304)
+            return handler.finish()
+
+        IMAGE_RESPONSES.labels(200).inc()
+        handler.set_header('Content-Length', stat.st_size)
+
+        while include_body:
+            chunk = fh.read(CHUNK_SIZE)
+            if not chunk:
+                break
+
+            handler.write(chunk)
+            await handler.flush()
+
+    handler.finish()
+
+
+class ImageCacheHandler(RequestHandler, ABC):
+    """ images of the image cache and their resized variants, see ``Media.sized_url`` """
+
+    async def get(self, path, include_body=True):
+        image_cache_dir = ImageCache()._cache_dir()
+
+        image_path = os.path.abspath(os.path.join(image_cache_dir, path))
+        if not image_path.startswith(image_cache_dir + os.sep):
+            raise HTTPError(404)
+
+        width = self.get_argument('width', '')
+        await write_image(self, image_path, int(width) if width.isdigit() else None, self.get_argument('v', None), include_body)
+
+    async def head(self, path):
+        await self.get(path, include_body=False)
@@ -19,14 +19,11 @@
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
 
-import os
-import re
 from abc import ABC
 
 from tornado.web import authenticated
 
 import sickrage
-from sickrage.core.helpers import read_file_buffered
 from sickrage.core.webserver.handlers.base import BaseHandler
 
 
@@ -89,11 +86,12 @@ class LogsClearAllHanlder(BaseHandler, ABC):
 
 class LogsViewHandler(BaseHandler, ABC):
     @authenticated
-    def get(self, *args, **kwargs):
+    async def get(self, *args, **kwargs):
         min_level = self.get_argument('minLevel', None) or sickrage.app.log.INFO
         log_filter = self.get_argument('logFilter', '')
         log_search = self.get_argument('logSearch', '')
         max_lines = self.get_argument('maxLines', None) or 500
+        page = self.get_argument('page', None) or 0
 
         log_name_filters = {
             '': 'No Filter',
@@ -114,42 +112,26 @@ class LogsViewHandler(BaseHandler, ABC):
             'MAIN': _('Main'),
         }
 
-        log_files = [sickrage.app.log.logFile] + \
-                    ["{}.{}".format(sickrage.app.log.logFile, x) for x in
-                     range(int(sickrage.app.log.logNr))]
-
-        levels_filtered = '|'.join(
-            [x for x in sickrage.app.log.logLevels.keys() if
-             sickrage.app.log.logLevels[x] >= int(min_level)])
-
-        log_regex = re.compile(
-            r"(?P<entry>^\d+\-\d+\-\d+\s+\d+\:\d+\:\d+\s+(?:{})[\s\S]+?(?:{})[\s\S]+?$)".format(levels_filtered,
-                                                                                                log_filter),
-            re.S + re.M)
-
-        data = []
-
-        try:
-            for logFile in [x for x in log_files if os.path.isfile(x)]:
-                data += list(reversed(re.findall("((?:^.+?{}.+?$))".format(log_search),
-                                                 "\n".join(next(read_file_buffered(logFile, reverse=True)).splitlines()),
-                                                 re.M + re.I)))
-                max_lines -= len(data)
-                if len(data) == max_lines:
-                    raise StopIteration
-        except StopIteration:
-            pass
+        log_lines = await self.run_task(sickrage.app.log.read_logs,
+                                        min_level=int(min_level),
+                                        thread_filter=log_filter,
+                                        search=log_search,
+                                        page=int(page),
+                                        max_lines=int(max_lines))
 
         return self.render(
             "/logs/view.mako",
             header="Log File",
             title="Logs",
             topmenu="system",
-            logLines="\n".join(log_regex.findall("\n".join(data))),
+            logLines="\n".join(log_lines),
             minLevel=int(min_level),
             logNameFilters=log_name_filters,
             logFilter=log_filter,
             logSearch=log_search,
+            maxLines=int(max_lines),
+            page=int(page),
+            hasNextPage=len(log_lines) == int(max_lines),
             controller='logs',
             action='view'
         )
@@ -19,25 +19,63 @@
 #  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 # ##############################################################################
 
+import datetime
 import os
+import time
 from abc import ABC
 from urllib.parse import urlencode
 
 from tornado.escape import json_encode, json_decode
-from tornado.httputil import url_concat
+from sqlalchemy import func
 from tornado.web import authenticated
 
 import sickrage
-from sickrage.core.common import SNATCHED, Quality, Overview
+from sickrage.core import metrics
+from sickrage.core.common import SNATCHED, Quality, Overview, SNATCHED_PROPER, SNATCHED_BEST, DOWNLOADED, WANTED, FAILED
 from sickrage.core.databases.main import MainDB
 from sickrage.core.exceptions import CantUpdateShowException, CantRefreshShowException
-from sickrage.core.helpers import try_int
+from sickrage.core.helpers import try_int, srdatetime
 from sickrage.core.helpers.tornado_http import TornadoHTTP
 from sickrage.core.tv.episode import TVEpisode
-from sickrage.core.tv.show.helpers import find_show, get_show_list
+from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.episode_statuses import EpisodeStatuses
+from sickrage.core.tv.show.helpers import find_show
+from sickrage.core.tv.show.overview import PAGE_SIZE, MAX_PAGE_SIZE, paginate, backlog_counts, backlog_criterion, \
+    missed_subtitles_criterion
 from sickrage.core.webserver.handlers.base import BaseHandler
 from sickrage.subtitles import Subtitles
 
+MANAGE_PAGE_SECONDS = metrics.histogram('sickrage_manage_page_seconds', 'Time spent querying pages of episodes of the manage overviews',
+                                        ['view'])
+MANAGE_PAGE_ROWS = metrics.counter('sickrage_manage_page_rows', 'Episodes sent in pages of the manage overviews', ['view'])
+
+
+def page_arguments(handler):
+    """
+    :return: offset and limit of the requested page of episodes
+    """
+    offset = max(try_int(handler.get_argument('offset', None), 0), 0)
+    limit = min(max(try_int(handler.get_argument('limit', None), PAGE_SIZE), 1), MAX_PAGE_SIZE)
+    return offset, limit
+
+
+def write_page(handler, view, start, total, offset, limit, rows):
+    """
+    Writes a page of episodes as json with the total number of episodes and the seconds it took
+    """
+    elapsed = time.time() - start
+
+    MANAGE_PAGE_SECONDS.labels(view).observe(elapsed)
+    MANAGE_PAGE_ROWS.labels(view).inc(len(rows))
+
+    return handler.write(json_encode({
+        'total': total,
+        'offset': offset,
+        'limit': limit,
+        'rows': rows,
+        'elapsed': round(elapsed, 3)
+    }))
+
 
 class ManageHandler(BaseHandler, ABC):
     @authenticated
@@ -48,24 +86,24 @@ class ManageHandler(BaseHandler, ABC):
 class ShowEpisodeStatusesHandler(BaseHandler, ABC):
     @authenticated
     def get(self, *args, **kwargs):
+        start = time.time()
+
         indexer_id = self.get_argument('indexer_id')
         which_status = self.get_argument('whichStatus')
 
         status_list = [int(which_status)]
         if status_list[0] == SNATCHED:
-            status_list = Quality.SNATCHED + Quality.SNATCHED_PROPER
-
-        result = {}
-        for dbData in self.db_session.query(TVEpisode).filter_by(showid=int(indexer_id)).filter(TVEpisode.season != 0, TVEpisode.status.in_(status_list)):
-            cur_season = int(dbData.season)
-            cur_episode = int(dbData.episode)
+            status_list = [SNATCHED, SNATCHED_PROPER, SNATCHED_BEST]
 
-            if cur_season not in result:
-                result[cur_season] = {}
+        offset, limit = page_arguments(self)
+        total, rows = paginate(self.db_session.query(TVEpisode.season, TVEpisode.episode, TVEpisode.name).filter_by(showid=int(indexer_id)).filter(
+            TVEpisode.season != 0, TVEpisode.ep_status.in_(status_list)).order_by(TVEpisode.season, TVEpisode.episode), offset, limit)
 
-            result[cur_season][cur_episode] = dbData.name
-
-        return self.write(json_encode(result))
+        return write_page(self, 'episode_statuses', start, total, offset, limit, [{
+            'season': x.season,
+            'episode': x.episode,
+            'name': x.name
+        } for x in rows])
 
 
 class EpisodeStatusesHandler(BaseHandler, ABC):
@@ -81,21 +119,16 @@ class EpisodeStatusesHandler(BaseHandler, ABC):
         if which_status:
             status_list = [int(which_status)]
             if int(which_status) == SNATCHED:
-                status_list = Quality.SNATCHED + Quality.SNATCHED_PROPER + Quality.SNATCHED_BEST
+                status_list = [SNATCHED, SNATCHED_PROPER, SNATCHED_BEST]
 
         # if we have no status then this is as far as we need to go
         if len(status_list):
-            for show in sorted(get_show_list(session=self.db_session), key=lambda d: d.name):
-                for episode in show.episodes:
-                    if episode.season != 0 and episode.status in status_list:
-                        if show.indexer_id not in ep_counts:
-                            ep_counts[show.indexer_id] = 1
-                        else:
-                            ep_counts[show.indexer_id] += 1
-
-                        show_names[show.indexer_id] = show.name
-                        if show.indexer_id not in sorted_show_ids:
-                            sorted_show_ids.append(show.indexer_id)
+            for indexer_id, name, count in self.db_session.query(TVShow.indexer_id, TVShow.name, func.count(TVEpisode.showid)).join(
+                    TVShow.episodes).filter(TVEpisode.season != 0, TVEpisode.ep_status.in_(status_list)).group_by(
+                TVShow.indexer_id, TVShow.name).order_by(TVShow.name):
+                ep_counts[indexer_id] = count
+                show_names[indexer_id] = name
+                sorted_show_ids.append(indexer_id)
 
         return self.render(
             "/manage/episode_statuses.mako",
@@ -119,7 +152,7 @@ class ChangeEpisodeStatusesHandler(BaseHandler, ABC):
 
         status_list = [int(old_status)]
         if status_list[0] == SNATCHED:
-            status_list = Quality.SNATCHED + Quality.SNATCHED_PROPER
+            status_list = [SNATCHED, SNATCHED_PROPER, SNATCHED_BEST]
 
         # make a list of all shows and their associated args
         to_change = {}
@@ -134,17 +167,14 @@ class ChangeEpisodeStatusesHandler(BaseHandler, ABC):
         for cur_indexer_id in to_change:
             # get a list of all the eps we want to change if they just said "all"
             if 'all' in to_change[cur_indexer_id]:
-                all_eps = ['{}x{}'.format(x.season, x.episode) for x in
-                           self.db_session.query(TVEpisode).filter_by(showid=int(cur_indexer_id)).filter(TVEpisode.status.in_(status_list),
-                                                                                                         TVEpisode.season != 0)]
-                to_change[cur_indexer_id] = all_eps
-
-            await TornadoHTTP().get(
-                url_concat(
-                    self.get_url("/home/setStatus"),
-                    dict(show=cur_indexer_id, eps='|'.join(to_change[cur_indexer_id]), status=new_status, direct=True)
-                )
-            )
+                to_change[cur_indexer_id] = [(x.season, x.episode) for x in
+                                             self.db_session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=int(cur_indexer_id)).filter(
+                                                 TVEpisode.ep_status.in_(status_list), TVEpisode.season != 0)]
+            else:
+                to_change[cur_indexer_id] = [tuple(map(int, x.split('x'))) for x in to_change[cur_indexer_id]]
+
+        changes = await self.run_task(EpisodeStatuses().set_status, to_change, int(new_status), old_statuses=status_list)
+        EpisodeStatuses.alert(changes)
 
         return self.redirect('/manage/episodeStatuses/')
 
@@ -152,32 +182,23 @@ class ChangeEpisodeStatusesHandler(BaseHandler, ABC):
 class ShowSubtitleMissedHandler(BaseHandler, ABC):
     @authenticated
     def get(self, *args, **kwargs):
+        start = time.time()
+
         indexer_id = self.get_argument('indexer_id')
         which_subs = self.get_argument('whichSubs')
 
-        result = {}
-        for dbData in self.db_session.query(TVEpisode).filter_by(showid=int(indexer_id)).filter(TVEpisode.status.endswith(4),
-                                                                                                TVEpisode.season != 0):
-            if which_subs == 'all':
-                if not frozenset(Subtitles().wanted_languages()).difference(dbData.subtitles.split(',')):
-                    continue
-            elif which_subs in dbData.subtitles:
-                continue
-
-            cur_season = dbData.season
-            cur_episode = dbData.episode
-
-            if cur_season not in result:
-                result[cur_season] = {}
-
-            if cur_episode not in result[cur_season]:
-                result[cur_season][cur_episode] = {}
+        offset, limit = page_arguments(self)
+        total, rows = paginate(self.db_session.query(TVEpisode.season, TVEpisode.episode, TVEpisode.name, TVEpisode.subtitles).filter_by(
+            showid=int(indexer_id)).filter(TVEpisode.ep_status == DOWNLOADED, TVEpisode.season != 0,
+                                           missed_subtitles_criterion(which_subs, Subtitles().wanted_languages())).order_by(
+            TVEpisode.season, TVEpisode.episode), offset, limit)
 
-            result[cur_season][cur_episode]["name"] = dbData.name
-
-            result[cur_season][cur_episode]["subtitles"] = dbData.subtitles
-
-        return self.write(json_encode(result))
+        return write_page(self, 'subtitles_missed', start, total, offset, limit, [{
+            'season': x.season,
+            'episode': x.episode,
+            'name': x.name,
+            'subtitles': x.subtitles
+        } for x in rows])
 
 
 class SubtitleMissedHandler(BaseHandler, ABC):
@@ -188,38 +209,15 @@ class SubtitleMissedHandler(BaseHandler, ABC):
         ep_counts = {}
         show_names = {}
         sorted_show_ids = []
-        status_results = []
 
         if which_subs:
-            for s in get_show_list(session=self.db_session):
-                if not s.subtitles == 1:
-                    continue
-
-                for e in s.episodes:
-                    if e.season != 0 and (str(e.status).endswith('4') or str(e.status).endswith('6')):
-                        status_results += [{
-                            'show_name': s.name,
-                            'indexer_id': s.indexer_id,
-                            'subtitles': e.subtitles
-                        }]
-
-            for cur_status_result in sorted(status_results, key=lambda k: k['show_name']):
-                if which_subs == 'all':
-                    if not frozenset(Subtitles().wanted_languages()).difference(
-                            cur_status_result["subtitles"].split(',')):
-                        continue
-                elif which_subs in cur_status_result["subtitles"]:
-                    continue
-
-                cur_indexer_id = int(cur_status_result["indexer_id"])
-                if cur_indexer_id not in ep_counts:
-                    ep_counts[cur_indexer_id] = 1
-                else:
-                    ep_counts[cur_indexer_id] += 1
-
-                show_names[cur_indexer_id] = cur_status_result["show_name"]
-                if cur_indexer_id not in sorted_show_ids:
-                    sorted_show_ids.append(cur_indexer_id)
+            for indexer_id, name, count in self.db_session.query(TVShow.indexer_id, TVShow.name, func.count(TVEpisode.showid)).join(
+                    TVShow.episodes).filter(TVShow.subtitles == 1, TVEpisode.season != 0, TVEpisode.ep_status == DOWNLOADED,
+                                            missed_subtitles_criterion(which_subs, Subtitles().wanted_languages())).group_by(
+                TVShow.indexer_id, TVShow.name).order_by(TVShow.name):
+                ep_counts[indexer_id] = count
+                show_names[indexer_id] = name
+                sorted_show_ids.append(indexer_id)
 
         return self.render(
             "/manage/subtitles_missed.mako",
@@ -252,8 +250,8 @@ class DownloadSubtitleMissedHandler(BaseHandler, ABC):
             # get a list of all the eps we want to download subtitles if they just said "all"
             if 'all' in to_download[cur_indexer_id]:
                 to_download[cur_indexer_id] = ['{}x{}'.format(x.season, x.episode) for x in
-                                               self.db_session.query(TVEpisode).filter_by(showid=int(cur_indexer_id)).filter(
-                                                   TVEpisode.status.endswith(4), TVEpisode.season != 0)]
+                                               self.db_session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=int(cur_indexer_id)).filter(
+                                                   TVEpisode.ep_status == DOWNLOADED, TVEpisode.season != 0)]
 
             for epResult in to_download[cur_indexer_id]:
                 season, episode = epResult.split('x')
@@ -277,45 +275,13 @@ class BacklogShowHandler(BaseHandler, ABC):
 class BacklogOverviewHandler(BaseHandler, ABC):
     @authenticated
     def get(self, *args, **kwargs):
-        show_counts = {}
-        show_cats = {}
-        show_results = {}
-
-        for curShow in get_show_list(session=self.db_session):
-            if curShow.paused:
-                continue
-
-            ep_cats = {}
-            ep_counts = {
-                Overview.SKIPPED: 0,
-                Overview.WANTED: 0,
-                Overview.QUAL: 0,
-                Overview.GOOD: 0,
-                Overview.UNAIRED: 0,
-                Overview.SNATCHED: 0,
-                Overview.SNATCHED_PROPER: 0,
-                Overview.SNATCHED_BEST: 0,
-                Overview.MISSED: 0,
-            }
-
-            show_results[curShow.indexer_id] = []
-
-            for curResult in sorted(curShow.episodes, key=lambda x: (x.season, x.episode), reverse=True):
-                cur_ep_cat = curShow.get_overview(int(curResult.status or -1))
-                if cur_ep_cat:
-                    ep_cats["{}x{}".format(curResult.season, curResult.episode)] = cur_ep_cat
-                    ep_counts[cur_ep_cat] += 1
-
-                show_results[curShow.indexer_id] += [curResult]
-
-            show_counts[curShow.indexer_id] = ep_counts
-            show_cats[curShow.indexer_id] = ep_cats
+        show_counts = backlog_counts(session=self.db_session)
 
         return self.render(
             "/manage/backlog_overview.mako",
             showCounts=show_counts,
-            showCats=show_cats,
-            showResults=show_results,
+            totalWanted=sum(x[Overview.WANTED] for x in show_counts.values()),
+            totalQual=sum(x[Overview.QUAL] for x in show_counts.values()),
             title=_('Backlog Overview'),
             header=_('Backlog Overview'),
             topmenu='manage',
@@ -324,6 +290,43 @@ class BacklogOverviewHandler(BaseHandler, ABC):
         )
 
 
+class BacklogOverviewEpisodesHandler(BaseHandler, ABC):
+    @authenticated
+    def get(self, *args, **kwargs):
+        start = time.time()
+
+        indexer_id = self.get_argument('indexer_id')
+        overview = try_int(self.get_argument('overview', None), None)
+
+        show = self.db_session.query(TVShow.indexer_id, TVShow.quality, TVShow.skip_downloaded, TVShow.airs, TVShow.network).filter_by(
+            indexer_id=int(indexer_id)).one_or_none()
+        if not show:
+            return self.send_error(404)
+
+        offset, limit = page_arguments(self)
+        total, rows = paginate(self.db_session.query(TVEpisode.season, TVEpisode.episode, TVEpisode.name, TVEpisode.airdate,
+                                                     TVEpisode.ep_status).filter_by(showid=show.indexer_id).filter(
+            backlog_criterion(show.quality, show.skip_downloaded, overview)).order_by(TVEpisode.season.desc(), TVEpisode.episode.desc()),
+            offset, limit)
+
+        episodes = []
+        for x in rows:
+            airdate = None
+            if x.airdate > datetime.date.min:
+                airdate = srdatetime.SRDateTime(sickrage.app.tz_updater.parse_date_time(x.airdate, show.airs, show.network), convert=True).dt
+
+            episodes.append({
+                'season': x.season,
+                'episode': x.episode,
+                'name': x.name,
+                'airdate': airdate.isoformat() if airdate else None,
+                'airdate_str': srdatetime.SRDateTime(airdate).srfdatetime() if airdate else _('Never'),
+                'overview': Overview.overviewStrings[Overview.WANTED if x.ep_status in (WANTED, FAILED) else Overview.QUAL]
+            })
+
+        return write_page(self, 'backlog_overview', start, total, offset, limit, episodes)
+
+
 class MassEditHandler(BaseHandler, ABC):
     @authenticated
     def get(self, *args, **kwargs):
@@ -0,0 +1,62 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+from abc import ABC
+
+from tornado.web import RequestHandler
+
+import sickrage
+from sickrage.core import metrics
+
+QUEUE_SIZE = metrics.gauge('sickrage_queue_size', 'Queue items waiting or running', ['queue'])
+DB_WAL_BYTES = metrics.gauge('sickrage_db_wal_bytes', 'Size of the SQLite write-ahead log', ['database'])
+DB_CHECKPOINT_LAG = metrics.gauge('sickrage_db_checkpoint_lag_frames', 'Write-ahead log frames a checkpoint could not write back yet', ['database'])
+LOG_QUEUE_SIZE = metrics.gauge('sickrage_log_queue_size', 'Log records waiting in the logging queue')
+LOG_RECORDS = metrics.gauge('sickrage_log_records', 'Log records enqueued, processed and dropped by the logging queue since startup', ['state'])
+
+
+class MetricsHandler(RequestHandler, ABC):
+    """ metrics in the Prometheus text format, requires the api key in the url like the api """
+
+    def get(self, api_key):
+        if sickrage.app.config.api_key != api_key:
+            sickrage.app.log.debug("IP:{} - METRICS ACCESS DENIED".format(self.request.remote_ip))
+            return self.send_error(401)
+
+        for queue in (sickrage.app.show_queue, sickrage.app.search_queue, sickrage.app.postprocessor_queue):
+            if queue:
+                QUEUE_SIZE.labels(queue.name).set(len(queue.queue_items))
+
+        for db in (sickrage.app.main_db, sickrage.app.cache_db):
+            wal_status = db.wal_status() if db else None
+            if wal_status:
+                DB_WAL_BYTES.labels(db.name).set(wal_status[0])
+                DB_CHECKPOINT_LAG.labels(db.name).set(wal_status[1])
+
+        log_stats = sickrage.app.log.queue_stats
+        if log_stats:
+            LOG_QUEUE_SIZE.set(log_stats['queued'])
+            for state in ('enqueued', 'processed', 'dropped'):
+                LOG_RECORDS.labels(state).set(log_stats[state])
+
+        self.set_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.set_header('Cache-Control', 'no-cache')
+        self.write(metrics.registry.exposition())
@@ -412,6 +412,31 @@ c<%inherit file="../layouts/config.mako"/>
                     </div>
                 </div>
 
+                <div class="form-row form-group">
+                    <div class="col-lg-3 col-md-4 col-sm-5">
+                        <label class="component-title">${_('Library update window')}</label>
+                    </div>
+                    <div class="col-lg-9 col-md-8 col-sm-7 component-desc">
+                        <div class="input-group">
+                            <div class="input-group-prepend">
+                                <span class="input-group-text">
+                                    <span class="fas fa-clock"></span>
+                                </span>
+                            </div>
+                            <input name="library_update_window" id="library_update_window"
+                                   value="${sickrage.app.config.library_update_window}"
+                                   placeholder="${_('default = 60')}"
+                                   title="media server library updates of the same show within this window are sent as one"
+                                   class="form-control"/>
+                            <div class="input-group-append">
+                                <span class="input-group-text">
+                                    seconds
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
                 <div class="form-row">
                     <div class="col-md-12">
                         <input type="submit" class="btn config_submitter" value="${_('Save Changes')}"/>
@@ -147,10 +147,11 @@
                             elif re.search(r'(?i)(?:nded)', curShow.status):
                                 display_status = _('Ended')
 
-                        cur_airs_next = curShow.airs_next
-                        cur_snatched = curShow.episodes_snatched
-                        cur_downloaded = curShow.episodes_downloaded
-                        cur_total = len(curShow.episodes) - curShow.episodes_special - curShow.episodes_unaired
+                        cur_stats = show_stats[curShow.indexer_id]
+                        cur_airs_next = cur_stats['airs_next']
+                        cur_snatched = cur_stats['snatched']
+                        cur_downloaded = cur_stats['downloaded']
+                        cur_total = cur_stats['total'] - cur_stats['special'] - cur_stats['unaired']
 
                         if cur_total != 0:
                             download_stat = str(cur_downloaded)
@@ -191,7 +192,7 @@
                             <div class="card card-block text-white bg-dark m-1 shadow">
                                 <a href="${srWebRoot}/home/displayShow?show=${curShow.indexer_id}">
                                     <img alt="" class="card-img-top"
-                                         src="${srWebRoot}${showImage(curShow.indexer_id, 'poster').url}"/>
+                                         src="${srWebRoot}${showImage(curShow.indexer_id, 'poster').sized_url(400)}"/>
                                 </a>
                                 <div class="card-header bg-dark py-0 px-0">
                                     <span style="display: none;">${download_stat}</span>
@@ -307,12 +308,13 @@
 
                                         download_stat_tip = ''
 
-                                        cur_airs_next = curShow.airs_next
-                                        cur_airs_prev = curShow.airs_prev
-                                        cur_snatched = curShow.episodes_snatched
-                                        cur_downloaded = curShow.episodes_downloaded
-                                        cur_total = len(curShow.episodes) - curShow.episodes_special - curShow.episodes_unaired
-                                        show_size = curShow.total_size
+                                        cur_stats = show_stats[curShow.indexer_id]
+                                        cur_airs_next = cur_stats['airs_next']
+                                        cur_airs_prev = cur_stats['airs_prev']
+                                        cur_snatched = cur_stats['snatched']
+                                        cur_downloaded = cur_stats['downloaded']
+                                        cur_total = cur_stats['total'] - cur_stats['special'] - cur_stats['unaired']
+                                        show_size = cur_stats['total_size']
 
                                         if cur_total != 0:
                                             download_stat = str(cur_downloaded)
@@ -370,7 +372,7 @@
                                             <td class="tvShow">
                                                 <a href="${srWebRoot}/home/displayShow?show=${curShow.indexer_id}"
                                                    title="${curShow.name}">
-                                                    <img src="${srWebRoot}${showImage(curShow.indexer_id, 'poster_thumb').url}"
+                                                    <img src="${srWebRoot}${showImage(curShow.indexer_id, 'poster_thumb').sized_url(100)}"
                                                          class="img-smallposter rounded shadow"
                                                          alt="${curShow.indexer_id}"/>
                                                     ${curShow.name}
@@ -4,7 +4,10 @@
     import sickrage
     from sickrage.core.queues.show import ShowQueueActions
     from sickrage.core.common import dateTimeFormat
-    from sickrage.core.helpers import pretty_time_delta
+    from sickrage.core.helpers import pretty_time_delta, pretty_file_size
+    from sickrage.core.websocket import broadcaster
+    from sickrage.core.caches.dir_snapshot_cache import DirSnapshot
+    from sickrage.clients import clients
 %>
 <%block name="content">
     <%
@@ -163,6 +166,183 @@
         </div>
     </div>
 
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('WebSocket')}</h3>
+                </div>
+                <div class="card-body">
+                    <% websocket_stats = broadcaster.stats %>
+                    <table id="websocketStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Connected Clients')}</th>
+                            <th>${_('Queued Bytes')}</th>
+                            <th>${_('Queued Messages')}</th>
+                            <th>${_('Frames Sent')}</th>
+                            <th>${_('Merged')}</th>
+                            <th>${_('Dropped')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                        <tr>
+                            <td>${websocket_stats['clients']}</td>
+                            <td>${pretty_file_size(websocket_stats['queued_bytes'])}</td>
+                            <td>${websocket_stats['queued_messages']}</td>
+                            <td>${websocket_stats['frames']}</td>
+                            <td>${websocket_stats['merged']}</td>
+                            <td>${websocket_stats['dropped']}</td>
+                        </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Show Directories')}</h3>
+                </div>
+                <div class="card-body">
+                    <% snapshot_stats = DirSnapshot.stats() %>
+                    <table id="dirSnapshotStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Unchanged Media Files')}</th>
+                            <th>${_('Parsed Media Files')}</th>
+                            <th>${_('Hit Rate')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                        <tr>
+                            <td>${snapshot_stats['unchanged']}</td>
+                            <td>${snapshot_stats['changed']}</td>
+                            <td>${'{:.1%}'.format(snapshot_stats['hit_rate'])}</td>
+                        </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <% log_stats = sickrage.app.log.queue_stats %>
+    % if log_stats:
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Logging')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="logQueueStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Queued Records')}</th>
+                            <th>${_('Enqueued')}</th>
+                            <th>${_('Processed')}</th>
+                            <th>${_('Dropped')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                        <tr>
+                            <td>${log_stats['queued']}</td>
+                            <td>${log_stats['enqueued']}</td>
+                            <td>${log_stats['processed']}</td>
+                            <td>${log_stats['dropped']}</td>
+                        </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+    % endif
+
+    % if sickrage.app.notification_dispatcher and sickrage.app.notification_dispatcher.stats:
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${_('Notifications')}</h3>
+                </div>
+                <div class="card-body">
+                    <table id="notifierStatusTable" class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Notifier')}</th>
+                            <th>${_('Sent')}</th>
+                            <th>${_('Failed')}</th>
+                            <th>${_('Retried')}</th>
+                            <th>${_('Coalesced')}</th>
+                            <th>${_('Merged')}</th>
+                            <th>${_('Pending')}</th>
+                            <th>${_('Avg Time')}</th>
+                            <th>${_('Max Time')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            % for notifier_id, notifier_stats in sorted(sickrage.app.notification_dispatcher.stats.items()):
+                                <tr>
+                                    <td>${notifier_id}</td>
+                                    <td>${notifier_stats.sent}</td>
+                                    <td>${notifier_stats.failed}</td>
+                                    <td>${notifier_stats.retried}</td>
+                                    <td>${notifier_stats.coalesced}</td>
+                                    <td>${notifier_stats.merged}</td>
+                                    <td>${sickrage.app.notification_dispatcher.pending(notifier_id)}</td>
+                                    <td>${'{:.3f}s'.format(notifier_stats.avg_time)}</td>
+                                    <td>${'{:.3f}s'.format(notifier_stats.max_time)}</td>
+                                </tr>
+                            % endfor
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+    % endif
+
+    % for __, client in [x for x in clients.values() if x[1].stats]:
+    <div class="row">
+        <div class="col-lg-10 mx-auto">
+            <div class="card mb-3">
+                <div class="card-header">
+                    <h3>${client.name}</h3>
+                </div>
+                <div class="card-body">
+                    <table class="table" width="100%">
+                        <thead class="thead-dark">
+                        <tr>
+                            <th>${_('Call')}</th>
+                            <th>${_('Calls')}</th>
+                            <th>${_('Failed')}</th>
+                            <th>${_('Avg Time')}</th>
+                            <th>${_('Max Time')}</th>
+                        </tr>
+                        </thead>
+                        <tbody>
+                            % for call, call_stats in sorted(client.stats.items()):
+                                <tr>
+                                    <td>${call}</td>
+                                    <td>${call_stats.calls}</td>
+                                    <td>${call_stats.failed}</td>
+                                    <td>${'{:.3f}s'.format(call_stats.avg_time)}</td>
+                                    <td>${'{:.3f}s'.format(call_stats.max_time)}</td>
+                                </tr>
+                            % endfor
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+    </div>
+    % endfor
+
     <div class="row">
         <div class="col-lg-10 mx-auto">
             <div class="card mb-3">
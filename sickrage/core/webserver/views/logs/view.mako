@@ -1,6 +1,7 @@
 <%inherit file="../layouts/main.mako"/>
 <%!
     from functools import cmp_to_key
+    from urllib.parse import urlencode
     import sickrage
 %>
 <%block name="content">
@@ -37,8 +38,21 @@
                     </div>
                 </div>
                 <div class="card-body">
-                    <div class="text-left" style="white-space: pre-line;">
-                        <div id="loglines">${logLines}</div>
+                    <div id="loglines">
+                        <div class="text-left" style="white-space: pre-line;">${logLines}</div>
+                        <% page_args = {'minLevel': minLevel, 'logFilter': logFilter, 'logSearch': logSearch, 'maxLines': maxLines} %>
+                        <ul class="pagination justify-content-center">
+                            % if page > 0:
+                                <li class="page-item">
+                                    <a class="page-link" href="${srWebRoot}/logs/view/?${urlencode(dict(page_args, page=page - 1))}">${_('Newer')}</a>
+                                </li>
+                            % endif
+                            % if hasNextPage:
+                                <li class="page-item">
+                                    <a class="page-link" href="${srWebRoot}/logs/view/?${urlencode(dict(page_args, page=page + 1))}">${_('Older')}</a>
+                                </li>
+                            % endif
+                        </ul>
                     </div>
                 </div>
             </div>
@@ -81,8 +81,6 @@
 
                             <tbody>
                                 % for curShow in sorted(get_show_list(), key=cmp_to_key(lambda x, y: x.name < y.name)):
-                                    <% curEp = curShow.airs_next %>
-
                                     <tr class="${curShow.status}" id="${curShow.indexer_id}">
                                         <td class="table-fit">
                                             <input type="checkbox" class="showCheck" id="${curShow.indexer_id}"
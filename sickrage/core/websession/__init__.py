@@ -32,7 +32,10 @@ from requests.utils import dict_from_cookiejar
 from urllib3 import disable_warnings
 
 import sickrage
-from sickrage.core import helpers
+from sickrage.core import helpers, metrics
+
+REQUEST_SECONDS = metrics.histogram('sickrage_http_request_seconds', 'Time spent on outgoing HTTP requests', ['host'])
+REQUEST_ERRORS = metrics.counter('sickrage_http_request_errors', 'Outgoing HTTP requests that failed', ['host'])
 
 
 def _add_proxies():
@@ -84,9 +87,18 @@ class WebSession(Session):
             response = super(WebSession, self).request(method, url, allow_redirects=False)
             url = self.get_redirect_target(response) or url
 
-        response = super(WebSession, self).request(method, url, verify=self._get_ssl_cert(verify), *args, **kwargs)
-        if self.cloudflare:
-            response = WebHelpers.cloudflare(self, response, **kwargs)
+        host = urlparse(url).hostname
+        try:
+            with REQUEST_SECONDS.labels(host).time():
+                response = super(WebSession, self).request(method, url, verify=self._get_ssl_cert(verify), *args, **kwargs)
+                if self.cloudflare:
+                    response = WebHelpers.cloudflare(self, response, **kwargs)
+        except Exception:
+            REQUEST_ERRORS.labels(host).inc()
+            raise
+
+        if not response.ok:
+            REQUEST_ERRORS.labels(host).inc()
 
         try:
             # check web response for errors
@@ -149,12 +161,15 @@ class WebHooks(object):
     @staticmethod
     def log_url(response, **kwargs):
         """Response hook to log request URL."""
+        if not sickrage.app.log.isEnabledFor(sickrage.app.log.DEBUG):
+            return
+
         request = response.request
-        sickrage.app.log.debug('{} URL: {} [Status: {}]'.format(request.method, request.url, response.status_code))
-        sickrage.app.log.debug('User-Agent: {}'.format(request.headers['User-Agent']))
+        sickrage.app.log.debug('%s URL: %s [Status: %s]', request.method, request.url, response.status_code)
+        sickrage.app.log.debug('User-Agent: %s', request.headers['User-Agent'])
 
         if request.method.upper() == 'POST':
-            sickrage.app.log.debug('With post data: {!r}'.format(request.body.decode() if isinstance(request.body, bytes) else request.body))
+            sickrage.app.log.debug('With post data: %r', request.body.decode() if isinstance(request.body, bytes) else request.body)
 
 
 class WebHelpers(object):
@@ -1,4 +1,6 @@
 import json
+import threading
+from collections import OrderedDict
 
 from tornado.websocket import WebSocketHandler, WebSocketClosedError
 
@@ -10,6 +12,16 @@ clients = set()
 class WebSocketUIHandler(WebSocketHandler):
     """WebSocket handler to send and receive data to and from a web client."""
 
+    # bytes a client may have in flight before frames are held back for it
+    max_pending_bytes = 1 << 20
+
+    # messages held back for a slow client before the oldest are dropped
+    max_backlog = 100
+
+    def initialize(self):
+        self.pending_bytes = 0
+        self.backlog = OrderedDict()
+
     def check_origin(self, origin):
         """Allow alternate origins."""
         return True
@@ -19,10 +31,8 @@ class WebSocketUIHandler(WebSocketHandler):
         clients.add(self)
 
         for n in sickrage.app.alerts.get_notifications(self.request.remote_ip):
-            try:
-                self.write_message(WebSocketMessage('notification', n.data).json())
-            except WebSocketClosedError:
-                pass
+            message = WebSocketMessage('notification', n.data)
+            self.send_frame(message.json(), [message])
 
     def on_message(self, message):
         """Received a message from the client."""
@@ -34,24 +44,131 @@ class WebSocketUIHandler(WebSocketHandler):
 
     def on_close(self):
         """Client disconnected from the WebSocket."""
-        clients.remove(self)
+        clients.discard(self)
+
+    def send_frame(self, frame, messages):
+        """
+        Write a serialized frame to the client, or hold its messages back while
+        the client is still busy receiving earlier frames.
+        :param frame: serialized frame
+        :param messages: list of WebSocketMessage objects contained in the frame
+        """
+        if self.pending_bytes >= self.max_pending_bytes or self.backlog:
+            for message in messages:
+                if message.key in self.backlog:
+                    del self.backlog[message.key]
+                    broadcaster.merged += 1
+                self.backlog[message.key] = message
+
+            while len(self.backlog) > self.max_backlog:
+                self.backlog.popitem(last=False)
+                broadcaster.dropped += 1
+
+            return
+
+        self.write_frame(frame)
+
+    def write_frame(self, frame):
+        try:
+            future = self.write_message(frame)
+        except WebSocketClosedError:
+            return
+
+        size = len(frame)
+        self.pending_bytes += size
+
+        def on_written(f):
+            self.pending_bytes -= size
+            if f.exception():
+                return
+
+            if self.backlog and self.pending_bytes < self.max_pending_bytes:
+                backlog, self.backlog = list(self.backlog.values()), OrderedDict()
+                self.write_frame(WebSocketBroadcaster.serialize(backlog))
+
+        future.add_done_callback(on_written)
 
     def __repr__(self):
         """Client representation."""
         return '<{} Client: {}>'.format(type(self).__name__, self.request.remote_ip)
 
 
+class WebSocketBroadcaster(object):
+    """
+    Collects pushed messages and broadcasts them to all connected clients in
+    periodic frames, each frame is serialized once for all clients.
+    """
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.pending = OrderedDict()
+        self.scheduled = False
+
+        self.frames = 0
+        self.merged = 0
+        self.dropped = 0
+
+    def add(self, message):
+        with self.lock:
+            if message.key in self.pending:
+                del self.pending[message.key]
+                self.merged += 1
+            self.pending[message.key] = message
+
+            if self.scheduled:
+                return
+            self.scheduled = True
+
+        sickrage.app.io_loop.add_callback(sickrage.app.io_loop.call_later, self.interval, self.flush)
+
+    def flush(self):
+        with self.lock:
+            messages, self.pending = list(self.pending.values()), OrderedDict()
+            self.scheduled = False
+
+        if not messages or not clients:
+            return
+
+        frame = self.serialize(messages)
+        self.frames += 1
+
+        for client in list(clients):
+            client.send_frame(frame, messages)
+
+    @staticmethod
+    def serialize(messages):
+        """Single messages are sent as is, multiple messages as a JSON list."""
+        if len(messages) == 1:
+            return messages[0].json()
+        return json.dumps([x.content for x in messages])
+
+    @property
+    def stats(self):
+        return {
+            'clients': len(clients),
+            'queued_bytes': sum(x.pending_bytes for x in clients),
+            'queued_messages': len(self.pending) + sum(len(x.backlog) for x in clients),
+            'frames': self.frames,
+            'merged': self.merged,
+            'dropped': self.dropped,
+        }
+
+
 class WebSocketMessage(object):
     """Represents a WebSocket message."""
 
-    def __init__(self, event, data):
+    def __init__(self, event, data, key=None):
         """
         Construct a new WebSocket message.
         :param event: A string representing the type of message (e.g. notification)
         :param data: A JSON-serializable object containing the message data.
+        :param key: Messages with the same event and key replace each other while queued, by default messages are
+                    never merged.
         """
         self.event = event
         self.data = data
+        self.key = (event, key) if key is not None else id(self)
 
     @property
     def content(self):
@@ -70,5 +187,7 @@ class WebSocketMessage(object):
         if not clients:
             return
 
-        for client in clients:
-            sickrage.app.io_loop.add_callback(client.write_message, self.json())
+        broadcaster.add(self)
+
+
+broadcaster = WebSocketBroadcaster()
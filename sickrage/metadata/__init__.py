@@ -17,12 +17,18 @@
 # along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import hashlib
 import importlib
 import inspect
+import io
 import os
 import pkgutil
 import re
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from xml.etree.ElementTree import ElementTree
 
 import fanart
@@ -33,6 +39,137 @@ from sickrage.core.websession import WebSession
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_error, indexer_episodenotfound, indexer_seasonnotfound
 
+# number of episodes rendered concurrently when writing metadata for a whole show
+METADATA_WORKERS = 4
+
+_local = threading.local()
+
+
+class MetadataFileCache(object):
+    """
+    Directory listings shared by the metadata workers of a single show, each
+    directory is listed once with os.scandir instead of a stat call per file
+    per metadata provider. Also counts files written and skipped.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.listings = {}
+        self.written = 0
+        self.skipped = 0
+
+    def listing(self, dirname):
+        with self.lock:
+            if dirname in self.listings:
+                return self.listings[dirname]
+
+        try:
+            names = set(x.name for x in os.scandir(dirname) if x.is_file())
+        except OSError:
+            names = set()
+
+        with self.lock:
+            return self.listings.setdefault(dirname, names)
+
+    def exists(self, path):
+        return os.path.basename(path) in self.listing(os.path.dirname(path))
+
+    def add(self, path, written=True):
+        names = self.listing(os.path.dirname(path))
+        with self.lock:
+            names.add(os.path.basename(path))
+            if written:
+                self.written += 1
+            else:
+                self.skipped += 1
+
+
+@contextmanager
+def metadata_file_cache(cache=None):
+    """
+    Activates a MetadataFileCache for the current thread, nested calls reuse
+    the already active cache.
+    """
+    previous = getattr(_local, 'file_cache', None)
+    _local.file_cache = cache or previous or MetadataFileCache()
+    try:
+        yield _local.file_cache
+    finally:
+        _local.file_cache = previous
+
+
+def file_exists(path):
+    cache = getattr(_local, 'file_cache', None)
+    if cache:
+        return cache.exists(path)
+    return os.path.isfile(path)
+
+
+def write_file(path, data):
+    """
+    Writes data to path unless the file already exists with the same content.
+
+    :param path: file location
+    :param data: file content
+    :type data: bytes
+    :return: True if the file was written, False if it was unchanged
+    """
+    cache = getattr(_local, 'file_cache', None)
+
+    if file_exists(path):
+        with open(path, 'rb') as f:
+            if hashlib.md5(f.read()).digest() == hashlib.md5(data).digest():
+                if cache:
+                    cache.add(path, written=False)
+                return False
+
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    if cache:
+        cache.add(path)
+
+    return True
+
+
+def create_episodes_meta_files(episode_keys, force=False):
+    """
+    Creates episode metadata files and thumbnails for all episodes using a
+    pool of workers, all workers share the active MetadataFileCache.
+
+    Workers load the episodes in a read-only session of their own, so they
+    only see what the caller committed.
+
+    :param episode_keys: list of (showid, indexer, season, episode)
+    """
+    from sickrage.core.databases.main import MainDB
+    from sickrage.core.tv.episode import TVEpisode
+
+    with metadata_file_cache() as cache:
+        @MainDB.with_session(read_only=True)
+        def worker(chunk, session=None):
+            with metadata_file_cache(cache):
+                for showid, indexer, season, episode in chunk:
+                    try:
+                        episode_obj = session.query(TVEpisode).filter_by(showid=showid, indexer=indexer, season=season,
+                                                                         episode=episode).one_or_none()
+                        if episode_obj:
+                            episode_obj.create_nfo(force)
+                            episode_obj.create_thumbnail(force)
+                    except Exception:
+                        sickrage.app.log.debug(traceback.format_exc())
+                    finally:
+                        # flags set while writing files are recomputed by the caller from the files
+                        session.rollback()
+
+        with ThreadPoolExecutor(max_workers=METADATA_WORKERS, thread_name_prefix=threading.currentThread().getName()) as executor:
+            for future in [executor.submit(worker, episode_keys[i::METADATA_WORKERS])
+                           for i in range(min(METADATA_WORKERS, len(episode_keys)))]:
+                try:
+                    future.result()
+                except Exception:
+                    sickrage.app.log.debug(traceback.format_exc())
+
 
 class GenericMetadata(object):
     """
@@ -107,8 +244,7 @@ class GenericMetadata(object):
     @staticmethod
     def _check_exists(location):
         if location:
-            result = os.path.isfile(location)
-            return result
+            return file_exists(location)
         return False
 
     def _has_show_metadata(self, show_obj):
@@ -162,7 +298,7 @@ class GenericMetadata(object):
         Returns the path where the episode thumbnail should be stored.
         ep_obj: a TVEpisode instance for which to create the thumbnail
         """
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
 
             tbn_filename = ep_obj.location.rpartition(".")
 
@@ -355,10 +491,11 @@ class GenericMetadata(object):
 
             sickrage.app.log.debug("Writing show nfo file to " + nfo_file_path)
 
-            with open(nfo_file_path, 'wb') as nfo_file:
-                data.write(nfo_file, encoding='utf-8')
+            nfo_data = io.BytesIO()
+            data.write(nfo_data, encoding='utf-8')
 
-            chmod_as_parent(nfo_file_path)
+            if write_file(nfo_file_path, nfo_data.getvalue()):
+                chmod_as_parent(nfo_file_path)
         except IOError as e:
             sickrage.app.log.warning(
                 "Unable to write file to " + nfo_file_path + " - are you sure the folder is writable? {}".format(e))
@@ -399,10 +536,11 @@ class GenericMetadata(object):
 
             sickrage.app.log.debug("Writing episode nfo file to " + nfo_file_path)
 
-            with open(nfo_file_path, 'wb') as nfo_file:
-                data.write(nfo_file, encoding='utf-8')
+            nfo_data = io.BytesIO()
+            data.write(nfo_data, encoding='utf-8')
 
-            chmod_as_parent(nfo_file_path)
+            if write_file(nfo_file_path, nfo_data.getvalue()):
+                chmod_as_parent(nfo_file_path)
         except IOError as e:
             sickrage.app.log.warning(
                 "Unable to write file to " + nfo_file_path + " - are you sure the folder is writable? {}".format(e))
@@ -566,7 +704,7 @@ class GenericMetadata(object):
         """
 
         # don't bother overwriting it
-        if os.path.isfile(image_path) and not force:
+        if self._check_exists(image_path) and not force:
             sickrage.app.log.debug("Image already exists, not downloading")
             return False
 
@@ -582,10 +720,8 @@ class GenericMetadata(object):
                 os.makedirs(image_dir)
                 chmod_as_parent(image_dir)
 
-            with open(image_path, 'wb') as outFile:
-                outFile.write(image_data)
-
-            chmod_as_parent(image_path)
+            if write_file(image_path, image_data):
+                chmod_as_parent(image_path)
         except IOError as e:
             sickrage.app.log.warning(
                 "Unable to write image to " + image_path + " - are you sure the show folder is writable? {}".format(e))
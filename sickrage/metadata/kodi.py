@@ -24,6 +24,7 @@
 import os
 
 from sickrage.core.helpers import replace_extension
+from sickrage.metadata import file_exists
 from sickrage.metadata.kodi_12plus import KODI_12PlusMetadata
 
 
@@ -100,7 +101,7 @@ class KODIMetadata(KODI_12PlusMetadata):
 
         ep_obj: a TVEpisode instance for which to create the thumbnail
         """
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             tbn_filename = replace_extension(ep_obj.location, 'tbn')
         else:
             return None
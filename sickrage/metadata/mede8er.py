@@ -22,6 +22,7 @@
 
 
 import datetime
+import io
 import os
 from xml.etree.ElementTree import Element, ElementTree, SubElement
 
@@ -32,6 +33,7 @@ from sickrage.core.helpers import replace_extension, indent_xml, chmod_as_parent
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, \
     indexer_error, indexer_seasonnotfound, indexer_shownotfound
+from sickrage.metadata import write_file
 from sickrage.metadata.mediabrowser import MediaBrowserMetadata
 
 
@@ -374,11 +376,11 @@ class Mede8erMetadata(MediaBrowserMetadata):
 
             sickrage.app.log.debug("Writing show nfo file to " + nfo_file_path)
 
-            nfo_file = open(nfo_file_path, 'wb')
+            nfo_data = io.BytesIO()
+            data.write(nfo_data)
 
-            data.write(nfo_file)
-            nfo_file.close()
-            chmod_as_parent(nfo_file_path)
+            if write_file(nfo_file_path, nfo_data.getvalue()):
+                chmod_as_parent(nfo_file_path)
         except IOError as e:
             sickrage.app.log.error(
                 "Unable to write file to " + nfo_file_path + " - are you sure the folder is writable? {}".format(e))
@@ -419,11 +421,11 @@ class Mede8erMetadata(MediaBrowserMetadata):
 
             sickrage.app.log.debug("Writing episode nfo file to " + nfo_file_path)
 
-            nfo_file = open(nfo_file_path, 'wb')
+            nfo_data = io.BytesIO()
+            data.write(nfo_data)
 
-            data.write(nfo_file)
-            nfo_file.close()
-            chmod_as_parent(nfo_file_path)
+            if write_file(nfo_file_path, nfo_data.getvalue()):
+                chmod_as_parent(nfo_file_path)
         except IOError as e:
             sickrage.app.log.warning(
                 "Unable to write file to " + nfo_file_path + " - are you sure the folder is writable? {}".format(e))
@@ -33,7 +33,7 @@ from sickrage.core.helpers import replace_extension, indent_xml
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, \
     indexer_error, indexer_seasonnotfound, indexer_shownotfound
-from sickrage.metadata import GenericMetadata
+from sickrage.metadata import GenericMetadata, file_exists
 
 
 class MediaBrowserMetadata(GenericMetadata):
@@ -114,7 +114,7 @@ class MediaBrowserMetadata(GenericMetadata):
         ep_obj: a TVEpisode object to get the path for
         """
 
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             xml_file_name = replace_extension(os.path.basename(ep_obj.location), self._ep_nfo_extension)
             metadata_dir_name = os.path.join(os.path.dirname(ep_obj.location), 'metadata')
             xml_file_path = os.path.join(metadata_dir_name, xml_file_name)
@@ -133,7 +133,7 @@ class MediaBrowserMetadata(GenericMetadata):
         ep_obj: a TVEpisode object to get the path from
         """
 
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             tbn_file_name = replace_extension(os.path.basename(ep_obj.location), 'jpg')
             metadata_dir_name = os.path.join(os.path.dirname(ep_obj.location), 'metadata')
             tbn_file_path = os.path.join(metadata_dir_name, tbn_file_name)
@@ -21,9 +21,7 @@
 
 
 
-import os
-
-from sickrage.metadata import GenericMetadata
+from sickrage.metadata import GenericMetadata, file_exists
 
 
 class PS3Metadata(GenericMetadata):
@@ -117,7 +115,7 @@ class PS3Metadata(GenericMetadata):
 
         ep_obj: a TVEpisode instance for which to create the thumbnail
         """
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             tbn_filename = ep_obj.location + ".cover.jpg"
         else:
             return None
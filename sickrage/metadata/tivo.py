@@ -30,7 +30,7 @@ from sickrage.core.helpers import chmod_as_parent
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, \
     indexer_error, indexer_seasonnotfound, indexer_shownotfound
-from sickrage.metadata import GenericMetadata
+from sickrage.metadata import GenericMetadata, file_exists, write_file
 
 
 class TIVOMetadata(GenericMetadata):
@@ -136,7 +136,7 @@ class TIVOMetadata(GenericMetadata):
 
         ep_obj: a TVEpisode object to get the path for
         """
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             metadata_file_name = os.path.basename(ep_obj.location) + "." + self._ep_nfo_extension
             metadata_dir_name = os.path.join(os.path.dirname(ep_obj.location), '.meta')
             metadata_file_path = os.path.join(metadata_dir_name, metadata_file_name)
@@ -318,11 +318,9 @@ class TIVOMetadata(GenericMetadata):
 
             sickrage.app.log.debug("Writing episode nfo file to " + nfo_file_path)
 
-            with open(nfo_file_path, 'w') as nfo_file:
-                # Calling encode directly, b/c often descriptions have wonky characters.
-                nfo_file.write(data)
-
-            chmod_as_parent(nfo_file_path)
+            # Calling encode directly, b/c often descriptions have wonky characters.
+            if write_file(nfo_file_path, data.encode('utf-8')):
+                chmod_as_parent(nfo_file_path)
 
         except EnvironmentError as e:
             sickrage.app.log.warning(
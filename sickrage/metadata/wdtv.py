@@ -33,7 +33,7 @@ from sickrage.core.helpers import replace_extension, indent_xml
 from sickrage.indexers import IndexerApi
 from sickrage.indexers.exceptions import indexer_episodenotfound, \
     indexer_error, indexer_seasonnotfound, indexer_shownotfound
-from sickrage.metadata import GenericMetadata
+from sickrage.metadata import GenericMetadata, file_exists
 
 
 class WDTVMetadata(GenericMetadata):
@@ -125,7 +125,7 @@ class WDTVMetadata(GenericMetadata):
 
         ep_obj: a TVEpisode instance for which to create the thumbnail
         """
-        if os.path.isfile(ep_obj.location):
+        if file_exists(ep_obj.location):
             tbn_filename = replace_extension(ep_obj.location, 'metathumb')
         else:
             return None
@@ -30,6 +30,10 @@ import sickrage
 from sickrage.core.helpers import is_ip_private
 
 
+class NotificationFailed(Exception):
+    """Raised by notifier methods when a notification couldn't be delivered, the dispatcher retries the call"""
+
+
 class Notifiers(object):
     def __init__(self):
         self.name = "Generic"
@@ -57,47 +61,57 @@ class Notifiers(object):
     def id(self):
         return str(re.sub(r"[^\w\d_]", "_", str(re.sub(r"[+]", "plus", self.name))).lower())
 
+    @property
+    def enabled(self):
+        return bool(getattr(sickrage.app.config, 'use_' + self.id, True))
+
+    def schedule_library_update(self, method, *args, key=None):
+        """
+        Queue a library update, updates with the same key within the library update window are sent once
+
+        :param method: name of the notifier method to call
+        :param args: arguments for the call
+        :param key: show path or host the update targets, defaults to the arguments
+        """
+        if not self.enabled:
+            return
+
+        sickrage.app.notification_dispatcher.dispatch(self, method, *args, key=key,
+                                                      delay=sickrage.app.config.library_update_window)
+
     @staticmethod
-    def mass_notify_download(ep_name):
+    def mass_notify(method, *args):
+        """
+        Queue a notification for all enabled notifiers that send it
+
+        :param method: name of the notifier method to call
+        :param args: arguments for the call
+        """
         for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_download(ep_name)
-            except Exception:
-                continue
+            if n.enabled and hasattr(n, method):
+                sickrage.app.notification_dispatcher.dispatch(n, method, *args)
+
+    @staticmethod
+    def mass_notify_download(ep_name):
+        Notifiers.mass_notify('notify_download', ep_name)
 
     @staticmethod
     def mass_notify_subtitle_download(ep_name, lang):
-        for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_subtitle_download(ep_name, lang)
-            except Exception:
-                continue
+        Notifiers.mass_notify('notify_subtitle_download', ep_name, lang)
 
     @staticmethod
     def mass_notify_snatch(ep_name):
-        for n in sickrage.app.notifier_providers.values():
-            try:
-                n.notify_snatch(ep_name)
-            except Exception:
-                continue
+        Notifiers.mass_notify('notify_snatch', ep_name)
 
     @staticmethod
     def mass_notify_version_update(new_version=""):
         if sickrage.app.config.notify_on_update:
-            for n in sickrage.app.notifier_providers.values():
-                try:
-                    n.notify_version_update(new_version)
-                except Exception:
-                    continue
+            Notifiers.mass_notify('notify_version_update', new_version)
 
     @staticmethod
     def mass_notify_login(ipaddress):
         if sickrage.app.config.notify_on_login and not is_ip_private(ipaddress):
-            for n in sickrage.app.notifier_providers.values():
-                try:
-                    n.notify_login(ipaddress)
-                except Exception:
-                    continue
+            Notifiers.mass_notify('notify_login', ipaddress)
 
 
 class NotifierProviders(dict):
@@ -0,0 +1,211 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import sickrage
+
+
+class NotifierStats(object):
+    def __init__(self):
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.coalesced = 0
+        self.merged = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def avg_time(self):
+        calls = self.sent + self.failed
+        return (self.total_time / calls) if calls else 0.0
+
+
+class NotificationDispatcher(object):
+    """
+    Sends notifications from a worker pool so slow notifiers don't hold up searches and post-processing.
+
+    Every notifier has its own queue that is worked off by one worker at a time, calls queued with the same
+    key while the notifier is busy are coalesced into one, failed calls are retried with an increasing delay.
+
+    Delayed calls, used for media server library updates, are held back for a window and calls with the same
+    key within that window are merged. Notifier methods fail by raising, deliveries that failed raise
+    :class:`NotificationFailed`, other return values are ignored.
+
+    When shutting down, held back and queued calls are still sent without retries, for a bounded time.
+    """
+
+    def __init__(self, workers=4, max_retries=3, retry_delay=10, shutdown_timeout=30):
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.shutdown_timeout = shutdown_timeout
+        self.lock = threading.Lock()
+        self.queues = defaultdict(OrderedDict)
+        self.active = set()
+        self.timers = set()
+        self.delayed = OrderedDict()
+        self.stats = defaultdict(NotifierStats)
+        self.executor = None
+        self.running = True
+
+    def dispatch(self, notifier, method, *args, key=None, delay=0):
+        """
+        Queue a call of a notifier method
+
+        :param notifier: notifier object
+        :param method: name of the notifier method to call
+        :param args: arguments for the call
+        :param key: queued calls of the same method and key are sent once, defaults to the arguments
+        :param delay: seconds to hold the call back, calls with the same key within that window are merged
+                      and sent once with the arguments of the last call
+        """
+        key = (method, key if key is not None else args)
+
+        if not delay:
+            return self._put(notifier, method, args, key, 0)
+
+        with self.lock:
+            if (notifier.id, key) in self.delayed:
+                self.delayed[(notifier.id, key)][1:3] = [method, args]
+                self.stats[notifier.id].merged += 1
+                return
+
+            timer = threading.Timer(delay, self._release, args=(notifier.id, key))
+            timer.daemon = True
+            self.delayed[(notifier.id, key)] = [notifier, method, args, timer]
+
+        timer.start()
+
+    def _release(self, notifier_id, key):
+        with self.lock:
+            if (notifier_id, key) not in self.delayed:
+                return
+            notifier, method, args, __ = self.delayed.pop((notifier_id, key))
+
+        self._put(notifier, method, args, key, 0)
+
+    def pending(self, notifier_id):
+        """
+        :param notifier_id: notifier id
+        :return: number of queued and held back calls of a notifier
+        """
+        with self.lock:
+            return len(self.queues[notifier_id]) + len([x for x in self.delayed if x[0] == notifier_id])
+
+    def _put(self, notifier, method, args, key, attempt):
+        with self.lock:
+            queue = self.queues[notifier.id]
+            if key in queue:
+                del queue[key]
+                self.stats[notifier.id].coalesced += 1
+            queue[key] = (method, args, attempt)
+
+            if notifier.id in self.active:
+                return
+            self.active.add(notifier.id)
+
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='NOTIFIER')
+
+        self.executor.submit(self._work, notifier)
+
+    def _work(self, notifier):
+        while True:
+            with self.lock:
+                queue = self.queues[notifier.id]
+                if not queue:
+                    self.active.discard(notifier.id)
+                    return
+                key, (method, args, attempt) = queue.popitem(last=False)
+
+            try:
+                self._call(notifier, method, args, key, attempt)
+            except Exception:
+                continue
+
+    def _call(self, notifier, method, args, key, attempt):
+        stats = self.stats[notifier.id]
+        start = time.time()
+
+        try:
+            getattr(notifier, method)(*args)
+            stats.sent += 1
+        except Exception as e:
+            stats.failed += 1
+
+            if attempt < self.max_retries and self.running:
+                stats.retried += 1
+                delay = self.retry_delay * 2 ** attempt
+                sickrage.app.log.debug("{} notification {} failed, retrying in {}s: {!r}".format(notifier.name, method, delay, e))
+                self._retry(notifier, method, args, key, attempt + 1, delay)
+            else:
+                sickrage.app.log.warning("{} notification {} failed: {!r}".format(notifier.name, method, e))
+        finally:
+            elapsed = time.time() - start
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+
+    def _retry(self, notifier, method, args, key, attempt, delay):
+        def retry():
+            with self.lock:
+                self.timers.discard(timer)
+            self._put(notifier, method, args, key, attempt)
+
+        timer = threading.Timer(delay, retry)
+        timer.daemon = True
+        with self.lock:
+            self.timers.add(timer)
+        timer.start()
+
+    def shutdown(self):
+        with self.lock:
+            self.running = False
+            for timer in self.timers:
+                timer.cancel()
+            self.timers.clear()
+
+            delayed, self.delayed = list(self.delayed.items()), OrderedDict()
+            for __, (__, __, __, timer) in delayed:
+                timer.cancel()
+
+        # send pending library updates and queued calls before going down
+        for (__, key), (notifier, method, args, __) in delayed:
+            self._put(notifier, method, args, key, 0)
+
+        deadline = time.time() + self.shutdown_timeout
+        while time.time() < deadline:
+            with self.lock:
+                if not self.active:
+                    break
+            time.sleep(0.1)
+
+        with self.lock:
+            dropped = sum(len(x) for x in self.queues.values())
+            self.queues.clear()
+        if dropped:
+            sickrage.app.log.warning("Dropping {} notifications that weren't sent within {}s".format(dropped, self.shutdown_timeout))
+
+        if self.executor:
+            self.executor.shutdown(wait=False)
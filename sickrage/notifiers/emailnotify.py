@@ -30,7 +30,7 @@ from email.utils import formatdate
 
 import sickrage
 from sickrage.core.tv.show.helpers import get_show_list
-from sickrage.notifiers import Notifiers
+from sickrage.notifiers import Notifiers, NotificationFailed
 
 
 class EmailNotifier(Notifiers):
@@ -87,7 +87,7 @@ class EmailNotifier(Notifiers):
                                   msg):
                     sickrage.app.log.debug("Snatch notification sent to [%s] for '%s'" % (to, ep_name))
                 else:
-                    sickrage.app.log.warning("Snatch notification WARNING: %s" % self.last_err)
+                    raise NotificationFailed("Snatch notification WARNING: %s" % self.last_err)
 
     def notify_download(self, ep_name, title="Completed:"):
         """
@@ -129,7 +129,7 @@ class EmailNotifier(Notifiers):
                                   msg):
                     sickrage.app.log.debug("Download notification sent to [%s] for '%s'" % (to, ep_name))
                 else:
-                    sickrage.app.log.warning("Download notification WARNING: %s" % self.last_err)
+                    raise NotificationFailed("Download notification WARNING: %s" % self.last_err)
 
     def notify_subtitle_download(self, ep_name, lang, title="Downloaded subtitle:"):
         """
@@ -171,7 +171,7 @@ class EmailNotifier(Notifiers):
                                   msg):
                     sickrage.app.log.debug("Download notification sent to [%s] for '%s'" % (to, ep_name))
                 else:
-                    sickrage.app.log.warning("Download notification WARNING: %s" % self.last_err)
+                    raise NotificationFailed("Download notification WARNING: %s" % self.last_err)
 
     def notify_version_update(self, new_version="??"):
         pass
@@ -25,7 +25,7 @@ from urllib.parse import urlencode
 
 import sickrage
 from sickrage.core.websession import WebSession
-from sickrage.notifiers import Notifiers
+from sickrage.notifiers import Notifiers, NotificationFailed
 
 
 class EMBYNotifier(Notifiers):
@@ -95,6 +95,16 @@ class EMBYNotifier(Notifiers):
             title = self.notifyStrings[self.NOTIFY_LOGIN]
             self._notify_emby(title + " - " + update_text.format(ipaddress))
 
+    def update_library_or_raise(self, show=None):
+        """Library update of the notification dispatcher
+        Raises: NotificationFailed if the Emby host couldn't be contacted, shows of other indexers than TheTVDB are skipped
+        """
+        if not sickrage.app.config.emby_host or (show and show.indexer != 1):
+            return
+
+        if self.update_library(show) is False:
+            raise NotificationFailed('Unable to update the library of Emby host: ' + sickrage.app.config.emby_host)
+
     def update_library(self, show=None):
         """Handles updating the Emby Media Server host via HTTP API
         Returns: True for no issue or False if there was an error
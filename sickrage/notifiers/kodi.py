@@ -31,7 +31,7 @@ from xml.etree import ElementTree
 
 import sickrage
 from sickrage.core.websession import WebSession
-from sickrage.notifiers import Notifiers
+from sickrage.notifiers import Notifiers, NotificationFailed
 
 
 class KODINotifier(Notifiers):
@@ -522,6 +522,16 @@ class KODINotifier(Notifiers):
     def test_notify(self, host, username, password):
         return self._notify_kodi("Testing KODI notifications from SiCKRAGE", "Test Notification", host, username, password, force=True)
 
+    def update_library_or_raise(self, showName=None):
+        """Library update of the notification dispatcher
+
+        Raises:
+            NotificationFailed if a KODI host couldn't be updated
+
+        """
+        if sickrage.app.config.kodi_host and self.update_library(showName) is False:
+            raise NotificationFailed('Unable to update the library of one or more KODI host(s): ' + sickrage.app.config.kodi_host)
+
     def update_library(self, showName=None):
         """Public wrapper for the update library functions to branch the logic for JSON-RPC or legacy HTTP API
 
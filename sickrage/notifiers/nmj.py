@@ -94,11 +94,11 @@ class NMJNotifier(Notifiers):
 
     def notify_download(self, ep_name):
         if sickrage.app.config.use_nmj:
-            self._notifyNMJ()
+            self.schedule_library_update('_notifyNMJ', key=sickrage.app.config.nmj_host)
 
     def notify_subtitle_download(self, ep_name, lang):
         if sickrage.app.config.use_nmj:
-            self._notifyNMJ()
+            self.schedule_library_update('_notifyNMJ', key=sickrage.app.config.nmj_host)
 
     def notify_version_update(self, new_version):
         return False
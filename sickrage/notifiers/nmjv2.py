@@ -37,10 +37,12 @@ class NMJv2Notifier(Notifiers):
         # Not implemented: Start the scanner when snatched does not make any sense
 
     def notify_download(self, ep_name):
-        self._notifyNMJ()
+        if sickrage.app.config.use_nmjv2:
+            self.schedule_library_update('_notifyNMJ', key=sickrage.app.config.nmjv2_host)
 
     def notify_subtitle_download(self, ep_name, lang):
-        self._notifyNMJ()
+        if sickrage.app.config.use_nmjv2:
+            self.schedule_library_update('_notifyNMJ', key=sickrage.app.config.nmjv2_host)
 
     def notify_version_update(self, new_version):
         return False
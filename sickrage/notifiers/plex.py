@@ -27,7 +27,7 @@ from xml.etree import ElementTree
 
 import sickrage
 from sickrage.core.websession import WebSession
-from sickrage.notifiers import Notifiers
+from sickrage.notifiers import Notifiers, NotificationFailed
 
 
 class PLEXNotifier(Notifiers):
@@ -159,6 +159,17 @@ class PLEXNotifier(Notifiers):
     def test_notify_pms(self, host, username, password, plex_server_token):
         return self.update_library(host=host, username=username, password=password, plex_server_token=plex_server_token, force=False)
 
+    def update_library_or_raise(self, ep_obj=None):
+        """Library update of the notification dispatcher
+
+        Raises:
+            NotificationFailed if a Plex Media Server couldn't be updated
+
+        """
+        hosts_failed = self.update_library(ep_obj)
+        if hosts_failed:
+            raise NotificationFailed('Unable to update the library of Plex Media Server host(s): ' + hosts_failed)
+
     def update_library(self, ep_obj=None, host=None, username=None, password=None, plex_server_token=None, force=True):
         """Handles updating the Plex Media Server host via HTTP API
 
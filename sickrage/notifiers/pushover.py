@@ -24,7 +24,7 @@ from urllib.parse import urlencode
 
 import sickrage
 from sickrage.core.websession import WebSession
-from sickrage.notifiers import Notifiers
+from sickrage.notifiers import Notifiers, NotificationFailed
 
 API_URL = "https://api.pushover.net/1/messages.json"
 
@@ -135,27 +135,31 @@ class PushoverNotifier(Notifiers):
             title = self.notifyStrings[self.NOTIFY_SNATCH]
 
         if sickrage.app.config.pushover_notify_onsnatch:
-            self._notifyPushover(title, ep_name)
+            self._notify(title, ep_name)
 
     def notify_download(self, ep_name, title=None):
         if not title:
             title = self.notifyStrings[self.NOTIFY_DOWNLOAD]
 
         if sickrage.app.config.pushover_notify_ondownload:
-            self._notifyPushover(title, ep_name)
+            self._notify(title, ep_name)
 
     def notify_subtitle_download(self, ep_name, lang, title=None):
         if not title:
             title = self.notifyStrings[self.NOTIFY_SUBTITLE_DOWNLOAD]
 
         if sickrage.app.config.pushover_notify_onsubtitledownload:
-            self._notifyPushover(title, ep_name + ": " + lang)
+            self._notify(title, ep_name + ": " + lang)
 
     def notify_version_update(self, new_version="??"):
         if sickrage.app.config.use_pushover:
             update_text = self.notifyStrings[self.NOTIFY_GIT_UPDATE_TEXT]
             title = self.notifyStrings[self.NOTIFY_GIT_UPDATE]
-            self._notifyPushover(title, update_text + new_version)
+            self._notify(title, update_text + new_version)
+
+    def _notify(self, title, message):
+        if sickrage.app.config.use_pushover and not self._notifyPushover(title, message):
+            raise NotificationFailed("Pushover notification failed")
 
     def _notifyPushover(self, title, message, sound=None, userKey=None, apiKey=None, force=False):
         """
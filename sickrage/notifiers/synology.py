@@ -29,6 +29,10 @@ class synologyNotifier(Notifiers):
         super(synologyNotifier, self).__init__()
         self.name = 'synology'
 
+    @property
+    def enabled(self):
+        return sickrage.app.config.use_synologynotifier
+
     def notify_snatch(self, ep_name):
         if sickrage.app.config.synologynotifier_notify_onsnatch:
             self._send_synologyNotifier(ep_name, self.notifyStrings[self.NOTIFY_SNATCH])
@@ -37,12 +37,14 @@ from xml.sax import SAXParseException
 from bencode3 import bdecode, bencode
 from feedparser import FeedParserDict
 from requests.utils import add_dict_to_cookiejar, dict_from_cookiejar
+from sqlalchemy import or_
 
 import sickrage
 from sickrage.core.api.cache import TorrentCacheAPI
 from sickrage.core.caches.tv_cache import TVCache
 from sickrage.core.classes import NZBSearchResult, SearchResult, TorrentSearchResult
 from sickrage.core.common import MULTI_EP_RESULT, Quality, SEASON_RESULT, cpu_presets
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 from sickrage.core.helpers import chmod_as_parent, sanitize_file_name, clean_url, bs4_parser, \
     validate_url, try_int, convert_size
@@ -59,6 +61,7 @@ class GenericProvider(object):
         self.urls = {'base_url': url}
         self.private = private
         self.supports_backlog = True
+        self.supports_generic_search = True
         self.supports_absolute_numbering = False
         self.anime_only = False
         self.search_mode = 'eponly'
@@ -118,6 +121,17 @@ class GenericProvider(object):
         return SearchResult(season, episodes)
 
     def get_content(self, url):
+        """
+        Get the .torrent/.nzb content of a result url, verified payloads are cached for reuse
+        by pick_best_result, snatch_episode and the torrent clients.
+        """
+        content = sickrage.app.content_cache.get(url)
+        if content is None:
+            content = self.fetch_content(url)
+            sickrage.app.content_cache.add(url, content)
+        return content
+
+    def fetch_content(self, url):
         if self.login():
             headers = {}
             if url.startswith('http'):
@@ -404,6 +418,36 @@ class GenericProvider(object):
 
         return results
 
+    @CacheDB.with_session
+    def find_generic_propers(self, session=None):
+        """
+        Find propers of all shows at once, from the provider cache and one search per proper string
+        instead of one search per episode.
+        """
+        results = []
+
+        for item in session.query(CacheDB.Provider).filter_by(provider=self.id).filter(
+                or_(CacheDB.Provider.name.ilike('%proper%'), CacheDB.Provider.name.ilike('%repack%'))):
+            result = self.getResult(item.season, [int(x) for x in item.episodes.strip('|').split('|') if x])
+            result.name, result.url = item.name, item.url
+            result.seeders, result.leechers, result.size = item.seeders, item.leechers, item.size
+            result.date = datetime.datetime.fromtimestamp(item.time)
+            results.append(result)
+
+        for term in self.proper_strings:
+            for item in self.search({'Episode': [term]}):
+                result = self.getResult(None, [])
+                result.name, result.url = self._get_title_and_url(item)
+                if not validate_url(result.url) and not result.url.startswith('magnet'):
+                    continue
+
+                result.seeders, result.leechers = self._get_result_stats(item)
+                result.size = self._get_size(item)
+                result.date = datetime.datetime.today()
+                results.append(result)
+
+        return results
+
     def add_cookies_from_ui(self):
         """
         Add the cookies configured from UI to the providers requests session.
@@ -576,7 +620,7 @@ class TorrentProvider(GenericProvider):
         result.provider = self
         return result
 
-    def get_content(self, url):
+    def fetch_content(self, url):
         result = None
 
         def verify_torrent(content):
@@ -599,10 +643,10 @@ class TorrentProvider(GenericProvider):
                     result = verify_torrent(b64decode(TorrentCacheAPI().get(info_hash)['data']['content']).strip())
                 except Exception:
                     torrent_url = "https://itorrents.org/torrent/{info_hash}.torrent".format(info_hash=info_hash)
-                    result = verify_torrent(super(TorrentProvider, self).get_content(torrent_url))
+                    result = verify_torrent(super(TorrentProvider, self).fetch_content(torrent_url))
 
         if not result:
-            result = verify_torrent(super(TorrentProvider, self).get_content(url))
+            result = verify_torrent(super(TorrentProvider, self).fetch_content(url))
 
         return result
 
@@ -637,6 +681,9 @@ class TorrentProvider(GenericProvider):
         :return: boolean, True on success
         """
 
+        if not result.content:
+            result.content = self.get_content(result.url)
+
         if not result.content:
             return False
 
@@ -731,6 +778,9 @@ class NZBProvider(GenericProvider):
         :return: boolean, True on success
         """
 
+        if not result.content:
+            result.content = self.get_content(result.url)
+
         if not result.content:
             return False
 
@@ -920,6 +970,9 @@ class NewznabProvider(NZBProvider):
 
         self.key = key
 
+        # searches need the tvdb id of a show
+        self.supports_generic_search = False
+
         self.search_mode = search_mode
         self.search_fallback = search_fallback
         self.enable_daily = enable_daily
@@ -39,6 +39,9 @@ class BitCannonProvider(TorrentProvider):
             'search': '{base_url}/api/search'.format(**self.urls)
         })
 
+        # searches need the show
+        self.supports_generic_search = False
+
         self.cache = TVCache(self, search_strings={'RSS': ['tv', 'anime']})
 
     def search(self, search_strings, age=0, show_id=None, season=None, episode=None, **kwargs):
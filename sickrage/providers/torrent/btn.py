@@ -40,6 +40,9 @@ class BTNProvider(TorrentProvider):
         self.minseed = None
         self.minleech = None
 
+        # searches need the show
+        self.supports_generic_search = False
+
         self.cache = TVCache(self, min_time=10)
 
     def _check_auth(self):
@@ -41,6 +41,9 @@ class EliteTorrentProvider(TorrentProvider):
         self.minseed = None
         self.minleech = None
 
+        # searches need the show
+        self.supports_generic_search = False
+
         self.cache = TVCache(self)
 
     def search(self, search_strings, age=0, show_id=None, season=None, episode=None, **kwargs):
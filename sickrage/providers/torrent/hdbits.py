@@ -39,6 +39,9 @@ class HDBitsProvider(TorrentProvider):
         self.username = None
         self.passkey = None
 
+        # searches post the tvdb id of the show
+        self.supports_generic_search = False
+
         self.cache = HDBitsCache(self, min_time=15)
 
     def _check_auth(self):
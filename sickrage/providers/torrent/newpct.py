@@ -47,6 +47,9 @@ class NewpctProvider(TorrentProvider):
 
         self.onlyspasearch = None
 
+        # searches need the show
+        self.supports_generic_search = False
+
         self.cache = NewpctCache(self, min_time=20)
 
     @MainDB.with_session
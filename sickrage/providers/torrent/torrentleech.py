@@ -51,6 +51,9 @@ class TorrentLeechProvider(TorrentProvider):
 
         self.proper_strings = ['PROPER', 'REPACK', 'REAL', 'RERIP']
 
+        # searches need the show
+        self.supports_generic_search = False
+
         self.cache = TVCache(self, min_time=20)
 
     # def login(self):
@@ -24,6 +24,8 @@ import os
 import pathlib
 import re
 import subprocess
+import threading
+from contextlib import contextmanager
 
 import subliminal
 from babelfish import language_converters, Language
@@ -37,6 +39,36 @@ from sickrage.core.tv.show.history import History
 from sickrage.subtitles.providers.utils import hash_itasa
 
 
+class SubtitleProviderPools(object):
+    """
+    Provider pools shared by subtitle downloads, one per set of languages. Providers keep login and
+    session state so a pool serves one download at a time, its providers are queried concurrently.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pools = {}
+
+    @contextmanager
+    def get(self, languages):
+        with self.lock:
+            key = frozenset(languages)
+            if key not in self.pools:
+                self.pools[key] = (subliminal.core.AsyncProviderPool(providers=Subtitles().getEnabledServiceList(),
+                                                                     provider_configs=Subtitles().provider_configs()),
+                                   threading.Lock())
+            pool, pool_lock = self.pools[key]
+
+        with pool_lock:
+            yield pool
+
+    def terminate(self):
+        with self.lock:
+            for pool, __ in self.pools.values():
+                pool.terminate()
+            self.pools.clear()
+
+
 class Subtitles(object):
     def __init__(self):
         for provider in ['itasa = sickrage.subtitles.providers.itasa:ItaSAProvider',
@@ -93,14 +125,32 @@ class Subtitles(object):
     def getEnabledServiceList(self):
         return [x['name'] for x in self.sortedServiceList() if x['enabled']]
 
+    def provider_configs(self):
+        return {
+            'addic7ed': {
+                'username': sickrage.app.config.addic7ed_user,
+                'password': sickrage.app.config.addic7ed_pass
+            },
+            'itasa': {
+                'username': sickrage.app.config.itasa_user,
+                'password': sickrage.app.config.itasa_pass
+            },
+            'legendastv': {
+                'username': sickrage.app.config.legendastv_user,
+                'password': sickrage.app.config.legendastv_pass
+            },
+            'opensubtitles': {
+                'username': sickrage.app.config.opensubtitles_user,
+                'password': sickrage.app.config.opensubtitles_pass
+            }
+        }
+
     @MainDB.with_session
-    def download_subtitles(self, show_id, season, episode, session=None):
+    def download_subtitles(self, show_id, season, episode, pools=None, inventory=None, session=None):
         show_object = find_show(show_id, session=session)
         episode_object = show_object.get_episode(season, episode)
 
-        existing_subtitles = episode_object.subtitles
-        if not isinstance(existing_subtitles, list):
-            existing_subtitles = []
+        existing_subtitles = [x for x in (episode_object.subtitles or '').split(',') if x]
 
         # First of all, check if we need subtitles
         languages = self.get_needed_languages(existing_subtitles)
@@ -110,43 +160,30 @@ class Subtitles(object):
 
         subtitles_path = self.get_subtitles_path(episode_object.location)
         video_path = episode_object.location
-        providers = self.getEnabledServiceList()
 
-        video = self.get_video(video_path, subtitles_path=subtitles_path, episode_object=episode_object)
+        video = self.get_video(video_path, subtitles_path=subtitles_path, subtitles=inventory is None, episode_object=episode_object)
         if not video:
             sickrage.app.log.debug('%s: Exception caught in subliminal.scan_video for S%02dE%02d' % (show_id, season, episode))
             return existing_subtitles, None
 
-        provider_configs = {
-            'addic7ed': {
-                'username': sickrage.app.config.addic7ed_user,
-                'password': sickrage.app.config.addic7ed_pass
-            },
-            'itasa': {
-                'username': sickrage.app.config.itasa_user,
-                'password': sickrage.app.config.itasa_pass
-            },
-            'legendastv': {
-                'username': sickrage.app.config.legendastv_user,
-                'password': sickrage.app.config.legendastv_pass
-            },
-            'opensubtitles': {
-                'username': sickrage.app.config.opensubtitles_user,
-                'password': sickrage.app.config.opensubtitles_pass
-            }
-        }
+        # external subtitles from the directory listing of the show's subtitle inventory
+        if inventory is not None:
+            video.subtitle_languages |= set(inventory.external_subtitles(video_path).values())
 
-        pool = subliminal.ProviderPool(providers=providers, provider_configs=provider_configs)
+        shared_pools = pools is not None
+        if not shared_pools:
+            pools = SubtitleProviderPools()
 
         try:
-            subtitles_list = pool.list_subtitles(video, languages)
-            if not subtitles_list:
-                sickrage.app.log.debug('%s: No subtitles found for S%02dE%02d on any provider' % (show_id, season, episode))
-                return existing_subtitles, None
+            with pools.get(languages) as pool:
+                subtitles_list = pool.list_subtitles(video, languages)
+                if not subtitles_list:
+                    sickrage.app.log.debug('%s: No subtitles found for S%02dE%02d on any provider' % (show_id, season, episode))
+                    return existing_subtitles, None
 
-            found_subtitles = pool.download_best_subtitles(subtitles_list, video, languages=languages,
-                                                           hearing_impaired=sickrage.app.config.subtitles_hearing_impaired,
-                                                           only_one=not sickrage.app.config.subtitles_multi)
+                found_subtitles = pool.download_best_subtitles(subtitles_list, video, languages=languages,
+                                                               hearing_impaired=sickrage.app.config.subtitles_hearing_impaired,
+                                                               only_one=not sickrage.app.config.subtitles_multi)
 
             save_subtitles(video, found_subtitles, directory=subtitles_path, single=not sickrage.app.config.subtitles_multi)
 
@@ -164,6 +201,9 @@ class Subtitles(object):
         except Exception as e:
             sickrage.app.log.error("Error occurred when downloading subtitles for {}: {}".format(video_path, e))
             return existing_subtitles, None
+        finally:
+            if not shared_pools:
+                pools.terminate()
 
         if sickrage.app.config.subtitles_history:
             for subtitle in found_subtitles:
@@ -180,22 +220,6 @@ class Subtitles(object):
             return set() if 'und' in subtitles else {self.from_code(language) for language in self.wanted_languages()}
         return {self.from_code(language) for language in self.wanted_languages().difference(subtitles)}
 
-    @MainDB.with_session
-    def refresh_subtitles(self, show_id, season, episode, session=None):
-        show_object = find_show(show_id, session=session)
-        episode_object = show_object.get_episode(season, episode)
-
-        video = self.get_video(episode_object.location, episode_object=episode_object)
-        if not video:
-            sickrage.app.log.debug("Exception caught in subliminal.scan_video, subtitles couldn't be refreshed")
-            return episode_object.subtitles, None
-        current_subtitles = self.get_subtitles(video)
-        if episode_object.subtitles == ','.join(current_subtitles):
-            sickrage.app.log.debug('No changed subtitles for {}'.format(episode_object.pretty_name()))
-            return episode_object.subtitles, None
-        else:
-            return current_subtitles, True
-
     def get_video(self, video_path, subtitles_path=None, subtitles=True, embedded_subtitles=None, episode_object=None):
         if not subtitles_path:
             subtitles_path = self.get_subtitles_path(video_path)
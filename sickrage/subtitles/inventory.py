@@ -0,0 +1,166 @@
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+import os
+from bisect import bisect_left
+
+import subliminal
+from babelfish import Language, LanguageReverseError
+from subliminal.refiners.metadata import refine as refine_metadata
+
+import sickrage
+from sickrage.core import metrics
+from sickrage.core.databases.cache import CacheDB
+from sickrage.subtitles import Subtitles
+
+INVENTORY_EPISODES = metrics.counter('sickrage_subtitle_inventory_episodes', 'Episode files checked for subtitles by result', ['result'])
+
+
+class SubtitleInventory(object):
+    """
+    Subtitle languages of the episode files of a show. Each directory holding episode files or subtitles is listed
+    once, subtitle files are matched to the episode files they are named after like subliminal does, only mkv files
+    are opened to look for embedded subtitles. The inventory is stored in the cache database with the file names and
+    stats it was taken from, episodes whose files didn't change since are skipped.
+    """
+
+    def __init__(self, show_id):
+        self.show_id = show_id
+        self.listings = {}
+        self.subtitles_paths = {}
+        self.changed = {}
+        self.previous = self.load()
+
+    @CacheDB.with_session
+    def load(self, session=None):
+        return {x.path: (x.signature, x.languages) for x in session.query(CacheDB.SubtitleInventory).filter_by(showid=self.show_id)}
+
+    @CacheDB.with_session
+    def save(self, session=None):
+        changed = list(self.changed)
+
+        # delete in chunks to stay below the sqlite bound parameter limit
+        for i in range(0, len(changed), 500):
+            session.query(CacheDB.SubtitleInventory).filter(CacheDB.SubtitleInventory.showid == self.show_id,
+                                                            CacheDB.SubtitleInventory.path.in_(changed[i:i + 500])).delete(synchronize_session=False)
+
+        if changed:
+            session.bulk_insert_mappings(CacheDB.SubtitleInventory, [{'showid': self.show_id,
+                                                                      'path': x,
+                                                                      'signature': self.changed[x][0],
+                                                                      'languages': self.changed[x][1]} for x in changed])
+
+        self.changed = {}
+
+    def listing(self, path):
+        """
+        :param path: full path to a directory
+        :return: dict of file name -> (size, mtime, inode) and the sorted names of the subtitle files in the directory
+        """
+        if path not in self.listings:
+            files = {}
+
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                entries = []
+
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        files[entry.name] = (st.st_size, st.st_mtime_ns, st.st_ino)
+                except OSError:
+                    continue
+
+            self.listings[path] = (files, sorted(x for x in files if x.endswith(subliminal.SUBTITLE_EXTENSIONS)))
+
+        return self.listings[path]
+
+    def subtitles_path(self, video_path):
+        """
+        :return: full path to the directory holding the subtitles of a video, same for all videos of a directory
+        """
+        dirpath = os.path.dirname(video_path)
+        if dirpath not in self.subtitles_paths:
+            self.subtitles_paths[dirpath] = Subtitles().get_subtitles_path(video_path)
+        return self.subtitles_paths[dirpath]
+
+    def external_subtitles(self, video_path):
+        """
+        Same as ``subliminal.core.search_external_subtitles``, from the listing of the subtitles directory
+
+        :param video_path: full path to the video
+        :return: dict of subtitle file name -> language
+        """
+        fileroot, fileext = os.path.splitext(os.path.basename(video_path))
+        __, names = self.listing(self.subtitles_path(video_path))
+
+        subtitles = {}
+        for name in names[bisect_left(names, fileroot):]:
+            if not name.startswith(fileroot):
+                break
+
+            language = Language('und')
+            language_code = name[len(fileroot):-len(os.path.splitext(name)[1])].replace(fileext, '').replace('_', '-')[1:]
+            if language_code:
+                try:
+                    language = Language.fromietf(language_code)
+                except (ValueError, LanguageReverseError):
+                    sickrage.app.log.debug("Cannot parse language code {!r} of subtitle {}".format(language_code, name))
+
+            subtitles[name] = language
+
+        return subtitles
+
+    def refresh(self, video_path):
+        """
+        :param video_path: full path to the video of an episode
+        :return: sorted subtitle language codes of the video, None if the video doesn't exist
+        """
+        video_path = os.path.normpath(video_path)
+
+        files, __ = self.listing(os.path.dirname(video_path))
+        if os.path.basename(video_path) not in files:
+            return None
+
+        embedded = not sickrage.app.config.embedded_subtitles_all and video_path.endswith('.mkv')
+        subtitles = self.external_subtitles(video_path)
+
+        signature = repr((files[os.path.basename(video_path)], self.subtitles_path(video_path), sorted(subtitles), embedded))
+        if video_path in self.previous and self.previous[video_path][0] == signature:
+            INVENTORY_EPISODES.labels('unchanged').inc()
+            return [x for x in self.previous[video_path][1].split(',') if x]
+
+        languages = set(subtitles.values())
+        if embedded:
+            video = subliminal.Video(video_path)
+            try:
+                refine_metadata(video, embedded_subtitles=True)
+            except Exception as e:
+                sickrage.app.log.debug("Unable to read the embedded subtitles of {}: {}".format(video_path, e))
+            languages |= video.subtitle_languages
+
+        codes = sorted({x.opensubtitles for x in languages if hasattr(x, 'opensubtitles') and x.opensubtitles})
+
+        self.changed[video_path] = self.previous[video_path] = (signature, ','.join(codes))
+        INVENTORY_EPISODES.labels('refreshed').inc()
+
+        return codes
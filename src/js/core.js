@@ -38,18 +38,19 @@ $(document).ready(function ($) {
             var ws = new WebSocket(proto + '//' + window.location.hostname + ':' + window.location.port + SICKRAGE.srWebRoot + '/ws/ui');
 
             ws.onmessage = function (evt) {
-                var msg = JSON.parse(evt.data);
-
-                // Add handling for different kinds of events. For ex: {"event": "notification", "data": {"title": ..}}
-                if (msg.event === 'notification') {
-                    SICKRAGE.notify(msg.data.type, msg.data.title, msg.data.body);
-                } else if (msg.event === 'task') {
-                    switch (msg.data.cmd) {
-                        case 'restart':
-                            window.location.href = SICKRAGE.srWebRoot + '/home/restart/?pid=' + SICKRAGE.srPID;
-                            break;
+                // frames contain either a single message or a list of messages
+                [].concat(JSON.parse(evt.data)).forEach(function (msg) {
+                    // Add handling for different kinds of events. For ex: {"event": "notification", "data": {"title": ..}}
+                    if (msg.event === 'notification') {
+                        SICKRAGE.notify(msg.data.type, msg.data.title, msg.data.body);
+                    } else if (msg.event === 'task') {
+                        switch (msg.data.cmd) {
+                            case 'restart':
+                                window.location.href = SICKRAGE.srWebRoot + '/home/restart/?pid=' + SICKRAGE.srPID;
+                                break;
+                        }
                     }
-                }
+                });
             };
         },
 
@@ -5188,6 +5189,22 @@ $(document).ready(function ($) {
                 $('.backstretch').css("opacity", SICKRAGE.getMeta('sickrage.FANART_BACKGROUND_OPACITY')).fadeIn("500");
             },
 
+            // adds a row to load the next page of episodes of a show after the last loaded row
+            moreRow: function (indexerId, columns, data, lastRow, loadMore) {
+                var loaded = data.offset + data.rows.length;
+                if (loaded >= data.total) {
+                    return;
+                }
+
+                var row = $('<tr class="show-' + indexerId + '"><td colspan="' + columns + '" class="text-center">' +
+                    '<input type="button" class="btn btn-sm" value="' + gt('Load more') + ' (' + (data.total - loaded) + ')"/></td></tr>');
+
+                row.insertAfter(lastRow).find('input').click(function () {
+                    row.remove();
+                    loadMore(loaded, lastRow);
+                });
+            },
+
             episode_statuses: function () {
                 function makeRow(indexerId, season, episode, name, checked) {
                     var row = '';
@@ -5200,6 +5217,22 @@ $(document).ready(function ($) {
                     return row;
                 }
 
+                function loadEpisodes(indexerId, offset, lastRow) {
+                    $.getJSON(SICKRAGE.srWebRoot + '/manage/showEpisodeStatuses', {
+                        indexer_id: indexerId,
+                        whichStatus: $('#oldStatus').val(),
+                        offset: offset
+                    }, function (data) {
+                        var checked = $('#allCheck-' + indexerId).prop('checked');
+                        $.each(data.rows, function (index, ep) {
+                            lastRow = $(makeRow(indexerId, ep.season, ep.episode, ep.name, checked)).insertAfter(lastRow);
+                        });
+                        SICKRAGE.manage.moreRow(indexerId, 4, data, lastRow, function (offset, row) {
+                            loadEpisodes(indexerId, offset, row);
+                        });
+                    });
+                }
+
                 $('.allCheck').click(function () {
                     var indexerId = $(this).attr('id').split('-')[1];
                     $('.' + indexerId + '-epcheck').prop('checked', $(this).prop('checked'));
@@ -5207,23 +5240,11 @@ $(document).ready(function ($) {
 
                 $('.get_more_eps').click(function () {
                     var curIndexerId = $(this).attr('id');
-                    var checked = $('#allCheck-' + curIndexerId).prop('checked');
-                    var lastRow = $('tr#' + curIndexerId);
                     var clicked = $(this).attr('data-clicked');
                     var action = $(this).attr('value');
 
                     if (!clicked) {
-                        $.getJSON(SICKRAGE.srWebRoot + '/manage/showEpisodeStatuses', {
-                            indexer_id: curIndexerId,
-                            whichStatus: $('#oldStatus').val()
-                        }, function (data) {
-                            $.each(data, function (season, eps) {
-                                $.each(eps, function (episode, name) {
-                                    //alert(season+'x'+episode+': '+name);
-                                    lastRow.after(makeRow(curIndexerId, season, episode, name, checked));
-                                });
-                            });
-                        });
+                        loadEpisodes(curIndexerId, 0, $('tr#' + curIndexerId));
                         $(this).attr('data-clicked', 1);
                         $(this).prop('value', 'Collapse');
                     } else {
@@ -5492,6 +5513,47 @@ $(document).ready(function ($) {
             },
 
             backlog_overview: function () {
+                function makeRow(ep) {
+                    var row = '';
+                    row += ' <tr class="seasonstyle ' + ep.overview + '">';
+                    row += '  <td class="tableleft" align="center">' + ep.season + 'x' + ep.episode + '</td>';
+                    row += '  <td class="tableright text-nowrap" align="center">' + ep.name + '</td>';
+                    row += '  <td>' + (ep.airdate ? '<time datetime="' + ep.airdate + '" class="date">' + ep.airdate_str + '</time>' : ep.airdate_str) + '</td>';
+                    row += ' </tr>';
+
+                    return row;
+                }
+
+                function loadEpisodes(table, offset) {
+                    $.getJSON(SICKRAGE.srWebRoot + '/manage/backlogOverview/episodes', {
+                        indexer_id: table.attr('data-indexer-id'),
+                        offset: offset
+                    }, function (data) {
+                        table.find('tbody').append($.map(data.rows, makeRow).join(''));
+
+                        var loaded = data.offset + data.rows.length;
+                        table.find('.get_more_eps').attr('data-offset', loaded).closest('tr').toggleClass('d-none', loaded >= data.total);
+                    });
+                }
+
+                // episodes of a show are loaded once its section comes into view
+                function loadVisible() {
+                    var bottom = $(window).scrollTop() + $(window).height() * 2;
+                    $('table.backlogShow:not([data-loaded])').each(function () {
+                        if ($(this).offset().top < bottom) {
+                            $(this).attr('data-loaded', 1);
+                            loadEpisodes($(this), 0);
+                        }
+                    });
+                }
+
+                $('.get_more_eps').click(function () {
+                    loadEpisodes($(this).closest('table'), $(this).attr('data-offset'));
+                });
+
+                $(window).on('scroll resize', _.debounce(loadVisible, 100));
+                loadVisible();
+
                 $('#pickShow').change(function () {
                     var id = $(this).val();
                     if (id) {
@@ -5580,6 +5642,22 @@ $(document).ready(function ($) {
                     return row;
                 }
 
+                function loadEpisodes(indexerId, offset, lastRow) {
+                    $.getJSON(SICKRAGE.srWebRoot + '/manage/showSubtitleMissed', {
+                        indexer_id: indexerId,
+                        whichSubs: $('#selectSubLang').val(),
+                        offset: offset
+                    }, function (data) {
+                        var checked = $('#allCheck-' + indexerId).prop('checked');
+                        $.each(data.rows, function (index, ep) {
+                            lastRow = $(makeRow(indexerId, ep.season, ep.episode, ep.name, ep.subtitles, checked)).insertAfter(lastRow);
+                        });
+                        SICKRAGE.manage.moreRow(indexerId, 4, data, lastRow, function (offset, row) {
+                            loadEpisodes(indexerId, offset, row);
+                        });
+                    });
+                }
+
                 $('.allCheck').click(function () {
                     var indexerId = $(this).attr('id').split('-')[1];
                     $('.' + indexerId + '-epcheck').prop('checked', $(this).prop('checked'));
@@ -5587,23 +5665,11 @@ $(document).ready(function ($) {
 
                 $('.get_more_eps').click(function () {
                     var indexerId = $(this).attr('id');
-                    var checked = $('#allCheck-' + indexerId).prop('checked');
-                    var lastRow = $('tr#' + indexerId);
                     var clicked = $(this).attr('data-clicked');
                     var action = $(this).attr('value');
 
                     if (!clicked) {
-                        $.getJSON(SICKRAGE.srWebRoot + '/manage/showSubtitleMissed', {
-                            indexer_id: indexerId,
-                            whichSubs: $('#selectSubLang').val()
-                        }, function (data) {
-                            $.each(data, function (season, eps) {
-                                $.each(eps, function (episode, data) {
-                                    //alert(season+'x'+episode+': '+name);
-                                    lastRow.after(makeRow(indexerId, season, episode, data.name, data.subtitles, checked));
-                                });
-                            });
-                        });
+                        loadEpisodes(indexerId, 0, $('tr#' + indexerId));
                         $(this).attr('data-clicked', 1);
                         $(this).prop('value', 'Collapse');
                     } else {
@@ -50,8 +50,12 @@ from sickrage.core.tv import episode
 from sickrage.core import Core, Config, NameCache, Logger
 from sickrage.providers import SearchProviders
 from sickrage.core.helpers import encryption
+from sickrage.core.databases.cache import CacheDB
 from sickrage.core.databases.main import MainDB
 
+# benchmarks and their timings only run when asked for, e.g. SICKRAGE_BENCHMARK=1 python -m pytest tests
+BENCHMARK = bool(os.environ.get('SICKRAGE_BENCHMARK'))
+
 
 class SiCKRAGETestCase(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -91,6 +95,13 @@ class SiCKRAGETestCase(unittest.TestCase):
                                       db_username='sickrage',
                                       db_password='sickrage')
 
+        sickrage.app.cache_db = CacheDB(db_type='sqlite',
+                                        db_prefix='sickrage',
+                                        db_host='localhost',
+                                        db_port='3306',
+                                        db_username='sickrage',
+                                        db_password='sickrage')
+
         encryption.initialize()
         sickrage.app.config.load()
 
@@ -138,8 +149,9 @@ class SiCKRAGETestDBCase(SiCKRAGETestCase):
 
     def tearDown(self):
         super(SiCKRAGETestDBCase, self).tearDown()
-        if os.path.isfile(sickrage.app.main_db.db_path):
-            os.unlink(sickrage.app.main_db.db_path)
+        for db in (sickrage.app.main_db, sickrage.app.cache_db):
+            if os.path.isfile(db.db_path):
+                os.unlink(db.db_path)
 
 
 def load_tests(loader, tests):
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import unittest
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage import clients
+from sickrage.clients import GenericClient, get_client, get_client_instance
+
+
+class GetClientTests(tests.SiCKRAGETestCase):
+    def tearDown(self):
+        clients.clients.clear()
+        super(GetClientTests, self).tearDown()
+
+    def test_get_client(self):
+        client = get_client('transmission')
+        self.assertIs(get_client('transmission'), client)
+
+        # clients are created again when their settings change
+        for setting, value in [('torrent_host', 'http://other:9091/'), ('torrent_verify_cert', not sickrage.app.config.torrent_verify_cert),
+                               ('torrent_auth_type', 'digest')]:
+            setattr(sickrage.app.config, setting, value)
+            self.assertIsNot(get_client('transmission'), client, setting)
+            client = get_client('transmission')
+
+
+class CallWithReauthTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(CallWithReauthTests, self).setUp(**kwargs)
+        self.client = GenericClient('test')
+        self.client.auth = 'expired'
+        self.client._get_auth = mock.Mock(return_value='session')
+
+    def call(self, *responses):
+        """
+        Calls a client method answering with the given (status code, return value or exception) responses
+
+        :return: return value of the call and number of times the method was called
+        """
+        responses = list(responses)
+        func = mock.Mock()
+
+        def request(result):
+            status_code, value = responses.pop(0)
+            self.client.response = mock.Mock(status_code=status_code)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        func.side_effect = request
+        return self.client._call_with_reauth(func, 'result'), func.call_count
+
+    def test_success(self):
+        self.assertEqual(self.call((200, True)), (True, 1))
+        self.assertEqual(self.call((500, False)), (False, 1))
+        self.client._get_auth.assert_not_called()
+
+    def test_expired_session(self):
+        # the method is called again with a new session
+        self.assertEqual(self.call((409, False), (200, True)), (True, 2))
+        self.assertEqual(self.client._get_auth.call_count, 1)
+        self.assertEqual(self.call((401, ValueError('no json')), (200, True)), (True, 2))
+        self.assertEqual(self.client._get_auth.call_count, 2)
+
+        # and only once
+        self.assertEqual(self.call((401, False), (401, False)), (False, 2))
+
+        # not at all when authenticating fails
+        self.client._get_auth.return_value = None
+        self.assertEqual(self.call((401, False)), (False, 1))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.call((500, ValueError('no json')))
+        self.client._get_auth.assert_not_called()
+
+
+class TransmissionTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(TransmissionTests, self).setUp(**kwargs)
+        sickrage.app.config.torrent_seed_time = 2
+        sickrage.app.config.torrent_high_bandwidth = False
+
+        self.client = get_client_instance('transmission')(host='http://localhost:9091/')
+        self.requests = []
+
+        def request(method='get', json=None, **kwargs):
+            self.requests.append(json)
+            self.client.response = mock.Mock(**{'json.return_value': {'result': 'success'}})
+            return True
+
+        self.client._request = request
+
+    def test_set_torrent_properties(self):
+        # ratio, seed time and priority are set with one torrent-set
+        self.assertTrue(self.client._set_torrent_properties(mock.Mock(hash='abc', ratio=2, priority=1)))
+        self.assertEqual(self.requests, [{'method': 'torrent-set', 'arguments': {'ids': ['abc'],
+                                                                                 'seedRatioLimit': 2.0, 'seedRatioMode': 1,
+                                                                                 'seedIdleLimit': 120, 'seedIdleMode': 1,
+                                                                                 'priority-high': [], 'queuePosition': 0}}])
+
+        self.requests.clear()
+        sickrage.app.config.torrent_seed_time = -1
+        self.assertTrue(self.client._set_torrent_properties(mock.Mock(hash='abc', ratio=None, priority=0)))
+        self.assertEqual(self.requests, [{'method': 'torrent-set', 'arguments': {'ids': ['abc'], 'seedRatioLimit': None, 'seedRatioMode': 0}}])
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - CLIENTS TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
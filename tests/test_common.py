@@ -22,11 +22,111 @@
 
 
 
+import itertools
+import pathlib
+import re
+import time
 import unittest
 
 import tests
 
 
+def legacy_scene_quality(name, anime=False):
+    """Quality.scene_quality before it was precompiled, golden reference for the scene quality tests"""
+    from sickrage.core.common import Quality
+
+    ret = Quality.UNKNOWN
+    if not name:
+        return ret
+
+    name = pathlib.Path(name).name
+
+    check_name = lambda l, func: func([re.search(x, name, re.I) for x in l])
+
+    if anime:
+        dvdOptions = check_name([r"dvd", r"dvdrip"], any)
+        blueRayOptions = check_name([r"BD", r"blue?-?ray"], any)
+        sdOptions = check_name([r"360p", r"480p", r"848x480", r"XviD"], any)
+        hdOptions = check_name([r"720p", r"1280x720", r"960x720"], any)
+        fullHD = check_name([r"1080p", r"1920x1080"], any)
+
+        if sdOptions and not blueRayOptions and not dvdOptions:
+            ret = Quality.SDTV
+        elif dvdOptions:
+            ret = Quality.SDDVD
+        elif hdOptions and not blueRayOptions and not fullHD:
+            ret = Quality.HDTV
+        elif fullHD and not blueRayOptions and not hdOptions:
+            ret = Quality.FULLHDTV
+        elif hdOptions and not blueRayOptions and not fullHD:
+            ret = Quality.HDWEBDL
+        elif blueRayOptions and hdOptions and not fullHD:
+            ret = Quality.HDBLURAY
+        elif blueRayOptions and fullHD and not hdOptions:
+            ret = Quality.FULLHDBLURAY
+
+        return ret
+
+    if (check_name([r"480p|\bweb\b|web.?dl|web(rip|mux|hd)|[sph]d.?tv|dsr|tv(rip|mux)|satrip", r"xvid|divx|[xh].?26[45]"], all)
+            and not check_name([r"(720|1080)[pi]"], all)
+            and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDTV
+    elif (check_name([r"dvd(rip|mux)|b[rd](rip|mux)|blue?-?ray", r"xvid|divx|[xh].?26[45]"], all)
+          and not check_name([r"(720|1080)[pi]"], all)
+          and not check_name([r"hr.ws.pdtv.[xh].?26[45]"], any)):
+        ret = Quality.SDDVD
+    elif (check_name([r"720p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"720p", r"hevc", r"[xh].?26[45]"], all)
+          or check_name([r"hr.ws.pdtv.[xh].?26[45]"], any) and not check_name([r"1080[pi]"], all)):
+        ret = Quality.HDTV
+    elif (check_name([r"720p|1080i", r"hd.?tv", r"mpeg-?2"], all)
+          or check_name([r"1080[pi].hdtv", r"h.?26[45]"], all)):
+        ret = Quality.RAWHDTV
+    elif (check_name([r"1080p", r"hd.?tv", r"[xh].?26[45]"], all)
+          or check_name([r"1080p", r"hevc", r"[xh].?26[45]"], all)):
+        ret = Quality.FULLHDTV
+    elif (check_name([r"720p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"720p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.HDWEBDL
+    elif (check_name([r"1080p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"1080p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.FULLHDWEBDL
+    elif check_name([r"720p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.HDBLURAY
+    elif check_name([r"1080p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.FULLHDBLURAY
+    elif check_name([r"2160p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_TV
+    elif check_name([r"4320p", r"hd.?tv", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_TV
+    elif (check_name([r"2160p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"2160p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_4K_WEBDL
+    elif (check_name([r"4320p", r"\bweb\b|web.?dl|web(rip|mux|hd)"], all)
+          or check_name([r"4320p", r"itunes", r"[xh].?26[45]"], all)):
+        ret = Quality.UHD_8K_WEBDL
+    elif check_name([r"2160p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_4K_BLURAY
+    elif check_name([r"4320p", r"blue?-?ray|hddvd|b[rd](rip|mux)", r"[xh].?26[45]"], all):
+        ret = Quality.UHD_8K_BLURAY
+
+    return ret
+
+
+def scene_quality_corpus():
+    resolutions = ['', '360p', '480p', '848x480', '720p', '1280x720', '960x720', '1080i', '1080p', '1920x1080',
+                   '2160p', '4320p']
+    sources = ['', 'HDTV', 'HD.TV', 'PDTV', 'SDTV', 'HR.WS.PDTV', 'DSR', 'TVRip', 'SATRip', 'WEB', 'WEB-DL', 'WEBRip',
+               'WEBHD', 'iTunes', 'DVD', 'DVDRip', 'BDRip', 'BRRip', 'BD', 'BluRay', 'Blu-Ray', 'HDDVD']
+    codecs = ['', 'x264', 'x.264', 'H.264', 'h264', 'x265', 'HEVC', 'HEVC.x265', 'XviD', 'DivX', 'MPEG2', 'MPEG-2']
+
+    for resolution, source, codec in itertools.product(resolutions, sources, codecs):
+        tags = '.'.join(x for x in (resolution, source, codec) if x)
+        yield 'Test.Show.S01E02.{}-GROUP'.format(tags)
+        yield '[Group] Test Show - 02 [{}]'.format(tags.replace('.', ' '))
+        yield '/downloads/Test.Show.S01E02.{}-GROUP.mkv'.format('.'.join(x for x in (source, codec, resolution) if x))
+
+
 class QualityTests(tests.SiCKRAGETestCase):
     # TODO: repack / proper ? air-by-date ? season rip? multi-ep?
 
@@ -116,6 +216,37 @@ class QualityTests(tests.SiCKRAGETestCase):
         from sickrage.core.common import Quality
         self.assertEqual(Quality.UNKNOWN, Quality.name_quality("Test.Show.S01E02-SICKRAGE"))
 
+    def test_scene_quality_golden(self):
+        from sickrage.core.common import Quality
+        for name in scene_quality_corpus():
+            for anime in (False, True):
+                self.assertEqual(legacy_scene_quality(name, anime), Quality.scene_quality(name, anime), name)
+
+    @unittest.skipUnless(tests.BENCHMARK, 'benchmarks only run with SICKRAGE_BENCHMARK set')
+    def test_scene_quality_benchmark(self):
+        from sickrage.core.common import Quality
+        names = list(scene_quality_corpus())
+
+        start = time.time()
+        for name in names:
+            legacy_scene_quality(name)
+        legacy = time.time() - start
+
+        Quality._scene_quality.cache_clear()
+        start = time.time()
+        for name in names:
+            Quality.scene_quality(name)
+        cold = time.time() - start
+
+        start = time.time()
+        for name in names:
+            Quality.scene_quality(name)
+        warm = time.time() - start
+
+        print("Scene quality of {} names/s: legacy {:.0f}, precompiled {:.0f}, memoized {:.0f}".format(
+            len(names), len(names) / legacy, len(names) / cold, len(names) / warm))
+        self.assertLess(cold, legacy)
+
 
 # def test_reverse_parsing(self):
 #        self.assertEqual(Quality.SDTV, Quality.nameQuality("Test Show - S01E02 - SDTV - GROUP"))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import time
+import unittest
+from base64 import b16decode, b32encode
+from hashlib import sha1
+from unittest import mock
+
+from bencode3 import bencode
+
+import tests
+from sickrage.core.caches.content_cache import ContentCache, info_hash_from_content, info_hash_from_url
+
+TORRENT_INFO = {'name': 'Show.Name.S01E01.720p.HDTV.x264-GROUP.mkv', 'length': 1024, 'piece length': 16384, 'pieces': '0' * 20}
+
+
+class ContentCacheTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(ContentCacheTests, self).setUp(**kwargs)
+        self.torrent = bencode({'announce': 'http://tracker/announce', 'info': TORRENT_INFO})
+        self.info_hash = sha1(bencode(TORRENT_INFO)).hexdigest()
+
+    def test_info_hash(self):
+        base32_hash = b32encode(b16decode(self.info_hash.upper())).decode()
+
+        self.assertEqual(info_hash_from_content(self.torrent), self.info_hash)
+        self.assertIsNone(info_hash_from_content(b'<nzb/>'))
+        self.assertEqual(info_hash_from_url('magnet:?xt=urn:btih:{}&dn=show'.format(self.info_hash.upper())), self.info_hash)
+        self.assertEqual(info_hash_from_url('magnet:?xt=urn:btih:{}&dn=show'.format(base32_hash)), self.info_hash)
+        self.assertIsNone(info_hash_from_url('http://tracker/show.torrent'))
+
+    def test_ttl(self):
+        cache = ContentCache(ttl=60)
+        now = time.time()
+
+        with mock.patch('time.time', return_value=now):
+            cache.add('http://indexer/show.nzb', b'<nzb/>')
+
+        with mock.patch('time.time', return_value=now + 59):
+            self.assertEqual(cache.get('http://indexer/show.nzb'), b'<nzb/>')
+
+        with mock.patch('time.time', return_value=now + 61):
+            self.assertIsNone(cache.get('http://indexer/show.nzb'))
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # nothing is cached for failed downloads
+        cache.add('http://indexer/other.nzb', None)
+        self.assertIsNone(cache.get('http://indexer/other.nzb'))
+        self.assertIsNone(cache.get(None))
+
+    def test_lru(self):
+        cache = ContentCache(max_entries=2)
+        cache.add('http://indexer/1.nzb', b'1')
+        cache.add('http://indexer/2.nzb', b'2')
+
+        # the least recently used entry is evicted
+        self.assertEqual(cache.get('http://indexer/1.nzb'), b'1')
+        cache.add('http://indexer/3.nzb', b'3')
+
+        self.assertEqual(cache.get('http://indexer/1.nzb'), b'1')
+        self.assertIsNone(cache.get('http://indexer/2.nzb'))
+        self.assertEqual(cache.get('http://indexer/3.nzb'), b'3')
+
+    def test_info_hash_key(self):
+        cache = ContentCache()
+        cache.add('http://tracker/show.torrent', self.torrent)
+
+        # a magnet of the same release is served from the downloaded .torrent
+        self.assertEqual(cache.get('magnet:?xt=urn:btih:{}&dn=show'.format(self.info_hash)), self.torrent)
+        self.assertEqual(cache.get('magnet:?xt=urn:btih:{}&tr=http://other/announce'.format(self.info_hash.upper())), self.torrent)
+        self.assertEqual(cache.get('http://tracker/show.torrent'), self.torrent)
+        self.assertIsNone(cache.get('magnet:?xt=urn:btih:{}'.format('a' * 40)))
+
+        cache.clear()
+        self.assertIsNone(cache.get('http://tracker/show.torrent'))
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - CONTENT CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -22,14 +22,23 @@
 
 
 import datetime
+import importlib
+import random
+import sqlite3
 import threading
 import unittest
 
+from sqlalchemy import create_engine, func
+from sqlalchemy.exc import IntegrityError, InvalidRequestError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
 import sickrage
 import tests
-from sickrage.core.common import UNAIRED
+from sickrage.core.common import UNAIRED, Quality, DOWNLOADED, SNATCHED, SNATCHED_PROPER, WANTED, statusStrings
+from sickrage.core.searchers import wanted_episodes_criterion
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.databases import UnitOfWork
 from sickrage.core.databases.main import MainDB
 
 
@@ -94,6 +103,227 @@ class DBBasicTests(tests.SiCKRAGETestDBCase):
         for t in threads:
             t.join()
 
+    @MainDB.with_session
+    def test_ep_status_ep_quality(self, session=None):
+        episode_obj = session.query(TVEpisode).filter_by(showid=0o0001, season=1, episode=1).one()
+        self.assertEqual((episode_obj.ep_status, episode_obj.ep_quality), (UNAIRED, Quality.NONE))
+
+        episode_obj.status = Quality.composite_status(DOWNLOADED, Quality.HDTV)
+        session.commit()
+
+        self.assertEqual(session.query(TVEpisode).filter_by(ep_status=DOWNLOADED, ep_quality=Quality.HDTV).count(), 1)
+        self.assertEqual(session.query(TVEpisode).filter_by(ep_status=UNAIRED).count(), 2)
+
+
+
+class UnitOfWorkTests(tests.SiCKRAGETestDBCase):
+    def _add_show(self, indexer_id):
+        with MainDB.session() as session:
+            session.add(TVShow(indexer=1, indexer_id=indexer_id, lang='en'))
+            session.commit()
+
+    @MainDB.with_session
+    def _show_ids(self, session=None):
+        return sorted(x for x, in session.query(TVShow.indexer_id))
+
+    def test_batched_commits(self):
+        with UnitOfWork(max_age=60) as unit:
+            for indexer_id in range(1, 4):
+                self._add_show(indexer_id)
+
+        self.assertEqual(unit.commits, 1)
+        self.assertEqual(self._show_ids(), [1, 2, 3])
+
+    def test_max_age(self):
+        with UnitOfWork(max_age=0) as unit:
+            for indexer_id in range(1, 4):
+                self._add_show(indexer_id)
+
+        self.assertEqual(unit.commits, 3)
+
+    def test_rollback_to_last_commit(self):
+        with UnitOfWork(max_age=60) as unit:
+            self._add_show(1)
+
+            with MainDB.session() as session:
+                session.add(TVShow(indexer=1, indexer_id=1, lang='en'))
+                self.assertRaises(IntegrityError, session.commit)
+                session.rollback()
+
+            self._add_show(2)
+
+            session = MainDB.session()
+            session.add(TVShow(indexer=1, indexer_id=3, lang='en'))
+            session.flush()
+
+        self.assertEqual(unit.commits, 1)
+        self.assertEqual(self._show_ids(), [1, 2])
+
+    def test_failed_item_keeps_commits(self):
+        try:
+            with UnitOfWork(max_age=60):
+                self._add_show(1)
+
+                session = MainDB.session()
+                session.add(TVShow(indexer=1, indexer_id=2, lang='en'))
+                session.flush()
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertEqual(self._show_ids(), [1])
+
+    def test_idle_unit_releases_lock(self):
+        written = threading.Event()
+
+        def writer():
+            self._add_show(2)
+            written.set()
+
+        with UnitOfWork(max_age=0.2) as unit:
+            self._add_show(1)
+
+            # the unit sits idle after its commit, another writer only waits until the batch is max_age old
+            thread = threading.Thread(target=writer)
+            thread.start()
+            self.assertTrue(written.wait(2))
+
+            self._add_show(3)
+
+        thread.join()
+
+        self.assertEqual(unit.commits, 2)
+        self.assertEqual(self._show_ids(), [1, 2, 3])
+
+    def test_lock_wait(self):
+        self._add_show(1)
+
+        blocker = sqlite3.connect(sickrage.app.main_db.db_path, isolation_level=None, check_same_thread=False)
+        blocker.execute('BEGIN IMMEDIATE')
+        threading.Timer(0.3, blocker.execute, ['COMMIT']).start()
+
+        with UnitOfWork() as unit:
+            self._add_show(2)
+
+        blocker.close()
+
+        self.assertEqual(unit.commits, 1)
+        self.assertGreater(unit.lock_wait, 0.2)
+        self.assertEqual(self._show_ids(), [1, 2])
+
+
+
+class ReadSessionTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(ReadSessionTests, self).setUp()
+        with MainDB.session() as session:
+            session.add(TVShow(indexer=1, indexer_id=1, lang='en'))
+
+    def test_read(self):
+        with MainDB.read_session() as session:
+            self.assertEqual([x for x, in session.query(TVShow.indexer_id)], [1])
+
+    def test_refuses_writes(self):
+        session = MainDB.read_session()
+        session.query(TVShow).one().paused = True
+        self.assertRaises(InvalidRequestError, session.commit)
+        session.rollback()
+
+        # statements that bypass the session can't write either
+        self.assertRaises(OperationalError, session.execute, 'UPDATE tv_shows SET paused = 1')
+        session.close()
+
+    def test_wal_status(self):
+        wal_size, checkpoint_lag = sickrage.app.main_db.wal_status()
+        self.assertGreater(wal_size, 0)
+        self.assertEqual(checkpoint_lag, 0)
+
+
+class EpStatusMigrationTests(tests.SiCKRAGETestCase):
+    def test_split_composite_status(self):
+        migration = importlib.import_module('sickrage.core.databases.main.db_repository.versions.'
+                                            '011_Add_Ep_Status_And_Ep_Quality_Columns_To_TVEpisode_Table')
+
+        for status in list(statusStrings.status_strings.keys()):
+            for quality in Quality.qualityStrings.keys():
+                composite = Quality.composite_status(status, quality) if status >= 0 else status
+                self.assertEqual(migration.split_composite_status(composite), Quality.split_composite_status(composite))
+
+
+class EpStatusQueryPlanTests(tests.SiCKRAGETestCase):
+    """Query plans of the episode status queries on the composite status and the split columns"""
+
+    SHOWS = 20
+    EPISODES = 40
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine('sqlite://')
+        TVEpisode.__table__.create(cls.engine)
+
+        rnd = random.Random(1)
+        statuses = [UNAIRED, WANTED, DOWNLOADED, DOWNLOADED, DOWNLOADED, SNATCHED, 5, 6, 7]
+        qualities = [Quality.SDTV, Quality.HDTV, Quality.FULLHDTV, Quality.HDWEBDL, Quality.FULLHDBLURAY]
+
+        rows = []
+        for showid in range(1, cls.SHOWS + 1):
+            for number in range(cls.EPISODES):
+                status = rnd.choice(statuses)
+                quality = rnd.choice(qualities) if status in (DOWNLOADED, SNATCHED, 6) else Quality.NONE
+                rows.append((showid, 1, number // 20 + 1, number % 20 + 1, str(datetime.date(2000, 1, 1) + datetime.timedelta(days=number)),
+                             Quality.composite_status(status, quality), status, quality))
+
+        connection = cls.engine.raw_connection()
+        connection.executemany('INSERT INTO tv_episodes (showid, indexer, season, episode, airdate, status, ep_status, ep_quality) '
+                               'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        connection.commit()
+        connection.close()
+
+        cls.engine.execute('ANALYZE')
+
+    def _explain(self, query):
+        compiled = query.statement.compile(self.engine)
+        params = [str(x) if isinstance(x, datetime.date) else x for x in (compiled.params[k] for k in compiled.positiontup)]
+
+        return [x[-1] for x in self.engine.execute('EXPLAIN QUERY PLAN ' + str(compiled), *params)]
+
+    def _compare(self, name, before, after):
+        before_plan, after_plan = self._explain(before), self._explain(after)
+
+        self.assertFalse([x for x in after_plan if x.startswith('SCAN')], '{}: {}'.format(name, after_plan))
+
+        return before_plan, after_plan
+
+    def test_query_plans(self):
+        session = sessionmaker(bind=self.engine)()
+        show = TVShow(indexer=1, indexer_id=10, quality=Quality.combine_qualities([Quality.HDTV], [Quality.FULLHDBLURAY]))
+
+        before_plan, __ = self._compare('episode statuses',
+                                        session.query(TVEpisode.showid, func.count(TVEpisode.showid)).filter(
+                                            TVEpisode.season != 0, TVEpisode.status.in_(Quality.SNATCHED + Quality.SNATCHED_PROPER)).group_by(TVEpisode.showid),
+                                        session.query(TVEpisode.showid, func.count(TVEpisode.showid)).filter(
+                                            TVEpisode.season != 0, TVEpisode.ep_status.in_([SNATCHED, SNATCHED_PROPER])).group_by(TVEpisode.showid))
+        self.assertTrue([x for x in before_plan if x.startswith('SCAN')], before_plan)
+
+        self._compare('show subtitles missed',
+                      session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show.indexer_id).filter(
+                          TVEpisode.status.endswith(4), TVEpisode.season != 0),
+                      session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show.indexer_id).filter(
+                          TVEpisode.ep_status == DOWNLOADED, TVEpisode.season != 0))
+
+        self._compare('new episodes',
+                      session.query(TVEpisode.showid).filter_by(status=UNAIRED).filter(TVEpisode.season > 0, TVEpisode.airdate > datetime.date.min),
+                      session.query(TVEpisode.showid).filter_by(ep_status=UNAIRED).filter(TVEpisode.season > 0, TVEpisode.airdate > datetime.date.min))
+
+        # the wanted episodes used to be picked from all episodes of a show
+        self._compare('wanted episodes',
+                      session.query(TVEpisode.season, TVEpisode.episode, TVEpisode.status).filter_by(showid=show.indexer_id).filter(TVEpisode.season > 0),
+                      session.query(TVEpisode.season, TVEpisode.episode).filter_by(showid=show.indexer_id).filter(
+                          TVEpisode.season > 0, wanted_episodes_criterion(show)))
+
+        session.close()
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - DB TESTS")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import tests
+from sickrage.core.caches.dir_snapshot_cache import DirSnapshot
+
+
+class DirSnapshotTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(DirSnapshotTests, self).setUp()
+        self.show_dir = tempfile.mkdtemp()
+        for name in ['Show.S01E01.mkv', 'Show.S01E02.mkv']:
+            self.write(name, b'episode')
+
+    def tearDown(self):
+        shutil.rmtree(self.show_dir, ignore_errors=True)
+        super(DirSnapshotTests, self).tearDown()
+
+    def path(self, name):
+        return os.path.join(self.show_dir, name)
+
+    def write(self, name, data):
+        with open(self.path(name), 'wb') as f:
+            f.write(data)
+
+    def snapshot(self):
+        snapshot = DirSnapshot(1, self.show_dir)
+        return snapshot, set(snapshot.media_files)
+
+    def test_changed_media_files(self):
+        snapshot, known_locations = self.snapshot()
+        self.assertEqual(sorted(snapshot.changed_media_files(set())), [self.path('Show.S01E01.mkv'), self.path('Show.S01E02.mkv')])
+        snapshot.save()
+
+        # unchanged files are skipped once an episode points at them
+        snapshot, known_locations = self.snapshot()
+        self.assertEqual(snapshot.changed_media_files(known_locations), [])
+        self.assertEqual(snapshot.changed_media_files(known_locations - {self.path('Show.S01E01.mkv')}), [self.path('Show.S01E01.mkv')])
+
+        # added, changed and removed files
+        self.write('Show.S01E02.mkv', b'proper episode')
+        self.write('Show.S01E03.mkv', b'episode')
+        os.remove(self.path('Show.S01E01.mkv'))
+
+        snapshot, __ = self.snapshot()
+        self.assertEqual(sorted(snapshot.changed_media_files(known_locations)), [self.path('Show.S01E02.mkv'), self.path('Show.S01E03.mkv')])
+        self.assertFalse(snapshot.exists(self.path('Show.S01E01.mkv')))
+        snapshot.save()
+
+        # media files are parsed again when their subtitles changed
+        self.write('Show.S01E03.en.srt', b'subtitle')
+
+        snapshot, known_locations = self.snapshot()
+        self.assertEqual(snapshot.changed_subtitles, [self.path('Show.S01E03.en.srt')])
+        self.assertEqual(snapshot.changed_media_files(known_locations), [self.path('Show.S01E03.mkv')])
+
+    def test_save_reload(self):
+        snapshot, __ = self.snapshot()
+        self.assertEqual(snapshot.previous, {})
+        snapshot.save()
+
+        self.assertEqual(DirSnapshot(1, self.show_dir).previous, snapshot.files)
+        self.assertEqual(DirSnapshot(2, self.show_dir).previous, {})
+
+        # only added, changed and removed rows are replaced
+        self.write('Show.S01E02.mkv', b'proper episode')
+        os.remove(self.path('Show.S01E01.mkv'))
+
+        snapshot, __ = self.snapshot()
+        snapshot.save()
+
+        previous = DirSnapshot(1, self.show_dir).previous
+        self.assertEqual(previous, snapshot.files)
+        self.assertEqual(list(previous), [self.path('Show.S01E02.mkv')])
+
+    def test_stats(self):
+        before = DirSnapshot.stats()
+
+        snapshot, known_locations = self.snapshot()
+        snapshot.changed_media_files(known_locations)
+        snapshot.save()
+        snapshot, known_locations = self.snapshot()
+        snapshot.changed_media_files(known_locations)
+
+        stats = DirSnapshot.stats()
+        self.assertEqual(stats['unchanged'] - before['unchanged'], 2)
+        self.assertEqual(stats['changed'] - before['changed'], 2)
+        self.assertGreater(stats['hit_rate'], 0)
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - DIRECTORY SNAPSHOT TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
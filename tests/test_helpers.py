@@ -70,7 +70,21 @@ test_cases = {
 
 
 class HelpersTests(tests.SiCKRAGETestCase):
-    pass
+    def test_contains_at_least_one_word(self):
+        from sickrage.core.helpers.show_names import contains_at_least_one_word
+
+        words = 'German, french,sub(bed|ed),x264 ,web-dl,'
+        for name in ['Show.Name.S01E01.GERMAN.HDTV-RLSGROUP', 'Show.Name.S01E01.720p.WEB-DL-RLSGROUP',
+                     'Show_Name_S01E01_French_HDTV', 'Show.Name.S01E01.HDTV.x264']:
+            self.assertTrue(contains_at_least_one_word(name, words), name)
+
+        for name in ['Show.Name.S01E01.GERMANY.HDTV-RLSGROUP', 'Show.Name.S01E01.HDTV.x265-RLSGROUP',
+                     'Show.Name.S01E01.subbed.HDTV', 'Show..Name']:
+            self.assertFalse(contains_at_least_one_word(name, words), name)
+
+        self.assertEqual(contains_at_least_one_word('Show.Name.S01E01.german.HDTV', words), 'German')
+        self.assertEqual(contains_at_least_one_word('Show.Name.S01E01.sub(bed|ed).HDTV', words.split(',')), 'sub(bed|ed)')
+        self.assertFalse(contains_at_least_one_word('Show.Name.S01E01.HDTV', ''))
 
 
 def test_generator(test_strings):
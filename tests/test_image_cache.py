@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from hachoir.metadata import extractMetadata
+from hachoir.parser import createParser
+
+import sickrage
+import tests
+from sickrage.core.caches import image_cache
+from sickrage.core.caches.image_cache import ImageCache, image_dimensions, image_version
+from sickrage.core.databases import UnitOfWork
+from sickrage.core.databases.main import MainDB
+from sickrage.core.media.poster import Poster
+from sickrage.core.tv.show import TVShow
+
+
+class ImageCacheTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(ImageCacheTests, self).setUp(**kwargs)
+        self.cache_dir = sickrage.app.cache_dir
+        sickrage.app.cache_dir = tempfile.mkdtemp()
+        self.image_cache = ImageCache()
+        self.images_dir = os.path.join(sickrage.PROG_DIR, 'core', 'webserver', 'static', 'images')
+
+    def tearDown(self):
+        shutil.rmtree(sickrage.app.cache_dir, ignore_errors=True)
+        sickrage.app.cache_dir = self.cache_dir
+        super(ImageCacheTests, self).tearDown()
+
+    def test_image_dimensions(self):
+        images_dir = self.images_dir
+
+        for name in ['backdrops/home.jpg', 'logo-badge.png']:
+            path = os.path.join(images_dir, name)
+
+            parser = createParser(path)
+            with parser:
+                metadata = extractMetadata(parser)
+
+            self.assertEqual(image_dimensions(path), (metadata.get('width'), metadata.get('height')), name)
+
+        self.assertIsNone(image_dimensions(self.FILEPATH))
+
+    def test_store_deduplicated(self):
+        os.makedirs(self.image_cache._cache_dir())
+
+        digest = self.image_cache.store(b'poster', self.image_cache.poster_path(1))
+        self.assertEqual(self.image_cache.store(b'poster', self.image_cache.poster_path(2)), digest)
+
+        with open(self.image_cache.poster_path(2), 'rb') as f:
+            self.assertEqual(f.read(), b'poster')
+        self.assertEqual(os.stat(self.image_cache.content_path(digest)).st_nlink, 3)
+
+        # replacing the poster of a show keeps the content still linked to the other show
+        self.image_cache.store(b'new poster', self.image_cache.poster_path(1))
+        self.assertEqual(os.stat(self.image_cache.content_path(digest)).st_nlink, 2)
+
+        os.remove(self.image_cache.poster_path(2))
+        self.image_cache.prune()
+        self.assertFalse(os.path.exists(self.image_cache.content_path(digest)))
+
+    @unittest.skipIf(image_cache.Image is None, "Pillow not installed")
+    def test_resize(self):
+        os.makedirs(self.image_cache._cache_dir())
+
+        with open(os.path.join(self.images_dir, 'backdrops', 'home.jpg'), 'rb') as f:
+            self.image_cache.store(f.read(), self.image_cache.fanart_path(1))
+
+        resized_path = self.image_cache.resize(self.image_cache.fanart_path(1), 350)
+        self.assertEqual(resized_path, self.image_cache.resized_path(self.image_cache.fanart_path(1), 400))
+        self.assertEqual(image_dimensions(resized_path)[0], 400)
+        self.assertEqual(self.image_cache.resize(self.image_cache.fanart_path(1), 400), resized_path)
+
+        # replaced images get a new variant
+        with open(os.path.join(self.images_dir, 'logo.png'), 'rb') as f:
+            self.image_cache.store(f.read(), self.image_cache.fanart_path(1))
+        os.utime(self.image_cache.fanart_path(1), ns=(0, 0))
+
+        self.image_cache.resize(self.image_cache.fanart_path(1), 400)
+        self.assertEqual(os.stat(resized_path).st_mtime_ns, 0)
+
+        # images not wider than the requested width are used as they are
+        with open(os.path.join(self.images_dir, 'logo-badge.png'), 'rb') as f:
+            self.image_cache.store(f.read(), self.image_cache.poster_path(1))
+        self.assertEqual(self.image_cache.resize(self.image_cache.poster_path(1), 400), self.image_cache.poster_path(1))
+
+    def test_sized_url(self):
+        self.assertEqual(Poster(1).url, '/images/poster.png')
+
+        os.makedirs(self.image_cache._cache_dir())
+        self.image_cache.store(b'poster', self.image_cache.poster_path(1))
+
+        # missing thumbnails are resized from the full size image
+        version = image_version(self.image_cache.poster_path(1))
+        self.assertEqual(Poster(1).url, '/cache/images/1.poster.jpg?v={}'.format(version))
+        self.assertEqual(Poster(1, 'thumb').url, '/cache/images/1.poster.jpg?v={}&width=400'.format(version))
+        self.assertEqual(Poster(1).sized_url(100), '/cache/images/1.poster.jpg?v={}&width=100'.format(version))
+
+
+class QueueFillCacheTests(tests.SiCKRAGETestDBCase):
+    def test_queue_fill_cache(self):
+        started, sickrage.app.started = sickrage.app.started, True
+        filled = []
+
+        try:
+            with mock.patch.object(ImageCache, 'fill_cache', lambda self, show_obj, force=False: filled.append((show_obj.indexer_id, show_obj.name))):
+                # the show added by the unit of work is loaded by the background thread
+                with UnitOfWork():
+                    with MainDB.session() as session:
+                        session.add(TVShow(indexer=1, indexer_id=1, lang='en', name='show 1'))
+                        session.commit()
+
+                    ImageCache().queue_fill_cache(1).result()
+
+                ImageCache().queue_fill_cache(2).result()
+        finally:
+            sickrage.app.started = started
+
+        self.assertEqual(filled, [(1, 'show 1')])
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - IMAGE CACHE TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
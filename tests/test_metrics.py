@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import threading
+import time
+import unittest
+
+import tests
+from sickrage.core.metrics import MetricsRegistry
+
+
+class MetricsTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(MetricsTests, self).setUp(**kwargs)
+        self.registry = MetricsRegistry()
+
+    def test_counter_threads(self):
+        counter = self.registry.counter('test_counter', 'test counter')
+
+        def work():
+            for __ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for __ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.value, 80000)
+
+        # cells of finished threads are kept
+        self.assertEqual(counter.value, 80000)
+        self.assertEqual(len(counter.shards), 0)
+
+    def test_gauge(self):
+        gauge = self.registry.gauge('test_gauge', 'test gauge')
+        gauge.inc(5)
+        gauge.dec(2)
+        self.assertEqual(gauge.value, 3)
+        gauge.set(10)
+        self.assertEqual(gauge.value, 10)
+
+    def test_histogram(self):
+        histogram = self.registry.histogram('test_seconds', 'test histogram', ['provider'], buckets=(1, 5))
+        for value in (0.5, 1, 2, 10):
+            histogram.labels('a').observe(value)
+
+        self.assertEqual(histogram.labels('a').samples(), [
+            ('_bucket', (('le', '1'),), 2),
+            ('_bucket', (('le', '5'),), 3),
+            ('_bucket', (('le', '+Inf'),), 4),
+            ('_sum', (), 13.5),
+            ('_count', (), 4),
+        ])
+
+    def test_exposition(self):
+        self.registry.counter('test_requests', 'test "requests"', ['host']).labels('a"b').inc(2)
+        self.registry.histogram('test_seconds', 'test histogram', buckets=(1,)).observe(0.5)
+
+        self.assertEqual(self.registry.exposition(), '\n'.join([
+            '# HELP test_requests test "requests"',
+            '# TYPE test_requests counter',
+            'test_requests_total{host="a\\"b"} 2',
+            '# HELP test_seconds test histogram',
+            '# TYPE test_seconds histogram',
+            'test_seconds_bucket{le="1"} 1',
+            'test_seconds_bucket{le="+Inf"} 1',
+            'test_seconds_sum 0.5',
+            'test_seconds_count 1',
+        ]) + '\n')
+
+    @unittest.skipUnless(tests.BENCHMARK, 'benchmarks only run with SICKRAGE_BENCHMARK set')
+    def test_benchmark(self):
+        counter = self.registry.counter('bench_counter', 'benchmark counter')
+        histogram = self.registry.histogram('bench_seconds', 'benchmark histogram', ['queue'])
+        samples = 100000
+
+        for name, record in (('counter', lambda: counter.inc()),
+                             ('histogram', lambda: histogram.labels('SEARCHQUEUE').observe(0.3))):
+            # cost of the benchmark loop itself
+            start = time.perf_counter()
+            for __ in range(samples):
+                (lambda: None)()
+            overhead = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for __ in range(samples):
+                record()
+            elapsed = (time.perf_counter() - start - overhead) / samples
+
+            print("Recorded {} {} samples in {:.0f}ns per sample".format(samples, name, elapsed * 1e9))
+            self.assertLess(elapsed, 1e-6)
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - METRICS TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import itertools
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage.core.classes import SearchResult, TorrentSearchResult
+from sickrage.core.common import Quality
+from sickrage.core.search import ResultRanker, pick_best_result
+
+ANY_QUALITIES = [Quality.SDTV, Quality.HDTV, Quality.HDWEBDL]
+BEST_QUALITIES = [Quality.HDTV, Quality.FULLHDBLURAY]
+NAME_TAGS = ['', '.PROPER', '.REPACK', '.iNTERNAL', '.XviD', '.x264', '.iNTERNAL.PROPER', '.XviD.REPACK']
+
+
+class FakeProvider(object):
+    def __init__(self, provider_id, provider_type):
+        self.id = provider_id
+        self.type = provider_type
+
+
+class VerifyProvider(object):
+    """Provider whose results can only be downloaded when their url is verifiable"""
+
+    def __init__(self, verifiable, private=False):
+        self.name = 'verify'
+        self.private = private
+        self.verifiable = verifiable
+        self.random = random.Random(1)
+        self.lock = threading.Lock()
+        self.downloaded = []
+
+    def get_content(self, url):
+        with self.lock:
+            self.downloaded.append(url)
+            delay = self.random.random() / 200
+
+        # finish verifications out of order
+        time.sleep(delay)
+        return b'content' if url in self.verifiable else None
+
+
+def reference_pick_best(results):
+    """Result selection of pick_best_result for results that passed its filters"""
+    best_result = None
+
+    for cur_result in results:
+        if not best_result:
+            best_result = cur_result
+        elif cur_result.quality in BEST_QUALITIES and (
+                best_result.quality < cur_result.quality or best_result.quality not in BEST_QUALITIES):
+            best_result = cur_result
+        elif cur_result.quality in ANY_QUALITIES and best_result.quality not in BEST_QUALITIES and best_result.quality < cur_result.quality:
+            best_result = cur_result
+        elif best_result.quality == cur_result.quality:
+            if "proper" in cur_result.name.lower() or "repack" in cur_result.name.lower():
+                best_result = cur_result
+            elif "internal" in best_result.name.lower() and "internal" not in cur_result.name.lower():
+                best_result = cur_result
+            elif "xvid" in best_result.name.lower() and "x264" in cur_result.name.lower():
+                best_result = cur_result
+
+    return best_result
+
+
+def reference_verified_pick(results, verifiable):
+    """Serial verification formerly done by pick_best_result, the best result is verified before the next best is picked"""
+    candidates = list(results)
+
+    while candidates:
+        best_result = reference_pick_best(candidates)
+        if best_result.url in verifiable:
+            return best_result
+        candidates.remove(best_result)
+
+
+def reference_seeders_narrowing(results):
+    """Seeders narrowing formerly done at the end of search_providers, only valid for two results"""
+    return list(set([a for a, b in itertools.product(results, repeat=len(results)) if a.seeders > b.seeders]))
+
+
+class ResultRankerTests(tests.SiCKRAGETestCase):
+    def setUp(self, **kwargs):
+        super(ResultRankerTests, self).setUp(**kwargs)
+        self.random = random.Random(1)
+        self.providers = [FakeProvider('provider{}'.format(i), 'torrent') for i in range(3)]
+
+    def _ranker(self):
+        ranker = ResultRanker(dict((x.id, i) for i, x in enumerate(self.providers)))
+        ranker.show_qualities[1] = (ANY_QUALITIES, BEST_QUALITIES)
+        return ranker
+
+    def _result(self, i, quality=None, tag=None, seeders=None):
+        result = SearchResult(1, [1])
+        result.show_id = 1
+        result.provider = self.random.choice(self.providers)
+        result.quality = quality if quality is not None else self.random.choice(ANY_QUALITIES + BEST_QUALITIES)
+        result.name = 'Show.Name.S01E01{}-GROUP{}'.format(tag if tag is not None else self.random.choice(NAME_TAGS), i)
+        result.seeders = seeders if seeders is not None else self.random.randint(0, 20)
+        return result
+
+    def test_matches_pick_best_result(self):
+        checked = 0
+
+        for __ in range(2000):
+            results = [self._result(i) for i in range(self.random.randint(1, 4))]
+
+            # only compare when the sequential selection doesn't depend on the result order
+            picks = set(reference_pick_best(list(x)) for x in itertools.permutations(results))
+            if len(picks) != 1:
+                continue
+
+            self.assertIs(self._ranker().best(results), picks.pop(), [x.name for x in results])
+            checked += 1
+
+        self.assertGreater(checked, 500)
+
+    def test_matches_seeders_narrowing(self):
+        for __ in range(500):
+            quality = self.random.choice(ANY_QUALITIES + BEST_QUALITIES)
+            results = [self._result(i, quality=quality, tag='') for i in range(2)]
+            if results[0].seeders == results[1].seeders:
+                continue
+
+            self.assertEqual(reference_seeders_narrowing(results), [self._ranker().best(results)])
+
+    def test_ties(self):
+        results = [self._result(i, quality=Quality.HDTV, tag='', seeders=5) for i in range(3)]
+        for result in results:
+            result.provider = self.providers[0]
+        self.assertIs(self._ranker().best(results), results[0])
+
+        for result in results:
+            result.name += '.PROPER'
+        self.assertIs(self._ranker().best(results), results[-1])
+
+    def test_provider_priority(self):
+        results = [self._result(i, quality=Quality.HDTV, tag='', seeders=5) for i in range(2)]
+        results[0].provider, results[1].provider = self.providers[2], self.providers[1]
+        self.assertIs(self._ranker().best(results), results[1])
+
+    def test_rank(self):
+        results = [self._result(i) for i in range(50)]
+        ranker = self._ranker()
+        ranked = ranker.rank(results)
+        self.assertEqual(len(ranked), len(results))
+        self.assertIs(ranked[0], ranker.best(results))
+        self.assertEqual([ranker.score(x) for x in ranked], sorted(map(ranker.score, results), reverse=True))
+
+    @unittest.skipUnless(tests.BENCHMARK, 'benchmarks only run with SICKRAGE_BENCHMARK set')
+    def test_benchmark(self):
+        results = [self._result(i) for i in range(1000)]
+
+        start = time.time()
+        self._ranker().rank(results)
+        elapsed = time.time() - start
+
+        print("Ranked {} results in {:.2f}ms".format(len(results), elapsed * 1000))
+        self.assertLess(elapsed, 1)
+
+
+class PickBestResultTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(PickBestResultTests, self).setUp()
+        self.random = random.Random(1)
+        sickrage.app.config.download_unverified_magnet_link = False
+
+        show = mock.Mock(is_anime=False, quality=Quality.combine_qualities(ANY_QUALITIES, BEST_QUALITIES),
+                         rls_ignore_words='', rls_require_words='')
+        patcher = mock.patch('sickrage.core.search.find_show', return_value=show)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _result(self, i, provider, url=None):
+        result = TorrentSearchResult(1, [1])
+        result.show_id = 1
+        result.provider = provider
+        result.quality = self.random.choice(ANY_QUALITIES + BEST_QUALITIES)
+        result.name = 'Show.Name.S01E01{}-GROUP{}'.format(self.random.choice(NAME_TAGS), i)
+        result.url = url or 'http://tracker/{}.torrent'.format(i)
+        result.size = 0
+        return result
+
+    def test_matches_serial_verification(self):
+        for __ in range(100):
+            count = self.random.randint(1, 8)
+            verifiable = {'http://tracker/{}.torrent'.format(i) for i in range(count) if self.random.random() < 0.3}
+            provider = VerifyProvider(verifiable)
+            results = [self._result(i, provider) for i in range(count)]
+
+            expected = reference_verified_pick(results, verifiable)
+            self.assertIs(pick_best_result(results), expected, [(x.name, x.url in verifiable) for x in results])
+
+            # each result is downloaded once at most
+            self.assertEqual(len(provider.downloaded), len(set(provider.downloaded)))
+
+    def test_unverified_results(self):
+        provider = VerifyProvider(set())
+        magnet = self._result(1, provider, url='magnet:?xt=urn:btih:' + 'a' * 40)
+        self.assertIsNone(pick_best_result([magnet]))
+
+        sickrage.app.config.download_unverified_magnet_link = True
+        self.assertIs(pick_best_result([magnet]), magnet)
+
+        # results of private providers are snatched without downloading them first
+        private_provider = VerifyProvider(set(), private=True)
+        result = self._result(2, private_provider)
+        self.assertIs(pick_best_result([result]), result)
+        self.assertEqual(private_provider.downloaded, [])
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - SEARCH TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
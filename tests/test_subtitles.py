@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import datetime
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+import sickrage
+import tests
+from sickrage.core.databases.cache import CacheDB
+from sickrage.core.databases.main import MainDB
+from sickrage.core.searchers.subtitle_searcher import SubtitleSearcher
+from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show import TVShow
+from sickrage.subtitles import SubtitleProviderPools, Subtitles
+from sickrage.subtitles.inventory import SubtitleInventory, INVENTORY_EPISODES
+
+
+class SubtitleInventoryTests(tests.SiCKRAGETestDBCase):
+    def setUp(self, **kwargs):
+        super(SubtitleInventoryTests, self).setUp(**kwargs)
+        sickrage.app.config.subtitles_dir = ''
+        sickrage.app.config.embedded_subtitles_all = True
+
+        self.root = os.path.splitext(self.FILEPATH)[0]
+        self.subtitles = [self.root + '.en.srt', self.root + '.pt-BR.srt', self.root + '.srt', self.root + '0.fr.srt']
+        for path in self.subtitles:
+            with open(path, 'w') as f:
+                f.write('subtitle')
+
+    def tearDown(self):
+        for path in self.subtitles:
+            if os.path.isfile(path):
+                os.remove(path)
+        super(SubtitleInventoryTests, self).tearDown()
+
+    def test_refresh(self):
+        # like subliminal, subtitles of other files starting with the same name have an undetermined language
+        inventory = SubtitleInventory(1)
+        self.assertEqual(inventory.refresh(self.FILEPATH), ['eng', 'pob', 'und'])
+        self.assertIsNone(inventory.refresh(self.root + '.avi'))
+        inventory.save()
+
+        # unchanged files are taken from the stored inventory
+        unchanged = INVENTORY_EPISODES.labels('unchanged').value
+        self.assertEqual(SubtitleInventory(1).refresh(self.FILEPATH), ['eng', 'pob', 'und'])
+        self.assertEqual(INVENTORY_EPISODES.labels('unchanged').value, unchanged + 1)
+
+        os.remove(self.root + '.en.srt')
+        self.assertEqual(SubtitleInventory(1).refresh(self.FILEPATH), ['pob', 'und'])
+        self.assertEqual(INVENTORY_EPISODES.labels('unchanged').value, unchanged + 1)
+
+
+class SubtitleSearcherTests(tests.SiCKRAGETestDBCase):
+    def setUp(self):
+        super(SubtitleSearcherTests, self).setUp()
+        sickrage.app.config.subtitles_languages = ['eng']
+        sickrage.app.config.subtitles_multi = True
+        self.searcher = SubtitleSearcher()
+
+    @MainDB.with_session
+    def add_episodes(self, episodes, session=None):
+        for indexer_id in [1, 2]:
+            session.add(TVShow(**{'indexer': 1, 'indexer_id': indexer_id, 'lang': 'en', 'name': 'show {}'.format(indexer_id),
+                                  'subtitles': indexer_id == 1}))
+        session.commit()
+
+        for showid, episode, airdate, searchcount, lastsearch, extra in episodes:
+            session.add(TVEpisode(**dict({'showid': showid, 'indexer': 1, 'season': 1, 'episode': episode, 'location': self.FILEPATH,
+                                          'airdate': airdate, 'subtitles_searchcount': searchcount, 'subtitles_lastsearch': lastsearch}, **extra)))
+        session.commit()
+
+    @CacheDB.with_session
+    def get_miss(self, episode, session=None):
+        miss = session.query(CacheDB.SubtitleMiss).filter_by(showid=1, season=1, episode=episode).one_or_none()
+        return miss and (miss.misses, miss.next_search, miss.languages)
+
+    def test_get_wanted_episodes(self):
+        old, new = datetime.date(2010, 1, 1), datetime.date.today()
+        today = new.toordinal()
+
+        self.add_episodes([(1, 1, old, 0, 0, {}),
+                           # old episodes are searched again after a day, twice at most
+                           (1, 2, old, 1, today, {}),
+                           (1, 3, old, 1, today - 2, {}),
+                           (1, 4, old, 2, today - 2, {}),
+                           # new episodes up to seven times, a day apart at the end
+                           (1, 5, new, 5, today, {}),
+                           (1, 6, new, 6, today - 1, {}),
+                           (1, 7, new, 7, today - 1, {}),
+                           # episodes with the wanted subtitles or without a file
+                           (1, 8, old, 0, 0, {'subtitles': 'eng'}),
+                           (1, 9, old, 0, 0, {'location': ''}),
+                           (1, 10, old, 0, 0, {'location': self.FILEPATH + '.missing'}),
+                           # earlier searches without results
+                           (1, 11, old, 0, 0, {}),
+                           (1, 12, old, 0, 0, {}),
+                           # shows without subtitles
+                           (2, 1, old, 0, 0, {})])
+
+        self.searcher._update_miss(1, 1, 11, True)
+        self.searcher._update_miss(1, 1, 12, True)
+        sickrage.app.config.subtitles_languages = ['eng', 'fre']
+        self.searcher._update_miss(1, 1, 11, True)
+
+        wanted = self.searcher._get_wanted_episodes()
+        self.assertEqual(sorted((x['show_id'], x['episode']) for x in wanted), [(1, 1), (1, 3), (1, 6), (1, 12)])
+        self.assertEqual(wanted[0]['show_name'], 'show 1')
+
+    def test_update_miss(self):
+        now = time.time()
+
+        # the wait doubles with every miss, up to a week
+        for misses, hours in [(1, 6), (2, 12), (3, 24), (4, 48), (5, 96), (6, 168), (7, 168)]:
+            self.searcher._update_miss(1, 1, 1, True)
+            self.assertEqual(self.get_miss(1)[0], misses)
+            self.assertAlmostEqual(self.get_miss(1)[1], now + hours * 3600, delta=60)
+        self.assertEqual(self.get_miss(1)[2], '1:eng')
+
+        # misses for other languages don't count
+        self.assertIn((1, 1, 1), self.searcher._get_misses())
+        sickrage.app.config.subtitles_languages = ['eng', 'fre']
+        self.assertNotIn((1, 1, 1), self.searcher._get_misses())
+
+        self.searcher._update_miss(1, 1, 1, True)
+        self.assertEqual(self.get_miss(1)[0], 1)
+        self.assertAlmostEqual(self.get_miss(1)[1], now + 6 * 3600, delta=60)
+        self.assertEqual(self.get_miss(1)[2], '1:eng,fre')
+
+        # a search with results clears the backoff
+        self.searcher._update_miss(1, 1, 1, False)
+        self.assertIsNone(self.get_miss(1))
+        self.searcher._update_miss(1, 1, 2, False)
+        self.assertIsNone(self.get_miss(2))
+
+    def test_download_subtitles(self):
+        self.add_episodes([(1, 1, datetime.date(2010, 1, 1), 0, 0, {})])
+        self.searcher._update_miss(1, 1, 1, True)
+
+        def download_subtitles(episode_obj, pools=None):
+            episode_obj.subtitles = found
+
+        ep_to_sub = {'show_name': 'show 1', 'show_id': 1, 'season': 1, 'episode': 1}
+        with mock.patch.object(TVEpisode, 'download_subtitles', download_subtitles):
+            found = ''
+            self.searcher._download_subtitles(ep_to_sub, None)
+            self.assertEqual(self.get_miss(1)[0], 2)
+
+            found = 'eng'
+            self.searcher._download_subtitles(ep_to_sub, None)
+            self.assertIsNone(self.get_miss(1))
+
+    def test_provider_pools(self):
+        pools = SubtitleProviderPools()
+
+        with mock.patch.object(Subtitles, 'getEnabledServiceList', return_value=['opensubtitles']), \
+                mock.patch('subliminal.core.AsyncProviderPool', side_effect=lambda **kwargs: mock.Mock()):
+            with pools.get(['eng', 'fre']) as pool:
+                pass
+            with pools.get({'fre', 'eng'}) as same_pool:
+                pass
+            with pools.get(['eng']) as other_pool:
+                pass
+
+            self.assertIs(pool, same_pool)
+            self.assertIsNot(pool, other_pool)
+
+            # a pool serves one download at a time
+            acquired = threading.Event()
+
+            def download():
+                with pools.get(['eng', 'fre']):
+                    acquired.set()
+
+            with pools.get(['eng', 'fre']):
+                thread = threading.Thread(target=download)
+                thread.start()
+                self.assertFalse(acquired.wait(0.5))
+            thread.join()
+            self.assertTrue(acquired.is_set())
+
+        pools.terminate()
+        pool.terminate.assert_called_once_with()
+        other_pool.terminate.assert_called_once_with()
+        self.assertEqual(pools.pools, {})
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - SUBTITLES TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
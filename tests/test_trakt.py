@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# ##############################################################################
+#  Author: echel0n <echel0n@sickrage.ca>
+#  URL: https://sickrage.ca/
+#  Git: https://git.sickrage.ca/SiCKRAGE/sickrage.git
+#  -
+#  This file is part of SiCKRAGE.
+#  -
+#  SiCKRAGE is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  -
+#  SiCKRAGE is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  -
+#  You should have received a copy of the GNU General Public License
+#  along with SiCKRAGE.  If not, see <http://www.gnu.org/licenses/>.
+# ##############################################################################
+
+import unittest
+from unittest import mock
+
+import tests
+from sickrage.core.common import WANTED, SNATCHED, DOWNLOADED, ARCHIVED, SKIPPED
+from sickrage.core.databases.main import MainDB
+from sickrage.core.searchers.trakt_searcher import TraktSearcher
+from sickrage.core.tv.episode import TVEpisode
+from sickrage.core.tv.show import TVShow
+
+
+def trakt_show(title, seasons):
+    """Show of a Trakt list as returned by the Trakt API, seasons is a dict of season number -> episode numbers"""
+    return mock.Mock(title=title, seasons={season: mock.Mock(episodes={x: mock.Mock() for x in episodes}) for season, episodes in seasons.items()})
+
+
+class TraktIndexTests(tests.SiCKRAGETestCase):
+    def test_show_index(self):
+        trakt_list = {('tvdb', '1'): trakt_show('show 1', {}), ('tvdb', 2): trakt_show('show 2', {}), ('tvdb', None): trakt_show('show 3', {})}
+        self.assertEqual(TraktSearcher.show_index(trakt_list), {('tvdb', 1), ('tvdb', 2)})
+
+    def test_episode_index(self):
+        trakt_list = {('tvdb', '1'): trakt_show('show 1', {1: [1, 2], '2': ['1']}),
+                      ('tvdb', 2): mock.Mock(title='show 2', seasons=None),
+                      ('tvdb', 'x'): trakt_show('show 3', {1: [1]})}
+        self.assertEqual(TraktSearcher.episode_index(trakt_list), {('tvdb', 1, 1, 1), ('tvdb', 1, 1, 2), ('tvdb', 1, 2, 1)})
+
+    def test_bulk_data_generate(self):
+        data = [(1, 1, 'show 1', 2010, 1, 1), (1, 1, 'show 1', 2010, 1, 2), (2, 1, 'show 2', 2012, 1, 1), (1, 1, 'show 1', 2010, 2, 1)]
+
+        # all the seasons of a show are sent
+        self.assertEqual(TraktSearcher.trakt_bulk_data_generate(data), {'shows': [
+            {'title': 'show 1', 'year': 2010, 'ids': {'tvdb': 1}, 'seasons': [{'number': 1, 'episodes': [{'number': 1}, {'number': 2}]},
+                                                                             {'number': 2, 'episodes': [{'number': 1}]}]},
+            {'title': 'show 2', 'year': 2012, 'ids': {'tvdb': 2}, 'seasons': [{'number': 1, 'episodes': [{'number': 1}]}]}]})
+
+
+class TraktSyncTests(tests.SiCKRAGETestDBCase):
+    @MainDB.with_session
+    def setUp(self, session=None):
+        super(TraktSyncTests, self).setUp()
+
+        session.add(TVShow(**{'indexer': 1, 'indexer_id': 1, 'lang': 'en', 'name': 'show 1', 'startyear': 2010}))
+        session.commit()
+
+        for episode, status, location in [(1, WANTED, ''), (2, SNATCHED, ''), (3, DOWNLOADED, '/show 1/3.mkv'),
+                                          (4, ARCHIVED, '/show 1/4.mkv'), (5, SKIPPED, ''), (6, DOWNLOADED, '/show 1/6.mkv')]:
+            session.add(TVEpisode(**{'showid': 1, 'indexer': 1, 'season': 1, 'episode': episode, 'location': location, 'status': status}))
+        session.commit()
+
+        self.api = {'sync/collection': mock.Mock(), 'sync/watchlist': mock.Mock()}
+        patcher = mock.patch('sickrage.core.searchers.trakt_searcher.TraktAPI', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.searcher = TraktSearcher()
+
+    def sent(self, request):
+        """
+        :return: list of (season, episode) sent by each call of a Trakt API method
+        """
+        return [[(season['number'], x['number']) for show in args[0]['shows'] for season in show['seasons'] for x in season['episodes']]
+                for args, __ in request.call_args_list]
+
+    def test_collection(self):
+        self.searcher.collection_index = {('tvdb', 1, 1, 4), ('tvdb', 1, 1, 2), ('tvdb', 1, 1, 7)}
+
+        # only episodes with a file are added
+        self.searcher.add_episodes_to_trakt_collection()
+        self.assertEqual(self.sent(self.api['sync/collection'].add), [[(1, 3), (1, 6)]])
+
+        # only episodes without a file are removed
+        self.searcher.remove_episodes_from_trakt_collection()
+        self.assertEqual(self.sent(self.api['sync/collection'].remove), [[(1, 2)]])
+
+        self.assertEqual(self.searcher.collection_index, {('tvdb', 1, 1, 3), ('tvdb', 1, 1, 4), ('tvdb', 1, 1, 6), ('tvdb', 1, 1, 7)})
+
+    def test_watchlist(self):
+        self.searcher.episode_watchlist_index = {('tvdb', 1, 1, 1), ('tvdb', 1, 1, 4), ('tvdb', 1, 1, 5)}
+
+        # only wanted and snatched episodes are added
+        self.searcher.add_episodes_to_trakt_watch_list()
+        self.assertEqual(self.sent(self.api['sync/watchlist'].add), [[(1, 2)]])
+
+        # only downloaded and archived episodes are removed
+        self.searcher.remove_episodes_from_trakt_watch_list()
+        self.assertEqual(self.sent(self.api['sync/watchlist'].remove), [[(1, 4)]])
+
+        self.assertEqual(self.searcher.episode_watchlist_index, {('tvdb', 1, 1, 1), ('tvdb', 1, 1, 2), ('tvdb', 1, 1, 5)})
+
+    def test_bulk_requests(self):
+        with mock.patch('sickrage.core.searchers.trakt_searcher.BULK_SIZE', 1):
+            # episodes of failed requests are sent again on the next sync
+            self.api['sync/collection'].add.side_effect = [None, Exception('timeout')]
+            self.searcher.add_episodes_to_trakt_collection()
+
+        self.assertEqual(self.sent(self.api['sync/collection'].add), [[(1, 3)], [(1, 4)]])
+        self.assertEqual(self.searcher.collection_index, {('tvdb', 1, 1, 3)})
+
+
+if __name__ == "__main__":
+    print("==================")
+    print("STARTING - TRAKT TESTS")
+    print("==================")
+    print("######################################################################")
+    unittest.main()
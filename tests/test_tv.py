@@ -21,12 +21,29 @@
 # ##############################################################################
 
 
+import datetime
+import random
+import threading
+import time
+import tracemalloc
 import unittest
 
+from unittest import mock
+
+from sqlalchemy.orm import joinedload, object_session
+
 import sickrage
 import tests
+from sickrage.core.common import Quality, Overview, UNAIRED, DOWNLOADED, SKIPPED, WANTED, IGNORED, FAILED, ARCHIVED, SNATCHED
+from sickrage.core.databases.main import MainDB
 from sickrage.core.tv.episode import TVEpisode
 from sickrage.core.tv.show import TVShow
+from sickrage.core.tv.show.coming_episodes import ComingEpisodes
+from sickrage.core.tv.show.episode_statuses import EpisodeStatuses
+from sickrage.core.tv.show.helpers import get_show_list
+from sickrage.core.tv.show.overview import is_low_quality, backlog_counts, backlog_criterion, missed_subtitles_criterion, paginate, \
+    episode_stats
+from sickrage.core.updaters.tz_updater import TimeZoneUpdater
 
 
 class TVShowTests(tests.SiCKRAGETestDBCase):
@@ -77,6 +94,277 @@ class TVTests(tests.SiCKRAGETestDBCase):
         sickrage.app.showlist = [show]
 
 
+class EpisodeStatusesTests(tests.SiCKRAGETestDBCase):
+    @MainDB.with_session
+    def setUp(self, session=None):
+        super(EpisodeStatusesTests, self).setUp()
+
+        for indexer_id in [1, 2]:
+            session.add(TVShow(**{'indexer': 1, 'indexer_id': indexer_id, 'lang': 'en', 'name': 'show {}'.format(indexer_id), 'paused': True}))
+            session.commit()
+
+            for season in range(1, 4):
+                for episode in range(1, 11):
+                    session.add(TVEpisode(**{'showid': indexer_id, 'indexer': 1, 'season': season, 'episode': episode, 'location': '',
+                                             'airdate': datetime.date(2010, 1, 1), 'status': SKIPPED, 'release_name': 'release'}))
+            session.commit()
+
+        session.query(TVEpisode).filter_by(showid=1, season=1, episode=1).one().status = UNAIRED
+        session.query(TVEpisode).filter_by(showid=1, season=1, episode=2).one().status = Quality.composite_status(DOWNLOADED, Quality.HDTV)
+
+    @MainDB.with_session
+    def test_set_status(self, session=None):
+        changes = EpisodeStatuses().set_status({1: None, 2: [(2, 1), (2, 2), (9, 9)]}, WANTED, session=session)
+
+        self.assertEqual([len(x.changed) for x in changes], [29, 2])
+        self.assertEqual([x[:3] for x in changes[0].refused], [(1, 1, "it is UNAIRED")])
+        self.assertEqual([x[:2] for x in changes[1].refused], [(9, 9)])
+
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=1, ep_status=WANTED, ep_quality=Quality.NONE).count(), 29)
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=2, ep_status=WANTED).count(), 2)
+
+        # release name of the downloaded episode is cleared, others are kept
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=1, season=1, episode=2).one().release_name, '')
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=1, season=1, episode=3).one().release_name, 'release')
+
+    @MainDB.with_session
+    def test_set_status_old_statuses(self, session=None):
+        changes = EpisodeStatuses().set_status({1: None}, IGNORED, old_statuses=[SKIPPED, DOWNLOADED], keep_downloaded=True, session=session)
+
+        self.assertEqual(len(changes[0].changed), 28)
+        self.assertEqual([x[:2] for x in changes[0].refused], [(1, 2)])
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=1, ep_status=IGNORED).count(), 28)
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=1, ep_status=UNAIRED).count(), 1)
+
+    @MainDB.with_session
+    def test_set_status_composite(self, session=None):
+        changes = EpisodeStatuses().set_status({2: [(1, 1)]}, Quality.composite_status(DOWNLOADED, Quality.HDTV), session=session)
+
+        # compared without the quality, a skipped episode without a file can't be marked as downloaded
+        self.assertEqual(changes[0].changed, [])
+        self.assertEqual([x[:3] for x in changes[0].refused], [(1, 1, "it's not SNATCHED/DOWNLOADED")])
+        self.assertEqual(session.query(TVEpisode).filter_by(showid=2, season=1, episode=1).one().ep_status, SKIPPED)
+
+
+class MetadataTests(tests.SiCKRAGETestDBCase):
+    @MainDB.with_session
+    def test_write_episode_nfos(self, session=None):
+        session.add(TVShow(**{'indexer': 1, 'indexer_id': 1, 'lang': 'en', 'name': 'show 1', 'location': self.TESTDIR}))
+        for episode in range(1, 11):
+            session.add(TVEpisode(**{'showid': 1, 'indexer': 1, 'season': 1, 'episode': episode, 'location': ''}))
+        session.commit()
+
+        show = session.query(TVShow).filter_by(indexer_id=1).one()
+        for episode_obj in show.episodes:
+            episode_obj.location = '/show 1/episode {}.mkv'.format(episode_obj.episode)
+
+        written = []
+
+        def create_episode_metadata(ep_obj, force=False):
+            written.append((ep_obj.location, ep_obj.show.name, object_session(ep_obj) is session, threading.get_ident()))
+
+        provider = mock.Mock(episode_metadata=True, episode_thumbnails=True, create_episode_metadata=create_episode_metadata,
+                             create_episode_thumb=mock.Mock(return_value=False))
+        with mock.patch.object(sickrage.app, 'metadata_providers', {'test': provider}):
+            show.write_episode_nfos()
+
+        # workers load the episodes with the show's changes in sessions of their own
+        self.assertEqual(sorted(x[0] for x in written), sorted(x.location for x in show.episodes))
+        self.assertEqual({x[1] for x in written}, {'show 1'})
+        self.assertNotIn(True, [x[2] for x in written])
+        self.assertNotIn(threading.get_ident(), [x[3] for x in written])
+
+
+class BacklogOverviewTests(tests.SiCKRAGETestDBCase):
+    qualities = [Quality.combine_qualities([Quality.SDTV], []),
+                 Quality.combine_qualities([Quality.SDTV], [Quality.HDTV, Quality.FULLHDBLURAY]),
+                 Quality.combine_qualities([Quality.SDTV, Quality.HDTV], [Quality.HDWEBDL])]
+
+    @MainDB.with_session
+    def setUp(self, session=None):
+        super(BacklogOverviewTests, self).setUp()
+
+        statuses = [WANTED, FAILED, SKIPPED, ARCHIVED] + [Quality.composite_status(DOWNLOADED, x) for x in sorted(Quality.qualityStrings)]
+
+        for indexer_id, (quality, skip_downloaded, paused) in enumerate([(self.qualities[1], False, False), (self.qualities[1], True, False),
+                                                                         (self.qualities[2], False, False), (self.qualities[0], False, False),
+                                                                         (self.qualities[1], False, True)], start=1):
+            session.add(TVShow(**{'indexer': 1, 'indexer_id': indexer_id, 'lang': 'en', 'name': 'show {}'.format(indexer_id), 'paused': paused,
+                                  'quality': quality, 'skip_downloaded': skip_downloaded}))
+            session.commit()
+
+            for episode, status in enumerate(statuses, start=1):
+                session.add(TVEpisode(**{'showid': indexer_id, 'indexer': 1, 'season': 1, 'episode': episode, 'location': '',
+                                         'airdate': datetime.date(2010, 1, 1), 'status': status,
+                                         'subtitles': ['', 'en', 'en,nl', 'nld'][episode % 4]}))
+            session.commit()
+
+    def test_is_low_quality(self):
+        for quality in self.qualities:
+            for skip_downloaded in [False, True]:
+                show = TVShow(**{'quality': quality, 'skip_downloaded': skip_downloaded})
+                for ep_quality in Quality.qualityStrings:
+                    overview = show.get_overview(Quality.composite_status(DOWNLOADED, ep_quality))
+                    self.assertEqual(is_low_quality(quality, skip_downloaded, ep_quality), overview == Overview.QUAL)
+
+    @MainDB.with_session
+    def test_backlog_counts(self, session=None):
+        counts = backlog_counts(session=session)
+
+        self.assertEqual(list(counts.keys()), [1, 2, 3, 4])
+
+        for show in session.query(TVShow).filter_by(paused=False):
+            overviews = [show.get_overview(x.status) for x in show.episodes]
+
+            self.assertEqual(counts[show.indexer_id][Overview.WANTED], overviews.count(Overview.WANTED))
+            self.assertEqual(counts[show.indexer_id][Overview.QUAL], overviews.count(Overview.QUAL))
+
+            for overview in [Overview.WANTED, Overview.QUAL]:
+                self.assertEqual(session.query(TVEpisode).filter_by(showid=show.indexer_id).filter(
+                    backlog_criterion(show.quality, show.skip_downloaded, overview)).count(), overviews.count(overview))
+
+    @MainDB.with_session
+    def test_paginate(self, session=None):
+        query = session.query(TVEpisode.episode).filter_by(showid=1).order_by(TVEpisode.episode.desc())
+
+        total, rows = paginate(query, 5, 3)
+
+        self.assertEqual(total, query.count())
+        self.assertEqual([x.episode for x in rows], [total - 5, total - 6, total - 7])
+
+    @MainDB.with_session
+    def test_missed_subtitles_criterion(self, session=None):
+        def missed(which_subs, wanted_languages):
+            return sorted(x.subtitles for x in session.query(TVEpisode.subtitles).filter(
+                TVEpisode.showid == 1, TVEpisode.episode <= 4, missed_subtitles_criterion(which_subs, wanted_languages)))
+
+        self.assertEqual(missed('nl', []), ['', 'en'])
+        self.assertEqual(missed('all', ['en']), ['', 'nld'])
+        self.assertEqual(missed('all', ['en', 'nl']), ['', 'en', 'nld'])
+        self.assertEqual(missed('all', []), [])
+
+
+class ShowListingTests(tests.SiCKRAGETestDBCase):
+    """Peak memory of the show listings loading all episodes of all shows and loading the episodes they use, times with SICKRAGE_BENCHMARK set"""
+
+    SHOWS = 100
+    EPISODES = 100
+
+    @MainDB.with_session
+    def setUp(self, session=None):
+        super(ShowListingTests, self).setUp()
+
+        sickrage.app.tz_updater = TimeZoneUpdater()
+
+        rnd = random.Random(1)
+        statuses = [UNAIRED, WANTED, SKIPPED, SNATCHED, Quality.composite_status(DOWNLOADED, Quality.HDTV), Quality.composite_status(ARCHIVED, Quality.SDTV)]
+        today = datetime.date.today()
+
+        session.bulk_insert_mappings(TVShow, [{'indexer': 1, 'indexer_id': x, 'lang': 'en', 'name': 'show {}'.format(x), 'paused': x % 10 == 0,
+                                               'status': 'Continuing', 'airs': '8:00 PM', 'network': 'cbs'} for x in range(1, self.SHOWS + 1)])
+
+        episodes = []
+        for showid in range(1, self.SHOWS + 1):
+            for number in range(self.EPISODES):
+                status = rnd.choice(statuses)
+                episodes.append({'showid': showid, 'indexer': 1, 'season': number // 20, 'episode': number % 20 + 1, 'location': '',
+                                 'airdate': today + datetime.timedelta(days=number - self.EPISODES + 5), 'status': status,
+                                 'ep_status': Quality.split_composite_status(status)[0], 'ep_quality': Quality.split_composite_status(status)[1],
+                                 'file_size': rnd.randint(0, 1000), 'description': 'description ' * 20})
+        session.bulk_insert_mappings(TVEpisode, episodes)
+        session.commit()
+
+    def _measure(self, name, before, after):
+        results = []
+        for function in (before, after):
+            tracemalloc.start()
+            start = time.time()
+            results.append((function(), time.time() - start, tracemalloc.get_traced_memory()[1]))
+            tracemalloc.stop()
+
+        (before_result, before_time, before_peak), (after_result, after_time, after_peak) = results
+        if tests.BENCHMARK:
+            print("{}: before {:.2f}ms {:.0f}KiB, after {:.2f}ms {:.0f}KiB".format(name, before_time * 1000, before_peak / 1024, after_time * 1000,
+                                                                                   after_peak / 1024))
+        self.assertLess(after_peak, before_peak)
+
+        return before_result, after_result
+
+    @MainDB.with_session
+    def test_episode_stats(self, session=None):
+        stats = episode_stats(session=session)
+
+        for show in session.query(TVShow).filter(TVShow.indexer_id.in_([1, 2, 3])):
+            self.assertEqual(stats[show.indexer_id], {'airs_next': show.airs_next,
+                                                      'airs_prev': show.airs_prev,
+                                                      'snatched': show.episodes_snatched,
+                                                      'downloaded': show.episodes_downloaded,
+                                                      'unaired': show.episodes_unaired,
+                                                      'special': show.episodes_special,
+                                                      'total': len(show.episodes),
+                                                      'total_size': show.total_size})
+
+        self.assertEqual(stats[self.SHOWS + 1]['total'], 0)
+
+    def test_home(self):
+        @MainDB.with_session
+        def before(session=None):
+            return [(x.indexer_id, x.airs_next, x.episodes_downloaded, x.total_size) for x in
+                    session.query(TVShow).options(joinedload(TVShow.episodes))]
+
+        @MainDB.with_session
+        def after(session=None):
+            stats = episode_stats(session=session)
+            return [(x.indexer_id, stats[x.indexer_id]['airs_next'], stats[x.indexer_id]['downloaded'], stats[x.indexer_id]['total_size'])
+                    for x in get_show_list(session=session)]
+
+        before_result, after_result = self._measure('home', before, after)
+        self.assertEqual(sorted(before_result), sorted(after_result))
+
+    def test_schedule(self):
+        @MainDB.with_session
+        def before(session=None):
+            today = datetime.date.today()
+            next_week = today + datetime.timedelta(days=7)
+            recently = today - datetime.timedelta(days=sickrage.app.config.coming_eps_missed_range)
+
+            results = []
+            for show in session.query(TVShow).options(joinedload(TVShow.episodes)):
+                for episode in sorted(show.episodes, key=lambda x: x.airdate):
+                    if episode.season == 0:
+                        continue
+
+                    if today <= episode.airdate < next_week and episode.ep_status not in (DOWNLOADED, SNATCHED, ARCHIVED, IGNORED):
+                        results.append((show.indexer_id, episode.season, episode.episode))
+                    if show.indexer_id not in [x[0] for x in results] and episode.airdate >= next_week and episode.ep_status not in (
+                            DOWNLOADED, SNATCHED):
+                        results.append((show.indexer_id, episode.season, episode.episode))
+                    if today > episode.airdate >= recently and episode.status in [WANTED, UNAIRED]:
+                        results.append((show.indexer_id, episode.season, episode.episode))
+            return results
+
+        @MainDB.with_session
+        def after(session=None):
+            return [(x['showid'], x['season'], x['episode']) for x in ComingEpisodes.get_coming_episodes(ComingEpisodes.categories, 'date', False,
+                                                                                                          session=session)]
+
+        before_result, after_result = self._measure('schedule', before, after)
+        self.assertEqual(sorted(before_result), sorted(after_result))
+
+    def test_api_shows(self):
+        @MainDB.with_session
+        def before(session=None):
+            return {x.indexer_id: (x.name, x.paused, x.airs_next) for x in session.query(TVShow).options(joinedload(TVShow.episodes))}
+
+        @MainDB.with_session
+        def after(session=None):
+            stats = episode_stats(session=session)
+            return {x.indexer_id: (x.name, x.paused, stats[x.indexer_id]['airs_next']) for x in get_show_list(session=session)}
+
+        before_result, after_result = self._measure('api shows', before, after)
+        self.assertEqual(before_result, after_result)
+
+
 if __name__ == '__main__':
     print("==================")
     print("STARTING - TV TESTS")